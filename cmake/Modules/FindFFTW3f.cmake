@@ -0,0 +1,42 @@
+# Try to find FFTW3f library and include path.
+# Once done this will define
+#
+# FFTW3F_INCLUDE_DIRS - where to find fftw3.h, etc.
+# FFTW3F_LIBRARIES - List of libraries when using libfftw3f.
+# FFTW3F_FOUND - True if libfftw3f found.
+
+find_package(PkgConfig)
+pkg_check_modules(PC_FFTW3F "fftw3f >= 3.0")
+
+find_path(FFTW3F_INCLUDE_DIR fftw3.h HINTS ${PC_FFTW3F_INCLUDE_DIRS} DOC "The directory where fftw3.h resides")
+find_library(FFTW3F_LIBRARY NAMES fftw3f libfftw3f HINTS ${PC_FFTW3F_LIBRARY_DIRS} DOC "The libfftw3f library")
+find_library(FFTW3F_THREADS_LIBRARY NAMES fftw3f_threads libfftw3f-3 HINTS ${PC_FFTW3F_LIBRARY_DIRS})
+
+if(FFTW3F_INCLUDE_DIR AND FFTW3F_LIBRARY)
+  set(FFTW3F_FOUND 1)
+  set(FFTW3F_LIBRARIES ${FFTW3F_LIBRARY})
+  if(FFTW3F_THREADS_LIBRARY)
+    list(APPEND FFTW3F_LIBRARIES ${FFTW3F_THREADS_LIBRARY})
+  endif(FFTW3F_THREADS_LIBRARY)
+  set(FFTW3F_INCLUDE_DIRS ${FFTW3F_INCLUDE_DIR})
+else(FFTW3F_INCLUDE_DIR AND FFTW3F_LIBRARY)
+  set(FFTW3F_FOUND 0)
+  set(FFTW3F_LIBRARIES)
+  set(FFTW3F_INCLUDE_DIRS)
+endif(FFTW3F_INCLUDE_DIR AND FFTW3F_LIBRARY)
+
+mark_as_advanced(FFTW3F_INCLUDE_DIR)
+mark_as_advanced(FFTW3F_LIBRARY)
+mark_as_advanced(FFTW3F_THREADS_LIBRARY)
+mark_as_advanced(FFTW3F_FOUND)
+
+if(NOT FFTW3F_FOUND)
+  set(FFTW3F_DIR_MESSAGE "libfftw3f was not found. Make sure FFTW3F_LIBRARY and FFTW3F_INCLUDE_DIR are set.")
+  if(NOT FFTW3f_FIND_QUIETLY)
+    message(STATUS "${FFTW3F_DIR_MESSAGE}")
+  else(NOT FFTW3f_FIND_QUIETLY)
+    if(FFTW3f_FIND_REQUIRED)
+      message(FATAL_ERROR "${FFTW3F_DIR_MESSAGE}")
+    endif(FFTW3f_FIND_REQUIRED)
+  endif(NOT FFTW3f_FIND_QUIETLY)
+endif(NOT FFTW3F_FOUND)
@@ -202,7 +202,7 @@ class dab_receiver_detailed(gr.top_block, Qt.QWidget):
         self._qtgui_const_sink_x_1_win = sip.wrapinstance(self.qtgui_const_sink_x_1.qwidget(), Qt.QWidget)
         self.top_layout.addWidget(self._qtgui_const_sink_x_1_win)
         self.fft_vxx_0 = fft.fft_vcc(dab_params.fft_length, True, [], True, 1)
-        self.dab_ofdm_synchronization_cvc_0 = dab.ofdm_synchronization_cvf(dab_params.fft_length, dab_params.cp_length, dab_params.fft_length, dab_params.symbols_per_frame)
+        self.dab_ofdm_synchronization_cvc_0 = dab.ofdm_synchronization_cvf(dab_params.fft_length, dab_params.cp_length, dab_params.ns_length, dab_params.symbols_per_frame)
         self.dab_ofdm_coarse_frequency_correction_vcvc_0 = dab.ofdm_coarse_frequency_correction_vcvc(dab_params.fft_length, dab_params.num_carriers, dab_params.cp_length)
         self.dab_msc_decode_0 = dab.msc_decode(dab.parameters.dab_parameters(mode=1, sample_rate=samp_rate, verbose=False), 528, 66, 2, False, False)
         self.dab_mp4_decode_bs_0 = dab.mp4_decode_bs((int(88/8)))
@@ -0,0 +1,63 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_H
+#define INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/sync_block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief converts QPSK symbols to int8 soft bits
+     * \ingroup dab
+     *
+     * Same output order as complex_to_interleaved_float_vcf (real parts,
+     * then imaginary parts), but the soft bits are scaled and saturated to int8.
+     */
+    class DAB_API complex_to_interleaved_char_vcb : virtual public gr::sync_block
+    {
+     public:
+      typedef std::shared_ptr<complex_to_interleaved_char_vcb> sptr;
+
+      virtual void set_scale(float scale) = 0;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::complex_to_interleaved_char_vcb.
+       *
+       * To avoid accidental use of raw pointers, dab::complex_to_interleaved_char_vcb's
+       * constructor is in a private implementation
+       * class. dab::complex_to_interleaved_char_vcb::make is the public interface for
+       * creating new instances.
+       *
+       * With scale 0, the scaling is adapted for each vector, so that the mean
+       * magnitude of its soft bits is 32.
+       */
+      static sptr make(unsigned int length, float scale = 0);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_H */
+
@@ -0,0 +1,87 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 by Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_CRC16_H
+#define INCLUDED_DAB_CRC16_H
+
+#include <gnuradio/dab/api.h>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace gr {
+  namespace dab {
+
+/*! \brief Table driven CRC16 of DAB (ETSI EN 300 401 clause 5.2.1)
+ *
+ * The shift register starts with all ones, the data is shifted in MSB first
+ * and the transmitted CRC word is the inverted register. With the default
+ * generator 0x1021 (x^16 + x^12 + x^5 + 1) this is the CRC of the FIBs and of
+ * the DAB+ access units.
+ *
+ * The bytes are processed 8 at a time with 8 lookup tables (slice-by-8).
+ * Used by fib_sink_vb, fib_source_b, crc16_bb and mp4_decode_bs.
+ *
+ * @param generator Generator polynom of the shift register (default is 0x1021 for DAB)
+ */
+    class DAB_API crc16
+    {
+     public:
+      crc16(uint16_t generator = 0x1021);
+
+      uint16_t generator() const { return d_generator; }
+
+      /*! \brief Shifts length bytes into the shift register.
+       * @param state state of the shift register before the data
+       * @return state of the shift register after the data (not inverted)
+       */
+      uint16_t update(uint16_t state, const uint8_t *data, size_t length) const;
+
+      /*! \brief CRC word of length bytes, as it is transmitted after them. */
+      uint16_t compute(const uint8_t *data, size_t length) const;
+
+      /*! \brief Checks length bytes, of which the last 2 are the CRC word (MSB first).
+       * @return true if the CRC word matches the data
+       */
+      bool check(const uint8_t *data, size_t length) const;
+
+      /*! \brief Checks consecutive blocks (e.g. FIBs of 32 bytes), each ending with its CRC word.
+       * @param data packed bytes of the blocks, an incomplete last block is ignored
+       * @param block_length bytes per block, including the CRC word
+       * @return result of check() for each block
+       */
+      std::vector<bool> check_blocks(const std::vector<uint8_t> &data, size_t block_length) const;
+
+      /*! \brief Like check_blocks(), with one bit per byte (MSB first, only the LSB of each byte counts).
+       * This is the format of the FIC bits after Viterbi decoding and energy dispersal.
+       * @param bits unpacked bits of the blocks, an incomplete last block is ignored
+       * @param block_length bytes per block, including the CRC word (256 bits for FIBs: 32)
+       */
+      std::vector<bool> check_unpacked_blocks(const std::vector<uint8_t> &bits, size_t block_length) const;
+
+     private:
+      uint16_t d_generator;
+      uint16_t d_table[8][256]; /*!< d_table[k][b]: register contribution of byte b followed by k zero bytes */
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_CRC16_H */
@@ -0,0 +1,67 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_DEMUX_CUS_H
+#define INCLUDED_DAB_DEMUX_CUS_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief demultiplexes the CUs (capacity units) of all sub-channels of a CIF in one pass
+     * \ingroup dab
+     *
+     * Routes every CU of the input stream to the output port of the
+     * sub-channel it belongs to. Output port i carries the CUs of the
+     * sub-channel defined by addresses[i] and sizes[i]. CUs that do not belong
+     * to any of the sub-channels are dropped.
+     * The block is type agnostic and works for float as well as int8 soft bits.
+     */
+    class DAB_API demux_cus : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<demux_cus> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::demux_cus.
+       *
+       * To avoid accidental use of raw pointers, dab::demux_cus's
+       * constructor is in a private implementation
+       * class. dab::demux_cus::make is the public interface for
+       * creating new instances.
+       *
+       * \param itemsize size of one soft bit in bytes
+       * \param vlen number of soft bits per CU
+       * \param frame_len number of CUs per CIF
+       * \param addresses start address (in CUs) of each sub-channel
+       * \param sizes size (in CUs) of each sub-channel
+       */
+      static sptr make(size_t itemsize, unsigned int vlen, unsigned int frame_len,
+                       const std::vector<unsigned int> &addresses,
+                       const std::vector<unsigned int> &sizes);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_DEMUX_CUS_H */
@@ -29,9 +29,26 @@ namespace gr {
   namespace dab {
 
     /*!
-     * \brief <+description of block+>
+     * \brief sink for DAB/DAB+ FIBs, interprets MCI and SI
      * \ingroup dab
      *
+     * Keeps a database of the ensemble (sub-channels, service components,
+     * service labels, programme types) that is updated incrementally from
+     * the received FIGs. Each time an entry actually changes, the database
+     * version is incremented and the changed entry is published as a PMT
+     * dictionary on the message port "fic_db".
+     *
+     * Messages in the same format, sent to the message port "restore", seed
+     * the database (e.g. from a cache of the last reception). Restored entries
+     * never overwrite received ones. They are dropped again if the received
+     * EId differs or if they are not confirmed by a received FIG within
+     * 10 seconds; removals are published with the key "removed".
+     *
+     * The CIF counter of each received FIG 0/0 is published on the message
+     * port "cif_count" as PMT dictionary with the keys "cif" (index of the
+     * CIF since the start of the stream, counted from the FIBs with
+     * fibs_per_cif FIBs per CIF) and "cif_count" (CIF counter, 0 ... 4999).
+     * The select_cus blocks tag each CIF of the MSC with the same index.
      */
     class DAB_API fib_sink_vb : virtual public gr::sync_block
     {
@@ -46,8 +63,10 @@ namespace gr {
        * constructor is in a private implementation
        * class. dab::fib_sink_vb::make is the public interface for
        * creating new instances.
+       *
+       * \param fibs_per_cif number of FIBs per CIF (4 in transmission mode 3, else 3)
        */
-      static sptr make();
+      static sptr make(int fibs_per_cif = 3);
 
       virtual std::string get_ensemble_info() = 0;
       virtual std::string get_service_info() = 0;
@@ -55,6 +74,13 @@ namespace gr {
       virtual std::string get_subch_info() = 0;
       virtual std::string get_programme_type() = 0;
       virtual bool get_crc_passed() = 0;
+      /*! \brief Version of the FIC database.
+       * Incremented on every change of an entry, so pollers can skip the
+       * JSON getters while the version is unchanged.
+       */
+      virtual uint64_t get_version() = 0;
+      /*! \brief Ensemble identifier (EId) from FIG 0/0, -1 if unknown. */
+      virtual int get_ensemble_id() = 0;
     };
 
   } // namespace dab
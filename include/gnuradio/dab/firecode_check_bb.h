@@ -31,6 +31,24 @@ namespace gr {
     /*!
      * checks firecode of logical frames
      *
+     * Synchronizes to the audio superframes of a DAB+ sub-channel (5 logical
+     * frames) and only passes complete superframes.
+     *
+     * Without further information, the superframe start is searched by
+     * checking the firecode at each logical frame. If the CIF counter is
+     * received on the message port "cif_count" (from fib_sink_vb) and the
+     * logical frames carry the "cif_start" tags of the select_cus blocks,
+     * the firecode is only checked at the logical frames whose CIF counter
+     * has the phase (modulo 5) of the last locked superframe start (0 before
+     * the first lock), which locks at the first superframe.
+     *
+     * Once locked, superframes are passed as a flywheel even if their
+     * firecode fails (the Reed-Solomon decoder may still correct them). Only
+     * after 3 consecutive fails, the block falls back to the search; predicted
+     * superframe starts that fail 3 times in a row are ignored until the
+     * search locks again.
+     *
+     * The stream tags of the passed superframes are moved along with them.
      */
     class DAB_API firecode_check_bb : virtual public gr::block
     {
@@ -33,6 +33,10 @@ namespace gr {
      * \brief DAB+ Audio frame decoder
      * \ingroup dab
      *
+     * The AAC decoding of the superframes runs in a thread pool that is shared by all
+     * DAB+ audio decoders of the process, with a persistent decoder handle per block.
+     * The output keeps the order of the superframes. The first sample after a change
+     * of the audio format is tagged with "sample_rate" (long), "sbr" and "ps" (bool).
      */
     class DAB_API mp4_decode_bs : virtual public gr::block
     {
@@ -0,0 +1,66 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_MSC_ENCODE_PACKED_BB_H
+#define INCLUDED_DAB_MSC_ENCODE_PACKED_BB_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief channel coding of a sub-channel on packed bytes
+     * \ingroup dab
+     *
+     * Energy dispersal, convolutional encoding (including the tail bits),
+     * puncturing and time interleaving of the logical frames of a
+     * sub-channel in one block. Input and output are packed bytes (MSB first),
+     * the output is identical to the bit-wise chain of msc_encode.
+     * With the scrambling vector {0} there is no time interleaving, which is
+     * used for the FIBs of the FIC.
+     */
+    class DAB_API msc_encode_packed_bb : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<msc_encode_packed_bb> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::msc_encode_packed_bb.
+       *
+       * To avoid accidental use of raw pointers, dab::msc_encode_packed_bb's
+       * constructor is in a private implementation
+       * class. dab::msc_encode_packed_bb::make is the public interface for
+       * creating new instances.
+       *
+       * \param framesize size of a logical frame in packed bytes (I/8)
+       * \param puncturing_vector puncturing sequence of the mother codeword (4*I + 24 bits)
+       * \param scrambling_vector delays (in logical frames) of the time interleaver
+       */
+      static sptr make(int framesize,
+                       const std::vector<unsigned char> &puncturing_vector,
+                       const std::vector<unsigned char> &scrambling_vector);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_MSC_ENCODE_PACKED_BB_H */
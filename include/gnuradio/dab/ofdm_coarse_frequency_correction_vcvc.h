@@ -45,6 +45,12 @@ namespace gr {
 
       virtual float get_snr() = 0;
 
+      /*!
+       * \brief Returns the measured coarse frequency offset, i.e. the
+       * position of the first occupied sub-carrier in the FFT vector.
+       */
+      virtual unsigned int get_freq_offset() = 0;
+
       /*!
        * \brief Return a shared_ptr to a new instance of dab::ofdm_coarse_frequency_correction_vcvc.
        *
@@ -0,0 +1,75 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+
+#ifndef INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_H
+#define INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief demodulation of the DAB OFDM symbols after the FFT in one pass
+     * \ingroup dab
+     *
+     * Combines scaling, coarse frequency correction, differential phasor,
+     * frequency deinterleaving and the demultiplexing into FIC and MSC.
+     */
+    class DAB_API ofdm_differential_demod_vcvc : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<ofdm_differential_demod_vcvc> sptr;
+
+      virtual float get_snr() = 0;
+
+      /*!
+       * \brief Returns the measured coarse frequency offset, i.e. the
+       * position of the first occupied sub-carrier in the FFT vector.
+       */
+      virtual unsigned int get_freq_offset() = 0;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::ofdm_differential_demod_vcvc.
+       *
+       * To avoid accidental use of raw pointers, dab::ofdm_differential_demod_vcvc's
+       * constructor is in a private implementation
+       * class. dab::ofdm_differential_demod_vcvc::make is the public interface for
+       * creating new instances.
+       *
+       * If symbol_mask is not empty, only the MSC symbols with a non-zero flag,
+       * whose previous symbol is flagged too, are demodulated. The other MSC
+       * symbols are written out as zeros.
+       */
+      static sptr make(int fft_length, int num_carriers,
+                       const std::vector<short> &deinterleaving_sequence,
+                       unsigned int symbols_fic, unsigned int symbols_msc,
+                       float scale = 1.0,
+                       const std::vector<unsigned char> &symbol_mask = std::vector<unsigned char>());
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_H */
+
@@ -0,0 +1,74 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_H
+#define INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief OFDM modulation of whole DAB transmission frames in one block
+     * \ingroup dab
+     *
+     * Combines QPSK mapping, phase reference symbol insertion, differential
+     * modulation, frequency interleaving, the batched IFFT of all symbols of a
+     * frame, the cyclic prefixes, scaling and the NULL symbol.
+     *
+     * Input 0 are the symbols as packed bytes (num_carriers/4 bytes per symbol,
+     * first the real, then the imaginary bits as for qpsk_mapper_vbvc), input 1
+     * the frame start trigger, which is 1 for the first symbol of each frame.
+     * Each frame consists of symbols_per_frame - 1 input symbols. The output
+     * are the complex baseband samples.
+     */
+    class DAB_API ofdm_differential_mod_vbc : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<ofdm_differential_mod_vbc> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::ofdm_differential_mod_vbc.
+       *
+       * To avoid accidental use of raw pointers, dab::ofdm_differential_mod_vbc's
+       * constructor is in a private implementation
+       * class. dab::ofdm_differential_mod_vbc::make is the public interface for
+       * creating new instances.
+       *
+       * \param fft_length length of the IFFT
+       * \param num_carriers number of used sub-carriers
+       * \param cp_length length of the cyclic prefix in samples
+       * \param ns_length length of the NULL symbol in samples
+       * \param symbols_per_frame number of OFDM symbols per frame, including the phase reference symbol
+       * \param prn phase reference symbol (multiples of pi/4 only)
+       * \param interleaving_sequence frequency interleaving sequence
+       * \param scale scaling factor for the output samples
+       */
+      static sptr make(int fft_length, int num_carriers, int cp_length, int ns_length,
+                       int symbols_per_frame, const std::vector<gr_complex> &prn,
+                       const std::vector<short> &interleaving_sequence, float scale = 1.0);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_H */
@@ -0,0 +1,61 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+
+#ifndef INCLUDED_DAB_OFDM_FFT_VCVC_H
+#define INCLUDED_DAB_OFDM_FFT_VCVC_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/sync_block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief batched forward FFT over all OFDM symbols of a transmission frame
+     * \ingroup dab
+     *
+     */
+    class DAB_API ofdm_fft_vcvc : virtual public gr::sync_block
+    {
+     public:
+      typedef std::shared_ptr<ofdm_fft_vcvc> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::ofdm_fft_vcvc.
+       *
+       * To avoid accidental use of raw pointers, dab::ofdm_fft_vcvc's
+       * constructor is in a private implementation
+       * class. dab::ofdm_fft_vcvc::make is the public interface for
+       * creating new instances.
+       *
+       * If symbol_mask is not empty, only the symbols of a frame with a
+       * non-zero flag are transformed. The others are written out as zeros.
+       */
+      static sptr make(int fft_length, int symbols_per_frame, float scale = 1.0,
+                       const std::vector<unsigned char> &symbol_mask = std::vector<unsigned char>());
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_FFT_VCVC_H */
+
@@ -43,6 +43,18 @@ namespace gr {
      public:
       typedef std::shared_ptr<ofdm_synchronization_cvf> sptr;
 
+      /*!
+       * \brief Returns true if the frame timing is locked, i.e. the predicted
+       * start of the last frame was verified.
+       */
+      virtual bool get_locked() = 0;
+
+      /*!
+       * \brief Returns the fine frequency offset (in rad/sample) measured
+       * at the start of the last frame.
+       */
+      virtual float get_frequency_offset() = 0;
+
       /*!
        * \brief Return a shared_ptr to a new instance of dab::ofdm_synchronization_cvf.
        *
@@ -51,7 +63,7 @@ namespace gr {
        * class. dab::ofdm_synchronization_cvf::make is the public interface for
        * creating new instances.
        */
-      static sptr make(int symbol_length, int cyclic_prefix_lenght, int fft_length, int symbols_per_frame);
+      static sptr make(int fft_length, int cyclic_prefix_length, int null_symbol_length, int symbols_per_frame);
     };
 
   } // namespace dab
@@ -32,6 +32,16 @@ namespace gr {
      * \brief Reed-Solomon decoder configured for DAB+
      * \ingroup dab
      *
+     * The syndromes of all RS packets of a superframe are computed at once,
+     * directly on the interleaved superframe. Only RS packets with non-zero
+     * syndromes are de-interleaved and run through the full decoder.
+     *
+     * If an RS packet is not correctable and bytes of the superframe are
+     * tagged with the key "reliability" (see viterbi_k7_r14), the packet is
+     * decoded again with its least reliable bytes as erasures: first with up
+     * to 4 of them, then with 2. Up to 10 erasures would be correctable, but
+     * the more erasures, the less redundancy is left to detect a wrong
+     * correction.
      */
     class DAB_API reed_solomon_decode_bb : virtual public gr::block
     {
@@ -48,7 +58,17 @@ namespace gr {
        */
       static sptr make(int bit_rate_n);
       
+      /*! \return number of corrected bytes in the last superframe */
       virtual int get_corrected_errors() = 0;
+
+      /*! \return number of error free RS packets in the last superframe */
+      virtual int get_clean_packets() = 0;
+
+      /*! \return number of corrected RS packets in the last superframe */
+      virtual int get_corrected_packets() = 0;
+
+      /*! \return number of uncorrectable RS packets in the last superframe */
+      virtual int get_uncorrectable_packets() = 0;
     };
 
   } // namespace dab
@@ -0,0 +1,75 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_H
+#define INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief selects and time deinterleaves a sub-channel out of a history of whole CIFs
+     * \ingroup dab
+     *
+     * Keeps the int8 soft bits of all CUs (capacity units) of the last CIFs in
+     * a ring buffer, as many as the time interleaving spans. At the end of each
+     * CIF the selected sub-channel is read out of the ring, time deinterleaved.
+     * The output equals select_cus_vbvb followed by time_deinterleave_bb.
+     * Because the ring holds the whole MSC, a sub-channel selected with
+     * set_subchannel() is completely deinterleaved from the next CIF on.
+     *
+     * The first soft bit of each CIF is tagged with the key "cif_start".
+     * The value of the tag is the index of the CIF since the start of the stream.
+     */
+    class DAB_API select_cus_history_vbb : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<select_cus_history_vbb> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::select_cus_history_vbb.
+       *
+       * To avoid accidental use of raw pointers, dab::select_cus_history_vbb's
+       * constructor is in a private implementation
+       * class. dab::select_cus_history_vbb::make is the public interface for
+       * creating new instances.
+       *
+       * \param vlen number of soft bits per CU
+       * \param frame_len number of CUs per CIF
+       * \param address start address (in CUs) of the sub-channel
+       * \param size size (in CUs) of the sub-channel
+       * \param scrambling_vector time interleaving delays (in CIFs)
+       */
+      static sptr make(unsigned int vlen, unsigned int frame_len, unsigned int address,
+                       unsigned int size, const std::vector<unsigned char> &scrambling_vector);
+
+      /*!
+       * \brief Selects another sub-channel, starting with the output of the current CIF.
+       */
+      virtual void set_subchannel(unsigned int address, unsigned int size) = 0;
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_H */
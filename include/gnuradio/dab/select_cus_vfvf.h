@@ -37,6 +37,8 @@ namespace gr {
      * \brief selects a number of CUs (capacity units) of a vector
      * \ingroup dab
      *
+     * The first selected CU of each CIF is tagged with the key "cif_start".
+     * The value of the tag is the index of the CIF since the start of the stream.
      */
     class DAB_API select_cus_vfvf : virtual public gr::block
     {
@@ -52,6 +54,11 @@ namespace gr {
        * creating new instances.
        */
       static sptr make(unsigned int vlen, unsigned int frame_len, unsigned int address, unsigned int size);
+
+      /*!
+       * \brief Selects another sub-channel, starting with the current CIF.
+       */
+      virtual void set_subchannel(unsigned int address, unsigned int size) = 0;
     };
 
   } // namespace dab
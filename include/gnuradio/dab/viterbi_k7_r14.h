@@ -0,0 +1,80 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_VITERBI_K7_R14_H
+#define INCLUDED_DAB_VITERBI_K7_R14_H
+
+#include <gnuradio/dab/api.h>
+#include <gnuradio/block.h>
+
+namespace gr {
+  namespace dab {
+
+    /*!
+     * \brief Viterbi decoder for the DAB convolutional code (K=7, rate 1/4)
+     * \ingroup dab
+     *
+     * Decodes codewords of 4*(length+6) soft bits (float or int8, positive for
+     * a 0, 0 for punctured bits) to length unpacked bits. The 6 tail bits are
+     * removed.
+     *
+     * The codewords of a work call are independent of each other and can be
+     * decoded on a pool of num_threads threads (the block's own thread
+     * included). The output order is not affected.
+     *
+     * With a reliability_threshold above 0, the reliability of each byte of
+     * the output (8 bits from the start of a codeword) is computed from the
+     * path metric differences of the discarded paths, like in the soft
+     * output Viterbi algorithm (0 ... 255, in units of soft bits with a mean
+     * magnitude of 32). The first bit of each byte with
+     * a reliability below reliability_threshold is tagged with the key
+     * "reliability" and the reliability as value, e.g. for the erasures of
+     * reed_solomon_decode_bb.
+     */
+    class DAB_API viterbi_k7_r14 : virtual public gr::block
+    {
+     public:
+      typedef std::shared_ptr<viterbi_k7_r14> sptr;
+
+      /*!
+       * \brief Return a shared_ptr to a new instance of dab::viterbi_k7_r14.
+       *
+       * To avoid accidental use of raw pointers, dab::viterbi_k7_r14's
+       * constructor is in a private implementation
+       * class. dab::viterbi_k7_r14::make is the public interface for
+       * creating new instances.
+       *
+       * \param length number of information bits per codeword (without the 6 tail bits)
+       * \param int8_soft_bits input soft bits are int8 instead of float
+       * \param num_threads number of decoding threads, 0 for one per CPU core
+       * \param reliability_threshold bytes with a smaller reliability are tagged, 0 for no tags
+       */
+      static sptr make(int length, bool int8_soft_bits = false, int num_threads = 1,
+                       int reliability_threshold = 0);
+
+      virtual int num_threads() const = 0;
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_VITERBI_K7_R14_H */
+
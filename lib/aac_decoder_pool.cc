@@ -0,0 +1,82 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 by Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "aac_decoder_pool.h"
+#include <algorithm>
+
+namespace gr {
+  namespace dab {
+
+    aac_decoder_pool &
+    aac_decoder_pool::instance() {
+      static aac_decoder_pool pool(std::max(1u, std::thread::hardware_concurrency()));
+      return pool;
+    }
+
+    aac_decoder_pool::aac_decoder_pool(int num_threads)
+            : d_stop(false) {
+      for (int i = 0; i < num_threads; i++) {
+        d_threads.push_back(std::thread(&aac_decoder_pool::worker, this));
+      }
+    }
+
+    aac_decoder_pool::~aac_decoder_pool() {
+      {
+        std::lock_guard<std::mutex> lock(d_mutex);
+        d_stop = true;
+      }
+      d_cond.notify_all();
+      for (auto &thread : d_threads) {
+        thread.join();
+      }
+    }
+
+    void
+    aac_decoder_pool::post(const std::function<void()> &job) {
+      {
+        std::lock_guard<std::mutex> lock(d_mutex);
+        d_jobs.push_back(job);
+      }
+      d_cond.notify_one();
+    }
+
+    void
+    aac_decoder_pool::worker() {
+      std::unique_lock<std::mutex> lock(d_mutex);
+      while (true) {
+        d_cond.wait(lock, [&] { return d_stop || !d_jobs.empty(); });
+        if (d_jobs.empty()) {
+          // stop request and all jobs done
+          return;
+        }
+        std::function<void()> job = d_jobs.front();
+        d_jobs.pop_front();
+        lock.unlock();
+        job();
+        lock.lock();
+      }
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
@@ -0,0 +1,69 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 by Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_AAC_DECODER_POOL_H
+#define INCLUDED_DAB_AAC_DECODER_POOL_H
+
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace gr {
+  namespace dab {
+
+    /*! \brief Process-wide pool of threads for the AAC decoding of all DAB+ services.
+     *
+     * All mp4_decode_bs blocks of a process share this pool, so that the decoding of many
+     * services spreads over all CPU cores instead of running on the scheduler thread of
+     * each service. A job decodes one superframe of one service; the blocks make sure that
+     * they have at most one job in the pool at a time, so the superframes of a service are
+     * decoded in order with the service's own decoder handle.
+     */
+    class aac_decoder_pool {
+    public:
+      /*! \brief Returns the pool of the process. The threads are started at the first call. */
+      static aac_decoder_pool &instance();
+
+      ~aac_decoder_pool();
+
+      /*! \brief Queues a job. The jobs are started in the order they are posted. */
+      void post(const std::function<void()> &job);
+
+      int num_threads() const { return d_threads.size(); }
+
+    private:
+      aac_decoder_pool(int num_threads);
+
+      void worker();
+
+      std::vector<std::thread> d_threads;
+      std::mutex d_mutex;
+      std::condition_variable d_cond; /*!< Signals a new job or the stop request to the threads. */
+      std::deque<std::function<void()> > d_jobs;
+      bool d_stop;
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_AAC_DECODER_POOL_H */
@@ -0,0 +1,82 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "complex_to_interleaved_char_vcb_impl.h"
+#include <volk/volk.h>
+#include <cmath>
+
+#define ADAPTIVE_MEAN_MAGNITUDE 32 /* mean magnitude of the int8 soft bits with adaptive scaling */
+
+namespace gr {
+  namespace dab {
+
+    complex_to_interleaved_char_vcb::sptr
+    complex_to_interleaved_char_vcb::make(unsigned int length, float scale) {
+      return gnuradio::get_initial_sptr(new complex_to_interleaved_char_vcb_impl(length, scale));
+    }
+
+    complex_to_interleaved_char_vcb_impl::complex_to_interleaved_char_vcb_impl(unsigned int length, float scale)
+            : gr::sync_block("complex_to_interleaved_char_vcb",
+                             gr::io_signature::make(1, 1, sizeof(gr_complex) * length),
+                             gr::io_signature::make(1, 1, sizeof(int8_t) * length * 2)),
+              d_length(length),
+              d_scale(scale) {
+      d_soft_bits = (float *) volk_malloc(sizeof(float) * length * 2, volk_get_alignment());
+    }
+
+    complex_to_interleaved_char_vcb_impl::~complex_to_interleaved_char_vcb_impl() {
+      volk_free(d_soft_bits);
+    }
+
+    int
+    complex_to_interleaved_char_vcb_impl::work(int noutput_items,
+                                               gr_vector_const_void_star &input_items,
+                                               gr_vector_void_star &output_items) {
+      gr_complex const *in = (const gr_complex *) input_items[0];
+      int8_t *out = (int8_t *) output_items[0];
+
+      for (int i = 0; i < noutput_items; i++) {
+        volk_32fc_deinterleave_32f_x2(d_soft_bits, &d_soft_bits[d_length], in, d_length);
+        float scale = d_scale;
+        if (scale == 0) {
+          float sum = 0;
+          for (unsigned int j = 0; j < 2 * d_length; j++) {
+            sum += std::fabs(d_soft_bits[j]);
+          }
+          scale = (sum > 0) ? ADAPTIVE_MEAN_MAGNITUDE * 2 * d_length / sum : 0;
+        }
+        // saturates to the range of int8
+        volk_32f_s32f_convert_8i(out, d_soft_bits, scale, 2 * d_length);
+        in += d_length;
+        out += 2 * d_length;
+      }
+
+      return noutput_items;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
+
@@ -0,0 +1,58 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_IMPL_H
+#define INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_IMPL_H
+
+#include <gnuradio/dab/complex_to_interleaved_char_vcb.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief converts QPSK symbols to int8 soft bits
+ * The real parts of a vector are followed by its imaginary parts, like in complex_to_interleaved_float_vcf.
+ * The soft bits are multiplied with scale and saturated to the range of int8.
+ *
+ * @param length length of the complex input vector
+ * @param scale scaling factor before the saturation, 0 for an adaptive scaling to a mean magnitude of 32
+ */
+    class complex_to_interleaved_char_vcb_impl : public complex_to_interleaved_char_vcb {
+    private:
+      unsigned int d_length; /*!< length of the complex input vector */
+      float d_scale;
+      float *d_soft_bits; /*!< float soft bits of one vector before the quantization */
+
+    public:
+      complex_to_interleaved_char_vcb_impl(unsigned int length, float scale);
+
+      ~complex_to_interleaved_char_vcb_impl();
+
+      virtual void set_scale(float scale) { d_scale = scale; }
+
+      int work(int noutput_items,
+               gr_vector_const_void_star &input_items,
+               gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_COMPLEX_TO_INTERLEAVED_CHAR_VCB_IMPL_H */
+
@@ -1,21 +1,98 @@
-#include <inttypes.h>
-#include <stdio.h>
-#include <iostream>
-
-uint16_t crc16(const char *bytestream, int length, uint16_t generator, uint16_t initial_state) {
-  uint16_t state;
-  char byte;
-  
-  state = bytestream[0]*256+bytestream[1];
-  state = ~state;
-  for (int i=2; i<length; i++) {
-    byte = bytestream[i];
-    for (int j=7; j>=0; j--) {
-      if (((state>>15)&1) == 1)
-        state = (((state<<1) + ((byte>>j)&1)) ^ generator);
-      else
-        state = (state<<1) + ((byte>>j)&1);
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 by Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/dab/crc16.h>
+
+namespace gr {
+  namespace dab {
+
+    crc16::crc16(uint16_t generator)
+            : d_generator(generator) {
+      for (int b = 0; b < 256; b++) {
+        uint16_t state = b << 8;
+        for (int j = 0; j < 8; j++) {
+          state = (state & 0x8000) ? (uint16_t) ((state << 1) ^ generator) : (uint16_t) (state << 1);
+        }
+        d_table[0][b] = state;
+      }
+      // each further table appends a zero byte
+      for (int k = 1; k < 8; k++) {
+        for (int b = 0; b < 256; b++) {
+          const uint16_t state = d_table[k - 1][b];
+          d_table[k][b] = (uint16_t) (state << 8) ^ d_table[0][state >> 8];
+        }
+      }
+    }
+
+    uint16_t
+    crc16::update(uint16_t state, const uint8_t *data, size_t length) const {
+      // the state only overlaps the first 2 of each 8 bytes
+      while (length >= 8) {
+        state = d_table[7][data[0] ^ (state >> 8)] ^ d_table[6][data[1] ^ (state & 0xff)]
+                ^ d_table[5][data[2]] ^ d_table[4][data[3]] ^ d_table[3][data[4]]
+                ^ d_table[2][data[5]] ^ d_table[1][data[6]] ^ d_table[0][data[7]];
+        data += 8;
+        length -= 8;
+      }
+      while (length-- > 0) {
+        state = (uint16_t) (state << 8) ^ d_table[0][*data++ ^ (state >> 8)];
+      }
+      return state;
+    }
+
+    uint16_t
+    crc16::compute(const uint8_t *data, size_t length) const {
+      return ~update(0xffff, data, length);
     }
-  }
-  return ~state;
-}
+
+    bool
+    crc16::check(const uint8_t *data, size_t length) const {
+      if (length < 2) {
+        return false;
+      }
+      return compute(data, length - 2) == ((data[length - 2] << 8) | data[length - 1]);
+    }
+
+    std::vector<bool>
+    crc16::check_blocks(const std::vector<uint8_t> &data, size_t block_length) const {
+      std::vector<bool> passed;
+      for (size_t start = 0; block_length > 0 && start + block_length <= data.size(); start += block_length) {
+        passed.push_back(check(&data[start], block_length));
+      }
+      return passed;
+    }
+
+    std::vector<bool>
+    crc16::check_unpacked_blocks(const std::vector<uint8_t> &bits, size_t block_length) const {
+      std::vector<uint8_t> packed(bits.size() / 8);
+      for (size_t i = 0; i < packed.size(); i++) {
+        for (int j = 0; j < 8; j++) {
+          packed[i] = (packed[i] << 1) | (bits[8 * i + j] & 1);
+        }
+      }
+      return check_blocks(packed, block_length);
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
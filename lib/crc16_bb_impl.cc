@@ -24,7 +24,6 @@
 
 #include <gnuradio/io_signature.h>
 #include "crc16_bb_impl.h"
-#include "crc16.h"
 
 namespace gr {
   namespace dab {
@@ -42,7 +41,7 @@ namespace gr {
                         gr::io_signature::make(1, 1, length * sizeof(char)),
                         /*Output item: FIB with CRC16.*/
                         gr::io_signature::make(1, 1, length * sizeof(char))),
-              d_length(length), d_generator(generator),
+              d_crc(generator), d_length(length), d_generator(generator),
               d_initial_state(initial_state) {
     }
 
@@ -68,7 +67,7 @@ namespace gr {
           out[i + n * d_length] = in[i + n * d_length];
         }
         //calculate crc16 word
-        d_crc = crc16(in + n * d_length, d_length, d_generator, d_initial_state);
+        const uint16_t crc = d_crc.compute((const uint8_t *) in + n * d_length, d_length - 2);
 
         //sanity check (last 2 bytes should be zeros)
         if (in[30 + n * d_length] != 0 || in[31 + n * d_length] != 0) {
@@ -77,9 +76,9 @@ namespace gr {
 
         // Write calculated crc to vector. (overwrite last 2 bytes)
         // Add MSByte first to FIB.
-        out[d_length - 2 + n * d_length] = (char) (d_crc >> 8);
+        out[d_length - 2 + n * d_length] = (char) (crc >> 8);
         // Add LSByte second to FIB.
-        out[d_length - 1 + n * d_length] = (char) (out[d_length - 2 + n * d_length] << 8) ^ d_crc;
+        out[d_length - 1 + n * d_length] = (char) (crc & 0xff);
       }
       // Tell runtime system how many input items we consumed on
       // each input stream.
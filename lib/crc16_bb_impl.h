@@ -22,6 +22,7 @@
 #define INCLUDED_DAB_CRC16_BB_IMPL_H
 
 #include <gnuradio/dab/crc16_bb.h>
+#include <gnuradio/dab/crc16.h>
 
 namespace gr {
   namespace dab {
@@ -31,7 +32,7 @@ namespace gr {
  *
  * output: char vector of length length (packed bytes) with crc at last 2 bytes (overwrites last 2 bytes)
  *
- * uses the crc16 function to calculate a 2 byte crc word and write it to the FIB (overwrites last 2 bytes)
+ * uses crc16 to calculate a 2 byte crc word and write it to the FIB (overwrites last 2 bytes)
  *
  * @param length Length of input and output vector in bytes. (default is 32 for DAB FIBs)
  * @param generator Generator polynom for shift register. (default is 0x1021 for DAB)
@@ -39,7 +40,7 @@ namespace gr {
  */
     class crc16_bb_impl : public crc16_bb {
     private:
-      uint16_t d_crc;
+      crc16 d_crc;
       int d_length, d_generator, d_initial_state;
 
     public:
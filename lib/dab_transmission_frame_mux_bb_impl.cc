@@ -87,8 +87,12 @@ namespace gr {
                              % d_fic_len % d_subch_total_size % d_vlen_out);
       set_output_multiple(d_vlen_out);
 
-      // generate PRBS for padding
-      generate_prbs(d_prbs, sizeof(d_prbs));
+      // generate PRBS for padding and repeat it in each CIF of the frame
+      d_msc_template.resize(d_num_cifs * d_cif_len);
+      generate_prbs(&d_msc_template[0], d_cif_len);
+      for (int k = 1; k < d_num_cifs; ++k) {
+        memcpy(&d_msc_template[k * d_cif_len], &d_msc_template[0], d_cif_len);
+      }
       GR_LOG_DEBUG(d_logger, boost::format("key num_subch: %d") % d_num_subch);
     }
 
@@ -132,31 +136,23 @@ namespace gr {
                                                      gr_vector_const_void_star &input_items,
                                                      gr_vector_void_star &output_items) {
       unsigned char *out = (unsigned char *) output_items[0];
-      // write FIBs
       const unsigned char *in_fic = (const unsigned char *) input_items[0];
       for (int i = 0; i < noutput_items / d_vlen_out; ++i) {
-        memcpy(out + i * d_vlen_out, in_fic, d_fic_len);
-        in_fic += d_fic_len;
-      }
-      // write sub-channels
-      unsigned int cu_index = 0;
-      for (int j = 0; j < d_num_subch; ++j) {
-        const unsigned char *in_msc = (const unsigned char *) input_items[j + 1];
-        for (int i = 0; i < noutput_items / d_vlen_out; ++i) {
+        unsigned char *frame = out + i * d_vlen_out;
+        // write FIBs
+        memcpy(frame, in_fic + i * d_fic_len, d_fic_len);
+        // start with the padding in all CUs
+        memcpy(frame + d_fic_len, &d_msc_template[0], d_num_cifs * d_cif_len);
+        // write sub-channels over the padding
+        unsigned int cu_index = 0;
+        for (int j = 0; j < d_num_subch; ++j) {
+          const unsigned char *in_msc = (const unsigned char *) input_items[j + 1];
           for (int k = 0; k < d_num_cifs; ++k) {
-            memcpy(out + i * d_vlen_out + d_fic_len + k * d_cif_len + cu_index * d_cu_len,
+            memcpy(frame + d_fic_len + k * d_cif_len + cu_index * d_cu_len,
                    in_msc + (i * d_num_cifs + k) * d_subch_size[j] * d_cu_len,
                    d_subch_size[j] * d_cu_len);
           }
-        }
-        cu_index += d_subch_size[j];
-      }
-      // fill remaining cus with padding
-      for (int i = 0; i < noutput_items / d_vlen_out; ++i) {
-        for (int j = d_subch_total_size * d_cu_len; j < d_cif_len; ++j) {
-          for (int k = 0; k < d_num_cifs; ++k) {
-            out[i * d_vlen_out + d_fic_len + k * d_cif_len + j] = d_prbs[j];
-          }
+          cu_index += d_subch_size[j];
         }
       }
       // Tell runtime system how many input items we consumed on
@@ -53,8 +53,9 @@ namespace gr {
       unsigned int d_vlen_out, d_num_cifs, d_num_fibs, d_subch_total_size;
       unsigned int d_fic_len;
 
-      unsigned char d_prbs[d_cif_len];
-      /*!< Vector for the PRBS, used for padding at the end of each frame. */
+      std::vector<unsigned char> d_msc_template;
+      /*!< MSC part of a transmission frame with the PRBS for padding in each CIF. Copied to each output frame
+       * before the sub-channels are written over it. */
 
       void generate_prbs(unsigned char *out_ptr, int length);
       /*!< Generates a PRBS after the rules of ETSI EN 300 401 and writes it to output buffer out_ptr.
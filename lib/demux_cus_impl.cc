@@ -0,0 +1,112 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "demux_cus_impl.h"
+#include <cstring>
+#include <stdexcept>
+
+namespace gr {
+  namespace dab {
+
+    demux_cus::sptr
+    demux_cus::make(size_t itemsize, unsigned int vlen, unsigned int frame_len,
+                    const std::vector<unsigned int> &addresses,
+                    const std::vector<unsigned int> &sizes) {
+      return gnuradio::get_initial_sptr(new demux_cus_impl(itemsize, vlen,
+                                                           frame_len,
+                                                           addresses, sizes));
+    }
+
+    /*
+     * The private constructor
+     */
+    demux_cus_impl::demux_cus_impl(size_t itemsize, unsigned int vlen,
+                                   unsigned int frame_len,
+                                   const std::vector<unsigned int> &addresses,
+                                   const std::vector<unsigned int> &sizes)
+            : gr::block("demux_cus",
+                        gr::io_signature::make(1, 1, itemsize * vlen),
+                        gr::io_signature::make(addresses.size(), addresses.size(), itemsize * vlen)),
+              d_cu_size(itemsize * vlen),
+              d_frame_len(frame_len),
+              d_cu_to_port(frame_len, -1) {
+      if (addresses.empty() || addresses.size() != sizes.size()) {
+        throw std::invalid_argument("demux_cus: need one size per sub-channel address");
+      }
+      for (unsigned int port = 0; port < addresses.size(); port++) {
+        if (addresses[port] + sizes[port] > frame_len) {
+          throw std::invalid_argument("demux_cus: sub-channel exceeds the CIF");
+        }
+        for (unsigned int cu = addresses[port]; cu < addresses[port] + sizes[port]; cu++) {
+          if (d_cu_to_port[cu] >= 0) {
+            throw std::invalid_argument("demux_cus: sub-channels overlap");
+          }
+          d_cu_to_port[cu] = port;
+        }
+      }
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    demux_cus_impl::~demux_cus_impl() {
+    }
+
+    void
+    demux_cus_impl::forecast(int noutput_items,
+                             gr_vector_int &ninput_items_required) {
+      ninput_items_required[0] = noutput_items;
+    }
+
+    int
+    demux_cus_impl::general_work(int noutput_items,
+                                 gr_vector_int &ninput_items,
+                                 gr_vector_const_void_star &input_items,
+                                 gr_vector_void_star &output_items) {
+      const char *in = (const char *) input_items[0];
+      // no output port can get more CUs than are consumed
+      int nconsume = std::min(noutput_items, ninput_items[0]);
+      std::vector<int> nwritten(output_items.size(), 0);
+      unsigned int cu = nitems_read(0) % d_frame_len;
+
+      for (int i = 0; i < nconsume; ++i) {
+        int port = d_cu_to_port[cu];
+        if (port >= 0) {
+          memcpy((char *) output_items[port] + nwritten[port]++ * d_cu_size,
+                 in + i * d_cu_size, d_cu_size);
+        }
+        if (++cu == d_frame_len) {
+          cu = 0;
+        }
+      }
+      consume_each(nconsume);
+      for (unsigned int port = 0; port < output_items.size(); port++) {
+        produce(port, nwritten[port]);
+      }
+      return WORK_CALLED_PRODUCE;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
@@ -0,0 +1,63 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_DEMUX_CUS_IMPL_H
+#define INCLUDED_DAB_DEMUX_CUS_IMPL_H
+
+#include <gnuradio/dab/demux_cus.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief Demultiplexes the CUs of several sub-channels out of a stream of CIFs.
+ * Each CIF is read only once; every CU is copied to the output port of
+ * the sub-channel it belongs to.
+ *
+ * @param itemsize Size of one soft bit in bytes.
+ * @param vlen Number of soft bits per CU.
+ * @param frame_len Length of a CIF in CUs.
+ * @param addresses Number of the first CU of each sub-channel.
+ * @param sizes Number of CUs of each sub-channel.
+ */
+    class demux_cus_impl : public demux_cus {
+    private:
+      size_t d_cu_size; /*!< size of one CU in bytes */
+      unsigned int d_frame_len;
+      std::vector<int> d_cu_to_port; /*!< output port of each CU in a CIF, -1 for unused CUs */
+
+    public:
+      demux_cus_impl(size_t itemsize, unsigned int vlen, unsigned int frame_len,
+                     const std::vector<unsigned int> &addresses,
+                     const std::vector<unsigned int> &sizes);
+
+      ~demux_cus_impl();
+
+      // Where all the action really happens
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_DEMUX_CUS_IMPL_H */
@@ -0,0 +1,83 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 by Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_DOUBLE_BUFFER_H
+#define INCLUDED_DAB_DOUBLE_BUFFER_H
+
+#include <atomic>
+
+namespace gr {
+  namespace dab {
+
+    /*! \brief Lock-free snapshot of a value that is written by one thread and read by many.
+     *
+     * The writer (the scheduler thread in work()) fills the back buffer and flips an atomic
+     * index. Readers register on the front buffer before copying it, so the writer never
+     * overwrites a buffer that is being read: if a reader still holds the back buffer,
+     * try_publish() returns false and the writer publishes again later.
+     * Neither side ever blocks on a lock.
+     */
+    template<typename T>
+    class double_buffer {
+    public:
+      double_buffer() : d_buffers(), d_index(0) {
+        d_readers[0] = 0;
+        d_readers[1] = 0;
+      }
+
+      /*! \brief Publishes a new value. Must only be called from a single writer thread.
+       * @param value Value that readers see from now on.
+       * @return false if a reader still holds the back buffer and nothing was published.
+       */
+      bool try_publish(const T &value) {
+        int back = 1 - d_index.load();
+        if (d_readers[back].load() != 0) {
+          return false;
+        }
+        d_buffers[back] = value;
+        d_index.store(back);
+        return true;
+      }
+
+      /*! \brief Returns a copy of the last published value. Can be called from any thread. */
+      T read() const {
+        while (true) {
+          int front = d_index.load();
+          d_readers[front].fetch_add(1);
+          // the writer may have flipped (and started to refill) the buffer before we registered
+          if (d_index.load() == front) {
+            T value = d_buffers[front];
+            d_readers[front].fetch_sub(1);
+            return value;
+          }
+          d_readers[front].fetch_sub(1);
+        }
+      }
+
+    private:
+      T d_buffers[2];
+      std::atomic<int> d_index; /*!< index of the buffer the readers copy */
+      mutable std::atomic<int> d_readers[2]; /*!< number of readers per buffer */
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_DOUBLE_BUFFER_H */
@@ -31,7 +31,6 @@
 #include <sstream>
 #include <string>
 #include <boost/format.hpp>
-#include "crc16.h"
 #include "FIC.h"
 
 
@@ -41,31 +40,44 @@ namespace gr {
   namespace dab {
 
     fib_sink_vb::sptr
-    fib_sink_vb::make() {
-      return gnuradio::get_initial_sptr(new fib_sink_vb_impl());
+    fib_sink_vb::make(int fibs_per_cif) {
+      return gnuradio::get_initial_sptr(new fib_sink_vb_impl(fibs_per_cif));
     }
 
-    fib_sink_vb_impl::fib_sink_vb_impl()
+    fib_sink_vb_impl::fib_sink_vb_impl(int fibs_per_cif)
             : gr::sync_block("fib_sink_vb",
                              gr::io_signature::make(1, 1, sizeof(char) * 32),
-                             gr::io_signature::make(0, 0, 0)) {
-      d_service_info_written_trigger = -1;
-      d_service_labels_written_trigger = -1;
-      d_subch_info_written_trigger = -1;
-      d_programme_type_written_trigger = -1;
-      d_crc_passed = false;
+                             gr::io_signature::make(0, 0, 0)),
+              d_crc_passed(false),
+              d_db_dirty(false),
+              d_snapshot_version(0),
+              d_restored_ensemble(false),
+              d_restored_ensemble_id(false),
+              d_restore_countdown(0),
+              d_port(pmt::mp("fic_db")),
+              d_cif_port(pmt::mp("cif_count")),
+              d_fibs_per_cif(fibs_per_cif),
+              d_fib_index(0) {
+      message_port_register_out(d_port);
+      message_port_register_out(d_cif_port);
+      message_port_register_in(pmt::mp("restore"));
+      set_msg_handler(pmt::mp("restore"), [this](pmt::pmt_t msg) { this->handle_restore(msg); });
     }
 
     int
     fib_sink_vb_impl::process_fib(const char *fib) {
       uint8_t type, length, pos;
-      if (crc16(fib, FIB_LENGTH, FIB_CRC_POLY, FIB_CRC_INITSTATE) != 0) {
+      if (!d_crc.check((const uint8_t *) fib, FIB_LENGTH)) {
         GR_LOG_DEBUG(d_logger, "FIB CRC error");
         d_crc_passed = false;
         return 1;
       }
       GR_LOG_DEBUG(d_logger, "FIB correct");
       d_crc_passed = true;
+      if (d_restore_countdown > 0 && --d_restore_countdown == 0) {
+        // drop all restored entries that were not confirmed by a received FIG
+        drop_restored();
+      }
       pos = 0;
       while (pos < FIB_LENGTH - FIB_CRC_LENGTH &&
              (uint8_t) fib[pos] != FIB_ENDMARKER &&
@@ -123,6 +135,12 @@ namespace gr {
                            ensemble_reference %
                            (int) country_ID %
                            CIF_counter);
+              update_ensemble_id((int) ((uint16_t) country_ID << 12 | ensemble_reference));
+              // CIF counter of the CIF that this FIB belongs to
+              pmt::pmt_t cif = pmt::make_dict();
+              cif = pmt::dict_add(cif, pmt::mp("cif"), pmt::from_uint64(d_fib_index / d_fibs_per_cif));
+              cif = pmt::dict_add(cif, pmt::mp("cif_count"), pmt::from_long(CIF_counter));
+              message_port_pub(d_cif_port, cif);
               break;
             }
             case FIB_MCI_EXTENSION_SUBCHANNEL_ORGA: {
@@ -157,26 +175,7 @@ namespace gr {
                                (int) subch_size);
                   subch_counter += 4;
 
-                  // write sub-channel info to json
-                  if (d_subch_info_written_trigger < 0) {
-                    d_subch_info_written_trigger = (int) subchID;
-                  } else {
-                    std::stringstream ss;
-                    ss << d_subch_info_current << ",{" << "\"ID\":"
-                       << (int) subchID << ",\"address\":"
-                       << (int) start_address << ",\"protection\":"
-                       << (int) protect_level << ",\"size\":"
-                       << (int) subch_size << "}\0";
-                    d_subch_info_current = ss.str();
-                    if ((int) subchID == d_subch_info_written_trigger) {
-                      std::stringstream ss_json;
-                      ss_json << d_subch_info_current << "]" << "\0";
-                      d_subch_info_current = "\0";
-                      d_json_subch_info = ss_json.str();
-                      d_json_subch_info[0] = '[';
-                      d_subch_info_written_trigger = -1;
-                    }
-                  }
+                  update_subch((int) subchID, (int) start_address, (int) protect_level, (int) subch_size);
                 }
               } while (1 + subch_counter < length);
               break;
@@ -206,27 +205,7 @@ namespace gr {
                                  format("(audio stream, type %d, subchID %d, primary %d)") %
                                  (int) comp_type %
                                  (int) subchID % (int) ps);
-                    // write service info from specififc subchannel to json
-                    if (d_service_info_written_trigger < 0) {
-                      d_service_info_written_trigger = (int) subchID;
-                    } else {
-                      std::stringstream ss;
-                      ss << d_service_info_current << ",{" << "\"reference\":"
-                         << (int) service_reference << ",\"ID\":"
-                         << (int) subchID << ",\"primary\":"
-                         << ((ps == 1) ? "true" : "false") << ",\"DAB+\":"
-                         << (((int) comp_type == 63) ? "true" : "false")
-                         << "}\0";
-                      d_service_info_current = ss.str();
-                      if ((int) subchID == d_service_info_written_trigger) {
-                        std::stringstream ss_json;
-                        ss_json << d_service_info_current << "]" << "\0";
-                        d_service_info_current = "\0";
-                        d_json_service_info = ss_json.str();
-                        d_json_service_info[0] = '[';
-                        d_service_info_written_trigger = -1;
-                      }
-                    }
+                    update_service_comp((int) subchID, (int) service_reference, ps == 1, (int) comp_type == 63);
                   } else if (TMID == 1) {
                     GR_LOG_DEBUG(d_logger,
                                  format("(data stream, type %d, subchID %d, primary %d)") %
@@ -305,24 +284,7 @@ namespace gr {
                              service_reference %
                              (int) programme_type);
 
-                // write programme type to json
-                if (d_programme_type_written_trigger < 0) {
-                  d_programme_type_written_trigger = (int) service_reference;
-                } else {
-                  std::stringstream ss;
-                  ss << d_programme_type_current << ",{" << "\"reference\":"
-                     << (int) service_reference << ",\"programme_type\":"
-                     << (int) programme_type << "}\0";
-                  d_programme_type_current = ss.str();
-                  if ((int) service_reference == d_programme_type_written_trigger) {
-                    std::stringstream ss_json;
-                    ss_json << d_programme_type_current << "]" << "\0";
-                    d_programme_type_current = "\0";
-                    d_json_programme_type = ss_json.str();
-                    d_json_programme_type[0] = '[';
-                    d_programme_type_written_trigger = -1;
-                  }
-                }
+                update_programme_type((int) service_reference, (int) programme_type);
               }
               break;
             }
@@ -348,10 +310,7 @@ namespace gr {
               uint8_t country_ID = (uint8_t)((data[2] & 0xf0) >> 4);
               memcpy(label, &data[4], 16);
               GR_LOG_DEBUG(d_logger, format("[ensemble label](%d): %s") % (int) country_ID % label);
-              // write json for ensemble label and country ID
-              std::stringstream ss;
-              ss << "{" << "\"" << label << "\":{" << "\"country_ID\":" << (int) country_ID << "}}";
-              d_json_ensemble_info = ss.str();
+              update_ensemble(label, (int) country_ID);
               break;
             }
             case FIB_SI_EXTENSION_PROGRAMME_SERVICE_LABEL: {
@@ -360,24 +319,7 @@ namespace gr {
               GR_LOG_DEBUG(d_logger,
                            format("[programme service label] (reference %d): %s") %
                            service_reference % label);
-              // write service labels from services to json
-              if (d_service_labels_written_trigger < 0) {
-                d_service_labels_written_trigger = (int) service_reference;
-              } else {
-                std::stringstream ss;
-                ss << d_service_labels_current << ",{" << "\"label\":\""
-                   << label << "\",\"reference\":"
-                   << (int) service_reference << "}\0";
-                d_service_labels_current = ss.str();
-                if ((int) service_reference == d_service_labels_written_trigger) {
-                  std::stringstream ss_json;
-                  ss_json << d_service_labels_current << "]" << "\0";
-                  d_service_labels_current = "\0";
-                  d_json_service_labels = ss_json.str();
-                  d_json_service_labels[0] = '[';
-                  d_service_labels_written_trigger = -1;
-                }
-              }
+              update_service_label((int) service_reference, label);
               break;
             }
             case FIB_SI_EXTENSION_SERVICE_COMP_LABEL:
@@ -420,6 +362,371 @@ namespace gr {
       }
     }
 
+    void
+    fib_sink_vb_impl::publish_change(pmt::pmt_t entry) {
+      d_db.version++;
+      d_db_dirty = true;
+      entry = pmt::dict_add(entry, pmt::mp("version"), pmt::from_uint64(d_db.version));
+      message_port_pub(d_port, entry);
+    }
+
+    void
+    fib_sink_vb_impl::publish_snapshot() {
+      // hand the changed database over to the getters; if a getter is still
+      // reading the back buffer, try again with the next call
+      if (d_db_dirty && d_db_snapshot.try_publish(d_db)) {
+        d_snapshot_version.store(d_db.version);
+        d_db_dirty = false;
+      }
+    }
+
+    void
+    fib_sink_vb_impl::update_subch(int subch_id, int address, int protection, int size, bool restored) {
+      std::map<int, subch_entry>::iterator it = d_db.subchs.find(subch_id);
+      if (it != d_db.subchs.end()) {
+        if (restored) {
+          return;
+        }
+        if (it->second.address == address && it->second.protection == protection && it->second.size == size) {
+          d_restored_subchs.erase(subch_id);
+          return;
+        }
+      }
+      d_db.subchs[subch_id] = subch_entry{address, protection, size};
+      if (restored) {
+        d_restored_subchs.insert(subch_id);
+      } else {
+        d_restored_subchs.erase(subch_id);
+      }
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("subchannel"));
+      entry = pmt::dict_add(entry, pmt::mp("ID"), pmt::from_long(subch_id));
+      entry = pmt::dict_add(entry, pmt::mp("address"), pmt::from_long(address));
+      entry = pmt::dict_add(entry, pmt::mp("protection"), pmt::from_long(protection));
+      entry = pmt::dict_add(entry, pmt::mp("size"), pmt::from_long(size));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::update_service_comp(int subch_id, int reference, bool primary, bool dabplus, bool restored) {
+      std::map<int, service_comp_entry>::iterator it = d_db.service_comps.find(subch_id);
+      if (it != d_db.service_comps.end()) {
+        if (restored) {
+          return;
+        }
+        if (it->second.reference == reference && it->second.primary == primary && it->second.dabplus == dabplus) {
+          d_restored_service_comps.erase(subch_id);
+          return;
+        }
+      }
+      d_db.service_comps[subch_id] = service_comp_entry{reference, primary, dabplus};
+      if (restored) {
+        d_restored_service_comps.insert(subch_id);
+      } else {
+        d_restored_service_comps.erase(subch_id);
+      }
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("service"));
+      entry = pmt::dict_add(entry, pmt::mp("reference"), pmt::from_long(reference));
+      entry = pmt::dict_add(entry, pmt::mp("ID"), pmt::from_long(subch_id));
+      entry = pmt::dict_add(entry, pmt::mp("primary"), pmt::from_bool(primary));
+      entry = pmt::dict_add(entry, pmt::mp("DAB+"), pmt::from_bool(dabplus));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::update_service_label(int reference, const std::string &label, bool restored) {
+      std::map<int, std::string>::iterator it = d_db.service_labels.find(reference);
+      if (it != d_db.service_labels.end()) {
+        if (restored) {
+          return;
+        }
+        if (it->second == label) {
+          d_restored_service_labels.erase(reference);
+          return;
+        }
+      }
+      d_db.service_labels[reference] = label;
+      if (restored) {
+        d_restored_service_labels.insert(reference);
+      } else {
+        d_restored_service_labels.erase(reference);
+      }
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("label"));
+      entry = pmt::dict_add(entry, pmt::mp("label"), pmt::mp(label));
+      entry = pmt::dict_add(entry, pmt::mp("reference"), pmt::from_long(reference));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::update_programme_type(int reference, int programme_type, bool restored) {
+      std::map<int, int>::iterator it = d_db.programme_types.find(reference);
+      if (it != d_db.programme_types.end()) {
+        if (restored) {
+          return;
+        }
+        if (it->second == programme_type) {
+          d_restored_programme_types.erase(reference);
+          return;
+        }
+      }
+      d_db.programme_types[reference] = programme_type;
+      if (restored) {
+        d_restored_programme_types.insert(reference);
+      } else {
+        d_restored_programme_types.erase(reference);
+      }
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("programme_type"));
+      entry = pmt::dict_add(entry, pmt::mp("reference"), pmt::from_long(reference));
+      entry = pmt::dict_add(entry, pmt::mp("programme_type"), pmt::from_long(programme_type));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::update_ensemble(const std::string &label, int country_ID, bool restored) {
+      if (d_db.country_ID >= 0) {
+        if (restored) {
+          return;
+        }
+        if (d_db.ensemble_label == label && d_db.country_ID == country_ID) {
+          d_restored_ensemble = false;
+          return;
+        }
+      }
+      d_db.ensemble_label = label;
+      d_db.country_ID = country_ID;
+      d_restored_ensemble = restored;
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("ensemble"));
+      entry = pmt::dict_add(entry, pmt::mp("label"), pmt::mp(label));
+      entry = pmt::dict_add(entry, pmt::mp("country_ID"), pmt::from_long(country_ID));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::update_ensemble_id(int ensemble_id, bool restored) {
+      if (d_db.ensemble_id >= 0) {
+        if (restored) {
+          return;
+        }
+        if (d_db.ensemble_id == ensemble_id) {
+          d_restored_ensemble_id = false;
+          return;
+        }
+        if (d_restored_ensemble_id) {
+          // the cached database belongs to another ensemble
+          GR_LOG_DEBUG(d_logger, "ensemble changed, dropping restored database");
+          drop_restored();
+        }
+      }
+      d_db.ensemble_id = ensemble_id;
+      d_restored_ensemble_id = restored;
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp("ensemble_id"));
+      entry = pmt::dict_add(entry, pmt::mp("EId"), pmt::from_long(ensemble_id));
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::publish_removal(const std::string &type, const std::string &key, int value) {
+      pmt::pmt_t entry = pmt::make_dict();
+      entry = pmt::dict_add(entry, pmt::mp("type"), pmt::mp(type));
+      entry = pmt::dict_add(entry, pmt::mp(key), pmt::from_long(value));
+      entry = pmt::dict_add(entry, pmt::mp("removed"), pmt::PMT_T);
+      publish_change(entry);
+    }
+
+    void
+    fib_sink_vb_impl::drop_restored() {
+      for (std::set<int>::const_iterator it = d_restored_subchs.begin(); it != d_restored_subchs.end(); ++it) {
+        d_db.subchs.erase(*it);
+        publish_removal("subchannel", "ID", *it);
+      }
+      for (std::set<int>::const_iterator it = d_restored_service_comps.begin();
+           it != d_restored_service_comps.end(); ++it) {
+        d_db.service_comps.erase(*it);
+        publish_removal("service", "ID", *it);
+      }
+      for (std::set<int>::const_iterator it = d_restored_service_labels.begin();
+           it != d_restored_service_labels.end(); ++it) {
+        d_db.service_labels.erase(*it);
+        publish_removal("label", "reference", *it);
+      }
+      for (std::set<int>::const_iterator it = d_restored_programme_types.begin();
+           it != d_restored_programme_types.end(); ++it) {
+        d_db.programme_types.erase(*it);
+        publish_removal("programme_type", "reference", *it);
+      }
+      if (d_restored_ensemble) {
+        publish_removal("ensemble", "country_ID", d_db.country_ID);
+        d_db.ensemble_label.clear();
+        d_db.country_ID = -1;
+      }
+      if (d_restored_ensemble_id) {
+        publish_removal("ensemble_id", "EId", d_db.ensemble_id);
+        d_db.ensemble_id = -1;
+      }
+      d_restored_subchs.clear();
+      d_restored_service_comps.clear();
+      d_restored_service_labels.clear();
+      d_restored_programme_types.clear();
+      d_restored_ensemble = false;
+      d_restored_ensemble_id = false;
+      d_restore_countdown = 0;
+    }
+
+    void
+    fib_sink_vb_impl::handle_restore(pmt::pmt_t msg) {
+      if (!pmt::is_dict(msg)) {
+        GR_LOG_WARN(d_logger, "restore: message is not a dictionary");
+        return;
+      }
+      pmt::pmt_t type = pmt::dict_ref(msg, pmt::mp("type"), pmt::PMT_NIL);
+      if (!pmt::is_symbol(type)) {
+        GR_LOG_WARN(d_logger, "restore: entry without type");
+        return;
+      }
+      std::string t = pmt::symbol_to_string(type);
+      try {
+        if (t == "subchannel") {
+          update_subch(pmt::to_long(pmt::dict_ref(msg, pmt::mp("ID"), pmt::PMT_NIL)),
+                       pmt::to_long(pmt::dict_ref(msg, pmt::mp("address"), pmt::PMT_NIL)),
+                       pmt::to_long(pmt::dict_ref(msg, pmt::mp("protection"), pmt::PMT_NIL)),
+                       pmt::to_long(pmt::dict_ref(msg, pmt::mp("size"), pmt::PMT_NIL)), true);
+        } else if (t == "service") {
+          update_service_comp(pmt::to_long(pmt::dict_ref(msg, pmt::mp("ID"), pmt::PMT_NIL)),
+                              pmt::to_long(pmt::dict_ref(msg, pmt::mp("reference"), pmt::PMT_NIL)),
+                              pmt::to_bool(pmt::dict_ref(msg, pmt::mp("primary"), pmt::PMT_NIL)),
+                              pmt::to_bool(pmt::dict_ref(msg, pmt::mp("DAB+"), pmt::PMT_NIL)), true);
+        } else if (t == "label") {
+          update_service_label(pmt::to_long(pmt::dict_ref(msg, pmt::mp("reference"), pmt::PMT_NIL)),
+                               pmt::symbol_to_string(pmt::dict_ref(msg, pmt::mp("label"), pmt::PMT_NIL)), true);
+        } else if (t == "programme_type") {
+          update_programme_type(pmt::to_long(pmt::dict_ref(msg, pmt::mp("reference"), pmt::PMT_NIL)),
+                                pmt::to_long(pmt::dict_ref(msg, pmt::mp("programme_type"), pmt::PMT_NIL)), true);
+        } else if (t == "ensemble") {
+          update_ensemble(pmt::symbol_to_string(pmt::dict_ref(msg, pmt::mp("label"), pmt::PMT_NIL)),
+                          pmt::to_long(pmt::dict_ref(msg, pmt::mp("country_ID"), pmt::PMT_NIL)), true);
+        } else if (t == "ensemble_id") {
+          update_ensemble_id(pmt::to_long(pmt::dict_ref(msg, pmt::mp("EId"), pmt::PMT_NIL)), true);
+        } else {
+          GR_LOG_WARN(d_logger, "restore: unknown entry type " + t);
+          return;
+        }
+      } catch (const std::exception &) {
+        GR_LOG_WARN(d_logger, "restore: invalid " + t + " entry");
+        return;
+      }
+      // restored entries have to be confirmed by the received FIGs within the validation window
+      d_restore_countdown = RESTORE_VALIDATION_FIBS;
+      publish_snapshot();
+    }
+
+    int
+    fib_sink_vb_impl::get_ensemble_id() {
+      return d_db_snapshot.read().ensemble_id;
+    }
+
+    /*! \brief Writes a string as JSON string literal, escaping quotes and backslashes. */
+    static void
+    write_json_string(std::stringstream &ss, const std::string &str) {
+      ss << "\"";
+      for (std::string::const_iterator c = str.begin(); c != str.end(); ++c) {
+        if (*c == '"' || *c == '\\') {
+          ss << '\\';
+        }
+        ss << *c;
+      }
+      ss << "\"";
+    }
+
+    std::string
+    fib_sink_vb_impl::get_ensemble_info() {
+      fic_database db = d_db_snapshot.read();
+      if (db.country_ID < 0) {
+        return "";
+      }
+      std::stringstream ss;
+      ss << "{";
+      write_json_string(ss, db.ensemble_label);
+      ss << ":{" << "\"country_ID\":" << db.country_ID << "}}";
+      return ss.str();
+    }
+
+    std::string
+    fib_sink_vb_impl::get_service_info() {
+      fic_database db = d_db_snapshot.read();
+      if (db.service_comps.empty()) {
+        return "";
+      }
+      std::stringstream ss;
+      for (std::map<int, service_comp_entry>::const_iterator it = db.service_comps.begin();
+           it != db.service_comps.end(); ++it) {
+        ss << ((it == db.service_comps.begin()) ? "[{" : ",{") << "\"reference\":"
+           << it->second.reference << ",\"ID\":"
+           << it->first << ",\"primary\":"
+           << (it->second.primary ? "true" : "false") << ",\"DAB+\":"
+           << (it->second.dabplus ? "true" : "false") << "}";
+      }
+      ss << "]";
+      return ss.str();
+    }
+
+    std::string
+    fib_sink_vb_impl::get_service_labels() {
+      fic_database db = d_db_snapshot.read();
+      if (db.service_labels.empty()) {
+        return "";
+      }
+      std::stringstream ss;
+      for (std::map<int, std::string>::const_iterator it = db.service_labels.begin();
+           it != db.service_labels.end(); ++it) {
+        ss << ((it == db.service_labels.begin()) ? "[{" : ",{") << "\"label\":";
+        write_json_string(ss, it->second);
+        ss << ",\"reference\":" << it->first << "}";
+      }
+      ss << "]";
+      return ss.str();
+    }
+
+    std::string
+    fib_sink_vb_impl::get_subch_info() {
+      fic_database db = d_db_snapshot.read();
+      if (db.subchs.empty()) {
+        return "";
+      }
+      std::stringstream ss;
+      for (std::map<int, subch_entry>::const_iterator it = db.subchs.begin();
+           it != db.subchs.end(); ++it) {
+        ss << ((it == db.subchs.begin()) ? "[{" : ",{") << "\"ID\":"
+           << it->first << ",\"address\":"
+           << it->second.address << ",\"protection\":"
+           << it->second.protection << ",\"size\":"
+           << it->second.size << "}";
+      }
+      ss << "]";
+      return ss.str();
+    }
+
+    std::string
+    fib_sink_vb_impl::get_programme_type() {
+      fic_database db = d_db_snapshot.read();
+      if (db.programme_types.empty()) {
+        return "";
+      }
+      std::stringstream ss;
+      for (std::map<int, int>::const_iterator it = db.programme_types.begin();
+           it != db.programme_types.end(); ++it) {
+        ss << ((it == db.programme_types.begin()) ? "[{" : ",{") << "\"reference\":"
+           << it->first << ",\"programme_type\":"
+           << it->second << "}";
+      }
+      ss << "]";
+      return ss.str();
+    }
+
     int
     fib_sink_vb_impl::work(int noutput_items,
                            gr_vector_const_void_star &input_items,
@@ -427,9 +734,11 @@ namespace gr {
       const char *in = (const char *) input_items[0];
 
       for (int i = 0; i < noutput_items; i++) {
+        d_fib_index = nitems_read(0) + i;
         process_fib(in);
         in += 32;
       }
+      publish_snapshot();
 
 
       return noutput_items;
@@ -22,13 +22,22 @@
 #define INCLUDED_DAB_FIB_SINK_VB_IMPL_H
 
 #include <gnuradio/dab/fib_sink_vb.h>
+#include <gnuradio/dab/crc16.h>
+#include <atomic>
+#include <map>
+#include <set>
+#include <string>
+#include "double_buffer.h"
 
 namespace gr {
   namespace dab {
 /*! \brief sink for DAB/DAB+ FIBs, interprets MSC and SI
  * CRC16 check of incoming fibs.
  * Reads correct fibs.
- * Generates json objects with service and multiplex information.
+ * Keeps a database with service and multiplex information, keyed by SubChId
+ * and service reference, and publishes every changed entry as PMT dictionary.
+ * Generates json objects with service and multiplex information on request,
+ * from a snapshot of the database that is published lock-free after each work call.
  */
     class fib_sink_vb_impl : public fib_sink_vb {
 
@@ -50,40 +59,91 @@ namespace gr {
        */
       void process_fig(uint8_t type, const char *data, uint8_t length);
 
-      bool d_crc_passed;
-
-      std::string d_json_ensemble_info;
-      // service info
-      std::string d_json_service_info;
-      std::string d_service_info_current;
-      int d_service_info_written_trigger;
-      // service labels
-      std::string d_json_service_labels;
-      std::string d_service_labels_current;
-      int d_service_labels_written_trigger;
-      // service subch
-      std::string d_json_subch_info;
-      std::string d_subch_info_current;
-      int d_subch_info_written_trigger;
-      // programme type
-      std::string d_json_programme_type;
-      std::string d_programme_type_current;
-      int d_programme_type_written_trigger;
+      /*! \brief Increments the database version and publishes a changed entry.
+       * @param entry PMT dictionary describing the changed entry.
+       */
+      void publish_change(pmt::pmt_t entry);
+      /*! \brief Publishes the database snapshot for the getters, if it changed. */
+      void publish_snapshot();
+      /*! \brief Updates one entry of the database and publishes it, if it changed.
+       * Restored entries (from a cache) never overwrite existing entries and
+       * are dropped again, if they are not confirmed by a received FIG.
+       */
+      void update_subch(int subch_id, int address, int protection, int size, bool restored = false);
+      void update_service_comp(int subch_id, int reference, bool primary, bool dabplus, bool restored = false);
+      void update_service_label(int reference, const std::string &label, bool restored = false);
+      void update_programme_type(int reference, int programme_type, bool restored = false);
+      void update_ensemble(const std::string &label, int country_ID, bool restored = false);
+      void update_ensemble_id(int ensemble_id, bool restored = false);
+      void publish_removal(const std::string &type, const std::string &key, int value);
+      /*! \brief Removes all restored entries that were not confirmed by a received FIG. */
+      void drop_restored();
+      /*! \brief Message handler of the "restore" port.
+       * @param msg PMT dictionary in the format of the "fic_db" messages.
+       */
+      void handle_restore(pmt::pmt_t msg);
+
+      struct subch_entry {
+        int address;
+        int protection;
+        int size;
+      };
+      struct service_comp_entry {
+        int reference;
+        bool primary;
+        bool dabplus;
+      };
+      struct fic_database {
+        fic_database() : version(0), ensemble_id(-1), country_ID(-1) {}
+        uint64_t version; /*!< incremented on every change of the database */
+        int ensemble_id; /*!< EId, -1 until the ensemble information has been received */
+        std::string ensemble_label;
+        int country_ID; /*!< -1 until the ensemble label has been received */
+        std::map<int, subch_entry> subchs; /*!< keyed by SubChId */
+        std::map<int, service_comp_entry> service_comps; /*!< keyed by SubChId */
+        std::map<int, std::string> service_labels; /*!< keyed by service reference */
+        std::map<int, int> programme_types; /*!< keyed by service reference */
+      };
+
+      crc16 d_crc; /*!< CRC16 of the FIBs */
+      std::atomic<bool> d_crc_passed;
+
+      fic_database d_db; /*!< only accessed by the scheduler thread */
+      bool d_db_dirty; /*!< d_db changed since the last published snapshot */
+      double_buffer<fic_database> d_db_snapshot; /*!< snapshot of d_db for the getters */
+      std::atomic<uint64_t> d_snapshot_version; /*!< version of the published snapshot */
+      // keys of restored entries that were not yet confirmed by a received FIG
+      std::set<int> d_restored_subchs;
+      std::set<int> d_restored_service_comps;
+      std::set<int> d_restored_service_labels;
+      std::set<int> d_restored_programme_types;
+      bool d_restored_ensemble;
+      bool d_restored_ensemble_id;
+      int d_restore_countdown; /*!< number of correct FIBs until unconfirmed entries are dropped */
+      static const int RESTORE_VALIDATION_FIBS = 1250; /*!< 10 seconds of FIBs */
+      const pmt::pmt_t d_port;
+      const pmt::pmt_t d_cif_port;
+      int d_fibs_per_cif;
+      uint64_t d_fib_index; /*!< index of the FIB in process since the start of the stream */
 
     public:
-      fib_sink_vb_impl();
+      fib_sink_vb_impl(int fibs_per_cif);
+
+      virtual std::string get_ensemble_info();
+
+      virtual std::string get_service_info();
 
-      virtual std::string get_ensemble_info() { return d_json_ensemble_info; }
+      virtual std::string get_service_labels();
 
-      virtual std::string get_service_info() { return d_json_service_info; }
+      virtual std::string get_subch_info();
 
-      virtual std::string get_service_labels() { return d_json_service_labels; }
+      virtual std::string get_programme_type();
 
-      virtual std::string get_subch_info() { return d_json_subch_info; }
+      virtual bool get_crc_passed() { return d_crc_passed.load(); }
 
-      virtual std::string get_programme_type() { return d_json_programme_type; }
+      virtual uint64_t get_version() { return d_snapshot_version.load(); }
 
-      virtual bool get_crc_passed() { return d_crc_passed; }
+      virtual int get_ensemble_id();
 
       int work(int noutput_items,
                gr_vector_const_void_star &input_items,
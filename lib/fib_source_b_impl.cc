@@ -26,6 +26,7 @@
 #include "fib_source_b_impl.h"
 #include "FIC.h"
 #include <stdexcept>
+#include <algorithm>
 #include <stdio.h>
 #include <sstream>
 #include <boost/format.hpp>
@@ -43,6 +44,7 @@ namespace gr {
                                                              0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
                                                              0, 0, 0, 0, 0, 0, 0, 0};
         // 000 00110 000 00000 0100000000000000 00 0 0000000000000 00000000
+        // the CIF counter (5 bits mod 20, 8 bits mod 250) is followed by the occurrence change
 
         //service orga header
         const char fib_source_b_impl::d_service_orga_header[16] = {0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0};
@@ -134,10 +136,11 @@ namespace gr {
                   d_data_rate_n(data_rate_n), d_dabplus(dabplus),
                   d_country_ID(country_ID) {
           if (d_transmission_mode != 3) {
-            set_output_multiple((8 * FIB_LENGTH) * 3);
+            d_fibs_per_row = 3;
           } else {
-            set_output_multiple((8 * FIB_LENGTH) * 4);
+            d_fibs_per_row = 4;
           }
+          set_output_multiple((8 * FIB_LENGTH) * d_fibs_per_row);
           //write the ensemble label with input string once at beginning
           write_label(d_ensemble_label + 32, ensemble_label);
           if (protection_mode.size() != num_subch) {
@@ -161,6 +164,7 @@ namespace gr {
                                          programme_service_labels.size() %
                                          num_subch % (16 * num_subch)).str());
           }
+          build_carousel();
         }
 
         /*
@@ -187,16 +191,27 @@ namespace gr {
         }
 
         /*
-         * Calculates the CIF modulo counters and changes the bits in
-         * d_ensemble_info with bit_adaption.
+         * Writes num_bits bits of value to out_ptr, MSB first.
          */
-        void fib_source_b_impl::CIF_counter(char *out_ptr, int counter) {
-          // mod 250 counter
-          int mod_250 = counter % 250;
-          bit_adaption(out_ptr, mod_250, 8);
-          // mod 20 counter
-          int mod_20 = ((counter - mod_250) / 250) % 20;
-          bit_adaption(out_ptr - 8, mod_20, 5);
+        void fib_source_b_impl::write_bits(char *out_ptr, uint16_t value,
+                                           int num_bits) {
+          for (int i = 0; i < num_bits; i++) {
+            out_ptr[i] = (value >> (num_bits - 1 - i)) & 1;
+          }
+        }
+
+        /*
+         * Packs the data field of the FIB and calculates its CRC16.
+         */
+        uint16_t fib_source_b_impl::fib_crc(const char *fib) const {
+          uint8_t packed[FIB_DATA_FIELD_LENGTH];
+          for (int i = 0; i < FIB_DATA_FIELD_LENGTH; i++) {
+            packed[i] = 0;
+            for (int j = 0; j < 8; j++) {
+              packed[i] = (packed[i] << 1) | (fib[8 * i + j] & 1);
+            }
+          }
+          return d_crc.compute(packed, FIB_DATA_FIELD_LENGTH);
         }
 
         /*
@@ -216,11 +231,62 @@ namespace gr {
           return 8 * num_chars;
         }
 
-        int
-        fib_source_b_impl::work(int noutput_items,
-                                gr_vector_const_void_star &input_items,
-                                gr_vector_void_star &output_items) {
-          char *out = (char *) output_items[0];
+        /*
+         * Assembles all rows of FIBs until the service labels repeat.
+         * The CRC16 of all FIBs is calculated here, apart from the first
+         * FIB of each row, which carries the CIF counter. For this FIB,
+         * the CRC16 is tabulated for all values of the mod 250 counter
+         * and the contribution of all values of the mod 20 counter.
+         * The CRC16 is affine in the message bits, therefore the CRC16
+         * of any CIF counter is the XOR of these two table entries.
+         */
+        void fib_source_b_impl::build_carousel() {
+          // Each row holds one FIB with labels per FIB after the two MCI FIBs.
+          int labels_per_row = d_fibs_per_row - 2;
+          int num_labels = d_num_subch + 1;
+          int gcd = labels_per_row;
+          int b = num_labels;
+          while (b != 0) {
+            int t = gcd % b;
+            gcd = b;
+            b = t;
+          }
+          d_num_rows = num_labels / gcd;
+
+          int row_length = d_fibs_per_row * (8 * FIB_LENGTH);
+          d_carousel.assign(d_num_rows * row_length, 0);
+          /* The MCI of more than 4 services (7 subchannels) does not fit in
+           * one FIB and write_row() writes beyond the row. */
+          std::vector<char> row_buffer((d_fibs_per_row + 2 + d_num_subch) * (8 * FIB_LENGTH));
+          d_nFIBs_written = 0;
+          d_label_counter = 0;
+          for (int row = 0; row < d_num_rows; row++) {
+            char *out = &d_carousel[row * row_length];
+            std::fill(row_buffer.begin(), row_buffer.end(), 0);
+            write_row(&row_buffer[0]);
+            std::memcpy(out, &row_buffer[0], row_length);
+            for (int fib = 1; fib < d_fibs_per_row; fib++) {
+              char *fib_ptr = out + fib * (8 * FIB_LENGTH);
+              write_bits(fib_ptr + 8 * FIB_DATA_FIELD_LENGTH, fib_crc(fib_ptr), 16);
+            }
+          }
+
+          // CRC16 tables of the first FIB in row (MCI), which is equal in all rows.
+          std::vector<char> fib(d_carousel.begin(), d_carousel.begin() + 8 * FIB_LENGTH);
+          for (int mod_250 = 0; mod_250 < 250; mod_250++) {
+            write_bits(&fib[d_size_ensemble_info - 16], mod_250, 8);
+            d_crc_mod250[mod_250] = fib_crc(&fib[0]);
+          }
+          write_bits(&fib[d_size_ensemble_info - 16], 0, 8);
+          for (int mod_20 = 0; mod_20 < 20; mod_20++) {
+            write_bits(&fib[d_size_ensemble_info - 21], mod_20, 5);
+            d_crc_mod20[mod_20] = fib_crc(&fib[0]) ^ d_crc_mod250[0];
+          }
+          d_row = 0;
+          d_cif_count = 0;
+        }
+
+        void fib_source_b_impl::write_row(char *out) {
           d_offset = 0;
 
           do {
@@ -235,12 +301,7 @@ namespace gr {
               //ensemble info
               std::memcpy(out + d_offset, d_ensemble_info, d_size_ensemble_info);
               d_offset += d_size_ensemble_info;
-              // Increase CIF counter.
-              if (d_transmission_mode != 3) {
-                CIF_counter(out + d_offset, d_nFIBs_written / 3);
-              } else {
-                CIF_counter(out + d_offset, d_nFIBs_written / 4);
-              }
+              // The CIF counter is written in work().
               // service orga
               // header
               std::memcpy(out + d_offset, d_service_orga_header, d_size_service_orga_header);
@@ -394,14 +455,36 @@ namespace gr {
           } while ((d_nFIBs_written % 3 != 0 && d_transmission_mode != 3) ||
                    (d_nFIBs_written % 4 != 0 && d_transmission_mode == 3));
           // Finished writing a row of FIBs (3 or 4) (number of FIBS for 1 Transmission Frame).
+        }
 
-          // Tell runtime system how many output items we produced.
-          if (d_transmission_mode != 3) {
-            return 3 * (8 * FIB_LENGTH);
-          }
-          else {
-            return 4 * (8 * FIB_LENGTH);
+        int
+        fib_source_b_impl::work(int noutput_items,
+                                gr_vector_const_void_star &input_items,
+                                gr_vector_void_star &output_items) {
+          char *out = (char *) output_items[0];
+          const int row_length = d_fibs_per_row * (8 * FIB_LENGTH);
+          const int num_rows = noutput_items / row_length;
+
+          for (int n = 0; n < num_rows; n++) {
+            std::memcpy(out, &d_carousel[d_row * row_length], row_length);
+            // patch CIF counter and CRC16 of the first FIB in row
+            int mod_250 = d_cif_count % 250;
+            int mod_20 = d_cif_count / 250;
+            write_bits(out + d_size_ensemble_info - 16, mod_250, 8);
+            write_bits(out + d_size_ensemble_info - 21, mod_20, 5);
+            write_bits(out + 8 * FIB_DATA_FIELD_LENGTH, d_crc_mod250[mod_250] ^ d_crc_mod20[mod_20], 16);
+
+            if (++d_row == d_num_rows) {
+              d_row = 0;
+            }
+            if (++d_cif_count == 5000) {
+              d_cif_count = 0;
+            }
+            out += row_length;
           }
+
+          // Tell runtime system how many output items we produced.
+          return num_rows * row_length;
         }
 
     } /* namespace dab */
@@ -22,15 +22,20 @@
 #define INCLUDED_DAB_FIB_SOURCE_B_IMPL_H
 
 #include <gnuradio/dab/fib_source_b.h>
+#include <gnuradio/dab/crc16.h>
 
 namespace gr {
   namespace dab {
 /*! \brief source that produces Fast Information Blocks (FIBs) according to the DAB standard ETSI EN 300 401
  *
- * output: unpacked byte stream with FIBs (each 256 bit) and zeros at last 16 bits for following CRC16
+ * output: unpacked byte stream with FIBs (each 256 bit) including their CRC16 in the last 16 bits
  *
  * produces Fast Information Blocks (FIBs) according to the DAB standard and the input parameters
  *
+ * All FIBs are assembled once into a carousel, that holds the rows of FIBs of one period of the
+ * service labels. work() replays the carousel and only patches the CIF counter in the first FIB
+ * of each row. The CRC16 of this FIB is updated with precomputed CRC words of the counter values.
+ *
  * @param transmission_mode transmission mode
  * @param num_subch number of subchannels to be transmitted, each in a speparated service
  * @param ensemble_label string label of the DAB ensemble (max 16 characters)
@@ -55,8 +60,6 @@ namespace gr {
       const static char d_ensemble_info[56]; //CIF counter changes every FIB
       const static int d_size_ensemble_info = 56;
 
-      void CIF_counter(char *out_ptr,
-                       int counter);//implementation of the mod 20 and mod 250 counter
       const static char d_service_orga_header[16]; //*const
       const static int d_size_service_orga_header = 16;
       const static char d_service_orga[40]; //*services
@@ -84,6 +87,34 @@ namespace gr {
        */
       int write_label(char *out_ptr, std::string label, int num_chars = 16); //default for 16 characters (16 byte)
 
+      //FIB carousel
+      int d_fibs_per_row; /*!< number of FIBs per transmission frame (3 or 4 FIBs) */
+      int d_num_rows; /*!< number of rows in the carousel until the labels repeat */
+      int d_row; /*!< next row of the carousel to write */
+      int d_cif_count; /*!< CIF counter of the next row (0 ... 4999) */
+      std::vector<char> d_carousel; /*!< all rows of FIBs with CRC16, unpacked */
+      uint16_t d_crc_mod250[250]; /*!< CRC16 of the first FIB in row for each mod 250 counter value */
+      uint16_t d_crc_mod20[20]; /*!< CRC16 contribution of each mod 20 counter value */
+      crc16 d_crc; /*!< CRC16 of the FIBs */
+
+      /*! \brief Assembles all rows of the carousel and calculates their CRC16.
+       * Has to be called again if the configuration changes.
+       */
+      void build_carousel();
+
+      /*! \brief Assembles the next row of FIBs (without CIF counter and CRC16) and writes it to out_ptr.
+       */
+      void write_row(char *out_ptr);
+
+      /*! \brief Calculates the CRC16 of an unpacked FIB.
+       * @param fib Pointer to unpacked FIB (256 bits), the last 16 bits (CRC field) are ignored.
+       */
+      uint16_t fib_crc(const char *fib) const;
+
+      /*! \brief Writes num_bits bits of value (MSB first) to out_ptr.
+       */
+      static void write_bits(char *out_ptr, uint16_t value, int num_bits);
+
     public:
       fib_source_b_impl(int transmission_mode, int coutry_ID,
                         int num_subch, std::string ensemble_label,
@@ -32,6 +32,7 @@
 #include <stdexcept>
 #include <sstream>
 #include <boost/format.hpp>
+#include <algorithm>
 
 using namespace boost;
 
@@ -49,9 +50,26 @@ namespace gr {
     firecode_check_bb_impl::firecode_check_bb_impl(int bit_rate_n)
             : gr::block("firecode_check_bb",
                         gr::io_signature::make(1, 1, sizeof(unsigned char)),
-                        gr::io_signature::make(1, 1, sizeof(unsigned char))) {
+                        gr::io_signature::make(1, 1, sizeof(unsigned char))),
+              d_locked(false),
+              d_fails(0),
+              d_predict_fails(0),
+              d_cif_phase(0),
+              d_have_cif(false),
+              d_cif_index(0),
+              d_cif_count(0),
+              d_have_tag(false),
+              d_tag_cif(0),
+              d_tag_frame(0),
+              d_cif_port(pmt::mp("cif_count")),
+              d_cif_start_key(pmt::mp("cif_start")) {
       d_frame_size = 24 * bit_rate_n;
+      d_firecode_passed = false;
       set_output_multiple(d_frame_size * 5); //logical frame
+      // the tags of the passed superframes are forwarded in general_work
+      set_tag_propagation_policy(TPP_DONT);
+      message_port_register_in(d_cif_port);
+      set_msg_handler(d_cif_port, [this](pmt::pmt_t msg) { this->handle_cif_count(msg); });
     }
 
     /*
@@ -60,6 +78,31 @@ namespace gr {
     firecode_check_bb_impl::~firecode_check_bb_impl() {
     }
 
+    void
+    firecode_check_bb_impl::handle_cif_count(pmt::pmt_t msg) {
+      if (!pmt::is_dict(msg)) {
+        return;
+      }
+      pmt::pmt_t cif = pmt::dict_ref(msg, pmt::mp("cif"), pmt::PMT_NIL);
+      pmt::pmt_t cif_count = pmt::dict_ref(msg, pmt::mp("cif_count"), pmt::PMT_NIL);
+      if (!pmt::is_integer(cif_count) || !(pmt::is_uint64(cif) || pmt::is_integer(cif))) {
+        return;
+      }
+      d_cif_index = pmt::is_uint64(cif) ? pmt::to_uint64(cif) : (uint64_t) pmt::to_long(cif);
+      d_cif_count = (int) pmt::to_long(cif_count);
+      d_have_cif = true;
+    }
+
+    int
+    firecode_check_bb_impl::cif_phase(uint64_t frame) {
+      if (!d_have_cif || !d_have_tag) {
+        return -1;
+      }
+      // the CIF counter wraps at 5000, a multiple of 5
+      int64_t cif = (int64_t) (d_tag_cif - d_tag_frame + frame) - (int64_t) d_cif_index;
+      return (int) (((d_cif_count + cif) % 5 + 5) % 5);
+    }
+
     void
     firecode_check_bb_impl::forecast(int noutput_items, gr_vector_int &ninput_items_required) {
       ninput_items_required[0] = noutput_items;
@@ -72,22 +115,78 @@ namespace gr {
                                          gr_vector_void_star &output_items) {
       const unsigned char *in = (const unsigned char *) input_items[0];
       unsigned char *out = (unsigned char *) output_items[0];
+      const int ninput_frames = ninput_items[0] / d_frame_size;
+      const int noutput_frames = noutput_items / d_frame_size;
+      // only whole logical frames are consumed
+      const uint64_t first_frame = nitems_read(0) / d_frame_size;
       d_nproduced = 0;
       d_nconsumed = 0;
 
-      while (d_nconsumed < noutput_items / d_frame_size - 4) {
+      std::vector<gr::tag_t> tags;
+      get_tags_in_range(tags, 0, nitems_read(0), nitems_read(0) + ninput_frames * d_frame_size, d_cif_start_key);
+      std::sort(tags.begin(), tags.end(), gr::tag_t::offset_compare);
+      size_t next_tag = 0;
+      std::vector<gr::tag_t> superframe_tags;
+
+      while (d_nconsumed + 5 <= ninput_frames && d_nproduced + 5 <= noutput_frames) {
+        const uint64_t frame = first_frame + d_nconsumed;
+        // the CIF index of the last tag up to this logical frame
+        while (next_tag < tags.size() &&
+               (tags[next_tag].offset + d_frame_size / 2) / d_frame_size <= frame) {
+          if (pmt::is_uint64(tags[next_tag].value)) {
+            d_tag_cif = pmt::to_uint64(tags[next_tag].value);
+            d_tag_frame = (tags[next_tag].offset + d_frame_size / 2) / d_frame_size;
+            d_have_tag = true;
+          }
+          next_tag++;
+        }
+        const int phase = cif_phase(frame);
+        if (!d_locked && phase >= 0 && d_predict_fails < d_max_fails && phase != d_cif_phase) {
+          // skip to the predicted superframe start
+          d_nconsumed += (d_cif_phase - phase + 5) % 5;
+          continue;
+        }
+
         if (fc.check(&in[d_nconsumed * d_frame_size])) {
-          // fire code OK, copy superframe to output
-          memcpy(out + d_nproduced * d_frame_size, in + d_nconsumed * d_frame_size, d_frame_size * 5);
-          d_nproduced += 5;
-          d_nconsumed += 5;
+          if (!d_locked) {
+            GR_LOG_DEBUG(d_logger, format("locked to superframes at frame %d") % frame);
+          }
+          d_locked = true;
+          d_fails = 0;
+          d_predict_fails = 0;
+          if (phase >= 0) {
+            d_cif_phase = phase;
+          }
           d_firecode_passed = true;
         } else {
-          GR_LOG_DEBUG(d_logger, format("fire code failed at frame %d") % (nitems_read(0) / d_frame_size));
-          // shift of one logical frame
-          d_nconsumed++;
+          GR_LOG_DEBUG(d_logger, format("fire code failed at frame %d") % frame);
           d_firecode_passed = false;
+          if (!d_locked) {
+            if (phase >= 0 && d_predict_fails < d_max_fails) {
+              d_predict_fails++;
+            }
+            // shift of one logical frame
+            d_nconsumed++;
+            continue;
+          }
+          if (++d_fails == d_max_fails) {
+            // lost the superframe synchronization, search again
+            d_locked = false;
+            d_fails = 0;
+            d_nconsumed++;
+            continue;
+          }
+        }
+        // copy superframe to output (flywheel, if the firecode failed)
+        memcpy(out + d_nproduced * d_frame_size, in + d_nconsumed * d_frame_size, d_frame_size * 5);
+        const uint64_t superframe_start = nitems_read(0) + d_nconsumed * d_frame_size;
+        get_tags_in_range(superframe_tags, 0, superframe_start, superframe_start + 5 * d_frame_size);
+        for (const gr::tag_t &tag : superframe_tags) {
+          add_item_tag(0, nitems_written(0) + d_nproduced * d_frame_size + (tag.offset - superframe_start),
+                       tag.key, tag.value, tag.srcid);
         }
+        d_nproduced += 5;
+        d_nconsumed += 5;
       }
       // Tell runtime system how many input items we consumed on
       // each input stream.
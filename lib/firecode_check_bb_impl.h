@@ -24,6 +24,7 @@
 
 #include <gnuradio/dab/firecode_check_bb.h>
 #include "firecode-checker.h"
+#include <atomic>
 
 namespace gr {
   namespace dab {
@@ -37,15 +38,36 @@ namespace gr {
       int d_bit_rate_n; /*!< Byte rate. */
       int d_frame_size; /*!< Size in bytes of one transmission frame (depending on bit_rate_n).*/
       int d_nproduced, d_nconsumed; /*!< Control variable for buffer read/write operations. */
-      bool d_firecode_passed; /*!< Boolean variable for displaying firecode fails. */
+      std::atomic<bool> d_firecode_passed; /*!< Boolean variable for displaying firecode fails. */
       firecode_checker fc; /*!< Instance of the class firecode_checker. */
+      const static int d_max_fails = 3; /*!< Consecutive firecode fails until the lock or the prediction is dropped. */
+      bool d_locked; /*!< Synchronized to the superframes, d_nconsumed points to a superframe start. */
+      int d_fails; /*!< Consecutive firecode fails while locked. */
+      int d_predict_fails; /*!< Consecutive firecode fails at predicted superframe starts. */
+      int d_cif_phase; /*!< CIF counter modulo 5 of the superframe starts. */
+      bool d_have_cif; /*!< A CIF counter was received on the message port. */
+      uint64_t d_cif_index; /*!< Index of the CIF (since stream start) of the last received CIF counter. */
+      int d_cif_count; /*!< Last received CIF counter. */
+      bool d_have_tag; /*!< A "cif_start" tag was received. */
+      uint64_t d_tag_cif; /*!< Index of the CIF of the last "cif_start" tag. */
+      uint64_t d_tag_frame; /*!< Logical frame (since stream start) of the last "cif_start" tag. */
+      const pmt::pmt_t d_cif_port;
+      const pmt::pmt_t d_cif_start_key;
+
+      void handle_cif_count(pmt::pmt_t msg);
+
+      /*! \brief Phase of the CIF counter of a logical frame
+       * @param frame logical frame since stream start
+       * @return CIF counter modulo 5 or -1 if unknown
+       */
+      int cif_phase(uint64_t frame);
 
     public:
       firecode_check_bb_impl(int bit_rate_n);
 
       ~firecode_check_bb_impl();
 
-      virtual bool get_firecode_passed() { return d_firecode_passed; }
+      virtual bool get_firecode_passed() { return d_firecode_passed.load(); }
 
       // Where all the action really happens
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
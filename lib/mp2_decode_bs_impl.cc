@@ -43,6 +43,13 @@
 #include <gnuradio/io_signature.h>
 #include "mp2_decode_bs_impl.h"
 
+#ifdef __SSE2__
+#include <emmintrin.h>
+#endif
+#ifdef __SSE4_1__
+#include <smmintrin.h>
+#endif
+
 using namespace boost;
 
 namespace gr {
@@ -250,6 +257,16 @@ namespace gr {
                               cos(((16 + i) * ((j << 1) + 1)) *
                                   0.0490873852123405));
 
+      // N[i][j] rearranged: each 8 values are the columns j, j + 1 of 4 rows
+      for (i = 0; i < 64; i++)
+        for (j = 0; j < 32; ++j)
+          d_N_pairs[i >> 2][j >> 1][((i & 3) << 1) | (j & 1)] = d_N[i][j];
+
+      // resolve the scale factors
+      for (i = 0; i < 63; i++)
+        d_scf_value[i] = (scf_base[i % 3] + ((1 << (i / 3)) >> 1)) >> (i / 3);
+      d_scf_value[63] = 0;
+
       // perform local initialization:
       for (i = 0; i < 2; ++i)
         for (j = 1023; j >= 0; j--)
@@ -257,6 +274,7 @@ namespace gr {
 
       d_V_offs = 0;
       d_baud_rate = 48000;  // default for DAB
+      d_sample_rate = 0;
       d_mp2_framesize = 24 * d_bit_rate;  // framesize in unpacked bits!!!
       d_mp2_frame = new uint8_t[2 * d_mp2_framesize];
       d_mp2_header_OK = 0;
@@ -310,7 +328,7 @@ namespace gr {
 
     void mp2_decode_bs_impl::read_samples(struct quantizer_spec *q, int scalefactor, int *sample) {
       int idx, adj, scale;
-      register int val;
+      int val;
 
       if (!q) {
         // no bits allocated for this subband
@@ -319,12 +337,7 @@ namespace gr {
       }
 
       // resolve scalefactor
-      if (scalefactor == 63) {
-        scalefactor = 0;
-      } else {
-        adj = scalefactor / 3;
-        scalefactor = (scf_base[scalefactor % 3] + ((1 << adj) >> 1)) >> adj;
-      }
+      scalefactor = d_scf_value[scalefactor];
 
       // decode samples
       adj = q->nlevels;
@@ -368,6 +381,140 @@ namespace gr {
       return result;
     }
 
+#ifdef __SSE2__
+    // low 32 bits of the products of 4 int32 (like the scalar code)
+    static inline __m128i mullo_epi32(__m128i a, __m128i b) {
+#ifdef __SSE4_1__
+      return _mm_mullo_epi32(a, b);
+#else
+      const __m128i even = _mm_mul_epu32(a, b);
+      const __m128i odd = _mm_mul_epu32(_mm_srli_epi64(a, 32), _mm_srli_epi64(b, 32));
+      return _mm_unpacklo_epi32(_mm_shuffle_epi32(even, _MM_SHUFFLE(0, 0, 2, 0)),
+                                _mm_shuffle_epi32(odd, _MM_SHUFFLE(0, 0, 2, 0)));
+#endif
+    }
+
+    // sign extension of 8 int16 to 2 x 4 int32
+    static inline void widen_epi16(__m128i x, __m128i &lo, __m128i &hi) {
+      lo = _mm_srai_epi32(_mm_unpacklo_epi16(x, x), 16);
+      hi = _mm_srai_epi32(_mm_unpackhi_epi16(x, x), 16);
+    }
+#endif
+
+    void mp2_decode_bs_impl::synthesis(int idx, int16_t *pcm) {
+      int32_t ch, i, j;
+
+      // shifting step
+      const int32_t offs = d_V_offs = (d_V_offs - 64) & 1023;
+
+#ifdef __SSE2__
+      // matrixing, both channels with the same rows of N
+      // The samples have up to 19 bits, so each is split into 9 low bits and the high bits
+      // for 16 bit multiplications. The sums are exactly the ones of the scalar code.
+      __m128i samples_lo[2][16], samples_hi[2][16];
+      for (ch = 0; ch < 2; ++ch) {
+        for (j = 0; j < 16; ++j) {
+          const int32_t s0 = d_sample[ch][2 * j][idx];
+          const int32_t s1 = d_sample[ch][2 * j + 1][idx];
+          samples_lo[ch][j] = _mm_set1_epi32((int32_t) (((uint32_t) (s1 & 511) << 16) | (uint32_t) (s0 & 511)));
+          samples_hi[ch][j] = _mm_set1_epi32((int32_t) (((uint32_t) (s1 >> 9) << 16) | ((uint32_t) (s0 >> 9) & 0xffff)));
+        }
+      }
+      const __m128i round_matrixing = _mm_set1_epi32(8192);
+      for (i = 0; i < 16; i += 2) {
+        __m128i v[2][2];
+        for (int g = 0; g < 2; ++g) {
+          __m128i sum_lo[2] = {_mm_setzero_si128(), _mm_setzero_si128()};
+          __m128i sum_hi[2] = {_mm_setzero_si128(), _mm_setzero_si128()};
+          for (j = 0; j < 16; ++j) {
+            const __m128i n = _mm_loadu_si128((const __m128i *) d_N_pairs[i + g][j]);
+            for (ch = 0; ch < 2; ++ch) {
+              sum_lo[ch] = _mm_add_epi32(sum_lo[ch], _mm_madd_epi16(n, samples_lo[ch][j]));
+              sum_hi[ch] = _mm_add_epi32(sum_hi[ch], _mm_madd_epi16(n, samples_hi[ch][j]));
+            }
+          }
+          for (ch = 0; ch < 2; ++ch) {
+            const __m128i s = _mm_add_epi32(_mm_slli_epi32(sum_hi[ch], 9), sum_lo[ch]);
+            // clamp to 14b, the int16 conversion keeps the low 16 bits
+            v[ch][g] = _mm_srai_epi32(_mm_slli_epi32(_mm_srai_epi32(_mm_add_epi32(s, round_matrixing), 14), 16), 16);
+          }
+        }
+        for (ch = 0; ch < 2; ++ch)
+          _mm_storeu_si128((__m128i *) &d_V[ch][offs + (i << 2)], _mm_packs_epi32(v[ch][0], v[ch][1]));
+      }
+
+      // windowing of U (the 16 segments of 32 values of V) and summation, 8 output samples at a time
+      const __m128i round_window = _mm_set1_epi32(32);
+      const __m128i round_output = _mm_set1_epi32(8);
+      for (j = 0; j < 32; j += 8) {
+        __m128i out[2];
+        for (ch = 0; ch < 2; ++ch) {
+          __m128i acc_lo = _mm_setzero_si128(), acc_hi = _mm_setzero_si128();
+          for (i = 0; i < 16; ++i) {
+            // U[(i << 5) + j] is V[offs + (i / 2) * 128 + (i odd ? 96 : 0) + j]
+            const int16_t *u = &d_V[ch][(offs + ((i >> 1) << 7) + ((i & 1) ? 96 : 0) + j) & 1023];
+            const int *d = &D[(i << 5) + j];
+            __m128i u_lo, u_hi;
+            widen_epi16(_mm_loadu_si128((const __m128i *) u), u_lo, u_hi);
+            u_lo = mullo_epi32(u_lo, _mm_loadu_si128((const __m128i *) d));
+            u_hi = mullo_epi32(u_hi, _mm_loadu_si128((const __m128i *) (d + 4)));
+            acc_lo = _mm_add_epi32(acc_lo, _mm_srai_epi32(_mm_add_epi32(u_lo, round_window), 6));
+            acc_hi = _mm_add_epi32(acc_hi, _mm_srai_epi32(_mm_add_epi32(u_hi, round_window), 6));
+          }
+          // sum = (-acc + 8) >> 4, saturated to 16 bits
+          acc_lo = _mm_srai_epi32(_mm_sub_epi32(round_output, acc_lo), 4);
+          acc_hi = _mm_srai_epi32(_mm_sub_epi32(round_output, acc_hi), 4);
+          out[ch] = _mm_packs_epi32(acc_lo, acc_hi);
+        }
+        // interleave the channels
+        _mm_storeu_si128((__m128i *) &pcm[j << 1], _mm_unpacklo_epi16(out[0], out[1]));
+        _mm_storeu_si128((__m128i *) &pcm[(j << 1) + 8], _mm_unpackhi_epi16(out[0], out[1]));
+      }
+#else
+      int32_t sum;
+      int32_t sample[32];
+      for (ch = 0; ch < 2; ++ch) {
+        for (j = 0; j < 32; ++j)
+          sample[j] = d_sample[ch][j][idx];
+
+        // matrixing
+        for (i = 0; i < 64; ++i) {
+          sum = 0;
+          for (j = 0; j < 32; ++j) // 8b*15b=23b
+            sum += d_N[i][j] * sample[j];
+          // intermediate value is 28 bit (23 + 5), clamp to 14b
+          d_V[ch][offs + i] = (sum + 8192) >> 14;
+        }
+
+        // construction of U
+        for (i = 0; i < 8; ++i)
+          for (j = 0; j < 32; ++j) {
+            d_U[(i << 6) + j]
+                    = d_V[ch][(offs + (i << 7) + j) & 1023];
+            d_U[(i << 6) + j + 32] =
+                    d_V[ch][(offs + (i << 7) + j + 96) & 1023];
+          }
+
+        // apply window
+        for (i = 0; i < 512; ++i)
+          d_U[i] = (d_U[i] * D[i] + 32) >> 6;
+
+        // output samples
+        for (j = 0; j < 32; ++j) {
+          sum = 0;
+          for (i = 0; i < 16; ++i)
+            sum -= d_U[(i << 5) + j];
+          sum = (sum + 8) >> 4;
+          if (sum < -32768)
+            sum = -32768;
+          if (sum > 32767)
+            sum = 32767;
+          pcm[(j << 1) | ch] = (uint16_t) sum;
+        }
+      }
+#endif
+    }
+
 ////////////////////////////////////////////////////////////////////////////////
 // FRAME DECODE FUNCTION                                                      //
 ////////////////////////////////////////////////////////////////////////////////
@@ -379,7 +526,7 @@ namespace gr {
       uint32_t mode;
       uint32_t frame_size;
       int32_t bound, sblimit;
-      int32_t sb, ch, gr, part, idx, nch, i, j, sum;
+      int32_t sb, ch, gr, part, idx, nch;
       int32_t table_idx;
 
       d_number_of_frames++;
@@ -538,47 +685,8 @@ namespace gr {
                 d_sample[ch][sb][idx] = 0;
 
           // synthesis loop
-          for (idx = 0; idx < 3; ++idx) {
-            // shifting step
-            d_V_offs = table_idx = (d_V_offs - 64) & 1023;
-
-            for (ch = 0; ch < 2; ++ch) {
-              // matrixing
-              for (i = 0; i < 64; ++i) {
-                sum = 0;
-                for (j = 0; j < 32; ++j) // 8b*15b=23b
-                  sum += d_N[i][j] * d_sample[ch][j][idx];
-                // intermediate value is 28 bit (23 + 5), clamp to 14b
-                d_V[ch][table_idx + i] = (sum + 8192) >> 14;
-              }
-
-              // construction of U
-              for (i = 0; i < 8; ++i)
-                for (j = 0; j < 32; ++j) {
-                  d_U[(i << 6) + j]
-                          = d_V[ch][(table_idx + (i << 7) + j) & 1023];
-                  d_U[(i << 6) + j + 32] =
-                          d_V[ch][(table_idx + (i << 7) + j + 96) & 1023];
-                }
-
-              // apply window
-              for (i = 0; i < 512; ++i)
-                d_U[i] = (d_U[i] * D[i] + 32) >> 6;
-
-              // output samples
-              for (j = 0; j < 32; ++j) {
-                sum = 0;
-                for (i = 0; i < 16; ++i)
-                  sum -= d_U[(i << 5) + j];
-                sum = (sum + 8) >> 4;
-                if (sum < -32768)
-                  sum = -32768;
-                if (sum > 32767)
-                  sum = 32767;
-                pcm[(idx << 6) | (j << 1) | ch] = (uint16_t) sum;
-              }
-            } // end of synthesis channel loop
-          } // end of synthesis sub-block loop
+          for (idx = 0; idx < 3; ++idx)
+            synthesis(idx, pcm + (idx << 6));
           // adjust PCM output pointer: decoded 3 * 32 = 96 stereo samples
           pcm += 192;
         } // decoding of the granule finished
@@ -615,7 +723,7 @@ namespace gr {
       int16_t *out_right = (int16_t *) output_items[1];
       d_nproduced = 0;
 
-      for (int logical_frame_count; logical_frame_count < noutput_items /
+      for (int logical_frame_count = 0; logical_frame_count < noutput_items /
                                                           d_output_size; logical_frame_count++) {
         int16_t i, j;
         int16_t lf =
@@ -39,6 +39,7 @@
 #include  <stdio.h>
 #include  <stdint.h>
 #include  <math.h>
+#include <atomic>
 //#include	"pad-handler.h"
 
 namespace gr {
@@ -66,7 +67,7 @@ namespace gr {
       int d_bit_rate;
       int d_nproduced;
       uint16_t *d_out;
-      int32_t d_sample_rate;
+      std::atomic<int32_t> d_sample_rate;
 
       int16_t d_V_offs;
       int32_t d_baud_rate;
@@ -83,6 +84,8 @@ namespace gr {
       uint8_t *d_mp2_frame;
       int16_t d_V[2][1024];
       int16_t d_N[64][32];
+      int16_t d_N_pairs[16][16][8]; /*!< d_N for the 16 bit multiplications: rows 4g..4g+3, columns 2p and 2p+1 */
+      int32_t d_scf_value[64]; /*!< resolved scale factors (24-bit fixed-point) */
       int32_t d_scfsi[2][32];
       int32_t d_scalefactor[2][32][3];
       int32_t d_sample[2][32][3];
@@ -100,6 +103,13 @@ namespace gr {
 
       int32_t get_bits(int32_t);
 
+      /*! \brief Synthesis filterbank of the sub-block idx of a granule, for both channels.
+       * Matrixing (64 x 32) into the V buffer, windowing with D[] and summation to 32 stereo samples.
+       * @param idx sub-block of the granule (0..2) in d_sample
+       * @param pcm 32 interleaved stereo samples
+       */
+      void synthesis(int idx, int16_t *pcm);
+
       int32_t mp2_decode_frame(uint8_t *, int16_t *);
 
       void add_bit_to_mp2(uint8_t *, uint8_t, int16_t);
@@ -109,7 +119,7 @@ namespace gr {
 
       ~mp2_decode_bs_impl();
 
-      virtual int32_t get_sample_rate() { return d_sample_rate; }
+      virtual int32_t get_sample_rate() { return d_sample_rate.load(); }
 
       // Where all the action really happens
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
@@ -32,6 +32,7 @@
 
 #include <gnuradio/io_signature.h>
 #include "mp4_decode_bs_impl.h"
+#include "aac_decoder_pool.h"
 #include <stdexcept>
 #include <stdio.h>
 #include <sstream>
@@ -56,26 +57,52 @@ namespace gr {
             : gr::block("mp4_decode_bs",
                         gr::io_signature::make(1, 1, sizeof(unsigned char)),
                         gr::io_signature::make(2, 2, sizeof(int16_t))),
-              d_bit_rate_n(bit_rate_n) {
+              d_bit_rate_n(bit_rate_n),
+              d_queued(0),
+              d_job_active(false),
+              d_pcm_offset(0),
+              d_tag_sample_rate(-1),
+              d_tag_sbr(false),
+              d_tag_ps(false),
+              d_sample_rate_key(pmt::mp("sample_rate")),
+              d_sbr_key(pmt::mp("sbr")),
+              d_ps_key(pmt::mp("ps")) {
       d_superframe_size = bit_rate_n * 110;
       d_aacInitialized = false;
       baudRate = 48000;
-      set_output_multiple(960 *
-                          4); //TODO: right? baudRate*0.12 for output of one superframe
       aacHandle = NeAACDecOpen();
       //memset(d_aac_frame, 0, 960);
       d_sample_rate = -1;
+      // the outputs only carry the format tags of general_work
+      set_tag_propagation_policy(TPP_DONT);
     }
 
     /*
      * Our virtual destructor.
      */
     mp4_decode_bs_impl::~mp4_decode_bs_impl() {
+      stop();
+      NeAACDecClose(aacHandle);
+    }
+
+    bool
+    mp4_decode_bs_impl::stop() {
+      // drop the queued superframes and wait for the superframe in the decoder
+      std::unique_lock<std::mutex> lock(d_mutex);
+      d_superframes.clear();
+      d_cond.wait(lock, [&] { return !d_job_active; });
+      d_pcm.clear();
+      d_queued = 0;
+      d_pcm_offset = 0;
+      return block::stop();
     }
 
     void
     mp4_decode_bs_impl::forecast(int noutput_items, gr_vector_int &ninput_items_required) {
-      ninput_items_required[0] = noutput_items; //TODO: how to calculate actual rate?
+      // the first superframe in the input buffer is skipped (see general_work)
+      // no input is needed as long as queued superframes can be written out
+      std::lock_guard<std::mutex> lock(d_mutex);
+      ninput_items_required[0] = d_queued > 0 ? 0 : 2 * d_superframe_size;
     }
 
     // returns aac channel configuration
@@ -133,7 +160,6 @@ namespace gr {
       if (init_result != 0) {
 /*      If some error initializing occured, skip the file */
         GR_LOG_ERROR(d_logger, "Error initializing decoding library");
-        NeAACDecClose(aacHandle);
         return false;
       }
       return true;
@@ -145,8 +171,7 @@ namespace gr {
                                               uint8_t sbrFlag,
                                               uint8_t mpegSurround,
                                               uint8_t aacChannelMode,
-                                              int16_t *out_sample1,
-                                              int16_t *out_sample2) {
+                                              pcm_frame &frame) {
       // copy AU to process it
       uint8_t au[2 * 960 + 10]; // sure, large enough
       memcpy(au, v, frame_length);
@@ -167,8 +192,7 @@ namespace gr {
                         aacChannelMode,
                         au,
                         frame_length,
-                        out_sample1,
-                        out_sample2);
+                        frame);
     }
 
     int16_t mp4_decode_bs_impl::MP42PCM(uint8_t dacRate,
@@ -177,8 +201,7 @@ namespace gr {
                                         uint8_t aacChannelMode,
                                         uint8_t buffer[],
                                         int16_t bufferLength,
-                                        int16_t *out_sample1,
-                                        int16_t *out_sample2) {
+                                        pcm_frame &frame) {
       int16_t samples;
       long unsigned int sample_rate;
       int16_t *outBuffer;
@@ -205,9 +228,9 @@ namespace gr {
           (sample_rate != (long unsigned) baudRate)) {
         baudRate = sample_rate;
       }
-      d_sample_rate = sample_rate;
       channels = hInfo.channels;
       if (hInfo.error != 0) {
+        // hInfo is not valid (sample rate 0), the format of the superframe is left unchanged
         GR_LOG_ERROR(d_logger, format("Warning:  %s") %
                                faacDecGetErrorMessage(hInfo.error));
         return 0;
@@ -217,51 +240,28 @@ namespace gr {
       if (channels == 2) {
         // the 2 channels are transmitted intereleaved; each channel gets samples/2 PCM samples
         for (int n = 0; n < samples / 2; n++) {
-          out_sample1[n + d_nsamples_produced] = (int16_t) outBuffer[n * 2];
-          out_sample2[n + d_nsamples_produced] = (int16_t) outBuffer[n * 2 + 1];
+          frame.left.push_back((int16_t) outBuffer[n * 2]);
+          frame.right.push_back((int16_t) outBuffer[n * 2 + 1]);
         }
       } else if (channels == 1) {
-        int16_t *buffer = (int16_t *) alloca(2 * samples);
-        int16_t i;
         for (int n = 0; n < samples / 2; n++) {
           // only 1 channel -> reproduce each sample to send it to a stereo output anyway
-          out_sample1[n + d_nsamples_produced] = (int16_t) outBuffer[n * 2];
-          out_sample2[n + d_nsamples_produced] = (int16_t) outBuffer[n * 2 + 1];
+          frame.left.push_back((int16_t) outBuffer[n * 2]);
+          frame.right.push_back((int16_t) outBuffer[n * 2 + 1]);
         }
-      } else
+      } else {
         GR_LOG_ERROR(d_logger, "Cannot handle these channels -> dump samples");
+        return 0;
+      }
+      d_sample_rate = sample_rate;
+      // the first decoded AU sets the sample rate of the superframe
+      if (frame.sample_rate < 0) {
+        frame.sample_rate = sample_rate;
+      }
 
-      d_nsamples_produced += samples / 2;
       return samples / 2;
     }
 
-/*! \brief CRC16 check
- * CRC16 check according to ETSI EN 300 401
- * @param msg data to check
- * @param len length of dataword without the 2 bytes crc at the end
- * @return true if CRC passed
- */
-    bool mp4_decode_bs_impl::crc16(const uint8_t *msg, int16_t len) {
-      int i, j;
-      uint16_t accumulator = 0xFFFF;
-      uint16_t crc;
-      uint16_t genpoly = 0x1021;
-
-      for (i = 0; i < len; i++) {
-        int16_t data = msg[i] << 8;
-        for (j = 8; j > 0; j--) {
-          if ((data ^ accumulator) & 0x8000)
-            accumulator = ((accumulator << 1) ^ genpoly) & 0xFFFF;
-          else
-            accumulator = (accumulator << 1) & 0xFFFF;
-          data = (data << 1) & 0xFFFF;
-        }
-      }
-      // compare calculated CRC with CRC in the AU
-      crc = ~((msg[len] << 8) | msg[len + 1]) & 0xFFFF;
-      return (crc ^ accumulator) == 0;
-    }
-
     uint16_t mp4_decode_bs_impl::BinToDec(const uint8_t *data, size_t offset, size_t length) {
       uint32_t output = (*(data + offset / 8) << 16) | ((*(data + offset / 8 + 1)) << 8) | (*(data + offset / 8 + 2));
       output >>= 24 - length - offset % 8;
@@ -269,6 +269,136 @@ namespace gr {
       return static_cast<uint16_t>(output);
     }
 
+    void
+    mp4_decode_bs_impl::decode_superframe(const uint8_t *in, pcm_frame &frame) {
+      // process superframe header
+      // bits 0 .. 15 is firecode
+      // bit 16 is unused
+      d_dac_rate = (in[2] >> 6) & 01; // bit 17
+      d_sbr_flag = (in[2] >> 5) & 01; // bit 18
+      d_aac_channel_mode = (in[2] >> 4) & 01; // bit 19
+      d_ps_flag = (in[2] >> 3) & 01; // bit 20
+      d_mpeg_surround = (in[2] & 07); // bits 21 .. 23
+      frame.sample_rate = -1;
+      frame.sbr = d_sbr_flag;
+      frame.ps = d_ps_flag;
+      // log header information
+      //GR_LOG_DEBUG(d_logger,
+      //             format("superframe header: dac_rate %d, sbr_flag %d, aac_mode %d, ps_flag %d, surround %d") %
+      //             (int) d_dac_rate %
+      //             (int) d_sbr_flag %
+      //             (int) d_aac_channel_mode %
+      //             (int) d_ps_flag %
+      //             (int) d_mpeg_surround);
+
+      switch (2 * d_dac_rate + d_sbr_flag) {
+        default:    // cannot happen
+        case 0:
+          d_num_aus = 4;
+          d_au_start[0] = 8;
+          d_au_start[1] = in[3] * 16 + (in[4] >> 4);
+          d_au_start[2] = (in[4] & 0xf) * 256 + in[5];
+          d_au_start[3] = in[6] * 16 + (in[7] >> 4);
+          d_au_start[4] = d_superframe_size;
+          break;
+
+        case 1:
+          d_num_aus = 2;
+          d_au_start[0] = 5;
+          d_au_start[1] = in[3] * 16 + (in[4] >> 4);
+          d_au_start[2] = d_superframe_size;
+          break;
+
+        case 2:
+          d_num_aus = 6;
+          d_au_start[0] = 11;
+          d_au_start[1] = in[3] * 16 + (in[4] >> 4);
+          d_au_start[2] = (in[4] & 0xf) * 256 + in[5];
+          d_au_start[3] = in[6] * 16 + (in[7] >> 4);
+          d_au_start[4] = (in[7] & 0xf) * 256 + in[8];
+          d_au_start[5] = in[9] * 16 + (in[10] >> 4);
+          d_au_start[6] = d_superframe_size;
+          break;
+
+        case 3:
+          d_num_aus = 3;
+          d_au_start[0] = 6;
+          d_au_start[1] = in[3] * 16 + (in[4] >> 4);
+          d_au_start[2] = (in[4] & 0xf) * 256 + in[5];
+          d_au_start[3] = d_superframe_size;
+          break;
+      }
+
+      /* Each of the d_num_aus AUs of each superframe (110 * d_bit_rate_n packed bytes)
+       * is now processed separately. */
+
+      for (int i = 0; i < d_num_aus; i++) {
+        int16_t aac_frame_length;
+
+        // sanity check for the address
+        if (d_au_start[i + 1] < d_au_start[i]) {
+          // throw std::runtime_error("AU start address invalid");
+          std::cout << "AU start address invalid"
+                    << "d_au_start[" << i
+                    << "] = " << d_au_start[i] << "; d_au_start[" << (i+1)
+                    << "]=" << d_au_start[i + 1] << std::endl;
+          continue;
+          // should not happen, the header is firecode checked
+        }
+        aac_frame_length = d_au_start[i + 1] - d_au_start[i] - 2;
+
+        // sanity check for the aac_frame_length (the decoder pool cannot throw, dump the superframe)
+        if ((aac_frame_length >= 960) || (aac_frame_length < 0)) {
+          GR_LOG_ERROR(d_logger, format("aac frame length not in range (%d)") % aac_frame_length);
+          return;
+        }
+
+        // CRC check of each AU (the 2 byte (16 bit) CRC word is excluded in aac_frame_length)
+        if (d_crc.check(&in[d_au_start[i]], aac_frame_length + 2)) {
+          //GR_LOG_DEBUG(d_logger, format("CRC check of AU %d successful") % i);
+          // handle proper AU
+          handle_aac_frame(&in[d_au_start[i]],
+                           aac_frame_length,
+                           d_dac_rate,
+                           d_sbr_flag,
+                           d_mpeg_surround,
+                           d_aac_channel_mode,
+                           frame);
+        } else {
+          // dump corrupted AU
+          GR_LOG_DEBUG(d_logger, format("CRC failure with dab+ frame"));
+        }
+      }
+    }
+
+    void
+    mp4_decode_bs_impl::decode_job() {
+      std::vector<uint8_t> superframe;
+      {
+        std::lock_guard<std::mutex> lock(d_mutex);
+        if (d_superframes.empty()) {
+          // the queue was dropped in stop()
+          d_job_active = false;
+          d_cond.notify_all();
+          return;
+        }
+        superframe.swap(d_superframes.front());
+        d_superframes.pop_front();
+      }
+      pcm_frame frame;
+      decode_superframe(&superframe[0], frame);
+      // Post the next superframe as a new job, so that the services take turns in the pool.
+      std::lock_guard<std::mutex> lock(d_mutex);
+      d_pcm.push_back(std::move(frame));
+      if (d_superframes.empty()) {
+        d_job_active = false;
+      } else {
+        aac_decoder_pool::instance().post([this] { decode_job(); });
+      }
+      // notify while holding the lock, the block may be destroyed as soon as d_job_active is false
+      d_cond.notify_all();
+    }
+
     int
     mp4_decode_bs_impl::general_work(int noutput_items,
                                      gr_vector_int &ninput_items,
@@ -277,114 +407,62 @@ namespace gr {
       const unsigned char *in = (const unsigned char *) input_items[0] + d_superframe_size;
       int16_t *out1 = (int16_t *) output_items[0];
       int16_t *out2 = (int16_t *) output_items[1];
-      d_nsamples_produced = 0;
-
-      for (int n = 0; n < noutput_items / (960 * 4); n++) {
-        // process superframe header
-        // bits 0 .. 15 is firecode
-        // bit 16 is unused
-        d_dac_rate = (in[n * d_superframe_size + 2] >> 6) & 01; // bit 17
-        d_sbr_flag = (in[n * d_superframe_size + 2] >> 5) & 01; // bit 18
-        d_aac_channel_mode = (in[n * d_superframe_size + 2] >> 4) & 01; // bit 19
-        d_ps_flag = (in[n * d_superframe_size + 2] >> 3) & 01; // bit 20
-        d_mpeg_surround = (in[n * d_superframe_size + 2] & 07); // bits 21 .. 23
-        // log header information
-        //GR_LOG_DEBUG(d_logger,
-        //             format("superframe header: dac_rate %d, sbr_flag %d, aac_mode %d, ps_flag %d, surround %d") %
-        //             (int) d_dac_rate %
-        //             (int) d_sbr_flag %
-        //             (int) d_aac_channel_mode %
-        //             (int) d_ps_flag %
-        //             (int) d_mpeg_surround);
-
-        switch (2 * d_dac_rate + d_sbr_flag) {
-          default:    // cannot happen
-          case 0:
-            d_num_aus = 4;
-            d_au_start[0] = 8;
-            d_au_start[1] = in[n * d_superframe_size + 3] * 16 + (in[n * d_superframe_size + 4] >> 4);
-            d_au_start[2] = (in[n * d_superframe_size + 4] & 0xf) * 256 + in[n * d_superframe_size + 5];
-            d_au_start[3] = in[n * d_superframe_size + 6] * 16 + (in[n * d_superframe_size + 7] >> 4);
-            d_au_start[4] = d_superframe_size;
-            break;
-
-          case 1:
-            d_num_aus = 2;
-            d_au_start[n * d_superframe_size + 0] = 5;
-            d_au_start[1] = in[n * d_superframe_size + 3] * 16 + (in[n * d_superframe_size + 4] >> 4);
-            d_au_start[2] = d_superframe_size;
-            break;
-
-          case 2:
-            d_num_aus = 6;
-            d_au_start[0] = 11;
-            d_au_start[1] = in[n * d_superframe_size + 3] * 16 + (in[n * d_superframe_size + 4] >> 4);
-            d_au_start[2] = (in[n * d_superframe_size + 4] & 0xf) * 256 + in[n * d_superframe_size + 5];
-            d_au_start[3] = in[n * d_superframe_size + 6] * 16 + (in[n * d_superframe_size + 7] >> 4);
-            d_au_start[4] = (in[n * d_superframe_size + 7] & 0xf) * 256 + in[8];
-            d_au_start[5] = in[n * d_superframe_size + 9] * 16 + (in[n * d_superframe_size + 10] >> 4);
-            d_au_start[6] = d_superframe_size;
-            break;
-
-          case 3:
-            d_num_aus = 3;
-            d_au_start[0] = 6;
-            d_au_start[1] = in[n * d_superframe_size + 3] * 16 + (in[n * d_superframe_size + 4] >> 4);
-            d_au_start[2] = (in[n * d_superframe_size + 4] & 0xf) * 256 + in[n * d_superframe_size + 5];
-            d_au_start[3] = d_superframe_size;
-            break;
-        }
-
-        /* Each of the d_num_aus AUs of each superframe (110 * d_bit_rate_n packed bytes)
-         * is now processed separately. */
-
-        for (int i = 0; i < d_num_aus; i++) {
-          int16_t aac_frame_length;
-
-          // sanity check for the address
-          if (d_au_start[i + 1] < d_au_start[i]) {
-            // throw std::runtime_error("AU start address invalid");
-            std::cout << "AU start address invalid"
-                      << "d_au_start[" << i
-                      << "] = " << d_au_start[i] << "; d_au_start[" << (i+1)
-                      << "]=" << d_au_start[i + 1] << std::endl;
-            continue;
-            // should not happen, the header is firecode checked
-          }
-          aac_frame_length = d_au_start[i + 1] - d_au_start[i] - 2;
-
-          // sanity check for the aac_frame_length
-          if ((aac_frame_length >= 960) || (aac_frame_length < 0)) {
-            throw std::out_of_range(
-                    (boost::format("aac frame length not in range (%d)") %
-                     aac_frame_length).str());
-          }
+      // the first superframe in the input buffer is skipped
+      const int available = ninput_items[0] / d_superframe_size - 1;
+      int consumed = 0;
+      int produced = 0;
+
+      std::unique_lock<std::mutex> lock(d_mutex);
+      // queue the superframes for the decoder
+      while (consumed < available && d_queued < d_max_superframes) {
+        d_superframes.push_back(std::vector<uint8_t>(in + consumed * d_superframe_size,
+                                                     in + (consumed + 1) * d_superframe_size));
+        consumed++;
+        d_queued++;
+      }
+      if (!d_superframes.empty() && !d_job_active) {
+        d_job_active = true;
+        aac_decoder_pool::instance().post([this] { decode_job(); });
+      }
+      // wait for the decoder only if this call can do nothing else
+      if (consumed == 0 && d_pcm.empty() && d_queued > 0) {
+        d_cond.wait(lock, [&] { return !d_pcm.empty(); });
+      }
 
-          // CRC check of each AU (the 2 byte (16 bit) CRC word is excluded in aac_frame_length)
-          if (crc16(&in[n * d_superframe_size + d_au_start[i]], aac_frame_length)) {
-            //GR_LOG_DEBUG(d_logger, format("CRC check of AU %d successful") % i);
-            // handle proper AU
-            handle_aac_frame(&in[n * d_superframe_size + d_au_start[i]],
-                             aac_frame_length,
-                             d_dac_rate,
-                             d_sbr_flag,
-                             d_mpeg_surround,
-                             d_aac_channel_mode,
-                             out1,
-                             out2);
-          } else {
-            // dump corrupted AU
-            GR_LOG_DEBUG(d_logger, format("CRC failure with dab+ frame"));
+      // write out the decoded superframes in order
+      while (!d_pcm.empty() && produced < noutput_items) {
+        const pcm_frame &frame = d_pcm.front();
+        const int nsamples = frame.left.size();
+        if (d_pcm_offset == 0 && nsamples > 0 &&
+            (frame.sample_rate != d_tag_sample_rate || frame.sbr != d_tag_sbr || frame.ps != d_tag_ps)) {
+          for (int port = 0; port < 2; port++) {
+            add_item_tag(port, nitems_written(port) + produced, d_sample_rate_key, pmt::from_long(frame.sample_rate));
+            add_item_tag(port, nitems_written(port) + produced, d_sbr_key, pmt::from_bool(frame.sbr));
+            add_item_tag(port, nitems_written(port) + produced, d_ps_key, pmt::from_bool(frame.ps));
           }
+          d_tag_sample_rate = frame.sample_rate;
+          d_tag_sbr = frame.sbr;
+          d_tag_ps = frame.ps;
+        }
+        const int n = std::min(noutput_items - produced, nsamples - d_pcm_offset);
+        memcpy(out1 + produced, &frame.left[d_pcm_offset], n * sizeof(int16_t));
+        memcpy(out2 + produced, &frame.right[d_pcm_offset], n * sizeof(int16_t));
+        produced += n;
+        d_pcm_offset += n;
+        if (d_pcm_offset == nsamples) {
+          d_pcm.pop_front();
+          d_pcm_offset = 0;
+          d_queued--;
         }
       }
+      lock.unlock();
 
       // Tell runtime system how many input items we consumed on
       // each input stream.
-      consume_each(noutput_items * d_superframe_size / (960 * 4));
+      consume_each(consumed * d_superframe_size);
 
       // Tell runtime system how many output items we produced.
-      return d_nsamples_produced;
+      return produced;
     }
 
   } /* namespace dab */
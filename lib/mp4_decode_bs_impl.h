@@ -31,18 +31,29 @@
 #define INCLUDED_DAB_MP4_DECODE_BS_IMPL_H
 
 #include <gnuradio/dab/mp4_decode_bs.h>
+#include <gnuradio/dab/crc16.h>
 #include "neaacdec.h"
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <mutex>
+#include <vector>
 
 namespace gr {
   namespace dab {
 /*! \brief DAB+ Audio frame decoder
  * according to ETSI TS 102 563
+ *
+ * The superframes are decoded asynchronously in the process-wide aac_decoder_pool. The block
+ * queues complete superframes, of which at most one is decoded at a time with the block's own
+ * faad2 handle, and writes out the PCM samples in the order of the superframes.
+ * The first sample of each decoded superframe with a new audio format is tagged with
+ * "sample_rate", "sbr" and "ps".
  */
     class mp4_decode_bs_impl : public mp4_decode_bs {
     private:
-      int d_nsamples_produced;
       int d_bit_rate_n;
-      int d_sample_rate;
+      std::atomic<int> d_sample_rate;
       int d_superframe_size;
       bool d_aacInitialized;
       int32_t baudRate;
@@ -51,7 +62,32 @@ namespace gr {
 
       NeAACDecHandle aacHandle;
 
-      bool crc16(const uint8_t *msg, int16_t len);
+      /*! PCM samples of one superframe */
+      struct pcm_frame {
+        std::vector<int16_t> left;
+        std::vector<int16_t> right;
+        int sample_rate;
+        bool sbr;
+        bool ps;
+      };
+
+      const static int d_max_superframes = 8; /*!< maximum number of superframes queued in the block */
+      std::mutex d_mutex;
+      std::condition_variable d_cond; /*!< Signals a decoded superframe or the end of the decoding job. */
+      std::deque<std::vector<uint8_t> > d_superframes; /*!< superframes waiting for the decoder */
+      std::deque<pcm_frame> d_pcm; /*!< decoded superframes waiting for the output */
+      int d_queued; /*!< number of superframes consumed but not written out yet */
+      bool d_job_active; /*!< a decoding job of this block is queued or running in the pool */
+      int d_pcm_offset; /*!< number of samples of d_pcm.front() that are already written out */
+      int d_tag_sample_rate; /*!< audio format of the last tag */
+      bool d_tag_sbr, d_tag_ps;
+      const pmt::pmt_t d_sample_rate_key, d_sbr_key, d_ps_key;
+      const crc16 d_crc; /*!< CRC16 of the AUs, read by the decoder pool */
+
+      /*! \brief Decodes the next queued superframe. Runs in the decoder pool. */
+      void decode_job();
+
+      void decode_superframe(const uint8_t *in, pcm_frame &frame);
 
       uint16_t BinToDec(const uint8_t *data, size_t offset, size_t length);
 
@@ -69,8 +105,7 @@ namespace gr {
                             uint8_t sbrFlag,
                             uint8_t mpegSurround,
                             uint8_t aacChannelMode,
-                            int16_t *out_sample1,
-                            int16_t *out_sample2);
+                            pcm_frame &frame);
 
       int16_t MP42PCM(uint8_t dacRate,
                       uint8_t sbrFlag,
@@ -78,15 +113,16 @@ namespace gr {
                       uint8_t aacChannelMode,
                       uint8_t buffer[],
                       int16_t bufferLength,
-                      int16_t *out_sample1,
-                      int16_t *out_sample2);
+                      pcm_frame &frame);
 
     public:
       mp4_decode_bs_impl(int bit_rate_n);
 
       ~mp4_decode_bs_impl();
 
-      virtual int get_sample_rate() { return d_sample_rate; }
+      virtual int get_sample_rate() { return d_sample_rate.load(); }
+
+      bool stop();
 
       // Where all the action really happens
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
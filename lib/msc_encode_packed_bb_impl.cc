@@ -0,0 +1,245 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "msc_encode_packed_bb_impl.h"
+#include <algorithm>
+#include <stdexcept>
+
+namespace gr {
+  namespace dab {
+
+    msc_encode_packed_bb::sptr
+    msc_encode_packed_bb::make(int framesize,
+                               const std::vector<unsigned char> &puncturing_vector,
+                               const std::vector<unsigned char> &scrambling_vector) {
+      return gnuradio::get_initial_sptr(new msc_encode_packed_bb_impl(framesize,
+                                                                      puncturing_vector,
+                                                                      scrambling_vector));
+    }
+
+    static uint8_t parity(uint8_t x) {
+      x ^= x >> 4;
+      x ^= x >> 2;
+      x ^= x >> 1;
+      return x & 1;
+    }
+
+    /* Bit-wise reference encoder (see conv_encoder_bb) to fill the tables.
+     * Returns the 4 code bits of each of the nbits input bits, the first code bit in the MSB. */
+    static uint32_t encode_bits(uint8_t &memory, uint8_t data, int nbits) {
+      uint32_t code = 0;
+      for (int i = 0; i < nbits; ++i) {
+        memory = (memory >> 1) | ((data >> 7) << 6);
+        data <<= 1;
+        code = (code << 4) | (parity(memory & 0x5b) << 3) | (parity(memory & 0x79) << 2) |
+               (parity(memory & 0x65) << 1) | parity(memory & 0x5b);
+      }
+      return (nbits == 8) ? code : code << (32 - 4 * nbits);
+    }
+
+    /*
+     * The private constructor
+     */
+    msc_encode_packed_bb_impl::msc_encode_packed_bb_impl(int framesize,
+                                                         const std::vector<unsigned char> &puncturing_vector,
+                                                         const std::vector<unsigned char> &scrambling_vector)
+            : gr::block("msc_encode_packed_bb",
+                        gr::io_signature::make(1, 1, sizeof(unsigned char)),
+                        gr::io_signature::make(1, 1, sizeof(unsigned char))),
+              d_framesize(framesize),
+              d_num_delays(scrambling_vector.size()),
+              d_frame_index(0) {
+      d_codeword_size = 4 * d_framesize + 3;
+      if (d_framesize <= 0 || puncturing_vector.size() != 8 * (size_t) d_codeword_size) {
+        throw std::invalid_argument("msc_encode_packed_bb: puncturing vector does not match the frame size");
+      }
+      if (d_num_delays == 0) {
+        throw std::invalid_argument("msc_encode_packed_bb: empty scrambling vector");
+      }
+
+      // packed PRBS, p(x) = x^9 + x^5 + 1 with initial state 111111111
+      d_prbs.assign(d_framesize, 0);
+      uint16_t prbs_state = 0x1ff;
+      for (int i = 0; i < 8 * d_framesize; ++i) {
+        uint8_t bit = ((prbs_state >> 8) ^ (prbs_state >> 4)) & 1;
+        prbs_state = ((prbs_state << 1) | bit) & 0x1ff;
+        d_prbs[i / 8] |= bit << (7 - i % 8);
+      }
+
+      // encoder tables
+      for (int i = 0; i < 256; ++i) {
+        uint8_t memory = 0;
+        d_input_table[i] = encode_bits(memory, i, 8);
+        d_next_state[i] = memory;
+      }
+      for (int s = 0; s < 128; ++s) {
+        uint8_t memory = s;
+        d_state_table[s] = encode_bits(memory, 0, 8);
+        memory = s;
+        d_tail_table[s] = encode_bits(memory, 0, 6);
+      }
+
+      // one extraction table per distinct byte mask of the puncturing vector
+      d_mask_index.resize(d_codeword_size);
+      std::vector<uint8_t> masks;
+      int punctured_bits = 0;
+      for (int i = 0; i < d_codeword_size; ++i) {
+        uint8_t mask = 0;
+        for (int b = 0; b < 8; ++b) {
+          mask = (mask << 1) | (puncturing_vector[8 * i + b] == 1);
+        }
+        size_t index = 0;
+        while (index < masks.size() && masks[index] != mask) {
+          ++index;
+        }
+        if (index == masks.size()) {
+          masks.push_back(mask);
+          uint8_t ones = 0;
+          for (int b = 0; b < 8; ++b) {
+            ones += (mask >> b) & 1;
+          }
+          d_mask_ones.push_back(ones);
+          for (int value = 0; value < 256; ++value) {
+            uint8_t bits = 0;
+            for (int b = 7; b >= 0; --b) {
+              if ((mask >> b) & 1) {
+                bits = (bits << 1) | ((value >> b) & 1);
+              }
+            }
+            d_extract.push_back(bits);
+          }
+        }
+        d_mask_index[i] = index;
+        punctured_bits += d_mask_ones[index];
+      }
+      if (punctured_bits % 8 != 0) {
+        throw std::invalid_argument("msc_encode_packed_bb: punctured frame is not a multiple of 8 bits");
+      }
+      d_outsize = punctured_bits / 8;
+
+      // the delays of the bits of the output bytes repeat after d_period bytes
+      d_period = 1;
+      while ((8 * d_period) % d_num_delays != 0) {
+        ++d_period;
+      }
+      d_byte_delays.resize(8 * d_period);
+      for (int j = 0; j < 8 * d_period; ++j) {
+        if (scrambling_vector[j % d_num_delays] >= d_num_delays) {
+          throw std::invalid_argument("msc_encode_packed_bb: delay exceeds the length of the scrambling vector");
+        }
+        d_byte_delays[j] = scrambling_vector[j % d_num_delays];
+      }
+      d_codeword.resize(d_codeword_size);
+      d_frames.assign(d_num_delays * d_outsize, 0);
+      d_delayed.resize(d_num_delays);
+
+      set_output_multiple(d_outsize);
+      set_relative_rate(static_cast<double>(d_outsize) / static_cast<double>(d_framesize));
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    msc_encode_packed_bb_impl::~msc_encode_packed_bb_impl() {
+    }
+
+    void
+    msc_encode_packed_bb_impl::forecast(int noutput_items,
+                                        gr_vector_int &ninput_items_required) {
+      ninput_items_required[0] = (noutput_items / d_outsize) * d_framesize;
+    }
+
+    void
+    msc_encode_packed_bb_impl::encode_frame(const uint8_t *in, uint8_t *out) {
+      // energy dispersal and convolutional encoding
+      uint8_t state = 0;
+      uint8_t *codeword = &d_codeword[0];
+      for (int i = 0; i < d_framesize; ++i) {
+        uint8_t data = in[i] ^ d_prbs[i];
+        uint32_t code = d_input_table[data] ^ d_state_table[state];
+        state = d_next_state[data];
+        *codeword++ = code >> 24;
+        *codeword++ = code >> 16;
+        *codeword++ = code >> 8;
+        *codeword++ = code;
+      }
+      uint32_t tail = d_tail_table[state];
+      *codeword++ = tail >> 24;
+      *codeword++ = tail >> 16;
+      *codeword++ = tail >> 8;
+
+      // puncturing into the ring buffer of the time interleaver
+      uint8_t *punctured = &d_frames[d_frame_index * d_outsize];
+      uint32_t acc = 0;
+      int acc_bits = 0;
+      for (int i = 0; i < d_codeword_size; ++i) {
+        uint8_t index = d_mask_index[i];
+        acc = (acc << d_mask_ones[index]) | d_extract[256 * index + d_codeword[i]];
+        acc_bits += d_mask_ones[index];
+        if (acc_bits >= 8) {
+          acc_bits -= 8;
+          *punctured++ = acc >> acc_bits;
+          acc &= (1u << acc_bits) - 1;
+        }
+      }
+
+      // time interleaving: bit j of the output is bit j of the frame delayed by scrambling_vector[j % 16]
+      for (int d = 0; d < d_num_delays; ++d) {
+        d_delayed[d] = &d_frames[((d_frame_index - d + d_num_delays) % d_num_delays) * d_outsize];
+      }
+      for (int k = 0; k < d_outsize; ++k) {
+        const uint8_t *delays = &d_byte_delays[8 * (k % d_period)];
+        uint8_t byte = 0;
+        for (int b = 0; b < 8; ++b) {
+          byte |= d_delayed[delays[b]][k] & (0x80 >> b);
+        }
+        out[k] = byte;
+      }
+      d_frame_index = (d_frame_index + 1) % d_num_delays;
+    }
+
+    int
+    msc_encode_packed_bb_impl::general_work(int noutput_items,
+                                            gr_vector_int &ninput_items,
+                                            gr_vector_const_void_star &input_items,
+                                            gr_vector_void_star &output_items) {
+      const unsigned char *in = (const unsigned char *) input_items[0];
+      unsigned char *out = (unsigned char *) output_items[0];
+
+      int nframes = std::min(noutput_items / d_outsize, ninput_items[0] / d_framesize);
+      for (int n = 0; n < nframes; ++n) {
+        encode_frame(in + n * d_framesize, out + n * d_outsize);
+      }
+
+      // Tell runtime system how many input items we consumed on
+      // each input stream.
+      consume_each(nframes * d_framesize);
+
+      // Tell runtime system how many output items we produced.
+      return nframes * d_outsize;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
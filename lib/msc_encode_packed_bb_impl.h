@@ -0,0 +1,85 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_MSC_ENCODE_PACKED_BB_IMPL_H
+#define INCLUDED_DAB_MSC_ENCODE_PACKED_BB_IMPL_H
+
+#include <gnuradio/dab/msc_encode_packed_bb.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief Channel coding of a sub-channel without unpacking the bits.
+ *
+ * The energy dispersal XORs whole bytes with the packed PRBS. The
+ * convolutional encoder (133, 171, 145, 133 octal) looks up the 32 code bits of
+ * an input byte in a 256-entry table and adds the contribution of the encoder
+ * state from a second table, which works as the code is linear.
+ * The puncturing extracts the transmitted bits of each mother codeword byte
+ * with a lookup table of the byte mask at this position. The time interleaver
+ * keeps the last 16 punctured frames and takes each bit of an output byte with
+ * a mask from the frame of its delay.
+ *
+ * @param framesize Size of a logical frame in packed bytes.
+ * @param puncturing_vector Puncturing sequence of the mother codeword.
+ * @param scrambling_vector Delays of the time interleaver.
+ */
+    class msc_encode_packed_bb_impl : public msc_encode_packed_bb {
+    private:
+      int d_framesize; /*!< size of an input frame in packed bytes */
+      int d_codeword_size; /*!< size of the mother codeword in packed bytes */
+      int d_outsize; /*!< size of a punctured frame in packed bytes */
+      std::vector<uint8_t> d_prbs; /*!< packed energy dispersal sequence of one frame */
+      uint32_t d_input_table[256]; /*!< code bits of an input byte, encoder state zero */
+      uint32_t d_state_table[128]; /*!< code bits of the encoder state, input byte zero */
+      uint32_t d_tail_table[128]; /*!< 24 code bits of the 6 tail bits for each state */
+      uint8_t d_next_state[256]; /*!< encoder state after an input byte */
+      std::vector<uint8_t> d_mask_index; /*!< index of the puncturing mask of each codeword byte */
+      std::vector<uint8_t> d_mask_ones; /*!< number of transmitted bits of each mask */
+      std::vector<uint8_t> d_extract; /*!< transmitted bits of all byte values, 256 entries per mask */
+      int d_num_delays; /*!< length of the scrambling vector */
+      int d_period; /*!< number of output bytes after which the delays of the bits repeat */
+      std::vector<uint8_t> d_byte_delays; /*!< delay of each bit of the d_period output bytes */
+      std::vector<uint8_t> d_codeword; /*!< mother codeword of the current frame */
+      std::vector<uint8_t> d_frames; /*!< ring buffer of the last d_num_delays punctured frames */
+      int d_frame_index; /*!< position of the current frame in d_frames */
+      std::vector<const uint8_t *> d_delayed; /*!< punctured frame of each delay */
+
+      void encode_frame(const uint8_t *in, uint8_t *out);
+
+    public:
+      msc_encode_packed_bb_impl(int framesize,
+                                const std::vector<unsigned char> &puncturing_vector,
+                                const std::vector<unsigned char> &scrambling_vector);
+
+      ~msc_encode_packed_bb_impl();
+
+      // Where all the action really happens
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_MSC_ENCODE_PACKED_BB_IMPL_H */
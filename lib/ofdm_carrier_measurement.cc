@@ -0,0 +1,109 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "ofdm_carrier_measurement.h"
+#include <volk/volk.h>
+#include <math.h>
+
+namespace gr {
+  namespace dab {
+
+    unsigned int
+    measure_coarse_frequency_offset(const gr_complex *symbol, int fft_length,
+                                    int num_carriers, float *mag_squared) {
+      unsigned int i, index;
+      float energy = 0, max = 0;
+      // first energy measurement is processed completely
+      volk_32fc_magnitude_squared_32f(mag_squared, symbol, num_carriers + 1);
+      volk_32f_accumulator_s32f(&energy, mag_squared, num_carriers + 1);
+      // subtract the central (DC) carrier which is not occupied
+      energy -= std::real(symbol[num_carriers]) * std::real(symbol[num_carriers]) +
+                std::imag(symbol[num_carriers]) * std::imag(symbol[num_carriers]);
+      max = energy;
+      index = 0;
+      /* the energy measurements with all possible carrier offsets are calculated over a moving sum,
+       * searching for a maximum of energy
+       */
+      for (i = 1; i < fft_length - num_carriers; i++) {
+        /* diff on left side */
+        energy -= std::real(symbol[i - 1]) * std::real(symbol[i - 1]) +
+                  std::imag(symbol[i - 1]) * std::imag(symbol[i - 1]);
+        /* diff for zero carrier */
+        energy += std::real(symbol[i + num_carriers / 2 - 1]) * std::real(symbol[i + num_carriers / 2 - 1]) +
+                  std::imag(symbol[i + num_carriers / 2 - 1]) * std::imag(symbol[i + num_carriers / 2 - 1]);
+        energy -= std::real(symbol[i + num_carriers / 2]) * std::real(symbol[i + num_carriers / 2]) +
+                  std::imag(symbol[i + num_carriers / 2]) * std::imag(symbol[i + num_carriers / 2]);
+        /* diff on rigth side */
+        energy += std::real(symbol[i + num_carriers]) * std::real(symbol[i + num_carriers]) +
+                  std::imag(symbol[i + num_carriers]) * std::imag(symbol[i + num_carriers]);
+        /* new max found? */
+        if (energy > max) {
+          max = energy;
+          index = i;
+        }
+      }
+      return index;
+    }
+
+    void
+    measure_carrier_snr(const gr_complex *symbol, int fft_length, int num_carriers,
+                        unsigned int freq_offset, float *mag_squared, float &snr) {
+      // measure normalized energy of occupied sub-carriers
+      float energy = 0;
+      volk_32fc_magnitude_squared_32f(mag_squared, &symbol[freq_offset], num_carriers + 1);
+      volk_32f_accumulator_s32f(&energy, mag_squared, num_carriers + 1);
+      // subtract the central (DC) carrier which is not assigned
+      energy -= std::real(symbol[num_carriers + freq_offset]) * std::real(symbol[num_carriers + freq_offset]) +
+                std::imag(symbol[num_carriers + freq_offset]) * std::imag(symbol[num_carriers + freq_offset]);
+
+      // measure normalized energy of empty sub-carriers
+      float noise_left = 0, noise_right, noise_total;
+      // empty sub-carriers on left side
+      volk_32fc_magnitude_squared_32f(mag_squared, symbol, freq_offset);
+      volk_32f_accumulator_s32f(&noise_left, mag_squared, freq_offset);
+      // empty sub-carriers on right side
+      volk_32fc_magnitude_squared_32f(mag_squared,
+                                      &symbol[freq_offset + num_carriers + 1],
+                                      fft_length - num_carriers - freq_offset - 1);
+      volk_32f_accumulator_s32f(&noise_right,
+                                mag_squared,
+                                fft_length - num_carriers - freq_offset - 1);
+      // add noise energies from both sides to total noise
+      noise_total = noise_left + noise_right;
+      noise_total += std::real(symbol[freq_offset + num_carriers / 2]) * std::real(symbol[freq_offset + num_carriers / 2]) +
+                     std::imag(symbol[freq_offset + num_carriers / 2]) * std::imag(symbol[freq_offset + num_carriers / 2]);
+
+      // normalize
+      energy = energy / num_carriers;
+      noise_total = noise_total / (fft_length - num_carriers);
+      // check if ratio is in the definition range of the log
+      if (energy > noise_total) {
+        // now we can calculate the SNR in dB
+        snr = 10 * log10((energy - noise_total) / noise_total);
+      }
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
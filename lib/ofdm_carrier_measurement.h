@@ -0,0 +1,58 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_OFDM_CARRIER_MEASUREMENT_H
+#define INCLUDED_DAB_OFDM_CARRIER_MEASUREMENT_H
+
+#include <gnuradio/gr_complex.h>
+
+namespace gr {
+  namespace dab {
+
+    /*! \brief Energy measurement over the num_carriers sub_carriers + the central carrier.
+     * The energy gets a maximum when the calculation window and the occupied carriers are congruent.
+     * Fine frequency synchronization in the range of one sub-carrier spacing has to be done already.
+     *
+     * @param symbol FFT vector of the phase reference symbol.
+     * @param fft_length Length of the FFT vector.
+     * @param num_carriers Number of occupied sub-carriers.
+     * @param mag_squared Buffer for at least num_carriers + 1 floats.
+     * @return Position of the first occupied sub-carrier.
+     */
+    unsigned int measure_coarse_frequency_offset(const gr_complex *symbol, int fft_length,
+                                                 int num_carriers, float *mag_squared);
+
+    /*! \brief SNR measurement by comparing the energy of occupied sub-carriers with the ones of empty sub-carriers.
+     *
+     * @param symbol FFT vector of the phase reference symbol.
+     * @param fft_length Length of the FFT vector.
+     * @param num_carriers Number of occupied sub-carriers.
+     * @param freq_offset Position of the first occupied sub-carrier.
+     * @param mag_squared Buffer for at least fft_length - num_carriers floats and num_carriers + 1 floats.
+     * @param snr Is set to the estimated SNR in dB, if it can be estimated.
+     */
+    void measure_carrier_snr(const gr_complex *symbol, int fft_length, int num_carriers,
+                             unsigned int freq_offset, float *mag_squared, float &snr);
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_CARRIER_MEASUREMENT_H */
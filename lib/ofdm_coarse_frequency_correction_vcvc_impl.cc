@@ -25,6 +25,7 @@
 
 #include <gnuradio/io_signature.h>
 #include "ofdm_coarse_frequency_correction_vcvc_impl.h"
+#include "ofdm_carrier_measurement.h"
 #include <volk/volk.h>
 #include <math.h>
 
@@ -55,7 +56,7 @@ namespace gr {
               d_freq_offset(0),
               d_snr(0) {
       unsigned int alignment = volk_get_alignment();
-      d_mag_squared = (float *) volk_malloc(sizeof(float) * num_carriers + 1, alignment);
+      d_mag_squared = (float *) volk_malloc(sizeof(float) * (num_carriers + 1), alignment);
     }
     /*
      * Our virtual destructor.
@@ -69,79 +70,16 @@ namespace gr {
      */
     void
     ofdm_coarse_frequency_correction_vcvc_impl::measure_energy(const gr_complex *symbol) {
-      unsigned int i, index;
-      float energy = 0, max = 0;
-      // first energy measurement is processed completely
-      volk_32fc_magnitude_squared_32f(d_mag_squared, symbol, d_num_carriers + 1);
-      volk_32f_accumulator_s32f(&energy, d_mag_squared, d_num_carriers + 1);
-      // subtract the central (DC) carrier which is not occupied
-      energy -= std::real(symbol[d_num_carriers]) * std::real(symbol[d_num_carriers]) +
-                std::imag(symbol[d_num_carriers]) * std::imag(symbol[d_num_carriers]);
-      max = energy;
-      index = 0;
-      /* the energy measurements with all possible carrier offsets are calculated over a moving sum,
-       * searching for a maximum of energy
-       */
-      for (i = 1; i < d_fft_length - d_num_carriers; i++) {
-        /* diff on left side */
-        energy -= std::real(symbol[i - 1]) * std::real(symbol[i - 1]) +
-                  std::imag(symbol[i - 1]) * std::imag(symbol[i - 1]);
-        /* diff for zero carrier */
-        energy += std::real(symbol[i + d_num_carriers / 2 - 1]) * std::real(symbol[i + d_num_carriers / 2 - 1]) +
-                  std::imag(symbol[i + d_num_carriers / 2 - 1]) * std::imag(symbol[i + d_num_carriers / 2 - 1]);
-        energy -= std::real(symbol[i + d_num_carriers / 2]) * std::real(symbol[i + d_num_carriers / 2]) +
-                  std::imag(symbol[i + d_num_carriers / 2]) * std::imag(symbol[i + d_num_carriers / 2]);
-        /* diff on rigth side */
-        energy += std::real(symbol[i + d_num_carriers]) * std::real(symbol[i + d_num_carriers]) +
-                  std::imag(symbol[i + d_num_carriers]) * std::imag(symbol[i + d_num_carriers]);
-        /* new max found? */
-        if (energy > max) {
-          max = energy;
-          index = i;
-        }
-      }
-      d_freq_offset = index;
-      //std::cout << "coarse freq offset: " << d_freq_offset << "\n";
+      d_freq_offset = measure_coarse_frequency_offset(symbol, d_fft_length, d_num_carriers, d_mag_squared);
     }
 
     /*! SNR measurement by comparing the energy of occupied sub-carriers with the ones of empty sub-carriers
-     * @return estimated SNR float value
      */
     void
     ofdm_coarse_frequency_correction_vcvc_impl::measure_snr(const gr_complex *symbol) {
-      // measure normalized energy of occupied sub-carriers
-      float energy = 0;
-      volk_32fc_magnitude_squared_32f(d_mag_squared, &symbol[d_freq_offset], d_num_carriers + 1);
-      volk_32f_accumulator_s32f(&energy, d_mag_squared, d_num_carriers + 1);
-      // subtract the central (DC) carrier which is not assigned
-      energy -= std::real(symbol[d_num_carriers + d_freq_offset]) * std::real(symbol[d_num_carriers + d_freq_offset]) +
-                std::imag(symbol[d_num_carriers + d_freq_offset]) * std::imag(symbol[d_num_carriers + d_freq_offset]);
-
-      // measure normalized energy of empty sub-carriers
-      float noise_left = 0, noise_right, noise_total;
-      // empty sub-carriers on left side
-      volk_32fc_magnitude_squared_32f(d_mag_squared, symbol, d_freq_offset);
-      volk_32f_accumulator_s32f(&noise_left, d_mag_squared, d_freq_offset);
-      // empty sub-carriers on right side
-      volk_32fc_magnitude_squared_32f(d_mag_squared,
-                                      &symbol[d_freq_offset + d_num_carriers + 1],
-                                      d_fft_length - d_num_carriers - d_freq_offset - 1);
-      volk_32f_accumulator_s32f(&noise_right,
-                                d_mag_squared,
-                                d_fft_length - d_num_carriers - d_freq_offset - 1);
-      // add noise energies from both sides to total noise
-      noise_total = noise_left + noise_right;
-      noise_total += std::real(symbol[d_freq_offset + d_num_carriers / 2]) * std::real(symbol[d_freq_offset + d_num_carriers / 2]) +
-                     std::imag(symbol[d_freq_offset + d_num_carriers / 2]) * std::imag(symbol[d_freq_offset + d_num_carriers / 2]);
-
-      // normalize
-      energy = energy / d_num_carriers;
-      noise_total = noise_total / (d_fft_length - d_num_carriers);
-      // check if ratio is in the definition range of the log
-      if (energy > noise_total) {
-        // now we can calculate the SNR in dB
-        d_snr = 10 * log10((energy - noise_total) / noise_total);
-      }
+      float snr = d_snr.load();
+      measure_carrier_snr(symbol, d_fft_length, d_num_carriers, d_freq_offset, d_mag_squared, snr);
+      d_snr.store(snr);
     }
 
     int
@@ -153,7 +91,7 @@ namespace gr {
       std::vector <gr::tag_t> tags;
       unsigned int tag_count = 0;
       // get tags for the beginning of a frame
-      get_tags_in_window(tags, 0, 0, noutput_items);
+      get_tags_in_window(tags, 0, 0, noutput_items, pmt::string_to_symbol("Start"));
       for (int i = 0; i < noutput_items; ++i) {
         /* new calculation for each new frame, measured at the pilot symbol and frequency correction
          * applied for all symbols of this frame
@@ -23,6 +23,7 @@
 #define INCLUDED_DAB_OFDM_COARSE_FREQUENCY_CORRECTION_VCVC_IMPL_H
 
 #include <gnuradio/dab/ofdm_coarse_frequency_correction_vcvc.h>
+#include <atomic>
 
 namespace gr {
   namespace dab {
@@ -39,8 +40,8 @@ namespace gr {
       int d_num_carriers;
       int d_cyclic_prefix_length;
       float *d_mag_squared;
-      unsigned int d_freq_offset; /*!< measured position of the first occupied sub-carrier*/
-      float d_snr; /*!< measured snr*/
+      std::atomic<unsigned int> d_freq_offset; /*!< measured position of the first occupied sub-carrier*/
+      std::atomic<float> d_snr; /*!< measured snr, read by get_snr() from other threads*/
 
     public:
       ofdm_coarse_frequency_correction_vcvc_impl(int fft_length,
@@ -53,7 +54,9 @@ namespace gr {
 
       void measure_snr(const gr_complex *);
 
-      virtual float get_snr() { return d_snr; }
+      virtual float get_snr() { return d_snr.load(); }
+
+      virtual unsigned int get_freq_offset() { return d_freq_offset.load(); }
 
       // Where all the action really happens
       int work(int noutput_items,
@@ -0,0 +1,210 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "ofdm_differential_demod_vcvc_impl.h"
+#include "ofdm_carrier_measurement.h"
+#include <volk/volk.h>
+#include <algorithm>
+#include <cassert>
+#include <stdexcept>
+#include <cstring>
+
+namespace gr {
+  namespace dab {
+
+    ofdm_differential_demod_vcvc::sptr
+    ofdm_differential_demod_vcvc::make(int fft_length, int num_carriers,
+                                       const std::vector<short> &deinterleaving_sequence,
+                                       unsigned int symbols_fic, unsigned int symbols_msc,
+                                       float scale, const std::vector<unsigned char> &symbol_mask) {
+      return gnuradio::get_initial_sptr(
+              new ofdm_differential_demod_vcvc_impl(fft_length, num_carriers,
+                                                    deinterleaving_sequence,
+                                                    symbols_fic, symbols_msc, scale,
+                                                    symbol_mask));
+    }
+
+    /*
+     * The private constructor
+     */
+    ofdm_differential_demod_vcvc_impl::ofdm_differential_demod_vcvc_impl(
+            int fft_length, int num_carriers,
+            const std::vector<short> &deinterleaving_sequence,
+            unsigned int symbols_fic, unsigned int symbols_msc, float scale,
+            const std::vector<unsigned char> &symbol_mask)
+            : gr::block("ofdm_differential_demod_vcvc",
+                        gr::io_signature::make(1, 1, fft_length * sizeof(gr_complex)),
+                        gr::io_signature::make(2, 2, num_carriers * sizeof(gr_complex))),
+              d_fft_length(fft_length),
+              d_num_carriers(num_carriers),
+              d_symbols_fic(symbols_fic),
+              d_symbols_msc(symbols_msc),
+              d_scale(scale),
+              d_symbol_mask(symbol_mask),
+              d_freq_offset(0),
+              d_snr(0),
+              d_fic_counter(symbols_fic),
+              d_msc_counter(symbols_msc) {
+      if (deinterleaving_sequence.size() != (unsigned int) num_carriers) {
+        throw std::invalid_argument("deinterleaving sequence has to be of length num_carriers");
+      }
+      if (!symbol_mask.empty() && symbol_mask.size() != 1 + symbols_fic + symbols_msc) {
+        throw std::invalid_argument("symbol mask has to be of length 1 + symbols_fic + symbols_msc");
+      }
+      set_tag_propagation_policy(TPP_DONT);
+      // the deinterleaver writes input carrier j to output carrier sequence[j],
+      // we invert this to read all output carriers in one gather
+      d_deinterleaving_gather.resize(num_carriers);
+      for (int j = 0; j < num_carriers; j++) {
+        assert(deinterleaving_sequence[j] < (short) num_carriers);
+        d_deinterleaving_gather[deinterleaving_sequence[j]] = j;
+      }
+      unsigned int alignment = volk_get_alignment();
+      d_mag_squared = (float *) volk_malloc(
+              sizeof(float) * std::max(num_carriers + 1, fft_length - num_carriers), alignment);
+      d_reference = (gr_complex *) volk_malloc(sizeof(gr_complex) * num_carriers, alignment);
+      d_current = (gr_complex *) volk_malloc(sizeof(gr_complex) * num_carriers, alignment);
+      d_phasor = (gr_complex *) volk_malloc(sizeof(gr_complex) * num_carriers, alignment);
+      memset(d_reference, 0, sizeof(gr_complex) * num_carriers);
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    ofdm_differential_demod_vcvc_impl::~ofdm_differential_demod_vcvc_impl() {
+      volk_free(d_mag_squared);
+      volk_free(d_reference);
+      volk_free(d_current);
+      volk_free(d_phasor);
+    }
+
+    void
+    ofdm_differential_demod_vcvc_impl::forecast(int noutput_items, gr_vector_int &ninput_items_required) {
+      ninput_items_required[0] = noutput_items;
+    }
+
+    void
+    ofdm_differential_demod_vcvc_impl::extract_carriers(const gr_complex *symbol, gr_complex *carriers) {
+      // first half (left of central sub-carrier) of the sub-carriers
+      volk_32fc_s32f_multiply_32fc(carriers, &symbol[d_freq_offset], d_scale, d_num_carriers / 2);
+      // second half (right of central sub-carrier) of the sub-carriers
+      volk_32fc_s32f_multiply_32fc(carriers + d_num_carriers / 2,
+                                   &symbol[d_freq_offset + d_num_carriers / 2 + 1],
+                                   d_scale, d_num_carriers / 2);
+    }
+
+    void
+    ofdm_differential_demod_vcvc_impl::demodulate(const gr_complex *symbol, gr_complex *out) {
+      extract_carriers(symbol, d_current);
+      volk_32fc_x2_multiply_conjugate_32fc(d_phasor, d_current, d_reference, d_num_carriers);
+      for (int k = 0; k < d_num_carriers; k++) {
+        out[k] = d_phasor[d_deinterleaving_gather[k]];
+      }
+      std::swap(d_current, d_reference);
+    }
+
+    int
+    ofdm_differential_demod_vcvc_impl::general_work(int noutput_items,
+                                                    gr_vector_int &ninput_items,
+                                                    gr_vector_const_void_star &input_items,
+                                                    gr_vector_void_star &output_items) {
+      const gr_complex *in = (const gr_complex *) input_items[0];
+      gr_complex *fic_out = (gr_complex *) output_items[0];
+      gr_complex *msc_out = (gr_complex *) output_items[1];
+      unsigned int nconsumed = 0;
+      unsigned int fic_syms_written = 0;
+      unsigned int msc_syms_written = 0;
+
+      // get tags for the beginning of a frame
+      std::vector <gr::tag_t> tags;
+      unsigned int tag_count = 0;
+      get_tags_in_window(tags, 0, 0, noutput_items, pmt::string_to_symbol("Start"));
+
+      for (int i = 0; i < noutput_items; ++i) {
+        if (tag_count < tags.size() &&
+            tags[tag_count].offset - nitems_read(0) - nconsumed == 0) {
+          // This input symbol is tagged: a new frame begins here.
+          if (d_fic_counter % d_symbols_fic == 0 &&
+              d_msc_counter % d_symbols_msc == 0) {
+            /* We are at the beginning of a frame and also finished writing the last frame.
+             * The phase reference symbol is used for the coarse frequency correction
+             * and as reference for the first differential phasor, but not written out. */
+            const gr_complex *symbol = &in[nconsumed++ * d_fft_length];
+            d_freq_offset = measure_coarse_frequency_offset(symbol, d_fft_length, d_num_carriers, d_mag_squared);
+            float snr = d_snr.load();
+            measure_carrier_snr(symbol, d_fft_length, d_num_carriers, d_freq_offset, d_mag_squared, snr);
+            d_snr.store(snr);
+            extract_carriers(symbol, d_reference);
+            tag_count++;
+            d_fic_counter = 0;
+            d_msc_counter = 0;
+          } else {
+            /* We did not finish the last frame, maybe we lost track in sync during a frame.
+             * Let's fill the remaining symbols with zeros
+             * before continuing with the new input frame. */
+            if (d_fic_counter % d_symbols_fic != 0) {
+              memset(&fic_out[fic_syms_written++ * d_num_carriers], 0,
+                     d_num_carriers * sizeof(gr_complex));
+              d_fic_counter++;
+            } else {
+              memset(&msc_out[msc_syms_written++ * d_num_carriers], 0,
+                     d_num_carriers * sizeof(gr_complex));
+              d_msc_counter++;
+            }
+          }
+        } else if (d_fic_counter < d_symbols_fic) {
+          demodulate(&in[nconsumed++ * d_fft_length], &fic_out[fic_syms_written++ * d_num_carriers]);
+          d_fic_counter++;
+        } else if (d_msc_counter < d_symbols_msc) {
+          const unsigned int index = 1 + d_symbols_fic + d_msc_counter;
+          const gr_complex *symbol = &in[nconsumed++ * d_fft_length];
+          gr_complex *out = &msc_out[msc_syms_written++ * d_num_carriers];
+          if (d_symbol_mask.empty() || (d_symbol_mask[index] && d_symbol_mask[index - 1])) {
+            demodulate(symbol, out);
+          } else {
+            if (d_symbol_mask[index]) {
+              // this symbol is only transformed as reference for the next one
+              extract_carriers(symbol, d_reference);
+            }
+            memset(out, 0, d_num_carriers * sizeof(gr_complex));
+          }
+          d_msc_counter++;
+        } else {
+          // symbol outside of a frame, we only keep it as reference
+          extract_carriers(&in[nconsumed++ * d_fft_length], d_reference);
+        }
+      }
+      consume_each(nconsumed);
+
+      // Tell runtime system how many output items we produced on each output stream separately.
+      produce(0, fic_syms_written);
+      produce(1, msc_syms_written);
+      return WORK_CALLED_PRODUCE;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
+
@@ -0,0 +1,99 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_IMPL_H
+#define INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_IMPL_H
+
+#include <gnuradio/dab/ofdm_differential_demod_vcvc.h>
+#include <atomic>
+
+namespace gr {
+  namespace dab {
+/*! \brief demodulation of the OFDM symbols after the FFT in one pass
+ * Does the work of multiply_const_vcc, ofdm_coarse_frequency_correction_vcvc,
+ * diff_phasor_vcc, frequency_interleaver_vcc and demux_cc, without copying
+ * each symbol through the buffers in between.
+ *
+ * @param fft_length length of the applied FFT; corresponding to the input vector length
+ * @param num_carriers number of occupied carriers; corresponding to the output vector length
+ * @param deinterleaving_sequence frequency deinterleaving sequence (same as for frequency_interleaver_vcc)
+ * @param symbols_fic number of symbols in the fic per transmission frame
+ * @param symbols_msc number of symbols in the msc per transmission frame
+ * @param scale scaling factor for the FFT output
+ * @param symbol_mask flag for each symbol of a frame (phase reference symbol, FIC, MSC),
+ * if it was transformed (empty: all symbols)
+ */
+    class ofdm_differential_demod_vcvc_impl : public ofdm_differential_demod_vcvc {
+    private:
+      int d_fft_length;
+      int d_num_carriers;
+      unsigned int d_symbols_fic;
+      /*!< Number of OFDM symbols with FIC content per transmission frame. */
+      unsigned int d_symbols_msc;
+      /*!< Number of OFDM symbols with MSC content per transmission frame. */
+      float d_scale; /*!< Scaling factor, applied while extracting the carriers. */
+      std::vector<unsigned char> d_symbol_mask;
+      /*!< Symbols of a frame which were transformed, empty if all symbols were transformed. */
+      std::vector<unsigned int> d_deinterleaving_gather;
+      /*!< Index of the input carrier for each output carrier (inverse of the deinterleaving sequence). */
+      float *d_mag_squared;
+      gr_complex *d_reference;
+      /*!< Occupied carriers of the previous symbol, reference for the differential phasor. */
+      gr_complex *d_current; /*!< Occupied carriers of the current symbol. */
+      gr_complex *d_phasor; /*!< Differential phasors of the current symbol before deinterleaving. */
+      std::atomic<unsigned int> d_freq_offset; /*!< measured position of the first occupied sub-carrier*/
+      std::atomic<float> d_snr; /*!< measured snr, read by get_snr() from other threads*/
+      unsigned int d_fic_counter; /*!< Counts the symbols containing fic data. */
+      unsigned int d_msc_counter; /*!< Counts the symbols containing msc data. */
+
+      /*! \brief Copies the occupied carriers of a symbol (without the central carrier) and scales them. */
+      void extract_carriers(const gr_complex *symbol, gr_complex *carriers);
+
+      /*! \brief Differential demodulation and deinterleaving of one symbol.
+       * The symbol becomes the reference for the next one.
+       */
+      void demodulate(const gr_complex *symbol, gr_complex *out);
+
+    public:
+      ofdm_differential_demod_vcvc_impl(int fft_length, int num_carriers,
+                                        const std::vector<short> &deinterleaving_sequence,
+                                        unsigned int symbols_fic, unsigned int symbols_msc,
+                                        float scale, const std::vector<unsigned char> &symbol_mask);
+
+      ~ofdm_differential_demod_vcvc_impl();
+
+      virtual float get_snr() { return d_snr.load(); }
+
+      virtual unsigned int get_freq_offset() { return d_freq_offset.load(); }
+
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_DIFFERENTIAL_DEMOD_VCVC_IMPL_H */
+
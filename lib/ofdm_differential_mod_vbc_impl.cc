@@ -0,0 +1,260 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include <gnuradio/fft/fft.h>
+#include "ofdm_differential_mod_vbc_impl.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+
+namespace gr {
+  namespace dab {
+
+    /* Plans for all (fft_length, num_symbols, symbol_length) combinations used in this process.
+     * Access is protected by the FFTW planner mutex of GNU Radio. */
+    static std::map<std::tuple<int, int, int>, fftwf_plan> s_plans;
+
+    /* The same wisdom file is used as for the FFT blocks of GNU Radio. */
+    static std::string
+    wisdom_filename() {
+      const char *home = getenv("HOME");
+      return std::string(home ? home : ".") + "/.gr_fftw_wisdom";
+    }
+
+    /* phase of the QPSK symbol in multiples of pi/4, indexed by [real bit][imaginary bit] (bit 1: negative) */
+    static const uint8_t QPSK_PHASE[2][2] = {{1, 7},
+                                             {3, 5}};
+
+    ofdm_differential_mod_vbc::sptr
+    ofdm_differential_mod_vbc::make(int fft_length, int num_carriers, int cp_length, int ns_length,
+                                    int symbols_per_frame, const std::vector<gr_complex> &prn,
+                                    const std::vector<short> &interleaving_sequence, float scale) {
+      return gnuradio::get_initial_sptr(
+              new ofdm_differential_mod_vbc_impl(fft_length, num_carriers, cp_length, ns_length,
+                                                 symbols_per_frame, prn, interleaving_sequence, scale));
+    }
+
+    /*
+     * The private constructor
+     */
+    ofdm_differential_mod_vbc_impl::ofdm_differential_mod_vbc_impl(int fft_length, int num_carriers,
+                                                                   int cp_length, int ns_length,
+                                                                   int symbols_per_frame,
+                                                                   const std::vector<gr_complex> &prn,
+                                                                   const std::vector<short> &interleaving_sequence,
+                                                                   float scale)
+            : gr::block("ofdm_differential_mod_vbc",
+                        gr::io_signature::make2(2, 2, sizeof(char) * num_carriers / 4, sizeof(char)),
+                        gr::io_signature::make(1, 1, sizeof(gr_complex))),
+              d_fft_length(fft_length),
+              d_num_carriers(num_carriers),
+              d_cp_length(cp_length),
+              d_ns_length(ns_length),
+              d_symbol_length(cp_length + fft_length),
+              d_num_data_symbols(symbols_per_frame - 1),
+              d_frame_length(ns_length + symbols_per_frame * (cp_length + fft_length)) {
+      if (num_carriers % 8 != 0 || num_carriers >= fft_length || symbols_per_frame < 2 || cp_length > fft_length) {
+        throw std::invalid_argument("ofdm_differential_mod_vbc: invalid OFDM parameters");
+      }
+      if (prn.size() != (unsigned int) num_carriers || interleaving_sequence.size() != (unsigned int) num_carriers) {
+        throw std::invalid_argument("ofdm_differential_mod_vbc: prn and interleaving sequence need one value per carrier");
+      }
+
+      // output value of each phase (exact for multiples of pi/2)
+      const float re[8] = {1, (float) M_SQRT1_2, 0, (float) -M_SQRT1_2, -1, (float) -M_SQRT1_2, 0, (float) M_SQRT1_2};
+      for (int k = 0; k < 8; ++k) {
+        d_constellation[k] = scale * gr_complex(re[k], re[(k + 6) % 8]);
+      }
+      d_prn_phase.resize(num_carriers);
+      for (int c = 0; c < num_carriers; ++c) {
+        int k = (int) std::lround(std::arg(prn[c]) / (M_PI / 4));
+        d_prn_phase[c] = (k + 8) % 8;
+        if (std::abs(prn[c] - gr_complex(re[d_prn_phase[c]], re[(d_prn_phase[c] + 6) % 8])) > 1e-3) {
+          throw std::invalid_argument("ofdm_differential_mod_vbc: phases of the prn have to be multiples of pi/4");
+        }
+      }
+      d_phase = d_prn_phase;
+
+      // frequency interleaving, central carrier, zero padding and the shift of the IFFT input (as fft_vcc)
+      const int zeros_on_left = (fft_length - num_carriers) / 2;
+      const int shift = fft_length - fft_length / 2;
+      d_bins.resize(num_carriers);
+      for (int c = 0; c < num_carriers; ++c) {
+        int position = interleaving_sequence[c];
+        if (position < 0 || position >= num_carriers) {
+          throw std::invalid_argument("ofdm_differential_mod_vbc: invalid interleaving sequence");
+        }
+        int bin = zeros_on_left + position + (position >= num_carriers / 2 ? 1 : 0);
+        d_bins[c] = (bin + shift) % fft_length;
+      }
+
+      d_freq = (fftwf_complex *) fftwf_malloc(sizeof(fftwf_complex) * fft_length * d_num_data_symbols);
+      d_frame = (gr_complex *) fftwf_malloc(sizeof(gr_complex) * d_frame_length);
+      gr_complex *first_data_symbol = &d_frame[d_ns_length + d_symbol_length];
+      d_plan = get_plan(fft_length, d_num_data_symbols, d_symbol_length, d_freq,
+                        (fftwf_complex *) &first_data_symbol[d_cp_length]);
+
+      // the planning overwrites the buffers: the NULL symbol and the unused bins are zero from now on
+      memset(d_freq, 0, sizeof(fftwf_complex) * fft_length * d_num_data_symbols);
+      memset(d_frame, 0, sizeof(gr_complex) * d_frame_length);
+
+      // the phase reference symbol is the same in every frame, transform it once
+      gr_complex *spectrum = (gr_complex *) d_freq;
+      for (int c = 0; c < num_carriers; ++c) {
+        spectrum[d_bins[c]] = d_constellation[d_prn_phase[c]];
+      }
+      fftwf_execute_dft(d_plan, d_freq, (fftwf_complex *) &first_data_symbol[d_cp_length]);
+      gr_complex *pilot = &d_frame[d_ns_length];
+      memcpy(&pilot[d_cp_length], &first_data_symbol[d_cp_length], sizeof(gr_complex) * fft_length);
+      memcpy(pilot, &pilot[fft_length], sizeof(gr_complex) * d_cp_length);
+      for (int c = 0; c < num_carriers; ++c) {
+        spectrum[d_bins[c]] = 0;
+      }
+
+      // no frame pending
+      d_frame_pos = d_frame_length;
+      set_relative_rate(static_cast<double>(d_frame_length) / static_cast<double>(d_num_data_symbols));
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    ofdm_differential_mod_vbc_impl::~ofdm_differential_mod_vbc_impl() {
+      // the plan stays in the cache for the next instance
+      fftwf_free(d_freq);
+      fftwf_free(d_frame);
+    }
+
+    fftwf_plan
+    ofdm_differential_mod_vbc_impl::get_plan(int fft_length, int num_symbols, int symbol_length,
+                                             fftwf_complex *in, fftwf_complex *out) {
+      gr::fft::planner::scoped_lock lock(gr::fft::planner::mutex());
+      std::tuple<int, int, int> dimensions(fft_length, num_symbols, symbol_length);
+      std::map<std::tuple<int, int, int>, fftwf_plan>::iterator it = s_plans.find(dimensions);
+      if (it != s_plans.end()) {
+        return it->second;
+      }
+      const std::string filename = wisdom_filename();
+      fftwf_import_wisdom_from_filename(filename.c_str());
+      // one backward transform per data symbol, each written behind its cyclic prefix
+      fftwf_plan plan = fftwf_plan_many_dft(1, &fft_length, num_symbols,
+                                            in, NULL, 1, fft_length,
+                                            out, NULL, 1, symbol_length,
+                                            FFTW_BACKWARD, FFTW_MEASURE);
+      fftwf_export_wisdom_to_filename(filename.c_str());
+      s_plans[dimensions] = plan;
+      return plan;
+    }
+
+    void
+    ofdm_differential_mod_vbc_impl::forecast(int noutput_items,
+                                             gr_vector_int &ninput_items_required) {
+      // a new frame is only needed after the last one is written out
+      int required = (d_frame_pos < d_frame_length) ? 0 : d_num_data_symbols;
+      ninput_items_required[0] = required;
+      ninput_items_required[1] = required;
+    }
+
+    void
+    ofdm_differential_mod_vbc_impl::modulate_frame(const unsigned char *in) {
+      const int bytes_per_symbol = d_num_carriers / 4;
+      const int half = d_num_carriers / 8;
+      gr_complex *spectrum = (gr_complex *) d_freq;
+      uint8_t *phase = &d_phase[0];
+
+      // QPSK mapping and differential modulation, starting from the phase reference symbol
+      memcpy(phase, &d_prn_phase[0], d_num_carriers);
+      for (int sym = 0; sym < d_num_data_symbols; ++sym) {
+        const unsigned char *bytes = &in[sym * bytes_per_symbol];
+        gr_complex *bins = &spectrum[sym * d_fft_length];
+        for (int j = 0; j < half; ++j) {
+          const unsigned char real_bits = bytes[j];
+          const unsigned char imag_bits = bytes[half + j];
+          for (int k = 0; k < 8; ++k) {
+            const int c = 8 * j + k;
+            phase[c] = (phase[c] + QPSK_PHASE[(real_bits >> (7 - k)) & 1][(imag_bits >> (7 - k)) & 1]) & 7;
+            bins[d_bins[c]] = d_constellation[phase[c]];
+          }
+        }
+      }
+
+      // IFFT of all data symbols directly into the frame
+      gr_complex *first_data_symbol = &d_frame[d_ns_length + d_symbol_length];
+      fftwf_execute_dft(d_plan, d_freq, (fftwf_complex *) &first_data_symbol[d_cp_length]);
+
+      // cyclic prefixes
+      for (int sym = 0; sym < d_num_data_symbols; ++sym) {
+        gr_complex *symbol = &first_data_symbol[sym * d_symbol_length];
+        memcpy(symbol, &symbol[d_fft_length], sizeof(gr_complex) * d_cp_length);
+      }
+    }
+
+    int
+    ofdm_differential_mod_vbc_impl::general_work(int noutput_items,
+                                                 gr_vector_int &ninput_items,
+                                                 gr_vector_const_void_star &input_items,
+                                                 gr_vector_void_star &output_items) {
+      const unsigned char *in = (const unsigned char *) input_items[0];
+      const char *trigger = (const char *) input_items[1];
+      gr_complex *out = (gr_complex *) output_items[0];
+      const int ninput = std::min(ninput_items[0], ninput_items[1]);
+      const int bytes_per_symbol = d_num_carriers / 4;
+
+      int consumed = 0;
+      int produced = 0;
+      while (produced < noutput_items) {
+        if (d_frame_pos == d_frame_length) {
+          // symbols before the first frame start are dropped
+          while (consumed < ninput && trigger[consumed] != 1) {
+            consumed++;
+          }
+          if (ninput - consumed < d_num_data_symbols) {
+            break;
+          }
+          modulate_frame(&in[consumed * bytes_per_symbol]);
+          consumed += d_num_data_symbols;
+          d_frame_pos = 0;
+        }
+        int n = std::min(noutput_items - produced, d_frame_length - d_frame_pos);
+        memcpy(&out[produced], &d_frame[d_frame_pos], sizeof(gr_complex) * n);
+        produced += n;
+        d_frame_pos += n;
+      }
+
+      // Tell runtime system how many input items we consumed on
+      // each input stream.
+      consume_each(consumed);
+
+      // Tell runtime system how many output items we produced.
+      return produced;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
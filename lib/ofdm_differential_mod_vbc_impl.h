@@ -0,0 +1,95 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_IMPL_H
+#define INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_IMPL_H
+
+#include <gnuradio/dab/ofdm_differential_mod_vbc.h>
+#include <fftw3.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief OFDM modulation of whole transmission frames.
+ * The differential modulation is done on the phase as multiple of pi/4, so the
+ * phase of every carrier is exact over the whole frame. The carriers are written
+ * directly to their (interleaved and shifted) IFFT bin. One FFTW plan transforms
+ * all data symbols of a frame and writes each symbol behind the room for its
+ * cyclic prefix in the frame buffer. The NULL symbol and the phase reference
+ * symbol are constant and calculated once.
+ *
+ * @param fft_length Length of the IFFT.
+ * @param num_carriers Number of used sub-carriers.
+ * @param cp_length Length of the cyclic prefix.
+ * @param ns_length Length of the NULL symbol.
+ * @param symbols_per_frame Number of OFDM symbols per frame, including the phase reference symbol.
+ * @param prn Phase reference symbol.
+ * @param interleaving_sequence Frequency interleaving sequence.
+ * @param scale Scaling factor for the output samples.
+ */
+    class ofdm_differential_mod_vbc_impl : public ofdm_differential_mod_vbc {
+    private:
+      int d_fft_length;
+      int d_num_carriers;
+      int d_cp_length;
+      int d_ns_length;
+      int d_symbol_length; /*!< cp_length + fft_length */
+      int d_num_data_symbols; /*!< input symbols per frame (symbols_per_frame - 1) */
+      int d_frame_length; /*!< output samples per frame, including the NULL symbol */
+      std::vector<int> d_bins; /*!< IFFT bin of each carrier */
+      std::vector<uint8_t> d_prn_phase; /*!< phase of the phase reference symbol in multiples of pi/4 */
+      std::vector<uint8_t> d_phase; /*!< current phase of each carrier in multiples of pi/4 */
+      gr_complex d_constellation[8]; /*!< scaled output value for each phase */
+      fftwf_complex *d_freq;
+      /*!< Spectra of the data symbols of a frame, only the carrier bins are written. */
+      gr_complex *d_frame; /*!< Time domain samples of the current frame. */
+      fftwf_plan d_plan;
+      /*!< Plan for the IFFT of all data symbols of a frame into d_frame, owned by the plan cache. */
+      int d_frame_pos; /*!< Number of samples of d_frame which are already written out. */
+
+      /*! \brief Modulates the data symbols of one frame into d_frame. */
+      void modulate_frame(const unsigned char *in);
+
+      /*! \brief Returns the cached plan for the given dimensions, creates it if needed.
+       * @param in Aligned buffer for the spectra, used for planning.
+       * @param out First data symbol in the frame buffer, used for planning.
+       */
+      static fftwf_plan get_plan(int fft_length, int num_symbols, int symbol_length,
+                                 fftwf_complex *in, fftwf_complex *out);
+
+    public:
+      ofdm_differential_mod_vbc_impl(int fft_length, int num_carriers, int cp_length, int ns_length,
+                                     int symbols_per_frame, const std::vector<gr_complex> &prn,
+                                     const std::vector<short> &interleaving_sequence, float scale);
+
+      ~ofdm_differential_mod_vbc_impl();
+
+      // Where all the action really happens
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_DIFFERENTIAL_MOD_VBC_IMPL_H */
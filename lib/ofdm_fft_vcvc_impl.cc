@@ -0,0 +1,173 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include <gnuradio/fft/fft.h>
+#include "ofdm_fft_vcvc_impl.h"
+#include <volk/volk.h>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <utility>
+
+namespace gr {
+  namespace dab {
+
+    /* Plans for all (fft_length, symbols_per_frame) combinations used in this process.
+     * Access is protected by the FFTW planner mutex of GNU Radio. */
+    static std::map<std::pair<int, int>, fftwf_plan> s_plans;
+
+    /* The same wisdom file is used as for the FFT blocks of GNU Radio. */
+    static std::string
+    wisdom_filename() {
+      const char *home = getenv("HOME");
+      return std::string(home ? home : ".") + "/.gr_fftw_wisdom";
+    }
+
+    ofdm_fft_vcvc::sptr
+    ofdm_fft_vcvc::make(int fft_length, int symbols_per_frame, float scale,
+                        const std::vector<unsigned char> &symbol_mask) {
+      return gnuradio::get_initial_sptr(
+              new ofdm_fft_vcvc_impl(fft_length, symbols_per_frame, scale, symbol_mask));
+    }
+
+    /*
+     * The private constructor
+     */
+    ofdm_fft_vcvc_impl::ofdm_fft_vcvc_impl(int fft_length, int symbols_per_frame, float scale,
+                                           const std::vector<unsigned char> &symbol_mask)
+            : gr::sync_block("ofdm_fft_vcvc",
+                             gr::io_signature::make(1, 1, fft_length * sizeof(gr_complex)),
+                             gr::io_signature::make(1, 1, fft_length * sizeof(gr_complex))),
+              d_fft_length(fft_length),
+              d_symbols_per_frame(symbols_per_frame),
+              d_scale(scale),
+              d_symbol_mask(symbol_mask),
+              d_symbol_index(symbols_per_frame) {
+      if (!symbol_mask.empty() && symbol_mask.size() != (unsigned int) symbols_per_frame) {
+        throw std::invalid_argument("symbol mask has to be of length symbols_per_frame");
+      }
+      d_buffer = (fftwf_complex *) fftwf_malloc(sizeof(fftwf_complex) * fft_length * symbols_per_frame);
+      // with a symbol mask, the symbols are transformed one by one
+      d_plan = get_plan(fft_length, d_symbol_mask.empty() ? symbols_per_frame : 1, d_buffer);
+      set_output_multiple(symbols_per_frame);
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    ofdm_fft_vcvc_impl::~ofdm_fft_vcvc_impl() {
+      // the plan stays in the cache for the next instance
+      fftwf_free(d_buffer);
+    }
+
+    fftwf_plan
+    ofdm_fft_vcvc_impl::get_plan(int fft_length, int symbols_per_frame, fftwf_complex *buffer) {
+      gr::fft::planner::scoped_lock lock(gr::fft::planner::mutex());
+      std::pair<int, int> dimensions(fft_length, symbols_per_frame);
+      std::map<std::pair<int, int>, fftwf_plan>::iterator it = s_plans.find(dimensions);
+      if (it != s_plans.end()) {
+        return it->second;
+      }
+      const std::string filename = wisdom_filename();
+      fftwf_import_wisdom_from_filename(filename.c_str());
+      // FFTW_MEASURE overwrites the buffer, which is no problem before the first work call
+      fftwf_plan plan = fftwf_plan_many_dft(1, &fft_length, symbols_per_frame,
+                                            buffer, NULL, 1, fft_length,
+                                            buffer, NULL, 1, fft_length,
+                                            FFTW_FORWARD, FFTW_MEASURE);
+      fftwf_export_wisdom_to_filename(filename.c_str());
+      s_plans[dimensions] = plan;
+      return plan;
+    }
+
+    void
+    ofdm_fft_vcvc_impl::shift_and_scale(const gr_complex *spectrum, gr_complex *out) {
+      // same shift as fft_vcc of GNU Radio, also for an odd fft_length
+      const unsigned int lower_half = d_fft_length / 2;
+      const unsigned int upper_half = d_fft_length - lower_half;
+      volk_32fc_s32f_multiply_32fc(out, &spectrum[lower_half], d_scale, upper_half);
+      volk_32fc_s32f_multiply_32fc(&out[upper_half], spectrum, d_scale, lower_half);
+    }
+
+    int
+    ofdm_fft_vcvc_impl::selective_work(int noutput_items, const gr_complex *in, gr_complex *out) {
+      // get tags for the beginning of a frame
+      std::vector<gr::tag_t> tags;
+      unsigned int tag_count = 0;
+      get_tags_in_window(tags, 0, 0, noutput_items, pmt::string_to_symbol("Start"));
+
+      for (int i = 0; i < noutput_items; ++i) {
+        if (tag_count < tags.size() && tags[tag_count].offset - nitems_read(0) == (uint64_t) i) {
+          d_symbol_index = 0;
+          tag_count++;
+        }
+        // symbols outside of a frame are not needed either
+        if (d_symbol_index < d_symbols_per_frame && d_symbol_mask[d_symbol_index]) {
+          memcpy(d_buffer, &in[i * d_fft_length], d_fft_length * sizeof(gr_complex));
+          fftwf_execute_dft(d_plan, d_buffer, d_buffer);
+          shift_and_scale((const gr_complex *) d_buffer, &out[i * d_fft_length]);
+        } else {
+          memset(&out[i * d_fft_length], 0, d_fft_length * sizeof(gr_complex));
+        }
+        if (d_symbol_index < d_symbols_per_frame) {
+          d_symbol_index++;
+        }
+      }
+      return noutput_items;
+    }
+
+    int
+    ofdm_fft_vcvc_impl::work(int noutput_items,
+                             gr_vector_const_void_star &input_items,
+                             gr_vector_void_star &output_items) {
+      const gr_complex *in = (const gr_complex *) input_items[0];
+      gr_complex *out = (gr_complex *) output_items[0];
+      if (!d_symbol_mask.empty()) {
+        return selective_work(noutput_items, in, out);
+      }
+      gr_complex *buffer = (gr_complex *) d_buffer;
+
+      for (int frame = 0; frame < noutput_items / d_symbols_per_frame; ++frame) {
+        memcpy(buffer, in, d_symbols_per_frame * d_fft_length * sizeof(gr_complex));
+        // same plan for all instances: execute it on the buffer of this instance
+        fftwf_execute_dft(d_plan, d_buffer, d_buffer);
+        // shift zero frequency to the middle and scale in one pass
+        for (int sym = 0; sym < d_symbols_per_frame; ++sym) {
+          shift_and_scale(&buffer[sym * d_fft_length], out);
+          out += d_fft_length;
+        }
+        in += d_symbols_per_frame * d_fft_length;
+      }
+
+      // Tell runtime system how many output items we produced.
+      return noutput_items - noutput_items % d_symbols_per_frame;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
+
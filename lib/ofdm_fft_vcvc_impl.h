@@ -0,0 +1,82 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_OFDM_FFT_VCVC_IMPL_H
+#define INCLUDED_DAB_OFDM_FFT_VCVC_IMPL_H
+
+#include <gnuradio/dab/ofdm_fft_vcvc.h>
+#include <fftw3.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief batched forward FFT over all OFDM symbols of a transmission frame
+ * All symbols of a frame are transformed with one call of a FFTW plan for
+ * symbols_per_frame transforms. The plans are shared between all instances
+ * with the same dimensions. The output is shifted (zero frequency in the
+ * middle of the vector) and scaled in the same pass.
+ *
+ * @param fft_length length of the FFT; corresponding to the input and output vector length
+ * @param symbols_per_frame number of symbols which are transformed at once
+ * @param scale scaling factor for the FFT output
+ * @param symbol_mask flag for each symbol of a frame, if it has to be transformed (empty: all symbols)
+ * The symbol positions are counted from the "Start" tag of each frame.
+ */
+    class ofdm_fft_vcvc_impl : public ofdm_fft_vcvc {
+    private:
+      int d_fft_length;
+      int d_symbols_per_frame;
+      float d_scale;
+      fftwf_complex *d_buffer;
+      /*!< Allocated buffer for the symbols of one frame, the FFT is calculated in place. */
+      fftwf_plan d_plan;
+      /*!< Plan for symbols_per_frame FFTs (for one FFT with a symbol mask), owned by the plan cache. */
+      std::vector<unsigned char> d_symbol_mask;
+      /*!< Symbols of a frame which are transformed, empty if all symbols are transformed. */
+      int d_symbol_index; /*!< Position of the next input symbol in its frame. */
+
+      /*! \brief Shifts and scales the FFT output of one symbol. */
+      void shift_and_scale(const gr_complex *spectrum, gr_complex *out);
+
+      /*! \brief Transforms the symbols of the symbol mask, the others are set to zero. */
+      int selective_work(int noutput_items, const gr_complex *in, gr_complex *out);
+
+      /*! \brief Returns the cached plan for the given dimensions, creates it if needed.
+       * @param buffer Aligned buffer of the requested size, used for planning.
+       */
+      static fftwf_plan get_plan(int fft_length, int symbols_per_frame, fftwf_complex *buffer);
+
+    public:
+      ofdm_fft_vcvc_impl(int fft_length, int symbols_per_frame, float scale,
+                         const std::vector<unsigned char> &symbol_mask);
+
+      ~ofdm_fft_vcvc_impl();
+
+      // Where all the action really happens
+      int work(int noutput_items,
+               gr_vector_const_void_star &input_items,
+               gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_OFDM_FFT_VCVC_IMPL_H */
+
@@ -35,6 +35,15 @@
 
 using namespace boost;
 
+/* Number of correlation steps whose lag products and energies are calculated at once with volk. */
+#define ACQUISITION_CHUNK_LENGTH 1024
+/* Number of moving average steps after which the correlation is calculated completely again
+ * to limit the drift caused by float rounding. */
+#define MOVING_AVERAGE_RESYNC 8192
+/* Number of consecutive frames whose predicted start could not be verified,
+ * before the flywheel is released and the frame is searched again from scratch. */
+#define FLYWHEEL_MAX_MISSES 3
+
 namespace gr {
   namespace dab {
 
@@ -65,7 +74,12 @@ namespace gr {
               d_energy_prefix(1),
               d_energy_repetition(1),
               d_frequency_offset_per_sample(0),
+              d_frame_frequency_offset(0),
               d_NULL_detected(false),
+              d_null_symbol_length(null_symbol_length),
+              d_frame_predicted(false),
+              d_locked(false),
+              d_missed_frames(0),
               d_moving_average_counter(0),
               d_symbol_count(0),
               d_on_triangle(false),
@@ -75,6 +89,12 @@ namespace gr {
       //allocation for repeating energy measurements/correlation
       unsigned int alignment = volk_get_alignment();
       d_mag_squared = (float *) volk_malloc(sizeof(float) * d_cyclic_prefix_length, alignment);
+      d_lag_products = (gr_complex *) volk_malloc(
+              sizeof(gr_complex) * (ACQUISITION_CHUNK_LENGTH + d_cyclic_prefix_length), alignment);
+      d_lag_energies = (float *) volk_malloc(
+              sizeof(float) * (ACQUISITION_CHUNK_LENGTH + d_cyclic_prefix_length + d_fft_length), alignment);
+      // the predicted start of a frame is verified in a window of +- a quarter of the cyclic prefix
+      d_flywheel_window = std::min(d_cyclic_prefix_length / 4, ACQUISITION_CHUNK_LENGTH / 2);
       this->set_output_multiple(d_fft_length+d_cyclic_prefix_length);
     }
 
@@ -82,45 +102,64 @@ namespace gr {
      * Our virtual destructor.
      */
     ofdm_synchronization_cvf_impl::~ofdm_synchronization_cvf_impl() {
+      volk_free(d_mag_squared);
+      volk_free(d_lag_products);
+      volk_free(d_lag_energies);
     }
 
     void
     ofdm_synchronization_cvf_impl::forecast(int noutput_items, gr_vector_int &ninput_items_required) {
       ninput_items_required[0] = noutput_items + d_fft_length + d_cyclic_prefix_length + 1;
+      if (d_frame_predicted) {
+        // the verification window behind the NULL symbol has to be available completely
+        ninput_items_required[0] = std::max(ninput_items_required[0],
+                                            d_null_symbol_length + d_flywheel_window +
+                                            d_fft_length + d_cyclic_prefix_length + 1);
+      }
     }
 
     void
-    ofdm_synchronization_cvf_impl::delayed_correlation(const gr_complex *sample, bool new_calculation) {
-      if (d_moving_average_counter > 100000 || d_moving_average_counter == 0 || new_calculation) {
-        //calculate delayed correlation for this sample completely
-        volk_32fc_x2_conjugate_dot_prod_32fc(&d_correlation, sample,
-                                             &sample[d_fft_length],
-                                             d_cyclic_prefix_length);
-         
-        // calculate energy of cyclic prefix for this sample completely
-        volk_32fc_magnitude_squared_32f(d_mag_squared, sample, d_cyclic_prefix_length);
-        volk_32f_accumulator_s32f(&d_energy_prefix, d_mag_squared, d_cyclic_prefix_length);
-
-        // calculate energy of its repetition for this sample completely
-        volk_32fc_magnitude_squared_32f(d_mag_squared, &sample[d_fft_length], d_cyclic_prefix_length);
-        volk_32f_accumulator_s32f(&d_energy_repetition, d_mag_squared, d_cyclic_prefix_length);
-      } else {
-        // calculate next step for moving average
-        d_correlation += sample[d_cyclic_prefix_length - 1] * conj(sample[d_fft_length + d_cyclic_prefix_length - 1]);
-        d_energy_prefix += std::real(sample[d_cyclic_prefix_length - 1] * conj(sample[d_cyclic_prefix_length - 1]));
-        d_energy_repetition += std::real( sample[d_fft_length + d_cyclic_prefix_length - 1] *
-                                          conj(sample[d_fft_length + d_cyclic_prefix_length - 1]));
-        d_correlation -= sample[0] * conj(sample[d_fft_length]);
-        d_energy_prefix -= std::real(sample[0] * conj(sample[0]));
-        d_energy_repetition -= std::real(sample[d_fft_length] * conj(sample[d_fft_length]));
-        d_moving_average_counter++;
-      }
+    ofdm_synchronization_cvf_impl::delayed_correlation(const gr_complex *sample) {
+      //calculate delayed correlation for this sample completely
+      volk_32fc_x2_conjugate_dot_prod_32fc(&d_correlation, sample,
+                                           &sample[d_fft_length],
+                                           d_cyclic_prefix_length);
+
+      // calculate energy of cyclic prefix for this sample completely
+      volk_32fc_magnitude_squared_32f(d_mag_squared, sample, d_cyclic_prefix_length);
+      volk_32f_accumulator_s32f(&d_energy_prefix, d_mag_squared, d_cyclic_prefix_length);
+
+      // calculate energy of its repetition for this sample completely
+      volk_32fc_magnitude_squared_32f(d_mag_squared, &sample[d_fft_length], d_cyclic_prefix_length);
+      volk_32f_accumulator_s32f(&d_energy_repetition, d_mag_squared, d_cyclic_prefix_length);
+    }
+
+    void
+    ofdm_synchronization_cvf_impl::prepare_moving_average(const gr_complex *sample, int length) {
+      // products of all samples entering or leaving the correlation window in this chunk
+      volk_32fc_x2_multiply_conjugate_32fc(d_lag_products, sample, &sample[d_fft_length],
+                                           length + d_cyclic_prefix_length);
+      // magnitude squared of all samples entering or leaving the prefix and the repetition window
+      volk_32fc_magnitude_squared_32f(d_lag_energies, sample,
+                                      length + d_cyclic_prefix_length + d_fft_length);
+    }
+
+    void
+    ofdm_synchronization_cvf_impl::moving_average_step(int step) {
+      // add the sample entering the window and subtract the sample leaving it
+      d_correlation += d_lag_products[step + d_cyclic_prefix_length - 1] - d_lag_products[step - 1];
+      d_energy_prefix += d_lag_energies[step + d_cyclic_prefix_length - 1] - d_lag_energies[step - 1];
+      d_energy_repetition += d_lag_energies[step + d_fft_length + d_cyclic_prefix_length - 1] -
+                             d_lag_energies[step + d_fft_length - 1];
+    }
+
+    void
+    ofdm_synchronization_cvf_impl::normalize_correlation() {
       // normalize
       d_correlation_normalized = d_correlation / std::sqrt(d_energy_prefix * d_energy_repetition);
       // calculate magnitude
       d_correlation_normalized_magnitude = d_correlation_normalized.real() * d_correlation_normalized.real() +
                                            d_correlation_normalized.imag() * d_correlation_normalized.imag();
-
     }
 
     /*! \brief returns true at a point with a little space before the peak of a correlation triangular
@@ -162,6 +201,28 @@ namespace gr {
         }
     }
 
+    int
+    ofdm_synchronization_cvf_impl::search_predicted_start(const gr_complex *sample) {
+      const int window_start = d_null_symbol_length - d_flywheel_window;
+      const int window_steps = 2 * d_flywheel_window;
+      float maximum = 0;
+      int peak = -1;
+      delayed_correlation(&sample[window_start]);
+      prepare_moving_average(&sample[window_start], window_steps);
+      for (int step = 0; step <= window_steps; ++step) {
+        if (step > 0) {
+          moving_average_step(step);
+        }
+        normalize_correlation();
+        if (d_correlation_normalized_magnitude > maximum) {
+          maximum = d_correlation_normalized_magnitude;
+          peak = window_start + step;
+        }
+      }
+      // the peak has to reach the same threshold we use to enter a correlation triangle
+      return (maximum > 0.35) ? peak : -1;
+    }
+
     int
     ofdm_synchronization_cvf_impl::general_work(int noutput_items,
                                                 gr_vector_int &ninput_items,
@@ -176,13 +237,17 @@ namespace gr {
           unsigned int num_syms = std::min(d_symbols_per_frame - d_symbol_count, noutput_items / (d_fft_length + d_cyclic_prefix_length));
           for (int sym_i = 0; sym_i < num_syms; ++sym_i) {
               // Measure frequency offset for each symbol individually.
-              delayed_correlation(&in[sym_i * (d_fft_length + d_cyclic_prefix_length)], true);
+              delayed_correlation(&in[sym_i * (d_fft_length + d_cyclic_prefix_length)]);
               d_frequency_offset_per_sample = std::arg(d_correlation) / d_fft_length; // in rad/sample
-              if (d_symbol_count == 0) {
+              if (d_symbol_count + sym_i == 0) {
                 d_phase = gr_complex(1,0);
+                d_frame_frequency_offset.store(d_frequency_offset_per_sample);
                 this->add_item_tag(0, this->nitems_written(0) + nwritten,
                                    pmt::mp("Start"),
                                    pmt::from_float(std::arg(d_correlation)));
+                this->add_item_tag(0, this->nitems_written(0) + nwritten,
+                                   pmt::mp("Lock"),
+                                   pmt::from_bool(d_locked.load()));
               }
               d_phase *= std::polar(float(1.0), static_cast<float>(d_cyclic_prefix_length * d_frequency_offset_per_sample));
               volk_32fc_s32fc_x2_rotator_32fc(
@@ -196,13 +261,62 @@ namespace gr {
               d_tracking = false;
               d_symbol_count = 0;
               d_NULL_detected = false;
+              // the next frame starts one NULL symbol after the end of this frame
+              d_frame_predicted = true;
           }
           consume_each(num_syms * (d_fft_length + d_cyclic_prefix_length));
           return nwritten;
 
-      } else { // Acquisition mode -> we search for the start of the next OFDM frame.
+      }
+      if (d_frame_predicted) { // Flywheel mode -> we verify the predicted start of the next OFDM frame.
+          if (ninput_items[0] < d_null_symbol_length + d_flywheel_window + d_fft_length + d_cyclic_prefix_length + 1) {
+              // wait for the complete verification window
+              consume_each(0);
+              return 0;
+          }
+          d_frame_predicted = false;
+          int frame_start = search_predicted_start(in);
+          if (frame_start >= 0) { // Prediction verified, we are locked to the frame timing.
+              d_locked = true;
+              d_missed_frames = 0;
+              d_tracking = true;
+              d_symbol_count = 0;
+              consume_each(frame_start);
+              return 0;
+          } else if (d_locked && ++d_missed_frames < FLYWHEEL_MAX_MISSES) {
+              // Prediction missed, but we keep the frame timing for a few frames.
+              d_tracking = true;
+              d_symbol_count = 0;
+              consume_each(d_null_symbol_length);
+              return 0;
+          } else { // Lost the frame timing, fall back to acquisition.
+              d_locked = false;
+              d_missed_frames = 0;
+          }
+      }
+      { // Acquisition mode -> we search for the start of the next OFDM frame.
+        int chunk_start = 0; // start of the chunk prepared for the moving average
+        int chunk_steps = 0; // number of moving average steps covered by the prepared chunk
+        d_moving_average_counter = 0;
         for (int i = 0; i < noutput_items; ++i) {
-            delayed_correlation(&in[i], true);
+            if (d_moving_average_counter == 0 || d_moving_average_counter >= MOVING_AVERAGE_RESYNC) {
+                // (re)start the moving average with a complete calculation to avoid drifting
+                delayed_correlation(&in[i]);
+                d_moving_average_counter = 1;
+                chunk_start = i;
+                chunk_steps = std::min(ACQUISITION_CHUNK_LENGTH, noutput_items - 1 - chunk_start);
+                prepare_moving_average(&in[chunk_start], chunk_steps);
+            } else {
+                if (i - chunk_start > chunk_steps) {
+                    // the next chunk starts with the sample leaving the current window
+                    chunk_start = i - 1;
+                    chunk_steps = std::min(ACQUISITION_CHUNK_LENGTH, noutput_items - 1 - chunk_start);
+                    prepare_moving_average(&in[chunk_start], chunk_steps);
+                }
+                moving_average_step(i - chunk_start);
+                d_moving_average_counter++;
+            }
+            normalize_correlation();
             if (d_NULL_detected) { // Search for peak of fixed_lag_correlation.
                 if (detect_start_of_symbol()) { // Detected start of first symbol.
                     d_tracking = true;
@@ -23,16 +23,20 @@
 #define INCLUDED_DAB_OFDM_SYNCHRONIZATION_CVF_IMPL_H
 
 #include <gnuradio/dab/ofdm_synchronization_cvf.h>
+#include <atomic>
 
 namespace gr {
   namespace dab {
 /*! \brief Sets tag at the beginning of each OFDM frame.
  * Lets only pass the one OFDM frames (without the NULL symbol), which
  * were detected completely.
+ * Once a frame was detected, the start of the next frame is predicted
+ * and only verified around the predicted position (flywheel). The lock
+ * state is tagged ("Lock") at the beginning of each frame.
  *
- * \param symbol_length Length of each OFDM symbol without guard intervall.
+ * \param fft_length Length of the FFT vector. (= length of each OFDM symbol without guard intervall)
  * \param cyclic_prefix_length Length of the cyclic prefix. (= length of the guard intervall)
- * \param fft_length Length of the FFT vector.
+ * \param null_symbol_length Length of the NULL symbol, used to predict the start of the next frame.
  * \param symbols_per_frame Number of OFDM symbols without the NULL symbol.
  *
  */
@@ -43,6 +47,15 @@ namespace gr {
       int d_moving_average_counter;
       /*!< Counts the number of steps the moving average did, to reset it
        * from time to time to avoid value drifting caused by float rounding.*/
+      gr_complex *d_lag_products;
+      /*!< Allocated buffer for the acquisition. Holds the products of each
+       * sample with the conjugate of the sample fft_length samples later for
+       * the current chunk, to update the correlation recursively.
+       */
+      float *d_lag_energies;
+      /*!< Allocated buffer for the acquisition. Holds the magnitude squared
+       * samples of the current chunk, to update the energies recursively.
+       */
       gr_complex d_correlation;
       /*!< Fixed lag correlation (not normalized) with the lag length
        * equal to the cyclic prefix length.
@@ -75,10 +88,28 @@ namespace gr {
        */
       float d_frequency_offset_per_sample;
       /*!< Frequency offset, described as a phase shift per sample. (in rad/sample)*/
+      std::atomic<float> d_frame_frequency_offset;
+      /*!< d_frequency_offset_per_sample at the start of the last frame, for get_frequency_offset(). */
       bool d_NULL_detected;
       /*!< Signalizes if we recently detected a NULL symbol and
        * therefore expect the first symbol of the next frame now.
        */
+      int d_null_symbol_length; /*!< Length of the NULL symbol. */
+      bool d_frame_predicted;
+      /*!< Signalizes that we just finished a frame and therefore expect
+       * the start of the next frame one NULL symbol later.
+       */
+      std::atomic<bool> d_locked;
+      /*!< Signalizes if the frame timing is locked (flywheel). The start
+       * of each frame is then predicted from the previous one and only
+       * verified in a short window instead of searching it from scratch.
+       */
+      int d_missed_frames;
+      /*!< Counts the consecutive frames whose predicted start could not be verified.*/
+      int d_flywheel_window;
+      /*!< Number of samples before and after the predicted frame start
+       * in which the correlation peak is searched for verification.
+       */
       int d_symbols_per_frame;
       /*!< Number of OFDM symbols without the NULL symbol. */
       int d_symbol_count; /*!< Counts the number of detected symbols.*/
@@ -93,12 +124,29 @@ namespace gr {
        * correlation triangle.
        */
 
-      /*! \brief Calculates a fixed lag correlation over the given sample sequence.
+      /*! \brief Calculates a fixed lag correlation over the given sample sequence from scratch.
        *
        * @param sample Pointer to the first sample of the sequence.
-       * @param new_calculation If true, calculated the correlation from scratch, else do a moving average.
        */
-      void delayed_correlation(const gr_complex *sample, bool new_calculation);
+      void delayed_correlation(const gr_complex *sample);
+
+      /*! \brief Prepares the lag products and energies of a chunk of samples for the moving average.
+       *
+       * @param sample Pointer to the first sample of the chunk.
+       * @param length Number of correlation steps the buffers have to cover.
+       */
+      void prepare_moving_average(const gr_complex *sample, int length);
+
+      /*! \brief Moves the fixed lag correlation window one sample forward.
+       * The correlation and both energies are updated recursively with the
+       * values prepared by prepare_moving_average().
+       *
+       * @param step Index of the new window start, relative to the start of the prepared chunk.
+       */
+      void moving_average_step(int step);
+
+      /*! \brief Normalizes the current correlation and calculates its magnitude. */
+      void normalize_correlation();
 
       /*! \brief Checks if we reached the maximum of a correlation triangle.
        * Peak detection with a very simple, a-causal method.
@@ -107,12 +155,23 @@ namespace gr {
       bool detect_start_of_symbol();
       bool detect_NULL();
 
+      /*! \brief Searches the correlation peak around the predicted start of the next frame.
+       *
+       * @param sample Pointer to the first sample after the last frame (start of the NULL symbol).
+       * @return Offset of the verified frame start relative to sample, or -1 if no peak was found.
+       */
+      int search_predicted_start(const gr_complex *sample);
+
     public:
-      ofdm_synchronization_cvf_impl(int symbol_length, int cyclic_prefix_length,
-                                    int fft_length, int symbols_per_frame);
+      ofdm_synchronization_cvf_impl(int fft_length, int cyclic_prefix_length,
+                                    int null_symbol_length, int symbols_per_frame);
 
       ~ofdm_synchronization_cvf_impl();
 
+      virtual bool get_locked() { return d_locked.load(); }
+
+      virtual float get_frequency_offset() { return d_frame_frequency_offset.load(); }
+
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
 
       // Where all the action really happens
@@ -32,14 +32,58 @@
 #include <stdio.h>
 #include <sstream>
 #include <boost/format.hpp>
+#include <algorithm>
 #include <gnuradio/io_signature.h>
 #include "reed_solomon_decode_bb_impl.h"
 
+#ifdef __SSSE3__
+#include <tmmintrin.h>
+#endif
+
+#define RS_PACKET_LENGTH 120
+#define RS_NROOTS 10
+#define RS_PAD 135
+#define RS_MAX_ERASURES 4
+#define VECTOR_WIDTH 16
+
 using namespace boost;
 
 namespace gr {
   namespace dab {
 
+    /* Multiplication by alpha^j (j = 0 ... 9, the roots of the generator polynomial) in GF(2^8)
+     * with the field polynomial 0x11D. The product of x is the XOR of the products of its low
+     * and its high nibble, so that 16 byte tables suffice (and fit a byte shuffle). */
+    struct syndrome_tables {
+      uint8_t lo[RS_NROOTS][16] __attribute__((aligned(16)));
+      uint8_t hi[RS_NROOTS][16] __attribute__((aligned(16)));
+
+      static uint8_t gf_mul(uint8_t a, uint8_t b) {
+        uint8_t product = 0;
+        while (b) {
+          if (b & 1) {
+            product ^= a;
+          }
+          a = (uint8_t) ((a << 1) ^ ((a & 0x80) ? 0x1d : 0));
+          b >>= 1;
+        }
+        return product;
+      }
+
+      syndrome_tables() {
+        uint8_t root = 1;
+        for (int j = 0; j < RS_NROOTS; j++) {
+          for (int x = 0; x < 16; x++) {
+            lo[j][x] = gf_mul((uint8_t) x, root);
+            hi[j][x] = gf_mul((uint8_t) (x << 4), root);
+          }
+          root = gf_mul(root, 2);
+        }
+      }
+    };
+
+    static const syndrome_tables SYNDROME_TABLES;
+
     reed_solomon_decode_bb::sptr
     reed_solomon_decode_bb::make(int bit_rate_n) {
       return gnuradio::get_initial_sptr
@@ -53,7 +97,9 @@ namespace gr {
             : gr::block("reed_solomon_decode_bb",
                         gr::io_signature::make(1, 1, sizeof(unsigned char)),
                         gr::io_signature::make(1, 1, sizeof(unsigned char))),
-              d_bit_rate_n(bit_rate_n) {
+              d_bit_rate_n(bit_rate_n),
+              d_have_reliability(false),
+              d_reliability_key(pmt::mp("reliability")) {
       rs_handle = init_rs_char(8, 0x11D, 0, 1, 10, 135);
       if (!rs_handle) {
         GR_LOG_DEBUG(d_logger, "RS init failed");
@@ -64,6 +110,16 @@ namespace gr {
       d_superframe_size_rs = bit_rate_n * 110;
       set_output_multiple(d_superframe_size_rs);
       d_corrected_errors = 0;
+      d_clean_packets = 0;
+      d_corrected_packets = 0;
+      d_uncorrectable_packets = 0;
+      // the vector loads of the last row may read up to VECTOR_WIDTH - 1 bytes past the superframe
+      d_superframe.resize(d_superframe_size + VECTOR_WIDTH);
+      d_syndrome_stride = (bit_rate_n + VECTOR_WIDTH - 1) / VECTOR_WIDTH * VECTOR_WIDTH;
+      d_syndromes.resize(RS_NROOTS * d_syndrome_stride);
+      d_reliability.resize(d_superframe_size);
+      // the reliability and cif_start tags end here
+      set_tag_propagation_policy(TPP_DONT);
     }
 
     /*
@@ -73,6 +129,77 @@ namespace gr {
       free_rs_char(rs_handle);
     }
 
+    void
+    reed_solomon_decode_bb_impl::compute_syndromes(const uint8_t *sf, int num_packets) {
+      // Horner scheme for all packets at once: s_j = s_j * alpha^j + byte, one row of bytes at a time
+#ifdef __SSSE3__
+      const __m128i low_nibble = _mm_set1_epi8(0x0f);
+      for (int i = 0; i < num_packets; i += VECTOR_WIDTH) {
+        __m128i syndrome[RS_NROOTS];
+        for (int j = 0; j < RS_NROOTS; j++) {
+          syndrome[j] = _mm_setzero_si128();
+        }
+        for (int pos = 0; pos < RS_PACKET_LENGTH; pos++) {
+          // lanes beyond num_packets read the next row (or the padding) and are ignored
+          const __m128i row = _mm_loadu_si128((const __m128i *) &sf[pos * num_packets + i]);
+          syndrome[0] = _mm_xor_si128(syndrome[0], row);
+          for (int j = 1; j < RS_NROOTS; j++) {
+            const __m128i lo = _mm_shuffle_epi8(_mm_load_si128((const __m128i *) SYNDROME_TABLES.lo[j]),
+                                                _mm_and_si128(syndrome[j], low_nibble));
+            const __m128i hi = _mm_shuffle_epi8(_mm_load_si128((const __m128i *) SYNDROME_TABLES.hi[j]),
+                                                _mm_and_si128(_mm_srli_epi16(syndrome[j], 4), low_nibble));
+            syndrome[j] = _mm_xor_si128(_mm_xor_si128(lo, hi), row);
+          }
+        }
+        for (int j = 0; j < RS_NROOTS; j++) {
+          _mm_storeu_si128((__m128i *) &d_syndromes[j * d_syndrome_stride + i], syndrome[j]);
+        }
+      }
+#else
+      std::fill(d_syndromes.begin(), d_syndromes.end(), 0);
+      for (int pos = 0; pos < RS_PACKET_LENGTH; pos++) {
+        const uint8_t *row = &sf[pos * num_packets];
+        for (int i = 0; i < num_packets; i++) {
+          d_syndromes[i] ^= row[i];
+        }
+        for (int j = 1; j < RS_NROOTS; j++) {
+          const uint8_t *lo = SYNDROME_TABLES.lo[j];
+          const uint8_t *hi = SYNDROME_TABLES.hi[j];
+          uint8_t *syndrome = &d_syndromes[j * d_syndrome_stride];
+          for (int i = 0; i < num_packets; i++) {
+            syndrome[i] = lo[syndrome[i] & 0x0f] ^ hi[syndrome[i] >> 4] ^ row[i];
+          }
+        }
+      }
+#endif
+    }
+
+    int
+    reed_solomon_decode_bb_impl::decode_with_erasures(const uint8_t *sf, int num_packets, int i) {
+      // tagged bytes of the packet, least reliable first
+      std::vector<std::pair<uint8_t, int> > candidates;
+      for (int pos = 0; pos < RS_PACKET_LENGTH; pos++) {
+        const uint8_t reliability = d_reliability[pos * num_packets + i];
+        if (reliability < 255) {
+          candidates.push_back(std::make_pair(reliability, pos));
+        }
+      }
+      std::sort(candidates.begin(), candidates.end());
+      for (int num_erasures = std::min((int) candidates.size(), RS_MAX_ERASURES); num_erasures > 0; num_erasures -= 2) {
+        for (int pos = 0; pos < RS_PACKET_LENGTH; pos++) {
+          rs_packet[pos] = sf[pos * num_packets + i];
+        }
+        for (int j = 0; j < num_erasures; j++) {
+          corr_pos[j] = candidates[j].second + RS_PAD;
+        }
+        int corr_count = decode_rs_char(rs_handle, rs_packet, corr_pos, num_erasures);
+        if (corr_count != -1) {
+          return corr_count;
+        }
+      }
+      return -1;
+    }
+
     void
     reed_solomon_decode_bb_impl::DecodeSuperframe(uint8_t *sf, size_t sf_len) {
 //	// insert errors for test
@@ -82,31 +209,52 @@ namespace gr {
 
       int subch_index = sf_len / 120;
       int total_corr_count = 0;
-      bool uncorr_errors = false;
+      int clean_packets = 0;
+      int corrected_packets = 0;
+      int uncorrectable_packets = 0;
+
+      compute_syndromes(sf, subch_index);
 
       // process all RS packets
       for (int i = 0; i < subch_index; i++) {
+        uint8_t syndromes = 0;
+        for (int j = 0; j < RS_NROOTS; j++) {
+          syndromes |= d_syndromes[j * d_syndrome_stride + i];
+        }
+        if (syndromes == 0) {
+          // error free packet, nothing to correct
+          clean_packets++;
+          continue;
+        }
         for (int pos = 0; pos < 120; pos++) {
           rs_packet[pos] = sf[pos * subch_index + i];
         }
         // detect errors
         int corr_count = decode_rs_char(rs_handle, rs_packet, corr_pos, 0);
+        if (corr_count == -1 && d_have_reliability) {
+          corr_count = decode_with_erasures(sf, subch_index, i);
+        }
         if (corr_count == -1) {
-          uncorr_errors = true;
+          uncorrectable_packets++;
           GR_LOG_DEBUG(d_logger, "uncorrectable error");
-        } else
+        } else {
+          corrected_packets++;
           total_corr_count += corr_count;
+        }
 
         // correct errors
         for (int j = 0; j < corr_count; j++) {
 
-          int pos = corr_pos[j] - 135;
+          int pos = corr_pos[j] - RS_PAD;
           if (pos < 0)
             continue;
           sf[pos * subch_index + i] = rs_packet[pos];
         }
       }
       d_corrected_errors = total_corr_count;
+      d_clean_packets = clean_packets;
+      d_corrected_packets = corrected_packets;
+      d_uncorrectable_packets = uncorrectable_packets;
     }
 
 
@@ -124,9 +272,21 @@ namespace gr {
       const unsigned char *in = (const unsigned char *) input_items[0];
       unsigned char *out = (unsigned char *) output_items[0];
 
+      std::vector<gr::tag_t> tags;
       for (int n = 0; n < noutput_items / d_superframe_size_rs; n++) {
-        uint8_t superframe[d_superframe_size];
+        uint8_t *superframe = &d_superframe[0];
         memcpy(superframe, &in[n * d_superframe_size], d_superframe_size);
+        // reliabilities of the superframe bytes for erasure decoding
+        const uint64_t superframe_start = nitems_read(0) + n * d_superframe_size;
+        get_tags_in_range(tags, 0, superframe_start, superframe_start + d_superframe_size, d_reliability_key);
+        d_have_reliability = !tags.empty();
+        if (d_have_reliability) {
+          std::fill(d_reliability.begin(), d_reliability.end(), 255);
+          for (const gr::tag_t &tag : tags) {
+            uint8_t &reliability = d_reliability[tag.offset - superframe_start];
+            reliability = std::min(reliability, (uint8_t) std::max(0L, std::min(255L, pmt::to_long(tag.value))));
+          }
+        }
         DecodeSuperframe(superframe, d_superframe_size);
         memcpy(&out[n * d_superframe_size_rs], superframe, d_superframe_size_rs);
       }
@@ -28,6 +28,8 @@
 #define INCLUDED_DAB_REED_SOLOMON_DECODE_BB_IMPL_H
 
 #include <gnuradio/dab/reed_solomon_decode_bb.h>
+#include <atomic>
+#include <vector>
 
 extern "C" {
 #include "fec/fec.h"
@@ -38,6 +40,7 @@ namespace gr {
 /*! \brief Reed-Solomon decoder configured for DAB+
  *
  * Reed Solomon RS(120, 110, t=5) with virtual interleaving; derived from RS(255, 245, t=5). Details see ETSI TS 102 563 clause 6.0 and 6.1.
+ * RS packets that are not correctable are decoded again with their least reliable bytes (see viterbi_k7_r14) as erasures.
  *
  * @param bit_rate_n data rate in multiples of 8kbit/s
  *
@@ -50,7 +53,27 @@ namespace gr {
       void *rs_handle;
       uint8_t rs_packet[120]; /*!< buffer for rs algorithm*/
       int corr_pos[10]; /*!< positions of detected and correctable errors*/
-      int d_corrected_errors; /*!< number of corrected errors in the current superframe*/
+      std::atomic<int> d_corrected_errors; /*!< number of corrected errors in the current superframe*/
+      std::atomic<int> d_clean_packets; /*!< number of error free RS packets in the current superframe*/
+      std::atomic<int> d_corrected_packets; /*!< number of corrected RS packets in the current superframe*/
+      std::atomic<int> d_uncorrectable_packets; /*!< number of uncorrectable RS packets in the current superframe*/
+      std::vector<uint8_t> d_superframe; /*!< superframe that is corrected in place, padded for vector loads*/
+      int d_syndrome_stride; /*!< number of RS packets rounded up to the vector width*/
+      std::vector<uint8_t> d_syndromes; /*!< syndromes of all RS packets, d_syndrome_stride per root*/
+      std::vector<uint8_t> d_reliability; /*!< reliability of each byte of the superframe, 255 if not tagged*/
+      bool d_have_reliability; /*!< the superframe has "reliability" tags*/
+      const pmt::pmt_t d_reliability_key;
+
+      /*! \brief Computes the syndromes of all RS packets of a superframe.
+       * The RS packets are read directly out of the interleaved superframe, where byte pos of
+       * packet i is at sf[pos * num_packets + i].
+       */
+      void compute_syndromes(const uint8_t *sf, int num_packets);
+
+      /*! \brief Decodes RS packet i of the superframe with its least reliable bytes as erasures.
+       * @return number of corrected bytes or -1 if not correctable
+       */
+      int decode_with_erasures(const uint8_t *sf, int num_packets, int i);
 
       void DecodeSuperframe(uint8_t *sf, size_t sf_len);
 
@@ -59,7 +82,13 @@ namespace gr {
 
       ~reed_solomon_decode_bb_impl();
 
-      virtual int get_corrected_errors() { return d_corrected_errors; }
+      virtual int get_corrected_errors() { return d_corrected_errors.load(); }
+
+      virtual int get_clean_packets() { return d_clean_packets.load(); }
+
+      virtual int get_corrected_packets() { return d_corrected_packets.load(); }
+
+      virtual int get_uncorrectable_packets() { return d_uncorrectable_packets.load(); }
 
       // Where all the action really happens
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
@@ -0,0 +1,156 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "select_cus_history_vbb_impl.h"
+#include <algorithm>
+#include <cstring>
+#include <stdexcept>
+
+namespace gr {
+  namespace dab {
+
+    select_cus_history_vbb::sptr
+    select_cus_history_vbb::make(unsigned int vlen, unsigned int frame_len,
+                                 unsigned int address, unsigned int size,
+                                 const std::vector<unsigned char> &scrambling_vector) {
+      return gnuradio::get_initial_sptr(new select_cus_history_vbb_impl(vlen, frame_len,
+                                                                        address, size,
+                                                                        scrambling_vector));
+    }
+
+    /*
+     * The private constructor
+     */
+    select_cus_history_vbb_impl::select_cus_history_vbb_impl(unsigned int vlen,
+                                                             unsigned int frame_len,
+                                                             unsigned int address,
+                                                             unsigned int size,
+                                                             const std::vector<unsigned char> &scrambling_vector)
+            : gr::block("select_cus_history_vbb",
+                        gr::io_signature::make(1, 1, vlen * sizeof(int8_t)),
+                        gr::io_signature::make(1, 1, sizeof(int8_t))),
+              d_vlen(vlen),
+              d_frame_len(frame_len),
+              d_scrambling_vector(scrambling_vector),
+              d_depth(scrambling_vector.size()),
+              d_ring(scrambling_vector.size() * frame_len * vlen, 0),
+              d_out_pos(0),
+              d_out_cif(0),
+              d_cif_start_key(pmt::mp("cif_start")) {
+      if (d_depth == 0) {
+        throw std::invalid_argument("select_cus_history_vbb: empty scrambling vector");
+      }
+      set_subchannel(address, size);
+      d_out_pos = d_cif_out.size();
+      set_tag_propagation_policy(TPP_DONT);
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    select_cus_history_vbb_impl::~select_cus_history_vbb_impl() {
+    }
+
+    void
+    select_cus_history_vbb_impl::set_subchannel(unsigned int address, unsigned int size) {
+      gr::thread::scoped_lock guard(d_setlock);
+      if (address + size > d_frame_len) {
+        throw std::invalid_argument("select_cus_history_vbb: sub-channel exceeds the CIF");
+      }
+      d_address = address;
+      d_size = size;
+    }
+
+    void
+    select_cus_history_vbb_impl::deinterleave(uint64_t cif) {
+      // soft bit j of CIF n is delayed by (depth-1 - scrambling_vector[j % depth]) CIFs
+      const unsigned int cif_length = d_frame_len * d_vlen;
+      const unsigned int first = d_address * d_vlen;
+      d_cif_out.resize(d_size * d_vlen);
+      for (unsigned int j = 0; j < d_cif_out.size(); j++) {
+        const unsigned int delay = d_depth - 1 - d_scrambling_vector[j % d_depth];
+        if (delay > cif) {
+          // before the start of the stream, like the zero history of time_deinterleave_bb
+          d_cif_out[j] = 0;
+        } else {
+          d_cif_out[j] = d_ring[((cif - delay) % d_depth) * cif_length + first + j];
+        }
+      }
+      d_out_pos = 0;
+      d_out_cif = cif;
+    }
+
+    void
+    select_cus_history_vbb_impl::forecast(int noutput_items,
+                                          gr_vector_int &ninput_items_required) {
+      ninput_items_required[0] = std::max(1, noutput_items / (int) d_vlen);
+    }
+
+    int
+    select_cus_history_vbb_impl::general_work(int noutput_items,
+                                              gr_vector_int &ninput_items,
+                                              gr_vector_const_void_star &input_items,
+                                              gr_vector_void_star &output_items) {
+      const int8_t *in = (const int8_t *) input_items[0];
+      int8_t *out = (int8_t *) output_items[0];
+      const unsigned int cif_length = d_frame_len * d_vlen;
+      int nconsumed = 0;
+      int nwritten = 0;
+
+      while (true) {
+        // write out the remaining soft bits of the last deinterleaved CIF
+        if (d_out_pos < d_cif_out.size()) {
+          unsigned int n = std::min((unsigned int) (noutput_items - nwritten),
+                                    (unsigned int) d_cif_out.size() - d_out_pos);
+          if (d_out_pos == 0 && n > 0) {
+            add_item_tag(0, nitems_written(0) + nwritten, d_cif_start_key, pmt::from_uint64(d_out_cif));
+          }
+          memcpy(&out[nwritten], &d_cif_out[d_out_pos], n);
+          nwritten += n;
+          d_out_pos += n;
+          if (d_out_pos < d_cif_out.size()) {
+            break;
+          }
+        }
+        if (nconsumed == ninput_items[0]) {
+          break;
+        }
+        // store the next CU in the ring
+        const uint64_t cu = nitems_read(0) + nconsumed;
+        const uint64_t cif = cu / d_frame_len;
+        memcpy(&d_ring[(cif % d_depth) * cif_length + (cu % d_frame_len) * d_vlen],
+               &in[nconsumed * d_vlen], d_vlen);
+        nconsumed++;
+        if (cu % d_frame_len == d_frame_len - 1) {
+          // the CIF is complete
+          deinterleave(cif);
+        }
+      }
+      consume_each(nconsumed);
+      return nwritten;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
@@ -0,0 +1,75 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_IMPL_H
+#define INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_IMPL_H
+
+#include <gnuradio/dab/select_cus_history_vbb.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief Selects and time deinterleaves a sub-channel out of a ring buffer of CIFs.
+ * Every CU is written to the ring, so any sub-channel can be read out
+ * without waiting for the delay of the time interleaving.
+ *
+ * @param vlen Number of soft bits per CU.
+ * @param frame_len Length of a CIF in CUs.
+ * @param address Number of the first CU of the sub-channel.
+ * @param size Number of CUs of the sub-channel.
+ * @param scrambling_vector Delays of the time interleaving (in CIFs).
+ */
+    class select_cus_history_vbb_impl : public select_cus_history_vbb {
+    private:
+      unsigned int d_vlen;
+      unsigned int d_frame_len;
+      unsigned int d_address;
+      unsigned int d_size;
+      std::vector<unsigned char> d_scrambling_vector;
+      unsigned int d_depth; /*!< Number of CIFs in the ring (length of the scrambling vector). */
+      std::vector<int8_t> d_ring; /*!< Soft bits of the last d_depth CIFs, d_frame_len*d_vlen each. */
+      std::vector<int8_t> d_cif_out; /*!< Deinterleaved sub-channel of the last complete CIF. */
+      unsigned int d_out_pos; /*!< Soft bits of d_cif_out already written out. */
+      uint64_t d_out_cif; /*!< Index of the CIF in d_cif_out since the start of the stream. */
+      pmt::pmt_t d_cif_start_key;
+
+      void deinterleave(uint64_t cif);
+
+    public:
+      select_cus_history_vbb_impl(unsigned int vlen, unsigned int frame_len,
+                                  unsigned int address, unsigned int size,
+                                  const std::vector<unsigned char> &scrambling_vector);
+
+      ~select_cus_history_vbb_impl();
+
+      void set_subchannel(unsigned int address, unsigned int size);
+
+      // Where all the action really happens
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_SELECT_CUS_HISTORY_VBB_IMPL_H */
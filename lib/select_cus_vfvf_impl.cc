@@ -50,7 +50,8 @@ namespace gr {
               d_vlen(vlen),
               d_frame_len(frame_len),
               d_address(address),
-              d_size(size) {
+              d_size(size),
+              d_cif_start_key(pmt::mp("cif_start")) {
     }
 
     /*
@@ -59,6 +60,13 @@ namespace gr {
     select_cus_vfvf_impl::~select_cus_vfvf_impl() {
     }
 
+    void
+    select_cus_vfvf_impl::set_subchannel(unsigned int address, unsigned int size) {
+      gr::thread::scoped_lock guard(d_setlock);
+      d_address = address;
+      d_size = size;
+    }
+
     void
     select_cus_vfvf_impl::forecast(int noutput_items,
                                    gr_vector_int &ninput_items_required) {
@@ -77,6 +85,10 @@ namespace gr {
       for (int i = 0; i < noutput_items; ++i) {
         if (d_address <= (nitems_read(0) + i) % d_frame_len &&
             (nitems_read(0) + i) % d_frame_len < d_address + d_size) {
+          if ((nitems_read(0) + i) % d_frame_len == d_address) {
+            add_item_tag(0, nitems_written(0) + nwritten, d_cif_start_key,
+                         pmt::from_uint64((nitems_read(0) + i) / d_frame_len));
+          }
           //this cu is one of the selected subchannel -> copy it to ouput buffer
           memcpy(&out[nwritten++ * d_vlen], &in[i * d_vlen], d_vlen * sizeof(float));
         }
@@ -35,6 +35,8 @@ namespace gr {
  * (each item is a vector with size vlen)
  * @param address Number of the first item in each frame to be copied.
  * @param size Number of items to copy in each frame.
+ * The first copied item of each frame is tagged with "cif_start", which lets
+ * downstream blocks find the start of the sub-channel after a reconfiguration.
  */
     class select_cus_vfvf_impl : public select_cus_vfvf {
     private:
@@ -42,6 +44,7 @@ namespace gr {
       unsigned int d_frame_len;
       unsigned int d_address;
       unsigned int d_size;
+      pmt::pmt_t d_cif_start_key;
 
     public:
       select_cus_vfvf_impl(unsigned int vlen, unsigned int frame_len,
@@ -49,6 +52,8 @@ namespace gr {
 
       ~select_cus_vfvf_impl();
 
+      void set_subchannel(unsigned int address, unsigned int size);
+
       // Where all the action really happens
       void forecast(int noutput_items, gr_vector_int &ninput_items_required);
 
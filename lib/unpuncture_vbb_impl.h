@@ -0,0 +1,59 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2004 Free Software Foundation, Inc.
+ * 
+ * This file is part of GNU Radio
+ * 
+ * GNU Radio is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ * 
+ * GNU Radio is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ * 
+ * You should have received a copy of the GNU General Public License
+ * along with GNU Radio; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+#ifndef INCLUDED_DAB_UNPUNCTURE_VBB_IMPL_H
+#define INCLUDED_DAB_UNPUNCTURE_VBB_IMPL_H
+
+#include <gnuradio/dab/unpuncture_vbb.h>
+
+namespace gr {
+  namespace dab {
+/*! \brief Unpuncturing of a stream bit sequence.
+ *
+ * Unpuncturing of a stream sequence according to the puncturing_vector.
+ * (writing a stream element at a '1' and writing the fillval at a '0')
+ *
+ * @param puncturing_vector Vector with puncturing sequence,
+ * length of puncturing_vector is length of a stream sequence.
+ * @param fillval Value to fill in for a zero of the puncturing vector.
+ *
+ */
+    class unpuncture_vbb_impl : public unpuncture_vbb {
+    private:
+      unsigned int ones(const std::vector<unsigned char> &puncturing_vector);
+
+      std::vector<unsigned char> d_puncturing_vector;
+      int8_t d_fillval;
+      unsigned int d_vlen_in;
+      unsigned int d_vlen_out;
+
+    public:
+      unpuncture_vbb_impl(const std::vector<unsigned char> &puncturing_vector, int8_t fillval);
+
+      int work(int noutput_items,
+               gr_vector_const_void_star &input_items,
+               gr_vector_void_star &output_items);
+    };
+
+  }
+}
+
+#endif /* INCLUDED_DAB_UNPUNCTURE_VBB_H */
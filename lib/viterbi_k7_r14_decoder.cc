@@ -0,0 +1,262 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "viterbi_k7_r14_decoder.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <stdexcept>
+
+#ifdef __SSE2__
+#include <emmintrin.h>
+#endif
+
+#define NUM_STATES 64
+#define NUM_BUTTERFLIES 32
+#define TAIL_BITS 6
+#define UNREACHED_METRIC 8192 /* initial path metric of all states except state 0 */
+#define QUANTIZATION_MEAN 32 /* mean magnitude of float soft bits after quantization */
+#define SOVA_WINDOW 48 /* trellis steps that a discarded path is traced back for the reliabilities */
+
+namespace gr {
+  namespace dab {
+
+    /* The encoder register holds the input bit in bit 6 and the 6 previous input bits below
+     * (the same as conv_encoder_bb). The state is the register without its oldest bit, so state s
+     * with input bit b leads to state (b << 5) | (s >> 1). The predecessors 2i and 2i+1 of the
+     * states i and i+32 form a butterfly. All polynomials have a tap on the input bit and on the
+     * oldest bit, so the four branches of a butterfly only differ in the sign of their metric. */
+    static const unsigned char POLYNOMIALS[4] = {0x5b, 0x79, 0x65, 0x5b};
+
+    /* Sign of each code bit for the branch from state 2i with input bit 0: +1 for a 1, -1 for a 0. */
+    struct branch_signs {
+      int16_t sign[4][NUM_BUTTERFLIES] __attribute__((aligned(16)));
+
+      branch_signs() {
+        for (int k = 0; k < 4; k++) {
+          for (int i = 0; i < NUM_BUTTERFLIES; i++) {
+            sign[k][i] = __builtin_parity(POLYNOMIALS[k] & (2 * i)) ? 1 : -1;
+          }
+        }
+      }
+    };
+
+    static const branch_signs BRANCH_SIGNS;
+
+    viterbi_k7_r14_decoder::viterbi_k7_r14_decoder(int length)
+            : d_length(length),
+              d_decisions(length + TAIL_BITS),
+              d_quantized(4 * (length + TAIL_BITS)) {
+      if (length <= 0) {
+        throw std::invalid_argument("viterbi_k7_r14: length has to be positive");
+      }
+    }
+
+    void
+    viterbi_k7_r14_decoder::add_compare_select(const int8_t *soft_bits, bool keep_differences) {
+      const int steps = d_length + TAIL_BITS;
+      if (keep_differences) {
+        d_differences.resize(steps * NUM_STATES);
+      }
+#ifdef __SSE2__
+      __m128i metrics[8];
+      metrics[0] = _mm_set_epi16(UNREACHED_METRIC, UNREACHED_METRIC, UNREACHED_METRIC, UNREACHED_METRIC,
+                                 UNREACHED_METRIC, UNREACHED_METRIC, UNREACHED_METRIC, 0);
+      for (int r = 1; r < 8; r++) {
+        metrics[r] = _mm_set1_epi16(UNREACHED_METRIC);
+      }
+      const __m128i *signs = (const __m128i *) BRANCH_SIGNS.sign;
+
+      for (int t = 0; t < steps; t++) {
+        const int8_t *symbol = &soft_bits[4 * t];
+        const __m128i q0 = _mm_set1_epi16(symbol[0]);
+        const __m128i q1 = _mm_set1_epi16(symbol[1]);
+        const __m128i q2 = _mm_set1_epi16(symbol[2]);
+        const __m128i q3 = _mm_set1_epi16(symbol[3]);
+        __m128i next[8];
+        int decisions[4];
+
+        for (int g = 0; g < 4; g++) {
+          // branch metrics of the butterflies 8g to 8g+7
+          __m128i cost = _mm_mullo_epi16(q0, signs[g]);
+          cost = _mm_add_epi16(cost, _mm_mullo_epi16(q1, signs[4 + g]));
+          cost = _mm_add_epi16(cost, _mm_mullo_epi16(q2, signs[8 + g]));
+          cost = _mm_add_epi16(cost, _mm_mullo_epi16(q3, signs[12 + g]));
+          // separate the metrics of the even and odd predecessors
+          const __m128i lo = metrics[2 * g];
+          const __m128i hi = metrics[2 * g + 1];
+          const __m128i even = _mm_packs_epi32(_mm_srai_epi32(_mm_slli_epi32(lo, 16), 16),
+                                               _mm_srai_epi32(_mm_slli_epi32(hi, 16), 16));
+          const __m128i odd = _mm_packs_epi32(_mm_srai_epi32(lo, 16), _mm_srai_epi32(hi, 16));
+          // input bit 0: states 8g to 8g+7
+          const __m128i even0 = _mm_adds_epi16(even, cost);
+          const __m128i odd0 = _mm_subs_epi16(odd, cost);
+          const __m128i decision0 = _mm_cmpgt_epi16(even0, odd0);
+          next[g] = _mm_min_epi16(even0, odd0);
+          // input bit 1: states 32+8g to 32+8g+7
+          const __m128i even1 = _mm_subs_epi16(even, cost);
+          const __m128i odd1 = _mm_adds_epi16(odd, cost);
+          const __m128i decision1 = _mm_cmpgt_epi16(even1, odd1);
+          next[4 + g] = _mm_min_epi16(even1, odd1);
+          decisions[g] = _mm_movemask_epi8(_mm_packs_epi16(decision0, decision1));
+          if (keep_differences) {
+            // |even - odd| of the states 8g to 8g+7 in the low and of 32+8g to 32+8g+7 in the high half
+            const __m128i difference0 = _mm_subs_epi16(even0, odd0);
+            const __m128i difference1 = _mm_subs_epi16(even1, odd1);
+            const __m128i differences = _mm_packus_epi16(
+                    _mm_max_epi16(difference0, _mm_subs_epi16(_mm_setzero_si128(), difference0)),
+                    _mm_max_epi16(difference1, _mm_subs_epi16(_mm_setzero_si128(), difference1)));
+            uint8_t *step_differences = &d_differences[t * NUM_STATES];
+            _mm_storel_epi64((__m128i *) &step_differences[8 * g], differences);
+            _mm_storel_epi64((__m128i *) &step_differences[NUM_BUTTERFLIES + 8 * g],
+                             _mm_srli_si128(differences, 8));
+          }
+        }
+        // movemask gives the 8 decisions of input bit 0 in the low byte and of input bit 1 in the high byte
+        uint64_t word = 0;
+        for (int g = 0; g < 4; g++) {
+          word |= (uint64_t) (decisions[g] & 0xff) << (8 * g);
+          word |= (uint64_t) ((decisions[g] >> 8) & 0xff) << (32 + 8 * g);
+        }
+        d_decisions[t] = word;
+
+        // normalize to the metric of state 0 to stay in the range of 16 bit
+        const __m128i reference = _mm_set1_epi16((int16_t) _mm_extract_epi16(next[0], 0));
+        for (int r = 0; r < 8; r++) {
+          metrics[r] = _mm_subs_epi16(next[r], reference);
+        }
+      }
+#else
+      int16_t metrics[NUM_STATES];
+      int16_t next[NUM_STATES];
+      metrics[0] = 0;
+      for (int s = 1; s < NUM_STATES; s++) {
+        metrics[s] = UNREACHED_METRIC;
+      }
+      for (int t = 0; t < steps; t++) {
+        const int8_t *symbol = &soft_bits[4 * t];
+        uint64_t word = 0;
+        for (int i = 0; i < NUM_BUTTERFLIES; i++) {
+          const int cost = BRANCH_SIGNS.sign[0][i] * symbol[0] + BRANCH_SIGNS.sign[1][i] * symbol[1]
+                           + BRANCH_SIGNS.sign[2][i] * symbol[2] + BRANCH_SIGNS.sign[3][i] * symbol[3];
+          const int even0 = metrics[2 * i] + cost;
+          const int odd0 = metrics[2 * i + 1] - cost;
+          const int even1 = metrics[2 * i] - cost;
+          const int odd1 = metrics[2 * i + 1] + cost;
+          next[i] = (int16_t) std::min(even0, odd0);
+          next[i + NUM_BUTTERFLIES] = (int16_t) std::min(even1, odd1);
+          word |= (uint64_t) (even0 > odd0) << i;
+          word |= (uint64_t) (even1 > odd1) << (i + NUM_BUTTERFLIES);
+          if (keep_differences) {
+            d_differences[t * NUM_STATES + i] = (uint8_t) std::min(std::abs(even0 - odd0), 255);
+            d_differences[t * NUM_STATES + i + NUM_BUTTERFLIES] = (uint8_t) std::min(std::abs(even1 - odd1), 255);
+          }
+        }
+        d_decisions[t] = word;
+        // normalize to the metric of state 0 to stay in the range of 16 bit
+        for (int s = 0; s < NUM_STATES; s++) {
+          metrics[s] = next[s] - next[0];
+        }
+      }
+#endif
+    }
+
+    void
+    viterbi_k7_r14_decoder::traceback(unsigned char *out, uint8_t *reliability) {
+      const int steps = d_length + TAIL_BITS;
+      if (reliability) {
+        d_survivor.resize(steps);
+      }
+      // the tail bits force the encoder back to state 0
+      unsigned int state = 0;
+      for (int t = steps - 1; t >= 0; t--) {
+        const unsigned int decision = (d_decisions[t] >> state) & 1;
+        if (t < d_length) {
+          out[t] = state >> 5;
+        }
+        if (reliability) {
+          d_survivor[t] = state;
+        }
+        state = ((state & (NUM_BUTTERFLIES - 1)) << 1) | decision;
+      }
+      if (reliability) {
+        soft_output(reliability);
+      }
+    }
+
+    void
+    viterbi_k7_r14_decoder::soft_output(uint8_t *reliability) {
+      const int steps = d_length + TAIL_BITS;
+      d_bit_reliability.assign(steps, 255);
+      // soft output Viterbi (Hagenauer): the bits in which the survivor differs from the path
+      // that was discarded at step t are at most as reliable as the path metric difference at t
+      for (int t = steps - 1; t > 0; t--) {
+        const unsigned int survivor = d_survivor[t];
+        const uint8_t difference = d_differences[t * NUM_STATES + survivor];
+        if (difference == 255) {
+          continue;
+        }
+        unsigned int discarded = (((survivor & (NUM_BUTTERFLIES - 1)) << 1) | ((d_decisions[t] >> survivor) & 1)) ^ 1;
+        for (int k = t - 1; k >= 0 && k >= t - SOVA_WINDOW && discarded != d_survivor[k]; k--) {
+          if ((discarded ^ d_survivor[k]) >> 5) {
+            d_bit_reliability[k] = std::min(d_bit_reliability[k], difference);
+          }
+          discarded = ((discarded & (NUM_BUTTERFLIES - 1)) << 1) | ((d_decisions[k] >> discarded) & 1);
+        }
+      }
+      for (int b = 0; b < reliability_length(); b++) {
+        const int last = std::min(8 * b + 8, d_length);
+        reliability[b] = *std::min_element(&d_bit_reliability[8 * b], &d_bit_reliability[last]);
+      }
+    }
+
+    void
+    viterbi_k7_r14_decoder::decode(const int8_t *soft_bits, unsigned char *out, uint8_t *reliability) {
+      add_compare_select(soft_bits, reliability != NULL);
+      traceback(out, reliability);
+    }
+
+    void
+    viterbi_k7_r14_decoder::decode(const float *soft_bits, unsigned char *out, uint8_t *reliability) {
+      const int n = codeword_length();
+      // punctured soft bits are 0 and do not count for the mean magnitude
+      float sum = 0;
+      int count = 0;
+      for (int i = 0; i < n; i++) {
+        if (soft_bits[i] != 0) {
+          sum += std::fabs(soft_bits[i]);
+          count++;
+        }
+      }
+      const float scale = (sum > 0) ? QUANTIZATION_MEAN * count / sum : 0;
+      for (int i = 0; i < n; i++) {
+        const long q = lrintf(soft_bits[i] * scale);
+        d_quantized[i] = (int8_t) std::max(-127L, std::min(127L, q));
+      }
+      decode(&d_quantized[0], out, reliability);
+    }
+
+  } // namespace dab
+} // namespace gr
@@ -0,0 +1,90 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_VITERBI_K7_R14_DECODER_H
+#define INCLUDED_DAB_VITERBI_K7_R14_DECODER_H
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace gr {
+  namespace dab {
+
+    /*! \brief Viterbi decoder for the DAB mother code (constraint length 7, code rate 1/4)
+     * with the polynomials 0133, 0171, 0145 and 0133 (octal), see ETSI EN 300 401, section 11.1.
+     *
+     * A codeword consists of 4*(length + 6) soft bits, the encoder starts and ends in state 0.
+     * A positive soft bit stands for a 0, a negative one for a 1 and 0 for an unknown
+     * (punctured) bit. The 6 tail bits are not written out.
+     *
+     * The add-compare-select of the 64 states is done with 16 bit path metrics in SSE2
+     * registers, if available.
+     * An instance holds the decisions of one codeword and must not be shared between threads.
+     *
+     * Optionally, the decoder returns a reliability for each byte of the output, computed like
+     * the soft output Viterbi algorithm: a bit is at most as reliable as the path metric
+     * difference of every discarded path that would have decided it differently, saturated to
+     * 255. The byte reliability is the smallest reliability of its 8 bits. Soft bits of 0 (e.g.
+     * symbols filled after a loss of sync) give small differences.
+     */
+    class viterbi_k7_r14_decoder {
+    private:
+      int d_length; /*!< Number of information bits per codeword. */
+      std::vector<uint64_t> d_decisions; /*!< One decision bit per state and trellis step. */
+      std::vector<int8_t> d_quantized; /*!< Soft bits of a float codeword, quantized to 8 bit. */
+      std::vector<uint8_t> d_differences; /*!< Path metric difference per state and trellis step, only kept for reliabilities. */
+      std::vector<uint8_t> d_survivor; /*!< State of the survivor path after each trellis step. */
+      std::vector<uint8_t> d_bit_reliability; /*!< Reliability of each decoded bit. */
+
+      void add_compare_select(const int8_t *soft_bits, bool keep_differences);
+
+      void traceback(unsigned char *out, uint8_t *reliability);
+
+      void soft_output(uint8_t *reliability);
+
+    public:
+      viterbi_k7_r14_decoder(int length);
+
+      int length() const { return d_length; }
+
+      /*! \brief Number of soft bits of a codeword. */
+      int codeword_length() const { return 4 * (d_length + 6); }
+
+      /*! \brief Number of bytes of the reliability output, one per 8 output bits. */
+      int reliability_length() const { return (d_length + 7) / 8; }
+
+      /*! \brief Decodes a codeword of 8 bit soft bits to length unpacked bits.
+       * @param reliability reliability_length() byte reliabilities, not computed if NULL
+       */
+      void decode(const int8_t *soft_bits, unsigned char *out, uint8_t *reliability = NULL);
+
+      /*! \brief Decodes a codeword of float soft bits to length unpacked bits.
+       * The soft bits are quantized to 8 bit with their mean magnitude as reference.
+       * @param reliability reliability_length() byte reliabilities, not computed if NULL
+       */
+      void decode(const float *soft_bits, unsigned char *out, uint8_t *reliability = NULL);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_VITERBI_K7_R14_DECODER_H */
@@ -0,0 +1,187 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <gnuradio/io_signature.h>
+#include "viterbi_k7_r14_impl.h"
+#include <algorithm>
+
+namespace gr {
+  namespace dab {
+
+    viterbi_k7_r14::sptr
+    viterbi_k7_r14::make(int length, bool int8_soft_bits, int num_threads, int reliability_threshold) {
+      return gnuradio::get_initial_sptr
+              (new viterbi_k7_r14_impl(length, int8_soft_bits, num_threads, reliability_threshold));
+    }
+
+    /*
+     * The private constructor
+     */
+    viterbi_k7_r14_impl::viterbi_k7_r14_impl(int length, bool int8_soft_bits, int num_threads,
+                                             int reliability_threshold)
+            : gr::block("viterbi_k7_r14",
+                        gr::io_signature::make(1, 1, int8_soft_bits ? sizeof(int8_t) : sizeof(float)),
+                        gr::io_signature::make(1, 1, sizeof(unsigned char))),
+              d_length(length),
+              d_int8_soft_bits(int8_soft_bits),
+              d_codeword_length(4 * (length + 6)),
+              d_reliability_threshold(reliability_threshold),
+              d_reliability_length((length + 7) / 8),
+              d_reliability_key(pmt::mp("reliability")),
+              d_stop(false),
+              d_job_id(0),
+              d_busy_workers(0),
+              d_job_in(NULL),
+              d_job_out(NULL),
+              d_job_codewords(0),
+              d_next_codeword(0) {
+      if (num_threads <= 0) {
+        num_threads = std::max(1u, std::thread::hardware_concurrency());
+      }
+      for (int i = 0; i < num_threads; i++) {
+        d_decoders.push_back(std::unique_ptr<viterbi_k7_r14_decoder>(new viterbi_k7_r14_decoder(length)));
+      }
+      set_output_multiple(length);
+      set_relative_rate((uint64_t) length, (uint64_t) d_codeword_length);
+    }
+
+    /*
+     * Our virtual destructor.
+     */
+    viterbi_k7_r14_impl::~viterbi_k7_r14_impl() {
+      stop();
+    }
+
+    bool
+    viterbi_k7_r14_impl::start() {
+      d_stop = false;
+      for (unsigned int i = 1; i < d_decoders.size(); i++) {
+        d_workers.push_back(std::thread(&viterbi_k7_r14_impl::worker, this, i, d_job_id));
+      }
+      return block::start();
+    }
+
+    bool
+    viterbi_k7_r14_impl::stop() {
+      {
+        std::lock_guard<std::mutex> lock(d_mutex);
+        d_stop = true;
+      }
+      d_job_cond.notify_all();
+      for (auto &worker : d_workers) {
+        worker.join();
+      }
+      d_workers.clear();
+      return block::stop();
+    }
+
+    void
+    viterbi_k7_r14_impl::worker(int index, uint64_t last_job) {
+      std::unique_lock<std::mutex> lock(d_mutex);
+      while (true) {
+        d_job_cond.wait(lock, [&] { return d_stop || d_job_id != last_job; });
+        if (d_stop) {
+          return;
+        }
+        last_job = d_job_id;
+        lock.unlock();
+        decode_codewords(*d_decoders[index]);
+        lock.lock();
+        if (--d_busy_workers == 0) {
+          d_done_cond.notify_one();
+        }
+      }
+    }
+
+    void
+    viterbi_k7_r14_impl::decode_codewords(viterbi_k7_r14_decoder &decoder) {
+      // the threads claim the codewords one by one, each codeword has a fixed place in the output buffer
+      int i;
+      while ((i = d_next_codeword++) < d_job_codewords) {
+        uint8_t *reliability = (d_reliability_threshold > 0) ? &d_reliability[i * d_reliability_length] : NULL;
+        if (d_int8_soft_bits) {
+          decoder.decode(&((const int8_t *) d_job_in)[i * d_codeword_length], &d_job_out[i * d_length],
+                         reliability);
+        } else {
+          decoder.decode(&((const float *) d_job_in)[i * d_codeword_length], &d_job_out[i * d_length],
+                         reliability);
+        }
+      }
+    }
+
+    void
+    viterbi_k7_r14_impl::forecast(int noutput_items, gr_vector_int &ninput_items_required) {
+      ninput_items_required[0] = (noutput_items / d_length) * d_codeword_length;
+    }
+
+    int
+    viterbi_k7_r14_impl::general_work(int noutput_items,
+                                      gr_vector_int &ninput_items,
+                                      gr_vector_const_void_star &input_items,
+                                      gr_vector_void_star &output_items) {
+      const int codewords = std::min(noutput_items / d_length, ninput_items[0] / d_codeword_length);
+
+      d_job_in = input_items[0];
+      d_job_out = (unsigned char *) output_items[0];
+      d_job_codewords = codewords;
+      d_next_codeword = 0;
+      if (d_reliability_threshold > 0) {
+        d_reliability.resize(codewords * d_reliability_length);
+      }
+      if (codewords > 1 && !d_workers.empty()) {
+        {
+          std::lock_guard<std::mutex> lock(d_mutex);
+          d_busy_workers = d_workers.size();
+          d_job_id++;
+        }
+        d_job_cond.notify_all();
+        decode_codewords(*d_decoders[0]);
+        std::unique_lock<std::mutex> lock(d_mutex);
+        d_done_cond.wait(lock, [&] { return d_busy_workers == 0; });
+      } else {
+        decode_codewords(*d_decoders[0]);
+      }
+      if (d_reliability_threshold > 0) {
+        for (int i = 0; i < codewords; i++) {
+          for (int b = 0; b < d_reliability_length; b++) {
+            const uint8_t reliability = d_reliability[i * d_reliability_length + b];
+            if (reliability < d_reliability_threshold) {
+              add_item_tag(0, nitems_written(0) + i * d_length + 8 * b, d_reliability_key,
+                           pmt::from_long(reliability));
+            }
+          }
+        }
+      }
+      // Tell runtime system how many input items we consumed on
+      // each input stream.
+      consume_each(codewords * d_codeword_length);
+
+      // Tell runtime system how many output items we produced.
+      return codewords * d_length;
+    }
+
+  } /* namespace dab */
+} /* namespace gr */
+
@@ -0,0 +1,95 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2017, 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL)
+ * Karlsruhe Institute of Technology (KIT).
+ *
+ * This is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this software; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+#ifndef INCLUDED_DAB_VITERBI_K7_R14_IMPL_H
+#define INCLUDED_DAB_VITERBI_K7_R14_IMPL_H
+
+#include <gnuradio/dab/viterbi_k7_r14.h>
+#include "viterbi_k7_r14_decoder.h"
+#include <atomic>
+#include <condition_variable>
+#include <memory>
+#include <mutex>
+#include <thread>
+
+namespace gr {
+  namespace dab {
+/*! \brief Viterbi decoder for the DAB mother code with the polynomials 0133, 0171, 0145, 0133
+ * Replaces trellis.viterbi_combined_fb with the DAB fsm and the following prune block.
+ *
+ * @param length number of information bits per codeword (without the 6 tail bits)
+ * @param int8_soft_bits input soft bits are int8 instead of float
+ * @param num_threads number of threads decoding the codewords of a work call,
+ * including the thread of the block (0: one per CPU core)
+ * @param reliability_threshold bytes with a smaller reliability are tagged with "reliability" (0: no tags)
+ */
+    class viterbi_k7_r14_impl : public viterbi_k7_r14 {
+    private:
+      int d_length;
+      bool d_int8_soft_bits;
+      int d_codeword_length;
+      int d_reliability_threshold; /*!< Bytes with a smaller reliability are tagged, 0 for no reliabilities. */
+      int d_reliability_length; /*!< Number of byte reliabilities per codeword. */
+      std::vector<uint8_t> d_reliability; /*!< Byte reliabilities of the codewords of a work call. */
+      const pmt::pmt_t d_reliability_key;
+      std::vector<std::unique_ptr<viterbi_k7_r14_decoder> > d_decoders; /*!< One decoder per thread, the first one for the block's thread. */
+
+      // worker pool
+      std::vector<std::thread> d_workers;
+      std::mutex d_mutex;
+      std::condition_variable d_job_cond; /*!< Signals a new job or the stop request to the workers. */
+      std::condition_variable d_done_cond; /*!< Signals the block's thread that all workers are done. */
+      bool d_stop;
+      uint64_t d_job_id;
+      int d_busy_workers;
+      const void *d_job_in;
+      unsigned char *d_job_out;
+      int d_job_codewords;
+      std::atomic<int> d_next_codeword; /*!< Next codeword of the job that is not claimed by a thread. */
+
+      void worker(int index, uint64_t last_job);
+
+      void decode_codewords(viterbi_k7_r14_decoder &decoder);
+
+    public:
+      viterbi_k7_r14_impl(int length, bool int8_soft_bits, int num_threads, int reliability_threshold);
+
+      ~viterbi_k7_r14_impl();
+
+      int num_threads() const { return d_decoders.size(); }
+
+      bool start();
+
+      bool stop();
+
+      void forecast(int noutput_items, gr_vector_int &ninput_items_required);
+
+      int general_work(int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items);
+    };
+
+  } // namespace dab
+} // namespace gr
+
+#endif /* INCLUDED_DAB_VITERBI_K7_R14_IMPL_H */
+
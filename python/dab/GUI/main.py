@@ -9,6 +9,7 @@ import user_frontend
 import usrp_dab_rx
 import usrp_dab_tx
 import gnuradio.dab.constants as constants
+from gnuradio import dab
 import math
 import json
 import sip
@@ -58,6 +59,10 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
         self.receiver_running = False
         self.audio_playing = False
         self.recording = False
+        # parsed FIC database per getter: (receiver, version, value)
+        self.fic_cache = {}
+        # decoded ensembles of earlier receptions, for a warm start
+        self.ensemble_cache = dab.ensemble_cache()
 
         # table preparations
         header = self.table_mci.horizontalHeader()
@@ -392,7 +397,8 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
                     self.spin_dab_mode.value(), self.spinbox_frequency.value(),
                     self.bit_rate, self.address, self.size, self.protection,
                     self.audio_bit_rate, self.dabplus, self.src_is_USRP,
-                    self.src_is_RTL, self.file_path)
+                    self.src_is_RTL, self.file_path,
+                    ensemble_cache=self.ensemble_cache)
                 self.my_receiver.set_volume(0)
                 self.my_receiver.start()
                 # status bar
@@ -400,7 +406,8 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
                 # init dev mode
                 self.dev_mode_init()
                 # once scan ensemble automatically (after per clicking btn)
-                time.sleep(1)
+                # a cached ensemble is restored as soon as the flowgraph runs
+                time.sleep(0.1 if self.my_receiver.has_cached_ensemble() else 1)
                 self.update_service_info()
                 self.btn_update_info.setEnabled(True)
                 self.snr_update()
@@ -574,6 +581,7 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
     def snr_update(self):
         # display snr in progress bar if an instance of usrp_dab_rx is existing
         if hasattr(self, 'my_receiver') and self.receiver_running:
+            self.my_receiver.update_ensemble_cache()
             SNR = self.my_receiver.get_snr()
             if SNR > 15.0:
                 self.setStyleSheet(
@@ -599,7 +607,14 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
     def play_audio(self):
         # play button pressed
         # if selected sub-channel is not the current sub-channel we have to reconfigure the receiver
-        if self.subch is not self.table_mci.currentRow():
+        if self.subch is not self.table_mci.currentRow() and \
+                self.my_receiver.is_dabplus == self.dabplus and \
+                self.my_receiver.audio_bit_rate == self.audio_bit_rate:
+            # same kind of service: retune the running receiver
+            self.subch = self.table_mci.currentRow()
+            self.my_receiver.set_subchannel(self.bit_rate, self.address, self.size, self.protection)
+            self.statusBar.showMessage("Audio playing.")
+        elif self.subch is not self.table_mci.currentRow():
             self.subch = self.table_mci.currentRow()
             dev_mode_opened = False
             if self.dev_mode_active:
@@ -621,7 +636,8 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
                 self.src_is_USRP,
                 self.src_is_RTL,
                 self.file_path,
-                prev_src=self.temp_src)
+                prev_src=self.temp_src,
+                ensemble_cache=self.ensemble_cache)
             self.my_receiver.set_volume(
                 float(self.slider_volume.value()) / 100)
             self.my_receiver.start()
@@ -666,7 +682,8 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
                 self.src_is_USRP,
                 self.src_is_RTL,
                 self.file_path,
-                prev_src=self.temp_src)
+                prev_src=self.temp_src,
+                ensemble_cache=self.ensemble_cache)
 
             self.my_receiver.start()
         elif new_sampling_rate == -1:
@@ -689,60 +706,44 @@ class DABstep(QtWidgets.QMainWindow, user_frontend.Ui_MainWindow):
             self.my_receiver.set_volume(
                 float(self.slider_volume.value()) / 100)
 
-    def get_ensemble_info(self):
-        self.json = self.my_receiver.get_ensemble_info()
-        if self.json is "":
-            return {"unknown": {"country_ID": 0}}
+    def get_fic_json(self, name, default):
+        # parse the json string of the FIC database only if it changed since the last call
+        version = self.my_receiver.get_fic_version()
+        cached = self.fic_cache.get(name)
+        if cached is not None and cached[0] is self.my_receiver and cached[1] == version:
+            return cached[2]
+        self.json = getattr(self.my_receiver, name)()
+        if self.json == "":
+            value = default
         else:
-            # load string (json) with ensemble info and convert it to dictionary
-            # string structure example: "{\"SWR_BW_N\":{\"country_ID\":1}}"
-            self.ensemble_info = json.loads(self.json)
-            json.dumps(self.ensemble_info)
-            return self.ensemble_info
+            value = json.loads(self.json)
+        self.fic_cache[name] = (self.my_receiver, version, value)
+        return value
+
+    def get_ensemble_info(self):
+        # string structure example: "{\"SWR_BW_N\":{\"country_ID\":1}}"
+        self.ensemble_info = self.get_fic_json("get_ensemble_info", {"unknown": {"country_ID": 0}})
+        return self.ensemble_info
 
     def get_service_info(self):
-        self.json = self.my_receiver.get_service_info()
-        if self.json is "":
-            return []
-        else:
-            # load string (json) with MCI and convert it to array of dictionaries
-            self.service_info = json.loads(self.json)
-            # string structure example: "[{\"reference\":736,\"ID\":2,\"primary\":true},{\"reference\":736,\"ID\":3,\"primary\":false},{\"reference\":234,\"ID\":5,\"primary\":true}]"
-            json.dumps(self.service_info)
-            return self.service_info
+        # string structure example: "[{\"reference\":736,\"ID\":2,\"primary\":true},{\"reference\":736,\"ID\":3,\"primary\":false},{\"reference\":234,\"ID\":5,\"primary\":true}]"
+        self.service_info = self.get_fic_json("get_service_info", [])
+        return self.service_info
 
     def get_service_labels(self):
-        self.json = self.my_receiver.get_service_labels()
-        if self.json is "":
-            return []
-        else:
-            # load string (json) with service labels and convert it to array of dictionaries
-            self.service_labels = json.loads(self.json)
-            # string structure example: "[{\"label\":\"SWR1_BW         \",\"reference\":736},{\"label\":\"SWR2            \",\"reference\":234}]"
-            json.dumps(self.service_labels)
-            return self.service_labels
+        # string structure example: "[{\"label\":\"SWR1_BW         \",\"reference\":736},{\"label\":\"SWR2            \",\"reference\":234}]"
+        self.service_labels = self.get_fic_json("get_service_labels", [])
+        return self.service_labels
 
     def get_subch_info(self):
-        self.json = self.my_receiver.get_subch_info()
-        if self.json is "":
-            return []
-        else:
-            # load string (json) with sub-channel info and convert it to array of dictionaries
-            self.subch_info = json.loads(self.json)
-            # string structure example: "[{\"ID\":2, \"address\":54, \"protect\":2,\"size\":84},{\"ID\":3, \"address\":54, \"protect\":2,\"size\":84}]"
-            json.dumps(self.subch_info)
-            return self.subch_info
+        # string structure example: "[{\"ID\":2, \"address\":54, \"protect\":2,\"size\":84},{\"ID\":3, \"address\":54, \"protect\":2,\"size\":84}]"
+        self.subch_info = self.get_fic_json("get_subch_info", [])
+        return self.subch_info
 
     def get_programme_type(self):
-        self.json = self.my_receiver.get_programme_type()
-        # load string (json) with service information (programme type) and convert it to array of dictionaries
-        if self.json == "":
-            return []
-        else:
-            self.programme_type = json.loads(self.json)
-            # string structure example: "[{\"reference\":736, \"programme_type\":13},{\"reference\":234, \"programme_type\":0}]"
-            json.dumps(self.programme_type)
-            return self.programme_type
+        # string structure example: "[{\"reference\":736, \"programme_type\":13},{\"reference\":234, \"programme_type\":0}]"
+        self.programme_type = self.get_fic_json("get_programme_type", [])
+        return self.programme_type
 
     def get_sample_rate(self):
         # TODO: set rational resampler in flowgraoph with sample rate
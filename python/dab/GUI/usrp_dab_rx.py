@@ -32,13 +32,15 @@ import time, math
 
 
 class usrp_dab_rx(gr.top_block):
-    def __init__(self, dab_mode, frequency, bit_rate, address, size, protection, audio_bit_rate, dabplus, use_usrp, use_rtl, src_path, sink_path = "None", prev_src=None):
+    def __init__(self, dab_mode, frequency, bit_rate, address, size, protection, audio_bit_rate, dabplus, use_usrp, use_rtl, src_path, sink_path = "None", prev_src=None, ensemble_cache=None):
         gr.top_block.__init__(self)
 
         self.dab_mode = dab_mode
         self.verbose = False
         self.sample_rate = 2048e3
         self.dabplus = dabplus
+        self.is_dabplus = dabplus
+        self.audio_bit_rate = audio_bit_rate
         self.use_usrp = use_usrp
         self.use_rtl = True
         self.src_path = src_path
@@ -124,13 +126,23 @@ class usrp_dab_rx(gr.top_block):
         ########################
         self.fic_dec = dab.fic_decode_vc(self.dab_params)
 
+        # warm start with the ensemble received last on this frequency
+        self.ensemble_cache = ensemble_cache
+        self.cached_ensemble = None
+        self.cache_version = -1
+        if self.ensemble_cache is not None:
+            self.cached_ensemble = self.ensemble_cache.lookup(self.frequency)
+            if self.cached_ensemble is not None:
+                self.fic_dec.restore_database(self.cached_ensemble["database"])
+
         ########################
         # MSC decoder
         ########################
         if self.dabplus:
-            self.dabplus = dab.dabplus_audio_decoder_ff(self.dab_params, bit_rate, address, size, protection, True)
+            self.dabplus = dab.dabplus_audio_decoder_ff(self.dab_params, bit_rate, address, size, protection, True,
+                                                        cif_history=True)
         else:
-            self.msc_dec = dab.msc_decode(self.dab_params, address, size, protection)
+            self.msc_dec = dab.msc_decode(self.dab_params, address, size, protection, cif_history=True)
             self.unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
             self.mp2_dec = dab.mp2_decode_bs(bit_rate / 8)
             self.s2f_left = blocks.short_to_float(1, 32767)
@@ -163,6 +175,8 @@ class usrp_dab_rx(gr.top_block):
         
         if self.dabplus:
             self.connect((self.demod, 1), self.dabplus)
+            # superframe synchronization with the CIF counter of the FIC
+            self.msg_connect(self.fic_dec, "cif_count", self.dabplus, "cif_count")
         else:
             self.connect((self.demod, 0), (self.msc_dec, 0), self.unpack, self.mp2_dec)
             self.connect((self.demod, 1), (self.msc_dec, 1))
@@ -204,6 +218,34 @@ class usrp_dab_rx(gr.top_block):
     def get_programme_type(self):
         return self.fic_dec.get_programme_type()
 
+    def get_fic_version(self):
+        return self.fic_dec.get_version()
+
+    def has_cached_ensemble(self):
+        return self.cached_ensemble is not None
+
+    def get_cached_sync(self):
+        # synchronization parameters of the last reception of the cached ensemble
+        return self.cached_ensemble["sync"] if self.cached_ensemble is not None else {}
+
+    def update_ensemble_cache(self):
+        # store the FIC database if it changed and we are receiving the ensemble
+        if self.ensemble_cache is None or not self.demod.get_locked():
+            return
+        version = self.fic_dec.get_version()
+        ensemble_id = self.fic_dec.get_ensemble_id()
+        if version == self.cache_version or ensemble_id < 0:
+            return
+        self.cache_version = version
+        self.ensemble_cache.store(self.frequency, ensemble_id, self.fic_dec.get_database(),
+                                  {"coarse_freq_offset": self.demod.get_coarse_freq_offset(),
+                                   "fine_freq_offset": self.demod.get_fine_freq_offset(),
+                                   "snr": self.get_snr()})
+
+    def stop(self):
+        self.update_ensemble_cache()
+        gr.top_block.stop(self)
+
     def get_sample_rate(self):
         return self.dabplus.get_sample_rate()
 
@@ -242,6 +284,22 @@ class usrp_dab_rx(gr.top_block):
             print("-> error - cannot tune to " + str(freq) + " Hz")
             return False
 
+    def set_subchannel(self, bit_rate, address, size, protection):
+        # switch the service without stopping synchronization and FIC decoding
+        if self.is_dabplus:
+            self.dabplus.set_subchannel(address, size, protection, bit_rate)
+        else:
+            self.lock()
+            self.disconnect(self.unpack, self.mp2_dec)
+            self.disconnect((self.mp2_dec, 0), self.s2f_left)
+            self.disconnect((self.mp2_dec, 1), self.s2f_right)
+            self.msc_dec.set_subchannel(address, size, protection)
+            self.mp2_dec = dab.mp2_decode_bs(bit_rate / 8)
+            self.connect(self.unpack, self.mp2_dec)
+            self.connect((self.mp2_dec, 0), self.s2f_left)
+            self.connect((self.mp2_dec, 1), self.s2f_right)
+            self.unlock()
+
     def set_gain(self, gain):
         if hasattr(self, 'src'):
             self.src.set_gain(gain, 0)
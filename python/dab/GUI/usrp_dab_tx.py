@@ -87,7 +87,7 @@ class usrp_dab_tx(gr.top_block):
                 # mp2 encoder
                 self.mp2_encoders[i] = dab.mp2_encode_sb(self.data_rates_n[i], 2, audio_sampling_rates[i])
             # encoder
-            self.msc_encoders[i] = dab.msc_encode(self.dp, self.data_rates_n[i], self.protections[i])
+            self.msc_encoders[i] = dab.msc_encode_packed(self.dp, self.data_rates_n[i], self.protections[i])
 
         ########################
         # MUX
@@ -99,7 +99,7 @@ class usrp_dab_tx(gr.top_block):
         # Modulator
         ########################
         self.s2v_mod = blocks.stream_to_vector(gr.sizeof_char, int(self.dp.num_carriers/4))
-        self.mod = dab.ofdm_mod(self.dp)
+        self.mod = dab.ofdm_mod(self.dp, fused=True)
 
         ########################
         # Sink
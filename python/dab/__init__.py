@@ -25,9 +25,12 @@ from .parameters import *
 from .ofdm_demod_cc import *
 from .ofdm_mod_bc import *
 from .fic_decode_vc import *
+from .ensemble_cache import *
 from .fic_encode import *
 from .msc_decode import *
+from .msc_decode_all import *
 from .msc_encode import *
+from .msc_encode_packed import *
 from .transmitter_c import *
 from .dabplus_audio_decoder_ff import *
 
@@ -0,0 +1,56 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(complex_to_interleaved_char_vcb.h) */
+/* BINDTOOL_HEADER_FILE_HASH(60e1ea509e76bc60520fef72aa6d9f41)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/complex_to_interleaved_char_vcb.h>
+// pydoc.h is automatically generated in the build directory
+#include <complex_to_interleaved_char_vcb_pydoc.h>
+
+void bind_complex_to_interleaved_char_vcb(py::module& m)
+{
+
+    using complex_to_interleaved_char_vcb = ::gr::dab::complex_to_interleaved_char_vcb;
+
+
+    py::class_<complex_to_interleaved_char_vcb,
+               gr::sync_block,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<complex_to_interleaved_char_vcb>>(
+        m, "complex_to_interleaved_char_vcb", D(complex_to_interleaved_char_vcb))
+
+        .def(py::init(&complex_to_interleaved_char_vcb::make),
+             py::arg("length"),
+             py::arg("scale") = 0,
+             D(complex_to_interleaved_char_vcb, make))
+
+
+        .def("set_scale",
+             &complex_to_interleaved_char_vcb::set_scale,
+             py::arg("scale"),
+             D(complex_to_interleaved_char_vcb, set_scale))
+
+
+        ;
+}
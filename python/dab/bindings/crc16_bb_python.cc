@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(crc16_bb.h)                                        */
-/* BINDTOOL_HEADER_FILE_HASH(ac2bcaae058ac87ae1fe2118b484a27d)                     */
+/* BINDTOOL_HEADER_FILE_HASH(f5c75161e2a0606a25f47ad1d3651c63)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -0,0 +1,85 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(crc16.h)                                        */
+/* BINDTOOL_HEADER_FILE_HASH(15e1e23eb0ae6a0280fbc512ee562578)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/crc16.h>
+// pydoc.h is automatically generated in the build directory
+#include <crc16_pydoc.h>
+
+void bind_crc16(py::module& m)
+{
+
+    using crc16 = ::gr::dab::crc16;
+
+
+    py::class_<crc16, std::shared_ptr<crc16>>(m, "crc16", D(crc16))
+
+        .def(py::init<uint16_t>(),
+             py::arg("generator") = 0x1021,
+             D(crc16, crc16))
+
+
+        .def("generator", &crc16::generator, D(crc16, generator))
+
+
+        .def("update",
+             [](const crc16& self, uint16_t state, const std::vector<uint8_t>& data) {
+                 return self.update(state, data.data(), data.size());
+             },
+             py::arg("state"),
+             py::arg("data"),
+             D(crc16, update))
+
+
+        .def("compute",
+             [](const crc16& self, const std::vector<uint8_t>& data) {
+                 return self.compute(data.data(), data.size());
+             },
+             py::arg("data"),
+             D(crc16, compute))
+
+
+        .def("check",
+             [](const crc16& self, const std::vector<uint8_t>& data) {
+                 return self.check(data.data(), data.size());
+             },
+             py::arg("data"),
+             D(crc16, check))
+
+
+        .def("check_blocks",
+             &crc16::check_blocks,
+             py::arg("data"),
+             py::arg("block_length"),
+             D(crc16, check_blocks))
+
+
+        .def("check_unpacked_blocks",
+             &crc16::check_unpacked_blocks,
+             py::arg("bits"),
+             py::arg("block_length"),
+             D(crc16, check_unpacked_blocks))
+
+        ;
+}
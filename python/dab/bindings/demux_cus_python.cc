@@ -0,0 +1,51 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(demux_cus.h)                                              */
+/* BINDTOOL_HEADER_FILE_HASH(c546ff3394f80b11501d491d3e063ecf)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/demux_cus.h>
+// pydoc.h is automatically generated in the build directory
+#include <demux_cus_pydoc.h>
+
+void bind_demux_cus(py::module& m)
+{
+
+    using demux_cus = ::gr::dab::demux_cus;
+
+
+    py::class_<demux_cus,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<demux_cus>>(m, "demux_cus", D(demux_cus))
+
+        .def(py::init(&demux_cus::make),
+             py::arg("itemsize"),
+             py::arg("vlen"),
+             py::arg("frame_len"),
+             py::arg("addresses"),
+             py::arg("sizes"),
+             D(demux_cus, make))
+
+
+        ;
+}
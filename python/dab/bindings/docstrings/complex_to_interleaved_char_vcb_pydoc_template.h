@@ -0,0 +1,29 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+#include "pydoc_macros.h"
+#define D(...) DOC(gr, dab, __VA_ARGS__)
+/*
+  This file contains placeholders for docstrings for the Python bindings.
+  Do not edit! These were automatically extracted during the binding process
+  and will be overwritten during the build process
+ */
+
+
+static const char* __doc_gr_dab_complex_to_interleaved_char_vcb = R"doc()doc";
+
+
+static const char*
+    __doc_gr_dab_complex_to_interleaved_char_vcb_complex_to_interleaved_char_vcb =
+        R"doc()doc";
+
+
+static const char* __doc_gr_dab_complex_to_interleaved_char_vcb_set_scale = R"doc()doc";
+
+
+static const char* __doc_gr_dab_complex_to_interleaved_char_vcb_make = R"doc()doc";
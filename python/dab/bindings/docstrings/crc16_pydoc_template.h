@@ -0,0 +1,39 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+#include "pydoc_macros.h"
+#define D(...) DOC(gr, dab, __VA_ARGS__)
+/*
+  This file contains placeholders for docstrings for the Python bindings.
+  Do not edit! These were automatically extracted during the binding process
+  and will be overwritten during the build process
+ */
+
+
+static const char* __doc_gr_dab_crc16 = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_crc16 = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_generator = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_update = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_compute = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_check = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_check_blocks = R"doc()doc";
+
+
+static const char* __doc_gr_dab_crc16_check_unpacked_blocks = R"doc()doc";
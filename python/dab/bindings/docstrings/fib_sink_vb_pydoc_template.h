@@ -43,3 +43,9 @@ static const char* __doc_gr_dab_fib_sink_vb_get_programme_type = R"doc()doc";
 
 
 static const char* __doc_gr_dab_fib_sink_vb_get_crc_passed = R"doc()doc";
+
+
+static const char* __doc_gr_dab_fib_sink_vb_get_version = R"doc()doc";
+
+
+static const char* __doc_gr_dab_fib_sink_vb_get_ensemble_id = R"doc()doc";
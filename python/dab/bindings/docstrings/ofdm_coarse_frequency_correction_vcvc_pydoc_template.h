@@ -32,4 +32,7 @@ static const char* __doc_gr_dab_ofdm_coarse_frequency_correction_vcvc_get_snr =
     R"doc()doc";
 
 
+static const char* __doc_gr_dab_ofdm_coarse_frequency_correction_vcvc_get_freq_offset = R"doc()doc";
+
+
 static const char* __doc_gr_dab_ofdm_coarse_frequency_correction_vcvc_make = R"doc()doc";
@@ -22,4 +22,10 @@ static const char* __doc_gr_dab_ofdm_synchronization_cvf_ofdm_synchronization_cv
     R"doc()doc";
 
 
+static const char* __doc_gr_dab_ofdm_synchronization_cvf_get_locked = R"doc()doc";
+
+
+static const char* __doc_gr_dab_ofdm_synchronization_cvf_get_frequency_offset = R"doc()doc";
+
+
 static const char* __doc_gr_dab_ofdm_synchronization_cvf_make = R"doc()doc";
@@ -30,3 +30,12 @@ static const char* __doc_gr_dab_reed_solomon_decode_bb_make = R"doc()doc";
 
 
 static const char* __doc_gr_dab_reed_solomon_decode_bb_get_corrected_errors = R"doc()doc";
+
+
+static const char* __doc_gr_dab_reed_solomon_decode_bb_get_clean_packets = R"doc()doc";
+
+
+static const char* __doc_gr_dab_reed_solomon_decode_bb_get_corrected_packets = R"doc()doc";
+
+
+static const char* __doc_gr_dab_reed_solomon_decode_bb_get_uncorrectable_packets = R"doc()doc";
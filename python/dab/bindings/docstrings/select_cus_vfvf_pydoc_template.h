@@ -22,3 +22,6 @@ static const char* __doc_gr_dab_select_cus_vfvf_select_cus_vfvf = R"doc()doc";
 
 
 static const char* __doc_gr_dab_select_cus_vfvf_make = R"doc()doc";
+
+
+static const char* __doc_gr_dab_select_cus_vfvf_set_subchannel = R"doc()doc";
@@ -0,0 +1,30 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+#include "pydoc_macros.h"
+#define D(...) DOC(gr, dab, __VA_ARGS__)
+/*
+  This file contains placeholders for docstrings for the Python bindings.
+  Do not edit! These were automatically extracted during the binding process
+  and will be overwritten during the build process
+ */
+
+
+static const char* __doc_gr_dab_viterbi_k7_r14 = R"doc()doc";
+
+
+static const char* __doc_gr_dab_viterbi_k7_r14_viterbi_k7_r14_0 = R"doc()doc";
+
+
+static const char* __doc_gr_dab_viterbi_k7_r14_viterbi_k7_r14_1 = R"doc()doc";
+
+
+static const char* __doc_gr_dab_viterbi_k7_r14_make = R"doc()doc";
+
+
+static const char* __doc_gr_dab_viterbi_k7_r14_num_threads = R"doc()doc";
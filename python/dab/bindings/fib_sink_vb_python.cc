@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(fib_sink_vb.h)                                        */
-/* BINDTOOL_HEADER_FILE_HASH(b47ee1845646dbc4e201bda6d3c964ea)                     */
+/* BINDTOOL_HEADER_FILE_HASH(3a4d958f834b3a597f8b4a09c3f310cb)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -39,7 +39,9 @@ void bind_fib_sink_vb(py::module& m)
                gr::basic_block,
                std::shared_ptr<fib_sink_vb>>(m, "fib_sink_vb", D(fib_sink_vb))
 
-        .def(py::init(&fib_sink_vb::make), D(fib_sink_vb, make))
+        .def(py::init(&fib_sink_vb::make),
+             py::arg("fibs_per_cif") = 3,
+             D(fib_sink_vb, make))
 
 
         .def("get_ensemble_info",
@@ -71,5 +73,15 @@ void bind_fib_sink_vb(py::module& m)
              &fib_sink_vb::get_crc_passed,
              D(fib_sink_vb, get_crc_passed))
 
+
+        .def("get_version",
+             &fib_sink_vb::get_version,
+             D(fib_sink_vb, get_version))
+
+
+        .def("get_ensemble_id",
+             &fib_sink_vb::get_ensemble_id,
+             D(fib_sink_vb, get_ensemble_id))
+
         ;
 }
@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(firecode_check_bb.h)                                        */
-/* BINDTOOL_HEADER_FILE_HASH(4b7073bc31a13bb2e40d17ddb32a42e0)                     */
+/* BINDTOOL_HEADER_FILE_HASH(c225e0381656ca549d56c89e4d1f4b68)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
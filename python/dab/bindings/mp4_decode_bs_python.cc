@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(mp4_decode_bs.h)                                        */
-/* BINDTOOL_HEADER_FILE_HASH(44d6b5cc22506aaff0385cf690f88bdd)                     */
+/* BINDTOOL_HEADER_FILE_HASH(87452334895d47c411598c9f5d029075)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -0,0 +1,49 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(msc_encode_packed_bb.h)                                              */
+/* BINDTOOL_HEADER_FILE_HASH(08a83719c0208a2353af812fe4bbb175)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/msc_encode_packed_bb.h>
+// pydoc.h is automatically generated in the build directory
+#include <msc_encode_packed_bb_pydoc.h>
+
+void bind_msc_encode_packed_bb(py::module& m)
+{
+
+    using msc_encode_packed_bb = ::gr::dab::msc_encode_packed_bb;
+
+
+    py::class_<msc_encode_packed_bb,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<msc_encode_packed_bb>>(m, "msc_encode_packed_bb", D(msc_encode_packed_bb))
+
+        .def(py::init(&msc_encode_packed_bb::make),
+             py::arg("framesize"),
+             py::arg("puncturing_vector"),
+             py::arg("scrambling_vector"),
+             D(msc_encode_packed_bb, make))
+
+
+        ;
+}
@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(ofdm_coarse_frequency_correction_vcvc.h) */
-/* BINDTOOL_HEADER_FILE_HASH(99946608a411cc5c43b608dbd5988225)                     */
+/* BINDTOOL_HEADER_FILE_HASH(ca7246335f838044f55d686173260269)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -55,5 +55,10 @@ void bind_ofdm_coarse_frequency_correction_vcvc(py::module& m)
              D(ofdm_coarse_frequency_correction_vcvc, get_snr))
 
 
+        .def("get_freq_offset",
+             &ofdm_coarse_frequency_correction_vcvc::get_freq_offset,
+             D(ofdm_coarse_frequency_correction_vcvc, get_freq_offset))
+
+
         ;
 }
@@ -0,0 +1,64 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(ofdm_differential_demod_vcvc.h) */
+/* BINDTOOL_HEADER_FILE_HASH(d97ce35fd121dbe423c3cd6849e35c98)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/ofdm_differential_demod_vcvc.h>
+// pydoc.h is automatically generated in the build directory
+#include <ofdm_differential_demod_vcvc_pydoc.h>
+
+void bind_ofdm_differential_demod_vcvc(py::module& m)
+{
+
+    using ofdm_differential_demod_vcvc = ::gr::dab::ofdm_differential_demod_vcvc;
+
+
+    py::class_<ofdm_differential_demod_vcvc,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<ofdm_differential_demod_vcvc>>(
+        m, "ofdm_differential_demod_vcvc", D(ofdm_differential_demod_vcvc))
+
+        .def(py::init(&ofdm_differential_demod_vcvc::make),
+             py::arg("fft_length"),
+             py::arg("num_carriers"),
+             py::arg("deinterleaving_sequence"),
+             py::arg("symbols_fic"),
+             py::arg("symbols_msc"),
+             py::arg("scale") = 1.0,
+             py::arg("symbol_mask") = std::vector<unsigned char>(),
+             D(ofdm_differential_demod_vcvc, make))
+
+
+        .def("get_snr",
+             &ofdm_differential_demod_vcvc::get_snr,
+             D(ofdm_differential_demod_vcvc, get_snr))
+
+
+        .def("get_freq_offset",
+             &ofdm_differential_demod_vcvc::get_freq_offset,
+             D(ofdm_differential_demod_vcvc, get_freq_offset))
+
+
+        ;
+}
@@ -0,0 +1,55 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(ofdm_differential_mod_vbc.h)                                              */
+/* BINDTOOL_HEADER_FILE_HASH(e7cdb28f38d61ea8c849e384b552f51a)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/ofdm_differential_mod_vbc.h>
+// pydoc.h is automatically generated in the build directory
+#include <ofdm_differential_mod_vbc_pydoc.h>
+
+void bind_ofdm_differential_mod_vbc(py::module& m)
+{
+
+    using ofdm_differential_mod_vbc = ::gr::dab::ofdm_differential_mod_vbc;
+
+
+    py::class_<ofdm_differential_mod_vbc,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<ofdm_differential_mod_vbc>>(
+        m, "ofdm_differential_mod_vbc", D(ofdm_differential_mod_vbc))
+
+        .def(py::init(&ofdm_differential_mod_vbc::make),
+             py::arg("fft_length"),
+             py::arg("num_carriers"),
+             py::arg("cp_length"),
+             py::arg("ns_length"),
+             py::arg("symbols_per_frame"),
+             py::arg("prn"),
+             py::arg("interleaving_sequence"),
+             py::arg("scale") = 1.0,
+             D(ofdm_differential_mod_vbc, make))
+
+
+        ;
+}
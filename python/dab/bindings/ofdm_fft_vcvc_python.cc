@@ -0,0 +1,52 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(ofdm_fft_vcvc.h) */
+/* BINDTOOL_HEADER_FILE_HASH(72266d004a050507c4a79f1ba52a5f68)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/ofdm_fft_vcvc.h>
+// pydoc.h is automatically generated in the build directory
+#include <ofdm_fft_vcvc_pydoc.h>
+
+void bind_ofdm_fft_vcvc(py::module& m)
+{
+
+    using ofdm_fft_vcvc = ::gr::dab::ofdm_fft_vcvc;
+
+
+    py::class_<ofdm_fft_vcvc,
+               gr::sync_block,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<ofdm_fft_vcvc>>(
+        m, "ofdm_fft_vcvc", D(ofdm_fft_vcvc))
+
+        .def(py::init(&ofdm_fft_vcvc::make),
+             py::arg("fft_length"),
+             py::arg("symbols_per_frame"),
+             py::arg("scale") = 1.0,
+             py::arg("symbol_mask") = std::vector<unsigned char>(),
+             D(ofdm_fft_vcvc, make))
+
+
+        ;
+}
@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(ofdm_synchronization_cvf.h) */
-/* BINDTOOL_HEADER_FILE_HASH(e4e04900c667ea06e05066cdd1175a9d)                     */
+/* BINDTOOL_HEADER_FILE_HASH(454b41354ab92683ca42833d3573269a)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -40,12 +40,22 @@ void bind_ofdm_synchronization_cvf(py::module& m)
         m, "ofdm_synchronization_cvf", D(ofdm_synchronization_cvf))
 
         .def(py::init(&ofdm_synchronization_cvf::make),
-             py::arg("symbol_length"),
-             py::arg("cyclic_prefix_lenght"),
              py::arg("fft_length"),
+             py::arg("cyclic_prefix_length"),
+             py::arg("null_symbol_length"),
              py::arg("symbols_per_frame"),
              D(ofdm_synchronization_cvf, make))
 
 
+        .def("get_locked",
+             &ofdm_synchronization_cvf::get_locked,
+             D(ofdm_synchronization_cvf, get_locked))
+
+
+        .def("get_frequency_offset",
+             &ofdm_synchronization_cvf::get_frequency_offset,
+             D(ofdm_synchronization_cvf, get_frequency_offset))
+
+
         ;
 }
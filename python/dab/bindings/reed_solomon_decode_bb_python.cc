@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(reed_solomon_decode_bb.h) */
-/* BINDTOOL_HEADER_FILE_HASH(1f1b910d03b725dfc911889a312dfb95)                     */
+/* BINDTOOL_HEADER_FILE_HASH(85768f5edc6e2a6ab5a78947f44fc689)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -48,5 +48,20 @@ void bind_reed_solomon_decode_bb(py::module& m)
              &reed_solomon_decode_bb::get_corrected_errors,
              D(reed_solomon_decode_bb, get_corrected_errors))
 
+
+        .def("get_clean_packets",
+             &reed_solomon_decode_bb::get_clean_packets,
+             D(reed_solomon_decode_bb, get_clean_packets))
+
+
+        .def("get_corrected_packets",
+             &reed_solomon_decode_bb::get_corrected_packets,
+             D(reed_solomon_decode_bb, get_corrected_packets))
+
+
+        .def("get_uncorrectable_packets",
+             &reed_solomon_decode_bb::get_uncorrectable_packets,
+             D(reed_solomon_decode_bb, get_uncorrectable_packets))
+
         ;
 }
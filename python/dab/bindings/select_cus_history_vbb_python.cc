@@ -0,0 +1,58 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(select_cus_history_vbb.h)                                 */
+/* BINDTOOL_HEADER_FILE_HASH(8e1ff8d5b17e04744f2219e2d1b189b4)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/select_cus_history_vbb.h>
+// pydoc.h is automatically generated in the build directory
+#include <select_cus_history_vbb_pydoc.h>
+
+void bind_select_cus_history_vbb(py::module& m)
+{
+
+    using select_cus_history_vbb = ::gr::dab::select_cus_history_vbb;
+
+
+    py::class_<select_cus_history_vbb,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<select_cus_history_vbb>>(m, "select_cus_history_vbb", D(select_cus_history_vbb))
+
+        .def(py::init(&select_cus_history_vbb::make),
+             py::arg("vlen"),
+             py::arg("frame_len"),
+             py::arg("address"),
+             py::arg("size"),
+             py::arg("scrambling_vector"),
+             D(select_cus_history_vbb, make))
+
+
+        .def("set_subchannel",
+             &select_cus_history_vbb::set_subchannel,
+             py::arg("address"),
+             py::arg("size"),
+             D(select_cus_history_vbb, set_subchannel))
+
+
+        ;
+}
@@ -0,0 +1,57 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(select_cus_vbvb.h)                                        */
+/* BINDTOOL_HEADER_FILE_HASH(d544469c4200ab1ebc4f5dcef282bab8)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/select_cus_vbvb.h>
+// pydoc.h is automatically generated in the build directory
+#include <select_cus_vbvb_pydoc.h>
+
+void bind_select_cus_vbvb(py::module& m)
+{
+
+    using select_cus_vbvb = ::gr::dab::select_cus_vbvb;
+
+
+    py::class_<select_cus_vbvb,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<select_cus_vbvb>>(m, "select_cus_vbvb", D(select_cus_vbvb))
+
+        .def(py::init(&select_cus_vbvb::make),
+             py::arg("vlen"),
+             py::arg("frame_len"),
+             py::arg("address"),
+             py::arg("size"),
+             D(select_cus_vbvb, make))
+
+
+        .def("set_subchannel",
+             &select_cus_vbvb::set_subchannel,
+             py::arg("address"),
+             py::arg("size"),
+             D(select_cus_vbvb, set_subchannel))
+
+
+        ;
+}
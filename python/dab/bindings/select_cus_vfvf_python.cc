@@ -14,7 +14,7 @@
 /* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
 /* BINDTOOL_USE_PYGCCXML(0)                                                        */
 /* BINDTOOL_HEADER_FILE(select_cus_vfvf.h)                                        */
-/* BINDTOOL_HEADER_FILE_HASH(6b8f1e58a0de6a141f245302da309aea)                     */
+/* BINDTOOL_HEADER_FILE_HASH(a48cfebdc5699887c57283e2fa1d77d2)                     */
 /***********************************************************************************/
 
 #include <pybind11/complex.h>
@@ -46,5 +46,12 @@ void bind_select_cus_vfvf(py::module& m)
              D(select_cus_vfvf, make))
 
 
+        .def("set_subchannel",
+             &select_cus_vfvf::set_subchannel,
+             py::arg("address"),
+             py::arg("size"),
+             D(select_cus_vfvf, set_subchannel))
+
+
         ;
 }
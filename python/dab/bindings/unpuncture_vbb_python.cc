@@ -0,0 +1,49 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(unpuncture_vbb.h)                                        */
+/* BINDTOOL_HEADER_FILE_HASH(3ad5cc09d31c1fde0ec326c4f03e5d12)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/unpuncture_vbb.h>
+// pydoc.h is automatically generated in the build directory
+#include <unpuncture_vbb_pydoc.h>
+
+void bind_unpuncture_vbb(py::module& m)
+{
+
+    using unpuncture_vbb = ::gr::dab::unpuncture_vbb;
+
+
+    py::class_<unpuncture_vbb,
+               gr::sync_block,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<unpuncture_vbb>>(m, "unpuncture_vbb", D(unpuncture_vbb))
+
+        .def(py::init(&unpuncture_vbb::make),
+             py::arg("puncturing_vector"),
+             py::arg("fillval") = 0,
+             D(unpuncture_vbb, make))
+
+
+        ;
+}
@@ -0,0 +1,55 @@
+/*
+ * Copyright 2023 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ */
+
+/***********************************************************************************/
+/* This file is automatically generated using bindtool and can be manually edited  */
+/* The following lines can be configured to regenerate this file during cmake      */
+/* If manual edits are made, the following tags should be modified accordingly.    */
+/* BINDTOOL_GEN_AUTOMATIC(0)                                                       */
+/* BINDTOOL_USE_PYGCCXML(0)                                                        */
+/* BINDTOOL_HEADER_FILE(viterbi_k7_r14.h) */
+/* BINDTOOL_HEADER_FILE_HASH(078a71e5f03259253b781413002acce8)                     */
+/***********************************************************************************/
+
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+#include <gnuradio/dab/viterbi_k7_r14.h>
+// pydoc.h is automatically generated in the build directory
+#include <viterbi_k7_r14_pydoc.h>
+
+void bind_viterbi_k7_r14(py::module& m)
+{
+
+    using viterbi_k7_r14 = ::gr::dab::viterbi_k7_r14;
+
+
+    py::class_<viterbi_k7_r14,
+               gr::block,
+               gr::basic_block,
+               std::shared_ptr<viterbi_k7_r14>>(
+        m, "viterbi_k7_r14", D(viterbi_k7_r14))
+
+        .def(py::init(&viterbi_k7_r14::make),
+             py::arg("length"),
+             py::arg("int8_soft_bits") = false,
+             py::arg("num_threads") = 1,
+             py::arg("reliability_threshold") = 0,
+             D(viterbi_k7_r14, make))
+
+
+        .def("num_threads",
+             &viterbi_k7_r14::num_threads,
+             D(viterbi_k7_r14, num_threads))
+
+        ;
+}
@@ -31,9 +31,16 @@ class dabplus_audio_decoder_ff(gr.hier_block2):
     -Reed Solomon error repair
     -mp4 decoder
     See the single blocks for more details
+
+    Connect the message port "cif_count" of fic_decode_vc to the message port
+    "cif_count" to synchronize to the superframes with the CIF counter.
+
+    The bytes with a Viterbi reliability below reliability_threshold are
+    tagged, so that the Reed-Solomon decoder can use them as erasures when
+    an RS packet is not correctable otherwise (0: no erasure decoding).
     """
 
-    def __init__(self, dab_params, bit_rate, address, subch_size, protection, output_float, verbose=False, debug=False):
+    def __init__(self, dab_params, bit_rate, address, subch_size, protection, output_float, verbose=False, debug=False, cif_history=False, reliability_threshold=32):
         if output_float: # map short samples to the range [-1,1] in floats
             gr.hier_block2.__init__(self,
                                     "dabplus_audio_decoder_ff",
@@ -65,16 +72,13 @@ class dabplus_audio_decoder_ff(gr.hier_block2):
         #     raise ValueError
 
         # MSC decoder extracts logical frames out of transmission frame and decodes it
-        self.msc_decoder = dab.msc_decode(self.dp, self.address, self.size, self.protection, self.verbose, self.debug)
-        # firecode synchronizes to superframes and checks
-        self.firecode = dab.firecode_check_bb(int(self.bit_rate_n))
-        # Reed-Solomon error repair
-        self.rs = dab.reed_solomon_decode_bb(int(self.bit_rate_n))
-        # mp4 decoder
-        self.mp4 = dab.mp4_decode_bs(int(self.bit_rate_n))
+        self.msc_decoder = dab.msc_decode(self.dp, self.address, self.size, self.protection, self.verbose, self.debug,
+                                           cif_history=cif_history, reliability_threshold=reliability_threshold)
+        self.create_superframe_decoder()
 
         # connections
-        self.connect(self, self.msc_decoder, self.firecode, self.rs, self.mp4)
+        self.connect(self, self.msc_decoder)
+        self.message_port_register_hier_in("cif_count")
 
         if self.output_float:
             # map short samples to the range [-1,1] in floats
@@ -82,12 +86,58 @@ class dabplus_audio_decoder_ff(gr.hier_block2):
             self.s2f_right = blocks.short_to_float(1, 32767)
             self.gain_left = blocks.multiply_const_ff(1, 1)
             self.gain_right = blocks.multiply_const_ff(1, 1)
-            self.connect((self.mp4, 0), self.s2f_left, self.gain_left, (self, 0))
-            self.connect((self.mp4, 1), self.s2f_right, self.gain_right, (self, 1))
+            self.connect(self.s2f_left, self.gain_left, (self, 0))
+            self.connect(self.s2f_right, self.gain_right, (self, 1))
+        self.connect_superframe_decoder(self.connect)
+
+    def create_superframe_decoder(self):
+        """
+        creates the blocks depending on the bit rate of the sub-channel
+        """
+        # firecode synchronizes to superframes and checks
+        self.firecode = dab.firecode_check_bb(int(self.bit_rate_n))
+        # Reed-Solomon error repair
+        self.rs = dab.reed_solomon_decode_bb(int(self.bit_rate_n))
+        # mp4 decoder
+        self.mp4 = dab.mp4_decode_bs(int(self.bit_rate_n))
+
+    def connect_superframe_decoder(self, connect):
+        """
+        connects (or disconnects) the blocks created by create_superframe_decoder
+
+        @param connect self.connect or self.disconnect
+        """
+        connect(self.msc_decoder, self.firecode, self.rs, self.mp4)
+        if connect == self.connect:
+            self.msg_connect(self, "cif_count", self.firecode, "cif_count")
+        else:
+            self.msg_disconnect(self, "cif_count", self.firecode, "cif_count")
+        if self.output_float:
+            connect((self.mp4, 0), self.s2f_left)
+            connect((self.mp4, 1), self.s2f_right)
         else:
             # output signed 16 bit integers (directly from decoder)
-            self.connect((self.mp4, 0), (self, 0))
-            self.connect((self.mp4, 1), (self, 1))
+            connect((self.mp4, 0), (self, 0))
+            connect((self.mp4, 1), (self, 1))
+
+    def set_subchannel(self, address, subch_size, protection, bit_rate):
+        """
+        switches to another DAB+ sub-channel while the flowgraph is running
+
+        The OFDM demodulation and the FIC decoding upstream keep running. The
+        MSC decoder is reconfigured in place and the superframe decoder is
+        rebuilt for the new bit rate.
+        """
+        self.lock()
+        self.connect_superframe_decoder(self.disconnect)
+        self.address = address
+        self.size = subch_size
+        self.protection = protection
+        self.bit_rate_n = bit_rate / 8
+        self.msc_decoder.set_subchannel(self.address, self.size, self.protection)
+        self.create_superframe_decoder()
+        self.connect_superframe_decoder(self.connect)
+        self.unlock()
 
     def set_volume(self, volume):
         self.gain_left.set_k(volume)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import json
+import os
+import tempfile
+import time
+
+
+def default_ensemble_cache_path():
+    cache_dir = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_dir, "gr-dab", "ensembles.json")
+
+
+class ensemble_cache(object):
+    """
+    @brief persistent cache of decoded ensembles for a warm start of the receiver
+
+    The cache is a JSON file with one record per frequency and EId. A record holds
+    the FIC database in the format of the fib_sink_vb "fic_db" messages (see
+    fic_decode_vc.get_database()) and the last good synchronization parameters.
+    As the EId is only known after the FIC was decoded, lookup() returns the record
+    of the ensemble that was received last on the frequency, if no EId is given.
+    """
+    def __init__(self, path=None, verbose=False):
+        self.path = path if path is not None else default_ensemble_cache_path()
+        self.verbose = verbose
+        self.records = self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                records = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(records, dict):
+            return {}
+        return records
+
+    def lookup(self, frequency, ensemble_id=None):
+        """
+        @return record with the keys "EId", "database", "sync" and "time", or None
+        """
+        frequency_records = self.records.get(str(int(round(frequency))))
+        if not frequency_records:
+            return None
+        if ensemble_id is None:
+            ensemble_id = frequency_records.get("last")
+        return frequency_records.get("ensembles", {}).get(str(ensemble_id))
+
+    def store(self, frequency, ensemble_id, database, sync=None):
+        frequency_records = self.records.setdefault(str(int(round(frequency))), {"ensembles": {}})
+        frequency_records["last"] = ensemble_id
+        frequency_records["ensembles"][str(ensemble_id)] = {
+            "EId": ensemble_id,
+            "database": database,
+            "sync": sync if sync is not None else {},
+            "time": time.time()}
+        self.save()
+
+    def save(self):
+        # write to a temporary file and replace the cache, so that a killed receiver never leaves a broken cache
+        cache_dir = os.path.dirname(self.path)
+        try:
+            if cache_dir and not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir or ".", prefix=".ensembles")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.records, f)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError) as e:
+            if self.verbose:
+                print("--> could not write ensemble cache " + self.path + ": " + str(e))
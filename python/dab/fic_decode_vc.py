@@ -19,9 +19,10 @@
 # Boston, MA 02110-1301, USA.
 #
 
-from gnuradio import gr, trellis, blocks, digital, dab
+import json
+import pmt
+from gnuradio import gr, blocks, dab
 #from . import dab_swig as dab
-from math import sqrt
 
 class fic_decode_vc(gr.hier_block2):
     """
@@ -31,8 +32,14 @@ class fic_decode_vc(gr.hier_block2):
     - do convolutional decoding
     - undo energy dispersal
     - get FIC information
+
+    Every change of the FIC database is published as PMT dictionary on the
+    message port "fic_db". restore_database() seeds the database with the
+    entries of get_database() from an earlier reception (ensemble_cache).
+    The CIF counter of the received FIG 0/0 is published on the message port
+    "cif_count" (see fib_sink_vb).
     """
-    def __init__(self, dab_params):
+    def __init__(self, dab_params, viterbi_threads=1):
         gr.hier_block2.__init__(self,
             "fic_decode_vc",
             gr.io_signature(1, 1, gr.sizeof_float * dab_params.num_carriers * 2),
@@ -50,34 +57,10 @@ class fic_decode_vc(gr.hier_block2):
         # unpuncturing
         self.unpuncture = dab.unpuncture_vff(self.dp.assembled_fic_puncturing_sequence, 0)
 
-        # convolutional coding
-        self.fsm = trellis.fsm(1, 4, [0o133, 0o171, 0o145, 0o133])  # OK (dumped to text and verified partially)
+        # convolutional decoding (including removal of the tail bits)
         self.conv_v2s = blocks.vector_to_stream(gr.sizeof_float, self.dp.fic_conv_codeword_length)
-        table = [
-            0, 0, 0, 0,
-            0, 0, 0, 1,
-            0, 0, 1, 0,
-            0, 0, 1, 1,
-            0, 1, 0, 0,
-            0, 1, 0, 1,
-            0, 1, 1, 0,
-            0, 1, 1, 1,
-            1, 0, 0, 0,
-            1, 0, 0, 1,
-            1, 0, 1, 0,
-            1, 0, 1, 1,
-            1, 1, 0, 0,
-            1, 1, 0, 1,
-            1, 1, 1, 0,
-            1, 1, 1, 1
-        ]
-        assert (len(table) / 4 == self.fsm.O())
-        table = [(1 - 2 * x) / sqrt(2) for x in table]
-        self.conv_decode = trellis.viterbi_combined_fb(self.fsm, 774, 0, 0, 4, table, digital.TRELLIS_EUCLIDEAN)
-        # self.conv_s2v = blocks.stream_to_vector(gr.sizeof_char, 774)
-        print(self.dp.fic_conv_codeword_length, self.dp.conv_code_add_bits_input)
-        self.conv_prune = dab.prune(gr.sizeof_char, self.dp.fic_conv_codeword_length // 4, 0,
-                                    self.dp.conv_code_add_bits_input)
+        self.conv_decode = dab.viterbi_k7_r14(self.dp.fic_conv_codeword_length // 4 - self.dp.conv_code_add_bits_input,
+                                              False, viterbi_threads)
 
         # energy dispersal
         self.prbs_src = blocks.vector_source_b(self.dp.prbs(self.dp.energy_dispersal_fic_vector_length), True)
@@ -89,7 +72,7 @@ class fic_decode_vc(gr.hier_block2):
         self.nullsink = blocks.null_sink(gr.sizeof_char)
         self.pack = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
         self.fibout = blocks.stream_to_vector(1, 32)
-        self.fibsink = dab.fib_sink_vb()
+        self.fibsink = dab.fib_sink_vb(self.dp.energy_dispersal_fic_fibs_per_vector)
 
 
         self.connect((self, 0),
@@ -99,13 +82,20 @@ class fic_decode_vc(gr.hier_block2):
                      self.unpuncture,
                      self.conv_v2s,
                      self.conv_decode,
-                     self.conv_prune,
                      self.add_mod_2,
                      self.pack,
                      self.fibout,
                      self.fibsink)
         self.connect(self.prbs_src, (self.add_mod_2, 1))
 
+        # forward changes of the FIC database
+        self.message_port_register_hier_out("fic_db")
+        self.msg_connect(self.fibsink, "fic_db", self, "fic_db")
+
+        # forward the CIF counter, e.g. for the superframe synchronization of dabplus_audio_decoder_ff
+        self.message_port_register_hier_out("cif_count")
+        self.msg_connect(self.fibsink, "cif_count", self, "cif_count")
+
     def get_ensemble_info(self):
         return self.fibsink.get_ensemble_info()
 
@@ -123,3 +113,37 @@ class fic_decode_vc(gr.hier_block2):
 
     def get_crc_passed(self):
         return self.fibsink.get_crc_passed()
+
+    def get_version(self):
+        return self.fibsink.get_version()
+
+    def get_ensemble_id(self):
+        return self.fibsink.get_ensemble_id()
+
+    def get_database(self):
+        """
+        @return list of the FIC database entries, in the format of the "fic_db" messages
+        """
+        entries = []
+        ensemble_id = self.get_ensemble_id()
+        if ensemble_id >= 0:
+            entries.append({"type": "ensemble_id", "EId": ensemble_id})
+        ensemble_info = self.get_ensemble_info()
+        if ensemble_info != "":
+            for label, info in json.loads(ensemble_info).items():
+                entries.append({"type": "ensemble", "label": label, "country_ID": info["country_ID"]})
+        for getter, entry_type in ((self.get_subch_info, "subchannel"),
+                                   (self.get_service_info, "service"),
+                                   (self.get_service_labels, "label"),
+                                   (self.get_programme_type, "programme_type")):
+            items = getter()
+            if items != "":
+                for item in json.loads(items):
+                    item["type"] = entry_type
+                    entries.append(item)
+        return entries
+
+    def restore_database(self, entries):
+        # the entries are handled by the block thread, once the flowgraph is running
+        for entry in entries:
+            self.fibsink._post(pmt.intern("restore"), pmt.to_pmt(entry))
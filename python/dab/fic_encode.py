@@ -27,11 +27,8 @@ class fic_encode(gr.hier_block2):
     """
     @brief block to encode the FIBs produced by FIB_source
 
-    -get unpacked bytes from FIB_source
-    -crc16
-    -energy dispersal
-    -convolutional encoding
-    -puncturing
+    -get unpacked bytes from FIB_source (FIBs including their crc16)
+    -energy dispersal, convolutional encoding and puncturing on packed bytes
     -output packed bytes
     """
     def __init__(self, dab_params):
@@ -42,43 +39,15 @@ class fic_encode(gr.hier_block2):
                                 # Output signature
         self.dp = dab_params
 
-        # crc
-        self.unpacked_to_packed_crc = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
-        self.s2v_crc = blocks.stream_to_vector(gr.sizeof_char, 32)
-        self.crc16 = dab.crc16_bb(32, 0x1021, 0xffff)
-        self.v2s_crc = blocks.vector_to_stream(gr.sizeof_char, 32)
-        self.packed_to_unpacked_crc = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
-
-        # energy dispersal
-        self.prbs_src = blocks.vector_source_b(self.dp.prbs(self.dp.energy_dispersal_fic_vector_length), True)
-        self.add_mod_2 = blocks.xor_bb()
-
-        # convolutional encoder
-        self.conv_pack = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
-        self.conv_encoder = dab.conv_encoder_bb(int(self.dp.energy_dispersal_fic_vector_length/8))
-        self.conv_unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
-
-        # puncturing
-        self.puncture = dab.puncture_bb(self.dp.assembled_fic_puncturing_sequence)
-
-        # pack bits
-        self.unpacked_to_packed_encoded = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+        # pack FIBs
+        self.unpacked_to_packed = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
 
+        # energy dispersal, convolutional encoding and puncturing on packed bytes (no time interleaving in the FIC)
+        self.encoder = dab.msc_encode_packed_bb(self.dp.energy_dispersal_fic_vector_length // 8,
+                                                self.dp.assembled_fic_puncturing_sequence, [0])
 
         # connect everything
         self.connect((self, 0),
-                     self.unpacked_to_packed_crc,
-                     self.s2v_crc,
-                     self.crc16,
-                     self.v2s_crc,
-                     self.packed_to_unpacked_crc,
-                     (self.add_mod_2, 0),
-                     self.conv_pack,
-                     self.conv_encoder,
-                     self.conv_unpack,
-                     self.puncture,
-                     self.unpacked_to_packed_encoded,
+                     self.unpacked_to_packed,
+                     self.encoder,
                      self)
-
-        #connect prbs
-        self.connect(self.prbs_src, (self.add_mod_2, 1))
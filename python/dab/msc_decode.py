@@ -19,8 +19,7 @@
 # Boston, MA 02110-1301, USA.
 #
 
-from gnuradio import gr, blocks, trellis, digital, dab
-from math import sqrt
+from gnuradio import gr, blocks, dab
 
 class msc_decode(gr.hier_block2):
     """
@@ -33,9 +32,21 @@ class msc_decode(gr.hier_block2):
     - do convolutional decoding
     - undo energy dispersal
     - output data stream of one subchannel (packed bytes)
+
+    With int8_soft_bits=True, the soft bits are quantized to int8 right after
+    the QPSK demodulation and stay int8 up to the Viterbi decoder.
+    viterbi_threads sets the number of threads decoding the CIF codewords.
+    With cif_history=True, the int8 soft bits of the whole MSC of the last 16
+    CIFs are kept in a ring buffer. The CU selection and the time
+    deinterleaving are done from this ring, so that set_subchannel() switches
+    without waiting for the delay of the time interleaving. cif_history
+    implies int8_soft_bits.
+    With reliability_threshold above 0, the output bytes with a smaller
+    reliability out of the Viterbi decoder are tagged with "reliability"
+    (see viterbi_k7_r14), e.g. for the erasures of reed_solomon_decode_bb.
     """
 
-    def __init__(self, dab_params, address, size, protection, verbose=False, debug=False):
+    def __init__(self, dab_params, address, size, protection, verbose=False, debug=False, int8_soft_bits=False, viterbi_threads=1, cif_history=False, reliability_threshold=0):
         gr.hier_block2.__init__(self,
                                 "msc_decode",
                                 # Input signature
@@ -48,84 +59,34 @@ class msc_decode(gr.hier_block2):
         self.protect = protection
         self.verbose = verbose
         self.debug = debug
-
-        # calculate n factor (multiple of 8kbits etc.)
-        self.n = self.size // self.dp.subch_size_multiple_n[self.protect]
-
-        # calculate puncturing factors (EEP, table 33, 34)
-        self.msc_I = self.n * 192
-        if (self.n > 1 or self.protect != 1):
-            self.puncturing_L1 = [6 * self.n - 3, 2 * self.n - 3, 6 * self.n - 3, 4 * self.n - 3]
-            self.puncturing_L2 = [3, 4 * self.n + 3, 3, 2 * self.n + 3]
-            self.puncturing_PI1 = [24, 14, 8, 3]
-            self.puncturing_PI2 = [23, 13, 7, 2]
-            # calculate length of punctured codeword (11.3.2)
-            self.msc_punctured_codeword_length = self.puncturing_L1[self.protect] * 4 * self.dp.puncturing_vectors_ones[
-                self.puncturing_PI1[self.protect]] + self.puncturing_L2[self.protect] * 4 * \
-                                                     self.dp.puncturing_vectors_ones[
-                                                         self.puncturing_PI2[self.protect]] + 12
-            self.assembled_msc_puncturing_sequence = self.puncturing_L1[self.protect] * 4 * self.dp.puncturing_vectors[
-                self.puncturing_PI1[self.protect]] + self.puncturing_L2[self.protect] * 4 * self.dp.puncturing_vectors[
-                self.puncturing_PI2[self.protect]] + self.dp.puncturing_tail_vector
-            self.msc_conv_codeword_length = 4*self.msc_I + 24 # 4*I + 24 ()
-        # exception in table
+        self.cif_history = cif_history
+        self.int8_soft_bits = int8_soft_bits or cif_history
+        self.viterbi_threads = viterbi_threads
+        self.reliability_threshold = reliability_threshold
+
+        if self.int8_soft_bits:
+            # complex to interleaved int8 soft bits (part of the qpsk demodulation), scaling and saturation
+            self.softbit_interleaver = dab.complex_to_interleaved_char_vcb(self.dp.num_carriers)
+            self.soft_bit_size = gr.sizeof_char
         else:
-            self.msc_punctured_codeword_length = 5 * 4 * self.dp.puncturing_vectors_ones[13] + 1 * 4 * \
-                                                                                               self.dp.puncturing_vectors_ones[
-                                                                                                   12] + 12
-        #sanity check
-        assert(6*self.n == self.puncturing_L1[self.protect] + self.puncturing_L2[self.protect])
-
-        # complex to interleaved float (part of the qpsk demodulation)
-        self.softbit_interleaver = dab.complex_to_interleaved_float_vcf(self.dp.num_carriers)
+            # complex to interleaved float (part of the qpsk demodulation)
+            self.softbit_interleaver = dab.complex_to_interleaved_float_vcf(self.dp.num_carriers)
+            self.soft_bit_size = gr.sizeof_float
+        soft_bit_size = self.soft_bit_size
 
         # repartition vectors in capacity units (CUs) and select a sub-channel
-        self.v2s_repart_to_cus = blocks.vector_to_stream(gr.sizeof_float, self.dp.num_carriers*2)
-        self.s2v_repart_to_cus = blocks.stream_to_vector(gr.sizeof_float, self.dp.msc_cu_size)
-        self.select_subch = dab.select_cus_vfvf(self.dp.msc_cu_size, self.dp.num_cus, self.address, self.size)
-
-        # time deinterleaving
-        self.time_v2s = blocks.vector_to_stream(gr.sizeof_float, self.dp.msc_cu_size)
-        self.time_deinterleaver = dab.time_deinterleave_ff(self.dp.msc_cu_size * self.size, self.dp.scrambling_vector)
-
-        # unpuncture
-        self.unpuncture_s2v = blocks.stream_to_vector(gr.sizeof_float, self.msc_punctured_codeword_length)
-        self.unpuncture = dab.unpuncture_vff(self.assembled_msc_puncturing_sequence, 0)
-        self.unpuncture_v2s = blocks.vector_to_stream(gr.sizeof_float, self.msc_conv_codeword_length)
-
-        # convolutional decoding
-        self.fsm = trellis.fsm(1, 4, [0o133, 0o171, 0o145, 0o133])  # OK (dumped to text and verified partially)
-        table = [
-            0, 0, 0, 0,
-            0, 0, 0, 1,
-            0, 0, 1, 0,
-            0, 0, 1, 1,
-            0, 1, 0, 0,
-            0, 1, 0, 1,
-            0, 1, 1, 0,
-            0, 1, 1, 1,
-            1, 0, 0, 0,
-            1, 0, 0, 1,
-            1, 0, 1, 0,
-            1, 0, 1, 1,
-            1, 1, 0, 0,
-            1, 1, 0, 1,
-            1, 1, 1, 0,
-            1, 1, 1, 1
-        ]
-        assert (len(table) / 4 == self.fsm.O())
-        table = [(1 - 2 * x) / sqrt(2) for x in table]
-        self.conv_decode = trellis.viterbi_combined_fb(self.fsm, self.msc_I + self.dp.conv_code_add_bits_input, 0, 0, 4, table, digital.TRELLIS_EUCLIDEAN)
-        self.conv_s2v = blocks.stream_to_vector(gr.sizeof_char, self.msc_I + self.dp.conv_code_add_bits_input)
-        self.conv_prune = dab.prune(gr.sizeof_char, int(self.msc_conv_codeword_length / 4), 0,
-                                            self.dp.conv_code_add_bits_input)
-
-        #energy descramble
-        self.prbs_src = blocks.vector_source_b(self.dp.prbs(self.msc_I), True)
-        self.add_mod_2 = blocks.xor_bb()
-
-        #pack bits
-        self.pack_bits = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+        self.v2s_repart_to_cus = blocks.vector_to_stream(soft_bit_size, self.dp.num_carriers*2)
+        self.s2v_repart_to_cus = blocks.stream_to_vector(soft_bit_size, self.dp.msc_cu_size)
+        if self.cif_history:
+            # time deinterleaving out of the history of the whole MSC
+            self.select_subch = dab.select_cus_history_vbb(self.dp.msc_cu_size, self.dp.num_cus, self.address,
+                                                           self.size, self.dp.scrambling_vector)
+        else:
+            if self.int8_soft_bits:
+                self.select_subch = dab.select_cus_vbvb(self.dp.msc_cu_size, self.dp.num_cus, self.address, self.size)
+            else:
+                self.select_subch = dab.select_cus_vfvf(self.dp.msc_cu_size, self.dp.num_cus, self.address, self.size)
+            self.time_v2s = blocks.vector_to_stream(soft_bit_size, self.dp.msc_cu_size)
 
         # connect blocks
         self.connect(
@@ -133,18 +94,11 @@ class msc_decode(gr.hier_block2):
                      self.softbit_interleaver,
                      self.v2s_repart_to_cus,
                      self.s2v_repart_to_cus,
-                     self.select_subch,
-                     self.time_v2s,
-                     self.time_deinterleaver,
-                     self.unpuncture_s2v,
-                     self.unpuncture,
-                     self.unpuncture_v2s,
-                     self.conv_decode,
-                     self.conv_prune,
-                     self.add_mod_2,
-                     self.pack_bits,
-                     (self))
-        self.connect(self.prbs_src, (self.add_mod_2, 1))
+                     self.select_subch)
+        if not self.cif_history:
+            self.connect(self.select_subch, self.time_v2s)
+        self.create_subchannel_decoder()
+        self.connect_subchannel_decoder(self.connect)
 
 
 #debug
@@ -158,25 +112,21 @@ class msc_decode(gr.hier_block2):
             self.connect((self.repartition_msc_to_cus, 0), self.sink_repartition_msc_to_cus)
 
             #data of one sub channel not decoded
-            self.sink_select_subch = blocks.file_sink(gr.sizeof_float * self.dp.msc_cu_size * self.size, "debug/select_subch.dat")
+            self.sink_select_subch = blocks.file_sink(soft_bit_size * self.dp.msc_cu_size * self.size, "debug/select_subch.dat")
             self.connect(self.select_subch, self.sink_select_subch)
 
             #sub channel time_deinterleaved
-            self.sink_subch_time_deinterleaved = blocks.file_sink(gr.sizeof_float, "debug/subch_time_deinterleaved.dat")
+            self.sink_subch_time_deinterleaved = blocks.file_sink(soft_bit_size, "debug/subch_time_deinterleaved.dat")
             self.connect(self.time_deinterleaver, self.sink_subch_time_deinterleaved)
 
             #sub channel unpunctured
-            self.sink_subch_unpunctured = blocks.file_sink(gr.sizeof_float, "debug/subch_unpunctured.dat")
+            self.sink_subch_unpunctured = blocks.file_sink(soft_bit_size, "debug/subch_unpunctured.dat")
             self.connect(self.unpuncture, self.sink_subch_unpunctured)
 
             # sub channel convolutional decoded
             self.sink_subch_decoded = blocks.file_sink(gr.sizeof_char, "debug/subch_decoded.dat")
             self.connect(self.conv_decode, self.sink_subch_decoded)
 
-            # sub channel convolutional decoded
-            self.sink_subch_pruned = blocks.file_sink(gr.sizeof_char, "debug/subch_pruned.dat")
-            self.connect(self.conv_prune, self.sink_subch_pruned)
-
             # sub channel energy dispersal undone unpacked
             self.sink_subch_energy_disp_undone = blocks.file_sink(gr.sizeof_char, "debug/subch_energy_disp_undone_unpacked.dat")
             self.connect(self.add_mod_2, self.sink_subch_energy_disp_undone)
@@ -184,3 +134,88 @@ class msc_decode(gr.hier_block2):
             # sub channel energy dispersal undone packed
             self.sink_subch_energy_disp_undone_packed = blocks.file_sink(gr.sizeof_char, "debug/subch_energy_disp_undone_packed.dat")
             self.connect(self.pack_bits, self.sink_subch_energy_disp_undone_packed)
+
+    def create_subchannel_decoder(self):
+        """
+        creates the blocks depending on the address, size and protection of the sub-channel
+        """
+        soft_bit_size = self.soft_bit_size
+
+        # calculate puncturing (EEP, table 33, 34)
+        self.msc_I, self.msc_punctured_codeword_length, self.assembled_msc_puncturing_sequence = \
+            self.dp.msc_eep_puncturing(self.size, self.protect)
+        self.msc_conv_codeword_length = 4*self.msc_I + 24 # 4*I + 24 ()
+
+        # drop soft bits up to the first complete CIF of the sub-channel (after a reconfiguration)
+        self.cif_align = blocks.tagged_stream_align(soft_bit_size, "cif_start")
+
+        # time deinterleaving
+        if self.cif_history:
+            # done by select_subch
+            self.time_deinterleaver = None
+        elif self.int8_soft_bits:
+            self.time_deinterleaver = dab.time_deinterleave_bb(self.dp.msc_cu_size * self.size, self.dp.scrambling_vector)
+        else:
+            self.time_deinterleaver = dab.time_deinterleave_ff(self.dp.msc_cu_size * self.size, self.dp.scrambling_vector)
+
+        # unpuncture
+        self.unpuncture_s2v = blocks.stream_to_vector(soft_bit_size, self.msc_punctured_codeword_length)
+        if self.int8_soft_bits:
+            self.unpuncture = dab.unpuncture_vbb(self.assembled_msc_puncturing_sequence, 0)
+        else:
+            self.unpuncture = dab.unpuncture_vff(self.assembled_msc_puncturing_sequence, 0)
+        self.unpuncture_v2s = blocks.vector_to_stream(soft_bit_size, self.msc_conv_codeword_length)
+
+        # convolutional decoding (including removal of the tail bits)
+        self.conv_decode = dab.viterbi_k7_r14(self.msc_I, self.int8_soft_bits, self.viterbi_threads,
+                                              self.reliability_threshold)
+
+        #energy descramble
+        self.prbs_src = blocks.vector_source_b(self.dp.prbs(self.msc_I), True)
+        self.add_mod_2 = blocks.xor_bb()
+
+        #pack bits
+        self.pack_bits = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+
+    def connect_subchannel_decoder(self, connect):
+        """
+        connects (or disconnects) the blocks created by create_subchannel_decoder
+
+        @param connect self.connect or self.disconnect
+        """
+        if self.cif_history:
+            connect(self.select_subch, self.cif_align)
+            deinterleaved = self.cif_align
+        else:
+            connect(self.time_v2s, self.cif_align, self.time_deinterleaver)
+            deinterleaved = self.time_deinterleaver
+        connect(
+                deinterleaved,
+                self.unpuncture_s2v,
+                self.unpuncture,
+                self.unpuncture_v2s,
+                self.conv_decode,
+                self.add_mod_2,
+                self.pack_bits,
+                (self))
+        connect(self.prbs_src, (self.add_mod_2, 1))
+
+    def set_subchannel(self, address, size, protection):
+        """
+        switches to another sub-channel while the flowgraph is running
+
+        The blocks in front of the CU selection keep running, the sub-channel
+        decoder is rebuilt for the new size and protection. Decoding resumes
+        with the first complete CIF of the new sub-channel, after the delay of
+        the time deinterleaver (without cif_history) or immediately (with
+        cif_history).
+        """
+        self.lock()
+        self.connect_subchannel_decoder(self.disconnect)
+        self.address = address
+        self.size = size
+        self.protect = protection
+        self.select_subch.set_subchannel(self.address, self.size)
+        self.create_subchannel_decoder()
+        self.connect_subchannel_decoder(self.connect)
+        self.unlock()
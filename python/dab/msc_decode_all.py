@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import json
+from gnuradio import gr, blocks, dab
+
+class msc_decode_all(gr.hier_block2):
+    """
+    @brief block to decode all sub-channels of the MSC (Main Service Channel) in one pass
+
+    - get MSC from byte stream
+    - repartition MSC to CIFs (Common Interleaved Frames), once for all sub-channels
+    - demultiplex the CUs of each CIF to one lane per sub-channel
+    - per lane: time deinterleaving, convolutional decoding, undo energy dispersal
+    - output i: data stream of sub-channel i (packed bytes)
+
+    The sub-channel table is a list of dicts with the keys "address", "size"
+    and "protection", or the JSON string returned by fib_sink_vb.get_subch_info().
+    The lanes are independent flowgraph branches, so the scheduler decodes
+    them in parallel. Each lane's Viterbi decoder uses viterbi_threads threads.
+    """
+
+    def __init__(self, dab_params, subchannels, verbose=False, int8_soft_bits=False, viterbi_threads=1):
+        if isinstance(subchannels, str):
+            subchannels = json.loads(subchannels)
+        self.subchannels = list(subchannels)
+        gr.hier_block2.__init__(self,
+                                "msc_decode_all",
+                                # Input signature
+                                gr.io_signature(1, 1, gr.sizeof_gr_complex * dab_params.num_carriers),
+                                # Output signature
+                                gr.io_signature(len(self.subchannels), len(self.subchannels), gr.sizeof_char))
+        self.dp = dab_params
+        self.verbose = verbose
+        self.int8_soft_bits = int8_soft_bits
+        self.viterbi_threads = viterbi_threads
+
+        if self.int8_soft_bits:
+            # complex to interleaved int8 soft bits (part of the qpsk demodulation), scaling and saturation
+            self.softbit_interleaver = dab.complex_to_interleaved_char_vcb(self.dp.num_carriers)
+            soft_bit_size = gr.sizeof_char
+        else:
+            # complex to interleaved float (part of the qpsk demodulation)
+            self.softbit_interleaver = dab.complex_to_interleaved_float_vcf(self.dp.num_carriers)
+            soft_bit_size = gr.sizeof_float
+
+        # repartition vectors in capacity units (CUs) and route them to the lanes of the sub-channels
+        self.v2s_repart_to_cus = blocks.vector_to_stream(soft_bit_size, self.dp.num_carriers*2)
+        self.s2v_repart_to_cus = blocks.stream_to_vector(soft_bit_size, self.dp.msc_cu_size)
+        self.demux_subchs = dab.demux_cus(soft_bit_size, self.dp.msc_cu_size, self.dp.num_cus,
+                                          [s['address'] for s in self.subchannels],
+                                          [s['size'] for s in self.subchannels])
+        self.connect(self, self.softbit_interleaver, self.v2s_repart_to_cus, self.s2v_repart_to_cus,
+                     self.demux_subchs)
+
+        self.lanes = []
+        for i, subch in enumerate(self.subchannels):
+            lane = self._make_lane(subch['size'], subch['protection'], soft_bit_size)
+            self.connect((self.demux_subchs, i), lane[0])
+            for upstream, downstream in zip(lane[:-1], lane[1:]):
+                self.connect(upstream, downstream)
+            self.connect(lane[-1], (self, i))
+            self.lanes.append(lane)
+            if self.verbose:
+                print("--> msc_decode_all: lane %d: address %d, size %d, protection %d" %
+                      (i, subch['address'], subch['size'], subch['protection']))
+
+    def _make_lane(self, size, protection, soft_bit_size):
+        msc_I, punctured_codeword_length, puncturing_sequence = self.dp.msc_eep_puncturing(size, protection)
+
+        # time deinterleaving
+        time_v2s = blocks.vector_to_stream(soft_bit_size, self.dp.msc_cu_size)
+        if self.int8_soft_bits:
+            time_deinterleaver = dab.time_deinterleave_bb(self.dp.msc_cu_size * size, self.dp.scrambling_vector)
+        else:
+            time_deinterleaver = dab.time_deinterleave_ff(self.dp.msc_cu_size * size, self.dp.scrambling_vector)
+
+        # unpuncture
+        unpuncture_s2v = blocks.stream_to_vector(soft_bit_size, punctured_codeword_length)
+        if self.int8_soft_bits:
+            unpuncture = dab.unpuncture_vbb(puncturing_sequence, 0)
+        else:
+            unpuncture = dab.unpuncture_vff(puncturing_sequence, 0)
+        unpuncture_v2s = blocks.vector_to_stream(soft_bit_size, 4*msc_I + 24)
+
+        # convolutional decoding (including removal of the tail bits)
+        conv_decode = dab.viterbi_k7_r14(msc_I, self.int8_soft_bits, self.viterbi_threads)
+
+        # energy descramble
+        prbs_src = blocks.vector_source_b(self.dp.prbs(msc_I), True)
+        add_mod_2 = blocks.xor_bb()
+        self.connect(prbs_src, (add_mod_2, 1))
+
+        # pack bits
+        pack_bits = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+
+        return [time_v2s, time_deinterleaver, unpuncture_s2v, unpuncture, unpuncture_v2s, conv_decode,
+                add_mod_2, pack_bits]
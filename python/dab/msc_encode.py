@@ -57,28 +57,10 @@ class msc_encode(gr.hier_block2):
         self.conv_unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
 
 
-        # calculate puncturing factors (EEP, table 33, 34)
-        if (self.n > 1 or self.protect != 1):
-            self.puncturing_L1 = [6 * self.n - 3, 2 * self.n - 3, 6 * self.n - 3, 4 * self.n - 3]
-            self.puncturing_L2 = [3, 4 * self.n + 3, 3, 2 * self.n + 3]
-            self.puncturing_PI1 = [24, 14, 8, 3]
-            self.puncturing_PI2 = [23, 13, 7, 2]
-            # calculate length of punctured codeword (11.3.2)
-            self.msc_punctured_codeword_length = self.puncturing_L1[self.protect] * 4 * self.dp.puncturing_vectors_ones[
-                self.puncturing_PI1[self.protect]] + self.puncturing_L2[self.protect] * 4 * \
-                                                     self.dp.puncturing_vectors_ones[
-                                                         self.puncturing_PI2[self.protect]] + 12
-            self.assembled_msc_puncturing_sequence = self.puncturing_L1[self.protect] * 4 * self.dp.puncturing_vectors[
-                self.puncturing_PI1[self.protect]] + self.puncturing_L2[self.protect] * 4 * self.dp.puncturing_vectors[
-                self.puncturing_PI2[self.protect]] + self.dp.puncturing_tail_vector
-            self.msc_conv_codeword_length = 4 * self.msc_I + 24  # 4*I + 24 ()
-        # exception in table
-        else:
-            self.msc_punctured_codeword_length = 5 * 4 * self.dp.puncturing_vectors_ones[13] + 1 * 4 * \
-                                                                                               self.dp.puncturing_vectors_ones[
-                                                                                                   12] + 12
-        # sanity check
-        assert (6 * self.n == self.puncturing_L1[self.protect] + self.puncturing_L2[self.protect])
+        # calculate puncturing (EEP, table 33, 34)
+        self.msc_I, self.msc_punctured_codeword_length, self.assembled_msc_puncturing_sequence = \
+            self.dp.msc_eep_puncturing(self.n * self.dp.subch_size_multiple_n[self.protect], self.protect)
+        self.msc_conv_codeword_length = 4 * self.msc_I + 24  # 4*I + 24 ()
 
         # puncturing
         self.puncture = dab.puncture_bb(self.assembled_msc_puncturing_sequence)
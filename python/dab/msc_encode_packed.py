@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# 
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+# 
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+# 
+
+from gnuradio import gr, dab
+
+class msc_encode_packed(gr.hier_block2):
+    """
+    @brief block to encode the logical frames of a sub-channel on packed bytes
+
+    Same interface and output as msc_encode, but energy dispersal,
+    convolutional encoding, puncturing and time interleaving are done on
+    packed bytes in one block (msc_encode_packed_bb) instead of unpacking
+    every bit.
+    """
+    def __init__(self, dab_params, data_rate_n, protection):
+        gr.hier_block2.__init__(self,
+            "msc_encode_packed",
+            gr.io_signature(1, 1, gr.sizeof_char),  # Input signature
+            gr.io_signature(1, 1, gr.sizeof_char)) # Output signature
+        self.dp = dab_params
+        self.n = data_rate_n
+        self.protect = protection
+
+        # calculate puncturing (EEP, table 33, 34)
+        self.msc_I, self.msc_punctured_codeword_length, self.assembled_msc_puncturing_sequence = \
+            self.dp.msc_eep_puncturing(self.n * self.dp.subch_size_multiple_n[self.protect], self.protect)
+
+        # energy dispersal, convolutional encoding, puncturing and time interleaving
+        self.encoder = dab.msc_encode_packed_bb(self.msc_I // 8, self.assembled_msc_puncturing_sequence,
+                                                self.dp.scrambling_vector)
+
+        self.connect(self, self.encoder, self)
@@ -34,8 +34,18 @@ class ofdm_demod_cc(gr.hier_block2):
     - frequency deinterleaving
     - demux into FIC and MSC
     - output of complex qpsk symbols, separated after FIC and MSC
+
+    With fused=True, all steps after the FFT are done in one block
+    (ofdm_differential_demod_vcvc) instead of a chain of blocks.
+
+    With batched_fft=True, the FFT of all symbols of a frame is calculated at
+    once (ofdm_fft_vcvc), including the scaling of the FFT output.
+
+    With a list of sub-channels (address, size), only the symbols carrying
+    these sub-channels (and the FIC) are transformed and demodulated, all other
+    MSC symbols are zero. This implies fused=True and batched_fft=True.
     """
-    def __init__(self, dab_params):
+    def __init__(self, dab_params, fused=False, batched_fft=False, subchannels=None):
         gr.hier_block2.__init__(self,
             "ofdm_demod_cc",
             gr.io_signature(1, 1, gr.sizeof_gr_complex),  # Input signature
@@ -43,42 +53,88 @@ class ofdm_demod_cc(gr.hier_block2):
 
         self.dp = dab_params
 
+        if subchannels:
+            symbol_mask = self.dp.symbol_mask(subchannels)
+            fused = True
+            batched_fft = True
+        else:
+            symbol_mask = []
+
         # fine time and frequency synchronization
         self.sync = dab.ofdm_synchronization_cvf(self.dp.fft_length,
                                                       self.dp.cp_length,
-                                                      self.dp.fft_length,
+                                                      self.dp.ns_length,
                                                       self.dp.symbols_per_frame)
 
         # FFT
-        self.fft = fft.fft_vcc(self.dp.fft_length, True, [], True)
-        self.multiply = blocks.multiply_const_vcc([1.0/sqrt(2048)]*self.dp.fft_length)
-
-        # coarse frequency correction (sub-carrier assignment)
-        self.coarse_freq_corr = dab.ofdm_coarse_frequency_correction_vcvc(self.dp.fft_length,
-                                                                               self.dp.num_carriers,
-                                                                               self.dp.cp_length)
-
-        # differential phasor
-        self.differential_phasor = dab.diff_phasor_vcc(1536)
-
-        # frequency deinterleaving
-        self.frequency_deinterleaver = dab.frequency_interleaver_vcc(self.dp.frequency_deinterleaving_sequence_array)
-
-        # demux into FIC and MSC
-        self.demux = dab.demux_cc(self.dp.num_carriers, self.dp.num_fic_syms, self.dp.num_msc_syms)
-
-        self.connect(
-            self,
-            self.sync,
-            self.fft,
-            self.multiply,
-            self.coarse_freq_corr,
-            self.differential_phasor,
-            self.frequency_deinterleaver,
-            self.demux,
-            (self, 0)
-        )
+        if batched_fft:
+            # the fused demodulator scales itself
+            self.fft = dab.ofdm_fft_vcvc(self.dp.fft_length,
+                                         self.dp.symbols_per_frame,
+                                         1.0 if fused else 1.0/sqrt(2048),
+                                         symbol_mask)
+        else:
+            self.fft = fft.fft_vcc(self.dp.fft_length, True, [], True)
+
+        if fused:
+            # scaling, coarse frequency correction, differential phasor,
+            # frequency deinterleaving and demux into FIC and MSC in one pass
+            self.coarse_freq_corr = dab.ofdm_differential_demod_vcvc(self.dp.fft_length,
+                                                                     self.dp.num_carriers,
+                                                                     self.dp.frequency_deinterleaving_sequence_array,
+                                                                     self.dp.num_fic_syms,
+                                                                     self.dp.num_msc_syms,
+                                                                     1.0/sqrt(2048),
+                                                                     symbol_mask)
+            self.demux = self.coarse_freq_corr
+
+            self.connect(
+                self,
+                self.sync,
+                self.fft,
+                self.demux,
+                (self, 0)
+            )
+        else:
+            if not batched_fft:
+                self.multiply = blocks.multiply_const_vcc([1.0/sqrt(2048)]*self.dp.fft_length)
+
+            # coarse frequency correction (sub-carrier assignment)
+            self.coarse_freq_corr = dab.ofdm_coarse_frequency_correction_vcvc(self.dp.fft_length,
+                                                                                   self.dp.num_carriers,
+                                                                                   self.dp.cp_length)
+
+            # differential phasor
+            self.differential_phasor = dab.diff_phasor_vcc(1536)
+
+            # frequency deinterleaving
+            self.frequency_deinterleaver = dab.frequency_interleaver_vcc(self.dp.frequency_deinterleaving_sequence_array)
+
+            # demux into FIC and MSC
+            self.demux = dab.demux_cc(self.dp.num_carriers, self.dp.num_fic_syms, self.dp.num_msc_syms)
+
+            if batched_fft:
+                # scaling is already done in the FFT
+                self.connect(self, self.sync, self.fft, self.coarse_freq_corr)
+            else:
+                self.connect(self, self.sync, self.fft, self.multiply, self.coarse_freq_corr)
+            self.connect(
+                self.coarse_freq_corr,
+                self.differential_phasor,
+                self.frequency_deinterleaver,
+                self.demux,
+                (self, 0)
+            )
         self.connect((self.demux, 1), (self, 1))
 
     def get_snr(self):
         return self.coarse_freq_corr.get_snr()
+
+    def get_locked(self):
+        return self.sync.get_locked()
+
+    def get_coarse_freq_offset(self):
+        return self.coarse_freq_corr.get_freq_offset()
+
+    def get_fine_freq_offset(self):
+        return self.sync.get_frequency_offset()
@@ -44,14 +44,17 @@ class ofdm_mod(gr.hier_block2):
 
     Takes a data stream and performs OFDM modulation according to the DAB standard.
     The output sample rate is 2.048 MSPS.
+    With fused=True, the whole modulation is done in one block
+    (ofdm_differential_mod_vbc), which transforms all symbols of a frame at once.
     """
 
-    def __init__(self, dab_params, verbose=False, debug=False):
+    def __init__(self, dab_params, verbose=False, debug=False, fused=False):
         """
         Hierarchical block for OFDM modulation
 
         @param dab_params DAB parameter object (dab.parameters.dab_parameters)
         @param debug enables debug output to files
+        @param fused modulate whole frames in one block (no debug output)
         """
 
         dp = dab_params
@@ -61,57 +64,67 @@ class ofdm_mod(gr.hier_block2):
                                 # input signature
                                 gr.io_signature(1, 1, gr.sizeof_gr_complex))  # output signature
 
-        # symbol mapping
-        self.mapper = dab.qpsk_mapper_vbvc(dp.num_carriers)
-
-        # add pilot symbol
-        self.insert_pilot = dab.ofdm_insert_pilot_vcc(dp.prn)
-
-        # phase sum
-        self.sum_phase = dab.sum_phasor_trig_vcc(dp.num_carriers)
-
-        # frequency interleaving
-        self.interleave = dab.frequency_interleaver_vcc(list(map(int,dp.frequency_interleaving_sequence_array)))
-
-        # add central carrier & move to middle
-        self.move_and_insert_carrier = dab.ofdm_move_and_insert_zero(dp.fft_length, dp.num_carriers)
-
-        # ifft
-        self.ifft = fft.fft_vcc(dp.fft_length, False, [], True)
-
-        # cyclic prefixer
-        self.prefixer = digital.ofdm_cyclic_prefixer(dp.fft_length, dp.symbol_length)
-
-        # normalize to energy = 1 after IFFT
-        self.multiply_const = blocks.multiply_const_cc(1.0 / sqrt(2048))
-
-        # convert back to vectors
-        self.s2v = blocks.stream_to_vector(gr.sizeof_gr_complex, dp.symbol_length)
-
-        # add null symbol
-        self.insert_null = dab.insert_null_symbol(dp.ns_length, dp.symbol_length)
-
-        # data
-        self.connect((self, 0), self.mapper, (self.insert_pilot, 0), (self.sum_phase, 0), self.interleave,
-                     self.move_and_insert_carrier, self.ifft, self.prefixer, self.multiply_const, self.s2v,
-                     (self.insert_null, 0))
-        self.connect(self.insert_null, self)
-
-        # control signal (frame start)
-        self.connect((self, 1), (self.insert_pilot, 1), (self.sum_phase, 1), (self.insert_null, 1))
-
-        if debug:
-            self.connect(self.mapper,
-                         blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers, "debug/generated_signal_mapper.dat"))
-            self.connect(self.insert_pilot, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
-                                                             "debug/generated_signal_pilot_inserted.dat"))
-            self.connect(self.sum_phase, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
-                                                          "debug/generated_signal_sum_phase.dat"))
-            self.connect(self.interleave, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
-                                                           "debug/generated_signal_interleave.dat"))
-            self.connect(self.move_and_insert_carrier, blocks.file_sink(gr.sizeof_gr_complex * dp.fft_length,
-                                                                        "debug/generated_signal_move_and_insert_carrier.dat"))
-            self.connect(self.ifft,
-                         blocks.file_sink(gr.sizeof_gr_complex * dp.fft_length, "debug/generated_signal_ifft.dat"))
-            self.connect(self.prefixer, blocks.file_sink(gr.sizeof_gr_complex, "debug/generated_signal_prefixer.dat"))
-            self.connect(self.insert_null, blocks.file_sink(gr.sizeof_gr_complex, "debug/generated_signal.dat"))
+        if fused:
+            # QPSK mapping, pilot, differential modulation, interleaving, IFFT, cyclic prefix,
+            # normalization to energy = 1 and NULL symbol in one pass
+            self.mod = dab.ofdm_differential_mod_vbc(dp.fft_length, dp.num_carriers, dp.cp_length, dp.ns_length,
+                                                     dp.symbols_per_frame, dp.prn,
+                                                     dp.frequency_interleaving_sequence_array, 1.0 / sqrt(2048))
+            self.connect((self, 0), (self.mod, 0))
+            self.connect((self, 1), (self.mod, 1))
+            self.connect(self.mod, self)
+        else:
+            # symbol mapping
+            self.mapper = dab.qpsk_mapper_vbvc(dp.num_carriers)
+
+            # add pilot symbol
+            self.insert_pilot = dab.ofdm_insert_pilot_vcc(dp.prn)
+
+            # phase sum
+            self.sum_phase = dab.sum_phasor_trig_vcc(dp.num_carriers)
+
+            # frequency interleaving
+            self.interleave = dab.frequency_interleaver_vcc(list(map(int,dp.frequency_interleaving_sequence_array)))
+
+            # add central carrier & move to middle
+            self.move_and_insert_carrier = dab.ofdm_move_and_insert_zero(dp.fft_length, dp.num_carriers)
+
+            # ifft
+            self.ifft = fft.fft_vcc(dp.fft_length, False, [], True)
+
+            # cyclic prefixer
+            self.prefixer = digital.ofdm_cyclic_prefixer(dp.fft_length, dp.symbol_length)
+
+            # normalize to energy = 1 after IFFT
+            self.multiply_const = blocks.multiply_const_cc(1.0 / sqrt(2048))
+
+            # convert back to vectors
+            self.s2v = blocks.stream_to_vector(gr.sizeof_gr_complex, dp.symbol_length)
+
+            # add null symbol
+            self.insert_null = dab.insert_null_symbol(dp.ns_length, dp.symbol_length)
+
+            # data
+            self.connect((self, 0), self.mapper, (self.insert_pilot, 0), (self.sum_phase, 0), self.interleave,
+                         self.move_and_insert_carrier, self.ifft, self.prefixer, self.multiply_const, self.s2v,
+                         (self.insert_null, 0))
+            self.connect(self.insert_null, self)
+
+            # control signal (frame start)
+            self.connect((self, 1), (self.insert_pilot, 1), (self.sum_phase, 1), (self.insert_null, 1))
+
+            if debug:
+                self.connect(self.mapper,
+                             blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers, "debug/generated_signal_mapper.dat"))
+                self.connect(self.insert_pilot, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
+                                                                 "debug/generated_signal_pilot_inserted.dat"))
+                self.connect(self.sum_phase, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
+                                                              "debug/generated_signal_sum_phase.dat"))
+                self.connect(self.interleave, blocks.file_sink(gr.sizeof_gr_complex * dp.num_carriers,
+                                                               "debug/generated_signal_interleave.dat"))
+                self.connect(self.move_and_insert_carrier, blocks.file_sink(gr.sizeof_gr_complex * dp.fft_length,
+                                                                            "debug/generated_signal_move_and_insert_carrier.dat"))
+                self.connect(self.ifft,
+                             blocks.file_sink(gr.sizeof_gr_complex * dp.fft_length, "debug/generated_signal_ifft.dat"))
+                self.connect(self.prefixer, blocks.file_sink(gr.sizeof_gr_complex, "debug/generated_signal_prefixer.dat"))
+                self.connect(self.insert_null, blocks.file_sink(gr.sizeof_gr_complex, "debug/generated_signal.dat"))
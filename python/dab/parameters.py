@@ -23,7 +23,44 @@
 # Andreas Mueller, 2008
 # andrmuel@ee.ethz.ch
 
-class dab_parameters:
+import functools
+
+import numpy as np
+
+
+def _read_only(array):
+    # the tables are shared by all users of a parameter object
+    array.flags.writeable = False
+    return array
+
+
+@functools.lru_cache(maxsize=None)
+def _prbs_period():
+    # one period of the PRBS, p(x) = x^9 + x^5 + 1 with initial state 111111111
+    bits = [1] * 9
+    sequence = []
+    for i in range(0, 511):
+        newbit = bits[8] ^ bits[4]
+        bits = [newbit] + bits[0:-1]
+        sequence.append(newbit)
+    return _read_only(np.array(sequence, dtype=np.uint8))
+
+
+class _cached_dab_parameters(type):
+    """
+    Returns the parameter object of an already seen (mode, sample_rate) instead
+    of building a new one, so that all blocks of a flowgraph share the tables.
+    """
+    def __call__(cls, mode, sample_rate=2048000, verbose=True):
+        key = (mode, sample_rate)
+        instance = cls.__instances__.get(key)
+        if instance is None:
+            instance = super(_cached_dab_parameters, cls).__call__(mode, sample_rate, verbose)
+            cls.__instances__[key] = instance
+        return instance
+
+
+class dab_parameters(metaclass=_cached_dab_parameters):
     """
     @brief Represents the DAB parameters.
 
@@ -32,7 +69,12 @@ class dab_parameters:
     as specified in
     ETSI EN 300 401 V1.4.1 (2006-06)
     "Digital Audio Broadcasting (DAB) to mobile, portable and fixed receivers"
+
+    There is only one (immutable) object per mode and sample rate, all derived
+    tables are read-only NumPy arrays that are calculated once, when the object
+    is created.
     """
+    __instances__ = {}
 
     # parameter values for all modes
 
@@ -292,24 +334,42 @@ class dab_parameters:
                 i])  # not sure - according to specification, code rate is only approximately 1/3, but seems to be exact
 
         # sanity checks for PRBS sequence (energy dispersal)
-        assert (self.prbs(16) == self.__prbs_bits__)  # bits from DAB standard
-        assert (self.prbs(511) == self.prbs(1022)[511:])  # sequence must repeat itself
+        assert (np.array_equal(self.prbs(16), self.__prbs_bits__))  # bits from DAB standard
+        assert (np.array_equal(self.prbs(511), self.prbs(1022)[511:]))  # sequence must repeat itself
         if verbose:
             print("--> DAB parameters self check ok")
 
         self.__update_parameters__()
+        self.__frozen__ = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "__frozen__", False):
+            raise AttributeError("dab_parameters are immutable, use dab_parameters(mode, sample_rate) instead")
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, dab_parameters):
+            return NotImplemented
+        return (self.mode, self.sample_rate) == (other.mode, other.sample_rate)
+
+    def __hash__(self):
+        return hash((self.mode, self.sample_rate))
 
     def set_mode(self, mode):
+        """
+        @return the parameter object for the given mode (this object is immutable)
+        """
         if self.verbose:
-            print("--> setting DAB mode to ") + str(mode)
-        self.mode = mode
-        self.__update_parameters__()
+            print("--> setting DAB mode to " + str(mode))
+        return dab_parameters(mode, self.sample_rate, self.verbose)
 
     def set_sample_rate(self, sample_rate):
+        """
+        @return the parameter object for the given sample rate (this object is immutable)
+        """
         if self.verbose:
-            print("--> setting sample rate to ") + str(sample_rate)
-        self.sample_rate = sample_rate
-        self.__update_parameters__()
+            print("--> setting sample rate to " + str(sample_rate))
+        return dab_parameters(self.mode, sample_rate, self.verbose)
 
     def __update_parameters__(self):
         if self.verbose:
@@ -329,52 +389,36 @@ class dab_parameters:
         self.bytes_per_symbol = self.num_carriers / 4
 
         # prn sequence
-        self.prn = []
-        for k in range(-self.num_carriers // 2, self.num_carriers // 2 + 1):
-            if k == 0:
-                # self.prn.append(0)
-                pass
-            else:
-                [kk, i, n] = self.__get_prn_kk_i_n__(k)
-                h = self.__prn_h__[i][k - kk]
-                phi_k = (h + n) % 4  # actually phi_k/(pi/2)
-                if phi_k == 0:  # e^(j*pi/2*phi_k) is not exact if calculated by python
-                    self.prn.append(1)
-                elif phi_k == 1:
-                    self.prn.append(1j)
-                elif phi_k == 2:
-                    self.prn.append(-1)
-                elif phi_k == 3:
-                    self.prn.append(-1j)
+        self.prn = self.__prn__()
 
         # frequency (de)interleaving
-        a = self.fft_length / 4 - 1
+        a = self.fft_length // 4 - 1
         b = self.fft_length
         A = [0]
         for i in range(1, self.fft_length):
             A.append((13 * A[-1] + a) % b)
-        D = [d for d in A if d >= self.fft_length / 8 and d <= 7 * self.fft_length / 8 and d != self.fft_length / 2]
+        A = np.array(A)
+        D = A[(A >= self.fft_length // 8) & (A <= 7 * self.fft_length // 8) & (A != self.fft_length // 2)]
         assert (len(D) == self.num_carriers)
-        self.frequency_interleaving_sequence = [d - self.fft_length / 2 for d in D]
-        assert (self.frequency_interleaving_sequence[0:len(self.__expected_frequency_interleaving__[mode - 1])] ==
-                self.__expected_frequency_interleaving__[mode - 1])
+        self.frequency_interleaving_sequence = _read_only(D - self.fft_length // 2)
+        expected = self.__expected_frequency_interleaving__[mode - 1]
+        assert (np.array_equal(self.frequency_interleaving_sequence[0:len(expected)], expected))
         # sequence for arrays, with indices starting from 0 and central carrier already removed
-        self.frequency_interleaving_sequence_array = [k + self.num_carriers / 2 - (k > 0) for k in
-                                                      self.frequency_interleaving_sequence]
+        self.frequency_interleaving_sequence_array = _read_only(
+            self.frequency_interleaving_sequence + self.num_carriers // 2 - (self.frequency_interleaving_sequence > 0))
         assert (len(self.frequency_interleaving_sequence_array) == self.num_carriers)
-        assert (min(self.frequency_interleaving_sequence_array) == 0)
-        assert (max(self.frequency_interleaving_sequence_array) == self.num_carriers - 1)
-        assert (len(set(self.frequency_interleaving_sequence_array)) == len(
+        assert (self.frequency_interleaving_sequence_array.min() == 0)
+        assert (self.frequency_interleaving_sequence_array.max() == self.num_carriers - 1)
+        assert (len(np.unique(self.frequency_interleaving_sequence_array)) == len(
             self.frequency_interleaving_sequence_array))  # uniqueness of elements
 
-        # frequency deinterleaving sequence
-        self.frequency_deinterleaving_sequence_array = [self.frequency_interleaving_sequence_array.index(i) for i in
-                                                        range(0, self.num_carriers)]
+        # frequency deinterleaving sequence (inverse permutation)
+        self.frequency_deinterleaving_sequence_array = _read_only(np.argsort(self.frequency_interleaving_sequence_array))
 
         # adapt for non-standard sample rate - do this at end, frequency interleaving calculation still needs default fft length
         if self.sample_rate != self.default_sample_rate:
             if self.verbose:
-                print("--> using non-standard sample rate: ") + str(self.sample_rate)
+                print("--> using non-standard sample rate: " + str(self.sample_rate))
             self.T = 1. / self.sample_rate
             self.ns_length = int(round(self.ns_length * float(self.sample_rate) / float(self.default_sample_rate)))
             self.cp_length = int(round(self.cp_length * float(self.sample_rate) / float(self.default_sample_rate)))
@@ -393,13 +437,14 @@ class dab_parameters:
         # see 11.2 page 132
         self.fic_punctured_codeword_length = self.__fic_punctured_codeword_length__[mode - 1]
         if mode in [1, 2, 4]:
-            self.assembled_fic_puncturing_sequence = 21 * 4 * self.puncturing_vectors[16] + 3 * 4 * \
-                                                                                            self.puncturing_vectors[
-                                                                                                15] + self.puncturing_tail_vector
+            assembled_fic_puncturing_sequence = 21 * 4 * self.puncturing_vectors[16] + 3 * 4 * \
+                                                                                       self.puncturing_vectors[
+                                                                                           15] + self.puncturing_tail_vector
         else:
-            self.assembled_fic_puncturing_sequence = 29 * 4 * self.puncturing_vectors[16] + 3 * 4 * \
-                                                                                            self.puncturing_vectors[
-                                                                                                15] + self.puncturing_tail_vector
+            assembled_fic_puncturing_sequence = 29 * 4 * self.puncturing_vectors[16] + 3 * 4 * \
+                                                                                       self.puncturing_vectors[
+                                                                                           15] + self.puncturing_tail_vector
+        self.assembled_fic_puncturing_sequence = _read_only(np.array(assembled_fic_puncturing_sequence, dtype=np.uint8))
         # assert (len(self.assembled_fic_puncturing_sequence) == self.fic_conv_codeword_length)
         # assert (
         # len(filter(lambda x: x == 1, self.assembled_fic_puncturing_sequence)) == self.fic_punctured_codeword_length)
@@ -412,36 +457,87 @@ class dab_parameters:
         self.num_fibs = self.__num_fibs__[mode - 1]
         self.num_cifs = self.__num_cifs__[mode - 1]
 
-    def __get_prn_kk_i_n__(self, k):
-        assert (k != 0)
-        assert (abs(k) <= self.num_carriers // 2)
-        if k < 0:
-            index = (k + self.num_carriers // 2) // 32
-            kk = 32 * (int(k) // 32)
-        else:
-            index = (k + self.num_carriers // 2 - 1) // 32
-            kk = 32 * (int(k - 1) // 32) + 1
-        values = self.__prn_kin__[self.mode - 1][index]
-        assert (k >= values[0] and k <= values[1])
-        assert (kk == values[2])
-        i = values[3]
-        n = values[4]
-        return [kk, i, n]
-
+    def __prn__(self):
+        """
+        Phase reference symbol (14.3.2), one value per carrier k = -K/2 ... K/2 without k = 0
+        """
+        half = self.num_carriers // 2
+        k = np.concatenate((np.arange(-half, 0), np.arange(1, half + 1)))
+        # row of table 39 - 42 of each carrier
+        index = np.where(k < 0, (k + half) // 32, (k + half - 1) // 32)
+        kk = np.where(k < 0, 32 * (k // 32), 32 * ((k - 1) // 32) + 1)
+        values = np.array(self.__prn_kin__[self.mode - 1])[index]
+        assert (np.all((k >= values[:, 0]) & (k <= values[:, 1])))
+        assert (np.array_equal(kk, values[:, 2]))
+        h = np.array(self.__prn_h__)[values[:, 3], k - kk]
+        phi_k = (h + values[:, 4]) % 4  # actually phi_k/(pi/2)
+        # e^(j*pi/2*phi_k) is not exact if calculated by numpy
+        return _read_only(np.array([1, 1j, -1, -1j], dtype=np.complex128)[phi_k])
+
+    @functools.lru_cache(maxsize=None)
     def prbs(self, length):
         """
         PRBS generated with the polynomial p(x) = x^9 + x^5 + 1
         and initial state 111111111
 
         @param length number of bits in the sequence
+        @return read-only uint8 array
+        """
+        return _read_only(np.resize(_prbs_period(), length))
+
+    @functools.lru_cache(maxsize=None)
+    def msc_eep_puncturing(self, size, protection):
+        """
+        Puncturing of a sub-channel with equal error protection, profile A
+        (11.3.2, tables 33 and 34).
+
+        @param size sub-channel size in CUs
+        @param protection protection level index (0: A1, ..., 3: A4)
+        @return (I, punctured codeword length, puncturing sequence), I being
+        the number of information bits per CIF and the puncturing sequence a
+        read-only uint8 array
+        """
+        n = size // self.subch_size_multiple_n[protection]
+        if n == 1 and protection == 1:
+            # exception in table 33
+            L1, L2, PI1, PI2 = 5, 1, 13, 12
+        else:
+            L1 = [6 * n - 3, 2 * n - 3, 6 * n - 3, 4 * n - 3][protection]
+            L2 = [3, 4 * n + 3, 3, 2 * n + 3][protection]
+            PI1 = [24, 14, 8, 3][protection]
+            PI2 = [23, 13, 7, 2][protection]
+        assert (6 * n == L1 + L2)
+        punctured_codeword_length = L1 * 4 * self.puncturing_vectors_ones[PI1] + \
+                                    L2 * 4 * self.puncturing_vectors_ones[PI2] + 12
+        puncturing_sequence = np.concatenate((np.tile(np.array(self.puncturing_vectors[PI1], dtype=np.uint8), L1 * 4),
+                                              np.tile(np.array(self.puncturing_vectors[PI2], dtype=np.uint8), L2 * 4),
+                                              np.array(self.puncturing_tail_vector, dtype=np.uint8)))
+        return n * 192, punctured_codeword_length, _read_only(puncturing_sequence)
+
+    def symbol_mask(self, subchannels):
+        """
+        Marks the OFDM symbols of a transmission frame, which have to be
+        demodulated to receive the given sub-channels. These are the phase
+        reference symbol, the FIC symbols, the MSC symbols carrying the CUs of
+        the sub-channels and the MSC symbols before them, which are needed as
+        reference for the differential demodulation.
+
+        @param subchannels list of (address, size) of the sub-channels in CUs
+        @return list of symbols_per_frame flags (1: symbol is needed)
         """
-        bits = [1] * 9
-        sequence = []
-        for i in range(0, length):
-            newbit = bits[8] ^ bits[4]
-            bits = [newbit] + bits[0:-1]
-            sequence.append(newbit)
-        return sequence
+        mask = [1] * (1 + self.num_fic_syms) + [0] * self.num_msc_syms
+        syms_per_cif = self.num_msc_syms // self.num_cifs
+        bits_per_sym = 2 * self.num_carriers
+        for (address, size) in subchannels:
+            assert (size > 0 and address + size <= self.num_cus)
+            first = (address * self.msc_cu_size) // bits_per_sym
+            last = ((address + size) * self.msc_cu_size - 1) // bits_per_sym
+            for cif in range(0, self.num_cifs):
+                start = 1 + self.num_fic_syms + cif * syms_per_cif
+                # the symbol before the first one is the reference for the differential demodulation
+                for sym in range(start + first - 1, start + last + 1):
+                    mask[sym] = 1
+        return mask
 
 class receiver_parameters:
     """
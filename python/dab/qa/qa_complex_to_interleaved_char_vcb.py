@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_complex_to_interleaved_char_vcb(gr_unittest.TestCase):
+    """
+    @brief QA for the conversion of QPSK symbols to int8 soft bits.
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_complex_to_interleaved_char_vcb(self):
+        # fixed scale with saturation
+        src_data = (1 + 2j, 3 - 4j, 5 + 60j, -70 + 8j)
+        expected_result = (10, 30, 20, -40, 50, -128, 127, 80)
+        src = blocks.vector_source_c(src_data)
+        s2v = blocks.stream_to_vector(gr.sizeof_gr_complex, 2)
+        complex_to_interleaved_char_vcb = dab.complex_to_interleaved_char_vcb(2, 10)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, 4)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, complex_to_interleaved_char_vcb, v2s, dst)
+        self.tb.run()
+        result_data = [x - 256 if x > 127 else x for x in dst.data()]
+        self.assertEqual(list(expected_result), result_data)
+
+    def test_002_complex_to_interleaved_char_vcb(self):
+        # adaptive scale: mean magnitude of 32 in each vector
+        src_data = (0.5 + 0.5j, -0.5 - 0.5j, 100 - 300j, -200 + 200j)
+        expected_result = (32, -32, 32, -32, 16, -32, -48, 32)
+        src = blocks.vector_source_c(src_data)
+        s2v = blocks.stream_to_vector(gr.sizeof_gr_complex, 2)
+        complex_to_interleaved_char_vcb = dab.complex_to_interleaved_char_vcb(2)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, 4)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, complex_to_interleaved_char_vcb, v2s, dst)
+        self.tb.run()
+        result_data = [x - 256 if x > 127 else x for x in dst.data()]
+        self.assertEqual(list(expected_result), result_data)
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
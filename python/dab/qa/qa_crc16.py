@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+#
+
+from gnuradio import gr_unittest
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_crc16(gr_unittest.TestCase):
+    """
+    @brief QA for the table driven CRC16
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.fib = [
+            0x1D, 0x13, 0x06, 0x00, 0x00, 0x01, 0x0B, 0x00, 0x00, 0x05, 0x03, 0x00, 0x00, 0x09, 0x07, 0x00, 0x00, 0x04,
+            0x09, 0x00, 0x00, 0x0C, 0x02, 0x00, 0x00, 0x02, 0x08, 0x00, 0x00, 0x0A, 0xE4, 0x9C]
+
+    # CRC word of a FIB and check of the FIB with its CRC word
+    def test_001_t(self):
+        crc16 = dab.crc16()
+        self.assertEqual(0x1021, crc16.generator())
+        self.assertEqual(0xE49C, crc16.compute(self.fib[:30]))
+        self.assertTrue(crc16.check(self.fib))
+        # data bytes with the MSB set
+        data = [0x80, 0xC5, 0xFF, 0x7E, 0x91]
+        crc = crc16.compute(data)
+        self.assertTrue(crc16.check(data + [crc >> 8, crc & 0xFF]))
+        self.assertEqual(crc ^ 0xFFFF, crc16.update(0xFFFF, data))
+        corrupted_fib = list(self.fib)
+        corrupted_fib[7] ^= 0x10
+        self.assertFalse(crc16.check(corrupted_fib))
+
+    # bulk check of packed and unpacked FIBs
+    def test_002_t(self):
+        crc16 = dab.crc16()
+        corrupted_fib = list(self.fib)
+        corrupted_fib[31] ^= 0x01
+        fibs = self.fib + corrupted_fib + self.fib + self.fib[:5]
+        self.assertEqual([True, False, True], crc16.check_blocks(fibs, 32))
+        bits = [(byte >> (7 - i)) & 1 for byte in fibs for i in range(8)]
+        self.assertEqual([True, False, True], crc16.check_unpacked_blocks(bits, 32))
+
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_crc16)
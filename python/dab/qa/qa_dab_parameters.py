@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+
+import numpy as np
+from gnuradio import gr, gr_unittest
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_dab_parameters(gr_unittest.TestCase):
+    """
+    @brief QA for the cached DAB parameter objects
+
+    This class verifies that one immutable parameter object per mode and sample rate is created
+    and that the derived tables are consistent.
+    """
+
+    def test_001_cached_object(self):
+        dp = dab.parameters.dab_parameters(1, 2048000, False)
+        self.assertTrue(dp is dab.parameters.dab_parameters(mode=1, sample_rate=2048000, verbose=False))
+        self.assertFalse(dp is dab.parameters.dab_parameters(2, 2048000, False))
+        self.assertEqual(hash(dp), hash(dab.parameters.dab_parameters(1, 2048000, False)))
+        self.assertTrue(dp.set_mode(3) is dab.parameters.dab_parameters(3, 2048000, False))
+        self.assertEqual(dp.mode, 1)
+        with self.assertRaises(AttributeError):
+            dp.mode = 2
+        with self.assertRaises(ValueError):
+            dp.prn[0] = 0
+
+    def test_002_tables(self):
+        for mode in range(1, 5):
+            dp = dab.parameters.dab_parameters(mode, 2048000, False)
+            self.assertEqual(len(dp.prn), dp.num_carriers)
+            # deinterleaving is the inverse permutation of the interleaving
+            interleaving = dp.frequency_interleaving_sequence_array
+            deinterleaving = dp.frequency_deinterleaving_sequence_array
+            self.assertTrue(np.array_equal(interleaving[deinterleaving], np.arange(dp.num_carriers)))
+            self.assertEqual(len(dp.assembled_fic_puncturing_sequence), dp.fic_conv_codeword_length)
+            self.assertEqual(int(np.sum(dp.assembled_fic_puncturing_sequence)), dp.fic_punctured_codeword_length)
+
+    def test_003_prbs_and_puncturing(self):
+        dp = dab.parameters.dab_parameters(1, 2048000, False)
+        self.assertEqual(list(dp.prbs(16)), [0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0])
+        self.assertTrue(np.array_equal(dp.prbs(511), dp.prbs(1533)[1022:]))
+        for protection in range(0, 4):
+            for n in (1, 2, 8):
+                size = n * dp.subch_size_multiple_n[protection]
+                (I, punctured_codeword_length, puncturing_sequence) = dp.msc_eep_puncturing(size, protection)
+                self.assertEqual(len(puncturing_sequence), 4 * I + 24)
+                self.assertEqual(int(np.sum(puncturing_sequence)), punctured_codeword_length)
+                self.assertTrue(puncturing_sequence is dp.msc_eep_puncturing(size, protection)[2])
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_dab_parameters)
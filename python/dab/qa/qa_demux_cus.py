@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_demux_cus(gr_unittest.TestCase):
+    """
+    @brief QA for the CU demultiplexer
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_t(self):
+        # 3 CIFs with 4 CUs of 2 bytes each, sub-channels at CU 2 (size 2) and CU 0 (size 1)
+        src_data = list(range(0, 24))
+        src = blocks.vector_source_b(src_data)
+        s2v = blocks.stream_to_vector(gr.sizeof_char, 2)
+        demux = dab.demux_cus(gr.sizeof_char, 2, 4, [2, 0], [2, 1])
+        dst0 = blocks.vector_sink_b(2)
+        dst1 = blocks.vector_sink_b(2)
+        self.tb.connect(src, s2v, demux)
+        self.tb.connect((demux, 0), dst0)
+        self.tb.connect((demux, 1), dst1)
+        self.tb.run()
+        self.assertEqual([4, 5, 6, 7, 12, 13, 14, 15, 20, 21, 22, 23], list(dst0.data()))
+        self.assertEqual([0, 1, 8, 9, 16, 17], list(dst1.data()))
+
+    def test_002_t(self):
+        # float soft bits
+        src_data = [float(x) for x in range(0, 12)]
+        src = blocks.vector_source_f(src_data)
+        demux = dab.demux_cus(gr.sizeof_float, 1, 3, [1], [1])
+        dst = blocks.vector_sink_f()
+        self.tb.connect(src, demux, dst)
+        self.tb.run()
+        self.assertFloatTuplesAlmostEqual((1, 4, 7, 10), dst.data())
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
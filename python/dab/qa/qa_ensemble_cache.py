@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import os
+import shutil
+import tempfile
+from gnuradio import gr, gr_unittest
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_ensemble_cache(gr_unittest.TestCase):
+    """
+    @brief QA for the persistent ensemble cache
+
+    This class verifies that stored ensembles are found again by frequency and EId.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "cache", "ensembles.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_001_store_lookup(self):
+        database = [{"type": "ensemble_id", "EId": 4330},
+                    {"type": "subchannel", "ID": 2, "address": 54, "protection": 2, "size": 84}]
+        cache = dab.ensemble_cache(self.path)
+        self.assertEqual(cache.lookup(208064000), None)
+        cache.store(208064000, 4330, database, {"coarse_freq_offset": 256})
+        cache.store(208064000, 4660, [], {})
+        cache.store(222064000, 4331, [], {})
+        # a new instance reads the file written by the first one
+        cache = dab.ensemble_cache(self.path)
+        # without EId, the ensemble received last on the frequency is returned
+        self.assertEqual(cache.lookup(208064000.0)["EId"], 4660)
+        record = cache.lookup(208064000, 4330)
+        self.assertEqual(record["database"], database)
+        self.assertEqual(record["sync"], {"coarse_freq_offset": 256})
+        self.assertEqual(cache.lookup(222064000)["EId"], 4331)
+        self.assertEqual(cache.lookup(208064000, 1234), None)
+
+    def test_002_broken_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{broken")
+        cache = dab.ensemble_cache(self.path)
+        self.assertEqual(cache.lookup(208064000), None)
+        cache.store(208064000, 4330, [], {})
+        self.assertEqual(dab.ensemble_cache(self.path).lookup(208064000)["EId"], 4330)
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_ensemble_cache)
@@ -19,9 +19,19 @@
 # Boston, MA 02110-1301, USA.
 #
 
+import json
+import pmt
 from gnuradio import gr, gr_unittest
 from gnuradio import blocks
-from . import dab_swig as dab
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
 
 class qa_fib_sink_vb (gr_unittest.TestCase):
     """
@@ -50,5 +60,68 @@ class qa_fib_sink_vb (gr_unittest.TestCase):
         self.tb.run()
         pass
 
+    def test_002_t (self):
+        """
+        FIC database built from sub-channel orga, service orga, service label,
+        programme type and ensemble label FIGs; repeated FIBs do not change it
+        """
+        data = (
+        # FIG 0/1 (2 sub-channels), FIG 0/2 (2 services)
+        0x09, 0x01, 0x08, 0x36, 0x88, 0x54, 0x0C, 0x8A, 0x88, 0x54, 0x0B, 0x02, 0xD2, 0xE0, 0x01, 0x3F, 0x08, 0xD0,
+        0xEA, 0x01, 0x3F, 0x0C, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x6A, 0x3E,
+        # FIG 1/1 (service label), FIG 0/17 (programme type)
+        0x35, 0x01, 0xD2, 0xE0, 0x53, 0x57, 0x52, 0x31, 0x20, 0x42, 0x57, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20,
+        0x20, 0x20, 0xFF, 0x00, 0x05, 0x11, 0xD2, 0xE0, 0x00, 0x0D, 0xFF, 0xFF, 0x1A, 0x7F,
+        # FIG 1/0 (ensemble label)
+        0x35, 0x00, 0x10, 0xEA, 0x53, 0x57, 0x52, 0x20, 0x42, 0x57, 0x20, 0x4E, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20,
+        0x20, 0x20, 0xFF, 0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x94, 0x3F)
+        src = blocks.vector_source_b(data * 3)
+        fibout = blocks.stream_to_vector(1, 32)
+        fibsink = dab.fib_sink_vb()
+        dbg = blocks.message_debug()
+        self.tb.connect(src, fibout, fibsink)
+        self.tb.msg_connect(fibsink, "fic_db", dbg, "store")
+        self.tb.run()
+        # 2 sub-channels, 2 service components, 1 label, 1 programme type, 1 ensemble label
+        self.assertEqual(fibsink.get_version(), 7)
+        self.assertEqual(dbg.num_messages(), 7)
+        self.assertTrue(fibsink.get_crc_passed())
+        self.assertEqual(json.loads(fibsink.get_subch_info()),
+                         [{"ID": 2, "address": 54, "protection": 2, "size": 84},
+                          {"ID": 3, "address": 138, "protection": 2, "size": 84}])
+        self.assertEqual([(s["reference"], s["ID"], s["DAB+"]) for s in json.loads(fibsink.get_service_info())],
+                         [(736, 2, True), (234, 3, True)])
+        self.assertEqual(json.loads(fibsink.get_service_labels()),
+                         [{"label": "SWR1 BW         ", "reference": 736}])
+        self.assertEqual(json.loads(fibsink.get_programme_type()),
+                         [{"reference": 736, "programme_type": 13}])
+        self.assertEqual(json.loads(fibsink.get_ensemble_info()),
+                         {"SWR BW N        ": {"country_ID": 1}})
+
+    def test_003_t (self):
+        """
+        restored entries that are not confirmed by the received FIGs (other EId) are dropped
+        """
+        data = (
+        # FIG 0/1 (2 sub-channels), FIG 0/2 (2 services)
+        0x09, 0x01, 0x08, 0x36, 0x88, 0x54, 0x0C, 0x8A, 0x88, 0x54, 0x0B, 0x02, 0xD2, 0xE0, 0x01, 0x3F, 0x08, 0xD0,
+        0xEA, 0x01, 0x3F, 0x0C, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x6A, 0x3E,
+        # FIG 1/0 (ensemble label), FIG 0/0 (ensemble information, EId 0x10EA)
+        0x35, 0x00, 0x10, 0xEA, 0x53, 0x57, 0x52, 0x20, 0x42, 0x57, 0x20, 0x4E, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20,
+        0x20, 0x20, 0xFF, 0x00, 0x06, 0x00, 0x10, 0xEA, 0x04, 0x24, 0x00, 0xFF, 0x5B, 0x34)
+        src = blocks.vector_source_b(data * 700)
+        fibout = blocks.stream_to_vector(1, 32)
+        fibsink = dab.fib_sink_vb()
+        restored = [{"type": "ensemble_id", "EId": 0x1234},
+                    {"type": "subchannel", "ID": 9, "address": 300, "protection": 1, "size": 72},
+                    {"type": "label", "label": "OLD             ", "reference": 999}]
+        for entry in restored:
+            fibsink._post(pmt.intern("restore"), pmt.to_pmt(entry))
+        self.tb.connect(src, fibout, fibsink)
+        self.tb.run()
+        self.assertEqual(fibsink.get_ensemble_id(), 0x10EA)
+        self.assertEqual([s["ID"] for s in json.loads(fibsink.get_subch_info())], [2, 3])
+        self.assertEqual(fibsink.get_service_labels(), "")
+
 if __name__ == '__main__':
     gr_unittest.run(qa_fib_sink_vb, "qa_fib_sink_vb.xml")
@@ -21,7 +21,27 @@
 
 from gnuradio import gr, gr_unittest
 from gnuradio import blocks
-from . import dab_swig as dab
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+def crc16(data):
+    # CRC16 of ETSI EN 300 401 (x^16 + x^12 + x^5 + 1, initial state 0xffff, inverted)
+    state = 0xffff
+    for byte in data:
+        state ^= byte << 8
+        for i in range(8):
+            if state & 0x8000:
+                state = ((state << 1) ^ 0x1021) & 0xffff
+            else:
+                state = (state << 1) & 0xffff
+    return state ^ 0xffff
 
 class qa_fib_source_b (gr_unittest.TestCase):
 
@@ -34,25 +54,42 @@ class qa_fib_source_b (gr_unittest.TestCase):
     # manual check if transmitted data is interpreted properly
     # trivial fib_source with only one sub-channel
     def test_001_t(self):
-        src = dab.fib_source_b_make(1,1,1,'Galaxy_News', 'Wasteland_Radio', 'Country_Mix', 0x09, [0], [8], [1])
+        src = dab.fib_source_b(1,1,1,'Galaxy_News', 'Wasteland_Radio', 'Country_Mix', 0x09, [0], [8], [1])
         fib_unpacked_to_packed = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
         s2v = blocks.stream_to_vector(gr.sizeof_char, 32)
-        crc16 = dab.crc16_bb(32, 0x1021, 0xffff)
         fibsink = dab.fib_sink_vb()
-        self.tb.connect(src, fib_unpacked_to_packed, blocks.head(gr.sizeof_char, 300), s2v, crc16, fibsink)
+        self.tb.connect(src, fib_unpacked_to_packed, blocks.head(gr.sizeof_char, 300), s2v, fibsink)
         self.tb.run()
         pass
 
     # multiple sub-channels
-    def test_001_t(self):
-        src = dab.fib_source_b_make(1,1,7,'Galaxy_News', 'Wasteland_Radio1Wasteland_Radio2Wasteland_Radio3Wasteland_Radio4Wasteland_Radio5Wasteland_Radio6Wasteland_Radio7', 'Country_Mix', 0x09, [0, 1, 2, 3, 3, 2, 1], [8, 2, 8, 8, 2, 1, 4], [1, 1, 0, 1, 1, 0, 1])
+    def test_002_t(self):
+        src = dab.fib_source_b(1,1,7,'Galaxy_News', 'Wasteland_Radio1Wasteland_Radio2Wasteland_Radio3Wasteland_Radio4Wasteland_Radio5Wasteland_Radio6Wasteland_Radio7', 'Country_Mix', 0x09, [0, 1, 2, 3, 3, 2, 1], [8, 2, 8, 8, 2, 1, 4], [1, 1, 0, 1, 1, 0, 1])
         fib_unpacked_to_packed = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
         s2v = blocks.stream_to_vector(gr.sizeof_char, 32)
-        crc16 = dab.crc16_bb(32, 0x1021, 0xffff)
         fibsink = dab.fib_sink_vb()
-        self.tb.connect(src, fib_unpacked_to_packed, blocks.head(gr.sizeof_char, 3000), s2v, crc16, fibsink)
+        self.tb.connect(src, fib_unpacked_to_packed, blocks.head(gr.sizeof_char, 3000), s2v, fibsink)
         self.tb.run()
         pass
 
+    # CRC16 of all FIBs and CIF counter of the replayed carousel
+    def test_003_t(self):
+        num_frames = 260
+        for (mode, fibs_per_frame) in [(1, 3), (3, 4)]:
+            tb = gr.top_block()
+            src = dab.fib_source_b(mode,1,2,'Galaxy_News', 'Wasteland_Radio1Wasteland_Radio2', 'Country_Mix', 0x09, [2, 1], [8, 4], [1, 0])
+            fib_unpacked_to_packed = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+            dst = blocks.vector_sink_b()
+            tb.connect(src, fib_unpacked_to_packed, blocks.head(gr.sizeof_char, num_frames * fibs_per_frame * 32), dst)
+            tb.run()
+            fibs = list(dst.data())
+            for n in range(0, num_frames * fibs_per_frame):
+                fib = fibs[n * 32:(n + 1) * 32]
+                self.assertEqual(crc16(fib[:30]), (fib[30] << 8) | fib[31])
+            for frame in range(0, num_frames):
+                fib = fibs[frame * fibs_per_frame * 32:(frame * fibs_per_frame + 1) * 32]
+                self.assertEqual(fib[5], frame % 250)
+                self.assertEqual(fib[4] & 0x1f, frame // 250)
+
 if __name__ == '__main__':
-    gr_unittest.run(qa_fib_source_b, "qa_fib_source_b.xml")
+    gr_unittest.run(qa_fib_source_b)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+import pmt
+import random
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+def firecode(data):
+    # CRC with the generator polynomial of the firecode (ETSI TS 102 563)
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(0, 8):
+            crc = ((crc << 1) ^ 0x782f) & 0xffff if crc & 0x8000 else (crc << 1) & 0xffff
+    return crc
+
+class qa_firecode_check_bb(gr_unittest.TestCase):
+    """
+    @brief QA for the firecode checker
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+        self.bit_rate_n = 4
+        self.frame_size = 24 * self.bit_rate_n
+
+    def tearDown(self):
+        self.tb = None
+
+    def logical_frames(self, num_frames, valid):
+        # random logical frames with the frame number in byte 12, valid firecode at the frames in valid
+        random.seed(1)
+        data = []
+        for frame in range(0, num_frames):
+            frame_data = [random.randrange(256) for _ in range(0, self.frame_size)]
+            frame_data[12] = frame
+            crc = firecode(frame_data[2:11])
+            if frame in valid:
+                frame_data[0:2] = [crc >> 8, crc & 0xff]
+            elif frame_data[0:2] == [crc >> 8, crc & 0xff]:
+                frame_data[0] ^= 1
+            data.extend(frame_data)
+        return data
+
+    def run_firecode(self, data, cif_count=None):
+        # every logical frame is tagged with its CIF index, starting at CIF 100
+        tags = [gr.tag_utils.python_to_tag((frame * self.frame_size, pmt.intern("cif_start"),
+                                            pmt.from_uint64(frame + 100), pmt.intern("src")))
+                for frame in range(0, len(data) // self.frame_size)]
+        src = blocks.vector_source_b(data, False, 1, tags)
+        firecode_check = dab.firecode_check_bb(self.bit_rate_n)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, firecode_check, dst)
+        if cif_count is not None:
+            # CIF 200 has the CIF counter cif_count
+            msg = pmt.make_dict()
+            msg = pmt.dict_add(msg, pmt.intern("cif"), pmt.from_uint64(200))
+            msg = pmt.dict_add(msg, pmt.intern("cif_count"), pmt.from_long(cif_count))
+            firecode_check._post(pmt.intern("cif_count"), msg)
+        self.tb.run()
+        result = list(dst.data())
+        return [result[n * self.frame_size + 12] for n in range(0, len(result) // self.frame_size)]
+
+    # search: a valid firecode at frame 1 locks, until it fails 3 times
+    def test_001_t(self):
+        valid = list(range(3, 60, 5)) + [1]
+        frames = self.run_firecode(self.logical_frames(60, valid))
+        self.assertEqual(list(range(1, 16)) + list(range(18, 58)), frames)
+
+    # CIF counter: the superframes start at the CIFs with CIF counter 0 modulo 5
+    def test_002_t(self):
+        valid = list(range(3, 60, 5)) + [1]
+        frames = self.run_firecode(self.logical_frames(60, valid), cif_count=207)
+        self.assertEqual(list(range(3, 58)), frames)
+
+    # flywheel: superframes with failed firecode are passed, until it fails 3 times
+    def test_003_t(self):
+        valid = [frame for frame in range(3, 60, 5) if frame not in (13, 28, 33, 38)]
+        frames = self.run_firecode(self.logical_frames(60, valid), cif_count=207)
+        self.assertEqual(list(range(3, 38)) + list(range(43, 58)), frames)
+
+    # wrong phase of the CIF counter: search after 3 fails at predicted superframe starts
+    def test_004_t(self):
+        valid = list(range(3, 60, 5))
+        frames = self.run_firecode(self.logical_frames(60, valid), cif_count=208)
+        self.assertEqual(list(range(13, 58)), frames)
+
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_firecode_check_bb)
@@ -21,8 +21,84 @@
 
 from gnuradio import gr, gr_unittest
 from gnuradio import blocks
+import hashlib
 import os
-from . import dab_swig as dab
+import random
+import struct
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+# Layer II tables of the decoder (high-rate table 3-B.2a, stereo, 128 kbit/s, 48 kHz: sblimit 27)
+STEP3 = [0x43]*3 + [0x42]*8 + [0x31]*12 + [0x20]*4
+STEP4 = [[0, 1, 2, 17], [0, 1, 2, 3, 4, 5, 6, 17], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 17],
+         [0, 1, 3, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]]
+QUANT = [(3, 1, 5), (5, 1, 7), (7, 0, 3), (9, 1, 10), (15, 0, 4), (31, 0, 5), (63, 0, 6), (127, 0, 7),
+         (255, 0, 8), (511, 0, 9), (1023, 0, 10), (2047, 0, 11), (4095, 0, 12), (8191, 0, 13),
+         (16383, 0, 14), (32767, 0, 15), (65535, 0, 16)]
+
+def mp2_frame(rnd, mode=0, mode_extension=0):
+    # MPEG-1 Layer II frame, 128 kbit/s, 48 kHz, no CRC (384 bytes)
+    bits = []
+    def put(value, n):
+        bits.extend((value >> (n - 1 - i)) & 1 for i in range(n))
+    put(0xFFFD, 16)
+    put(8, 4); put(1, 2); put(0, 1); put(0, 1)
+    put(mode, 2); put(mode_extension, 2); put(0, 4)
+    sblimit = 27
+    bound = (mode_extension + 1) * 4 if mode == 1 else 32
+    bound = min(bound, sblimit)
+    while True:
+        alloc = [[rnd.randrange(1 << (STEP3[sb] >> 4)) if rnd.random() < 0.3 else 0 for sb in range(sblimit)]
+                 for ch in range(2)]
+        for sb in range(bound, sblimit):
+            alloc[1][sb] = alloc[0][sb]
+        quant = [[STEP4[STEP3[sb] & 15][alloc[ch][sb]] for sb in range(sblimit)] for ch in range(2)]
+        size = len(bits)
+        for sb in range(sblimit):
+            for ch in range(2 if sb < bound else 1):
+                size += STEP3[sb] >> 4
+                if quant[ch][sb]:
+                    nlevels, grouping, cw_bits = QUANT[quant[ch][sb] - 1]
+                    size += 12 * (cw_bits if grouping else 3 * cw_bits)
+            for ch in range(2):
+                if quant[ch][sb]:
+                    size += 2 + 18
+        if size <= 384 * 8:
+            break
+    for sb in range(sblimit):
+        for ch in range(2 if sb < bound else 1):
+            put(alloc[ch][sb], STEP3[sb] >> 4)
+    scfsi = [[rnd.randrange(4) for sb in range(sblimit)] for ch in range(2)]
+    for sb in range(sblimit):
+        for ch in range(2):
+            if quant[ch][sb]:
+                put(scfsi[ch][sb], 2)
+    for sb in range(sblimit):
+        for ch in range(2):
+            if quant[ch][sb]:
+                put(rnd.randrange(64), 6)
+                if scfsi[ch][sb] in (0, 1, 3):
+                    put(rnd.randrange(64), 6)
+                if scfsi[ch][sb] == 0:
+                    put(rnd.randrange(64), 6)
+    for granule in range(12):
+        for sb in range(sblimit):
+            for ch in range(2 if sb < bound else 1):
+                if quant[ch][sb]:
+                    nlevels, grouping, cw_bits = QUANT[quant[ch][sb] - 1]
+                    if grouping:
+                        put(rnd.randrange(1 << cw_bits), cw_bits)
+                    else:
+                        for i in range(3):
+                            put(rnd.randrange(1 << cw_bits), cw_bits)
+    assert len(bits) <= 384 * 8, len(bits)
+    return bits + [0] * (384 * 8 - len(bits))
 
 class qa_mp2_decode_bs (gr_unittest.TestCase):
 
@@ -49,6 +125,26 @@ class qa_mp2_decode_bs (gr_unittest.TestCase):
             log.set_level("WARN")
         pass
 
+    # random frames (stereo and joint stereo), the PCM output must not change with the synthesis filterbank
+    def test_002_t (self):
+        rnd = random.Random(1)
+        bits = []
+        for frame in range(0, 4):
+            bits += mp2_frame(rnd, mode=(frame % 2), mode_extension=rnd.randrange(4))
+        src = blocks.vector_source_b(bits)
+        mp2_decode = dab.mp2_decode_bs(16)
+        sink_left = blocks.vector_sink_s()
+        sink_right = blocks.vector_sink_s()
+        self.tb.connect(src, (mp2_decode, 0), sink_left)
+        self.tb.connect((mp2_decode, 1), sink_right)
+        self.tb.run()
+        left = list(sink_left.data())
+        right = list(sink_right.data())
+        self.assertEqual(len(left), 4 * 1152)
+        self.assertEqual(len(right), 4 * 1152)
+        pcm = struct.pack("<%dh" % (2 * len(left)), *(left + right))
+        self.assertEqual(hashlib.md5(pcm).hexdigest(), "32060ff9692c76e68123b0498e55d70a")
+
 
 if __name__ == '__main__':
     gr_unittest.run(qa_mp2_decode_bs, "qa_mp2_decode_bs.xml")
@@ -22,8 +22,35 @@
 from gnuradio import gr, gr_unittest
 from gnuradio import blocks
 from gnuradio import audio
+import math
 import os
-from . import dab_swig as dab
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+def crc16(data):
+    # CRC of the AUs (ETSI TS 102 563), transmitted inverted
+    crc = 0xffff
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(0, 8):
+            crc = ((crc << 1) ^ 0x1021) & 0xffff if crc & 0x8000 else (crc << 1) & 0xffff
+    return crc ^ 0xffff
+
+def firecode(data):
+    # CRC with the generator polynomial of the firecode (ETSI TS 102 563)
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(0, 8):
+            crc = ((crc << 1) ^ 0x782f) & 0xffff if crc & 0x8000 else (crc << 1) & 0xffff
+    return crc
 
 class qa_mp4_decode_bs (gr_unittest.TestCase):
     """
@@ -34,18 +61,99 @@ class qa_mp4_decode_bs (gr_unittest.TestCase):
 
     def setUp (self):
         self.tb = gr.top_block ()
+        # AAC LC, stereo, 48 kHz: 6 AUs of 960 samples per superframe
+        self.bit_rate_n = 12
+        self.superframe_size = 110 * self.bit_rate_n
+        self.superframe_samples = 6 * 960
+        self.num_superframes = 10
 
     def tearDown (self):
         self.tb = None
 
+    def amplitude(self, superframe):
+        # a different level for each superframe, to see the order of the output
+        return 1000 * ((3 * superframe) % 11 + 1)
+
+    def superframes(self):
+        # encodes a 1 kHz tone to DAB+ superframes (with firecode and AU CRCs, without Reed-Solomon parity)
+        pcm = [int(self.amplitude(n // self.superframe_samples) * math.sin(2 * math.pi * n / 48.0))
+               for n in range(0, self.num_superframes * self.superframe_samples)]
+        tb = gr.top_block()
+        src_left = blocks.vector_source_s(pcm)
+        src_right = blocks.vector_source_s(pcm)
+        mp4_encode = dab.mp4_encode_sb(self.bit_rate_n, 2, 48000, 0)
+        dst = blocks.vector_sink_b()
+        tb.connect(src_left, (mp4_encode, 0), dst)
+        tb.connect(src_right, (mp4_encode, 1))
+        tb.run()
+        data = list(dst.data())
+        self.assertEqual(len(data), self.num_superframes * self.superframe_size)
+        return [data[n * self.superframe_size:(n + 1) * self.superframe_size]
+                for n in range(0, self.num_superframes)]
+
+    def au_starts(self, superframe):
+        # 6 AUs (dac_rate 1, sbr_flag 0), the last one ends at the end of the superframe
+        starts = [11]
+        for i in range(0, 5):
+            pos = 3 + (3 * i) // 2
+            if i % 2 == 0:
+                starts.append((superframe[pos] << 4) | (superframe[pos + 1] >> 4))
+            else:
+                starts.append(((superframe[pos] & 0xf) << 8) | superframe[pos + 1])
+        return starts + [self.superframe_size]
+
+    def set_ps_flag(self, superframe):
+        # signal parametric stereo in the superframe header (bit 20), the AUs are not changed
+        superframe[2] |= 0x08
+        crc = firecode(superframe[2:11])
+        superframe[0:2] = [crc >> 8, crc & 0xff]
+
+    def decode(self, superframes, input_tags=()):
+        tb = gr.top_block()
+        src = blocks.vector_source_b(sum(superframes, []), False, 1, list(input_tags))
+        mp4_decode = dab.mp4_decode_bs(self.bit_rate_n)
+        sink_left = blocks.vector_sink_s()
+        sink_right = blocks.vector_sink_s()
+        tb.connect(src, (mp4_decode, 0), sink_left)
+        tb.connect((mp4_decode, 1), sink_right)
+        tb.run()
+        left = list(sink_left.data())
+        self.assertEqual(left, list(sink_right.data()))
+        tags = []
+        for port, sink in enumerate((sink_left, sink_right)):
+            for tag in sink.tags():
+                key = pmt.symbol_to_string(tag.key)
+                value = pmt.to_long(tag.value) if key == "sample_rate" else pmt.to_bool(tag.value)
+                tags.append((port, tag.offset, key, value))
+        return left, sorted(tags)
+
+    def format_tags(self, offset, ps):
+        return sorted((port, offset, key, value) for port in (0, 1)
+                      for key, value in (("sample_rate", 48000), ("sbr", False), ("ps", ps)))
+
+    def assert_order(self, pcm):
+        # The RMS of each AU length block of the output has to follow the levels of the input superframes,
+        # for one delay of the codec. Blocks next to a change of the level and the first superframe are not checked.
+        block = 960
+        rms = [math.sqrt(sum(x * x for x in pcm[b * block:(b + 1) * block]) / block)
+               for b in range(0, len(pcm) // block)]
+        levels = [self.amplitude(b // 6) / math.sqrt(2) for b in range(0, 6 * self.num_superframes)]
+        for delay in range(0, 12):
+            errors = [abs(rms[b] / levels[b + delay] - 1) for b in range(0, len(rms))
+                      if 6 < b + delay < len(levels) - 1 and
+                      levels[b + delay - 1] == levels[b + delay] == levels[b + delay + 1]]
+            if len(errors) >= 30 and max(errors) < 0.1:
+                return
+        self.fail("decoded superframes are not in the order of the input")
+
 # manual check, if header info makes sense, and if audio is played, input = repaired (= Reed-Solomon decoded) DAB+ audio superframes
     def test_001_t (self):
         if os.path.exists("debug/reed_solomon_repaired.dat"):
-            self.src = blocks.file_source_make(gr.sizeof_char, "debug/reed_solomon_repaired.dat")
-            self.mp4 = dab.mp4_decode_bs_make(14)
-            self.s2f_left = blocks.short_to_float_make(1, 32767)
-            self.s2f_right = blocks.short_to_float_make(1, 32767)
-            self.audio = audio.sink_make(32000)
+            self.src = blocks.file_source(gr.sizeof_char, "debug/reed_solomon_repaired.dat")
+            self.mp4 = dab.mp4_decode_bs(14)
+            self.s2f_left = blocks.short_to_float(1, 32767)
+            self.s2f_right = blocks.short_to_float(1, 32767)
+            self.audio = audio.sink(32000)
 
             self.tb.connect(self.src, (self.mp4, 0), self.s2f_left, (self.audio, 0))
             self.tb.connect((self.mp4, 1), self.s2f_right, (self.audio, 1))
@@ -56,6 +164,47 @@ class qa_mp4_decode_bs (gr_unittest.TestCase):
             log.set_level("WARN")
         pass
 
+    # the PCM samples are written out in the order of the superframes, the format is tagged once
+    def test_002_t (self):
+        # the tags of the superframes are not propagated to the PCM samples
+        input_tags = [gr.tag_utils.python_to_tag((n * self.superframe_size, pmt.intern("cif_start"),
+                                                  pmt.from_uint64(5 * n), pmt.intern("src")))
+                      for n in range(0, self.num_superframes)]
+        # the first superframe in the input is skipped by the decoder
+        left, tags = self.decode(self.superframes(), input_tags)
+        self.assertLessEqual(len(left), (self.num_superframes - 1) * self.superframe_samples)
+        self.assertGreaterEqual(len(left), (self.num_superframes - 1) * self.superframe_samples - 960)
+        self.assert_order(left)
+        self.assertEqual(tags, self.format_tags(0, False))
+
+    # a change of the audio format is tagged at the first sample of the superframe
+    def test_003_t (self):
+        superframes = self.superframes()
+        for superframe in superframes[6:]:
+            self.set_ps_flag(superframe)
+        left, tags = self.decode(superframes)
+        # the superframes 6 .. 9 are complete
+        offset = len(left) - (self.num_superframes - 6) * self.superframe_samples
+        self.assertEqual(tags, sorted(self.format_tags(0, False) + self.format_tags(offset, True)))
+
+    # AUs with CRC failure or decoding error are dropped, without changing the tagged format
+    def test_004_t (self):
+        clean, tags = self.decode(self.superframes())
+        superframes = self.superframes()
+        # CRC failure in AU 2 of superframe 3
+        starts = self.au_starts(superframes[3])
+        superframes[3][starts[2] + 20] ^= 0xff
+        # AU 3 of superframe 5 with valid CRC, but the reserved bit of ics_info set and max_sfb out of range
+        starts = self.au_starts(superframes[5])
+        au = superframes[5][starts[3]:starts[4] - 2]
+        au[1] |= 0x8f
+        au[2] |= 0xc0
+        crc = crc16(au)
+        superframes[5][starts[3]:starts[4]] = au + [crc >> 8, crc & 0xff]
+        left, tags = self.decode(superframes)
+        self.assertEqual(len(left), len(clean) - 2 * 960)
+        self.assertEqual(tags, self.format_tags(0, False))
+
 
 if __name__ == '__main__':
     gr_unittest.run(qa_mp4_decode_bs, "qa_mp4_decode_bs.xml")
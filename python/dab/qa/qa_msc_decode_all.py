@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import json
+import random
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_msc_decode_all(gr_unittest.TestCase):
+    """
+    @brief QA for the ensemble-wide MSC decoder.
+
+    Every output of msc_decode_all has to match a single msc_decode for the same sub-channel.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+        self.dp = dab.parameters.dab_parameters(1, 2048000, False)
+        random.seed(42)
+        # 24 CIFs of random QPSK symbols
+        num_syms = 24 * self.dp.num_msc_syms // self.dp.num_cifs
+        self.src_data = [complex(random.choice([-1, 1]), random.choice([-1, 1]))
+                         for i in range(0, num_syms * self.dp.num_carriers)]
+        self.subchannels = [{"ID": 1, "address": 54, "size": 84, "protection": 2},
+                            {"ID": 2, "address": 0, "size": 48, "protection": 1},
+                            {"ID": 3, "address": 300, "size": 36, "protection": 0}]
+
+    def tearDown(self):
+        self.tb = None
+
+    def run_reference(self, int8_soft_bits):
+        expected = []
+        for subch in self.subchannels:
+            tb = gr.top_block()
+            src = blocks.vector_source_c(self.src_data, False, self.dp.num_carriers)
+            msc = dab.msc_decode(self.dp, subch["address"], subch["size"], subch["protection"],
+                                 int8_soft_bits=int8_soft_bits)
+            dst = blocks.vector_sink_b()
+            tb.connect(src, msc, dst)
+            tb.run()
+            expected.append(list(dst.data()))
+        return expected
+
+    def run_msc_decode_all(self, subchannels, int8_soft_bits):
+        src = blocks.vector_source_c(self.src_data, False, self.dp.num_carriers)
+        msc = dab.msc_decode_all(self.dp, subchannels, int8_soft_bits=int8_soft_bits)
+        self.tb.connect(src, msc)
+        dsts = []
+        for i in range(0, len(self.subchannels)):
+            dsts.append(blocks.vector_sink_b())
+            self.tb.connect((msc, i), dsts[i])
+        self.tb.run()
+        return [list(dst.data()) for dst in dsts]
+
+    def test_001_msc_decode_all(self):
+        expected = self.run_reference(False)
+        result = self.run_msc_decode_all(self.subchannels, False)
+        for i in range(0, len(self.subchannels)):
+            self.assertTrue(len(result[i]) > 0)
+            self.assertEqual(expected[i], result[i])
+
+    def test_002_msc_decode_all_json_int8(self):
+        expected = self.run_reference(True)
+        result = self.run_msc_decode_all(json.dumps(self.subchannels), True)
+        for i in range(0, len(self.subchannels)):
+            self.assertEqual(expected[i], result[i])
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import random
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_msc_encode_packed(gr_unittest.TestCase):
+    """
+    @brief QA for the packed MSC encoder
+
+    This class verifies that msc_encode_packed_bb produces the same output as the bit-wise
+    chain of energy dispersal, conv_encoder_bb, puncture_bb and time_interleave_bb.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+        self.dp = dab.parameters.dab_parameters(1, 2048000, False)
+
+    def tearDown(self):
+        self.tb = None
+
+    def encode(self, encoder, src_data):
+        tb = gr.top_block()
+        src = blocks.vector_source_b(src_data)
+        dst = blocks.vector_sink_b()
+        tb.connect(src, encoder, dst)
+        tb.run()
+        return list(dst.data())
+
+    def test_001_t(self):
+        # 20 logical frames, longer than the delay of the time interleaver
+        for (data_rate_n, protection) in [(14, 2), (1, 1), (3, 0)]:
+            src_data = [random.randint(0, 255) for i in range(0, 20 * data_rate_n * 24)]
+            reference = self.encode(dab.msc_encode(self.dp, data_rate_n, protection), src_data)
+            result = self.encode(dab.msc_encode_packed(self.dp, data_rate_n, protection), src_data)
+            size = data_rate_n * self.dp.subch_size_multiple_n[protection]
+            self.assertEqual(len(result), 20 * self.dp.msc_eep_puncturing(size, protection)[1] // 8)
+            self.assertEqual(reference, result)
+
+    def test_002_t(self):
+        # FIC: no time interleaving
+        framesize = self.dp.energy_dispersal_fic_vector_length // 8
+        src_data = [random.randint(0, 255) for i in range(0, 4 * framesize)]
+        unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
+        prbs_src = blocks.vector_source_b(self.dp.prbs(self.dp.energy_dispersal_fic_vector_length), True)
+        add_mod_2 = blocks.xor_bb()
+        conv_pack = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+        conv_encoder = dab.conv_encoder_bb(framesize)
+        conv_unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
+        puncture = dab.puncture_bb(self.dp.assembled_fic_puncturing_sequence)
+        pack = blocks.unpacked_to_packed_bb(1, gr.GR_MSB_FIRST)
+        src = blocks.vector_source_b(src_data)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, unpack, add_mod_2, conv_pack, conv_encoder, conv_unpack, puncture, pack, dst)
+        self.tb.connect(prbs_src, (add_mod_2, 1))
+        self.tb.run()
+        reference = list(dst.data())
+        result = self.encode(dab.msc_encode_packed_bb(framesize, self.dp.assembled_fic_puncturing_sequence, [0]),
+                             src_data)
+        self.assertEqual(len(result), 4 * self.dp.fic_punctured_codeword_length // 8)
+        self.assertEqual(reference, result)
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_msc_encode_packed)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import random
+import pmt
+from gnuradio import gr, gr_unittest
+from gnuradio import blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_ofdm_differential_demod_vcvc(gr_unittest.TestCase):
+    """
+    @brief QA for the fused OFDM demodulation block after the FFT.
+
+    This class implements a test bench to verify the corresponding C++ class
+    against the chain of blocks it replaces.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def make_frames(self, fft_length, num_carriers, offset, symbols_per_frame, num_frames):
+        random.seed(42)
+        data = []
+        for s in range(symbols_per_frame * num_frames):
+            for k in range(fft_length):
+                if offset <= k <= offset + num_carriers and k != offset + num_carriers // 2:
+                    data.append(complex(random.choice([-10, 10]), random.choice([-10, 10])))
+                else:
+                    data.append(complex(random.uniform(-0.1, 0.1), random.uniform(-0.1, 0.1)))
+        tags = []
+        for f in range(num_frames):
+            tag = gr.tag_t()
+            tag.offset = f * symbols_per_frame
+            tag.key = pmt.intern("Start")
+            tag.value = pmt.from_float(0.0)
+            tags.append(tag)
+        return data, tags
+
+    def test_001_t(self):
+        fft_length = 16
+        num_carriers = 8
+        symbols_fic = 2
+        symbols_msc = 3
+        scale = 0.25
+        deinterleaving_sequence = [3, 6, 0, 5, 7, 1, 4, 2]
+        data, tags = self.make_frames(fft_length, num_carriers, 3, 1 + symbols_fic + symbols_msc, 3)
+
+        # reference chain
+        src_ref = blocks.vector_source_c(data, False, fft_length, tags)
+        multiply = blocks.multiply_const_vcc([scale] * fft_length)
+        coarse_freq_corr = dab.ofdm_coarse_frequency_correction_vcvc(fft_length, num_carriers, 0)
+        diff_phasor = dab.diff_phasor_vcc(num_carriers)
+        deinterleaver = dab.frequency_interleaver_vcc(deinterleaving_sequence)
+        demux = dab.demux_cc(num_carriers, symbols_fic, symbols_msc)
+        fic_ref = blocks.vector_sink_c(num_carriers)
+        msc_ref = blocks.vector_sink_c(num_carriers)
+        self.tb.connect(src_ref, multiply, coarse_freq_corr, diff_phasor, deinterleaver, demux, fic_ref)
+        self.tb.connect((demux, 1), msc_ref)
+
+        # fused block
+        src = blocks.vector_source_c(data, False, fft_length, tags)
+        demod = dab.ofdm_differential_demod_vcvc(fft_length, num_carriers, deinterleaving_sequence,
+                                                 symbols_fic, symbols_msc, scale)
+        fic = blocks.vector_sink_c(num_carriers)
+        msc = blocks.vector_sink_c(num_carriers)
+        self.tb.connect(src, demod, fic)
+        self.tb.connect((demod, 1), msc)
+        self.tb.run()
+
+        self.assertEqual(len(fic.data()), 3 * symbols_fic * num_carriers)
+        self.assertEqual(len(msc.data()), 3 * symbols_msc * num_carriers)
+        self.assertComplexTuplesAlmostEqual(fic_ref.data(), fic.data(), 4)
+        self.assertComplexTuplesAlmostEqual(msc_ref.data(), msc.data(), 4)
+        self.assertAlmostEqual(coarse_freq_corr.get_snr(), demod.get_snr(), 4)
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
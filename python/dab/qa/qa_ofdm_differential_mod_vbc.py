@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+
+import random
+from gnuradio import gr, gr_unittest
+from gnuradio import blocks, digital, fft
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_ofdm_differential_mod_vbc(gr_unittest.TestCase):
+    """
+    @brief QA for the fused OFDM modulator.
+
+    This class implements a test bench to verify the corresponding C++ class
+    against the chain of blocks it replaces.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_t(self):
+        fft_length = 16
+        num_carriers = 8
+        cp_length = 4
+        ns_length = 6
+        symbols_per_frame = 4
+        num_frames = 3
+        scale = 0.25
+        prn = [1, 1j, -1, -1j, -1j, 1, 1j, -1]
+        interleaving_sequence = [3, 6, 0, 5, 7, 1, 4, 2]
+        random.seed(42)
+        data = [random.randint(0, 255) for i in range(0, num_frames * (symbols_per_frame - 1) * num_carriers // 4)]
+        trigger = ([1] + [0] * (symbols_per_frame - 2)) * num_frames
+
+        # reference chain (without the NULL symbol)
+        src_ref = blocks.vector_source_b(data, False, num_carriers // 4)
+        trigger_ref = blocks.vector_source_b(trigger, False)
+        mapper = dab.qpsk_mapper_vbvc(num_carriers)
+        insert_pilot = dab.ofdm_insert_pilot_vcc(prn)
+        sum_phase = dab.sum_phasor_trig_vcc(num_carriers)
+        interleave = dab.frequency_interleaver_vcc(interleaving_sequence)
+        move_and_insert_carrier = dab.ofdm_move_and_insert_zero(fft_length, num_carriers)
+        ifft = fft.fft_vcc(fft_length, False, [], True)
+        prefixer = digital.ofdm_cyclic_prefixer(fft_length, cp_length + fft_length)
+        multiply_const = blocks.multiply_const_cc(scale)
+        dst_ref = blocks.vector_sink_c()
+        self.tb.connect(src_ref, mapper, (insert_pilot, 0), (sum_phase, 0), interleave, move_and_insert_carrier,
+                        ifft, prefixer, multiply_const, dst_ref)
+        self.tb.connect(trigger_ref, (insert_pilot, 1), (sum_phase, 1))
+        self.tb.connect((sum_phase, 1), blocks.null_sink(gr.sizeof_char))
+
+        # fused block
+        src = blocks.vector_source_b(data, False, num_carriers // 4)
+        trigger_src = blocks.vector_source_b(trigger, False)
+        mod = dab.ofdm_differential_mod_vbc(fft_length, num_carriers, cp_length, ns_length, symbols_per_frame,
+                                            prn, interleaving_sequence, scale)
+        dst = blocks.vector_sink_c()
+        self.tb.connect(src, (mod, 0), dst)
+        self.tb.connect(trigger_src, (mod, 1))
+        self.tb.run()
+
+        frame_length = symbols_per_frame * (cp_length + fft_length)
+        reference = []
+        for f in range(0, num_frames):
+            reference += [0] * ns_length + list(dst_ref.data()[f * frame_length:(f + 1) * frame_length])
+        self.assertEqual(len(dst.data()), num_frames * (ns_length + frame_length))
+        self.assertComplexTuplesAlmostEqual(reference, dst.data(), 5)
+
+    def test_002_t(self):
+        # symbols before the first frame start are dropped, the phase reference symbol is the same in every frame
+        fft_length = 16
+        num_carriers = 8
+        prn = [1, 1j, -1, -1j, -1j, 1, 1j, -1]
+        interleaving_sequence = [3, 6, 0, 5, 7, 1, 4, 2]
+        data = [0x55, 0xaa] * 2 + [0, 0] * 4
+        trigger = [0, 0, 1, 0, 1, 0]
+        src = blocks.vector_source_b(data, False, num_carriers // 4)
+        trigger_src = blocks.vector_source_b(trigger, False)
+        mod = dab.ofdm_differential_mod_vbc(fft_length, num_carriers, 4, 6, 3, prn, interleaving_sequence, 1.0)
+        dst = blocks.vector_sink_c()
+        self.tb.connect(src, (mod, 0), dst)
+        self.tb.connect(trigger_src, (mod, 1))
+        self.tb.run()
+        result = dst.data()
+        frame_length = 6 + 3 * 20
+        self.assertEqual(len(result), 2 * frame_length)
+        self.assertComplexTuplesAlmostEqual(result[:6], [0] * 6)
+        self.assertComplexTuplesAlmostEqual(result[6:26], result[frame_length + 6:frame_length + 26])
+        # all bits zero: every data symbol is rotated by pi/4 against the previous one
+        self.assertComplexTuplesAlmostEqual([x * (1 + 1j) / abs(1 + 1j) for x in result[26:46]], result[46:66], 5)
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_ofdm_differential_mod_vbc)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import random
+import pmt
+from gnuradio import gr, gr_unittest
+from gnuradio import blocks
+from gnuradio import fft
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_ofdm_fft_vcvc(gr_unittest.TestCase):
+    """
+    @brief QA for the batched FFT block.
+
+    This class implements a test bench to verify the corresponding C++ class
+    against the FFT block of GNU Radio followed by a scaling.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def compare_with_fft_vcc(self, fft_length, symbols_per_frame, num_frames, scale):
+        random.seed(42)
+        data = [complex(random.uniform(-1, 1), random.uniform(-1, 1))
+                for i in range(fft_length * symbols_per_frame * num_frames)]
+
+        # reference chain
+        src_ref = blocks.vector_source_c(data, False, fft_length)
+        fft_ref = fft.fft_vcc(fft_length, True, [], True)
+        multiply = blocks.multiply_const_vcc([scale] * fft_length)
+        dst_ref = blocks.vector_sink_c(fft_length)
+        self.tb.connect(src_ref, fft_ref, multiply, dst_ref)
+
+        # batched FFT
+        src = blocks.vector_source_c(data, False, fft_length)
+        batched_fft = dab.ofdm_fft_vcvc(fft_length, symbols_per_frame, scale)
+        dst = blocks.vector_sink_c(fft_length)
+        self.tb.connect(src, batched_fft, dst)
+        self.tb.run()
+
+        self.assertEqual(len(dst.data()), len(data))
+        self.assertComplexTuplesAlmostEqual(dst_ref.data(), dst.data(), 4)
+
+    def test_001_t(self):
+        self.compare_with_fft_vcc(64, 5, 4, 0.125)
+
+    def test_002_t(self):
+        # odd FFT length and two blocks sharing the same plan
+        self.compare_with_fft_vcc(15, 3, 2, 1.0)
+        self.tearDown()
+        self.setUp()
+        self.compare_with_fft_vcc(15, 3, 2, 1.0)
+
+    def test_003_t(self):
+        # only the flagged symbols of each frame are transformed
+        fft_length = 32
+        symbol_mask = [1, 1, 0, 0, 1, 0]
+        symbols_per_frame = len(symbol_mask)
+        num_frames = 3
+        random.seed(42)
+        data = [complex(random.uniform(-1, 1), random.uniform(-1, 1))
+                for i in range(fft_length * symbols_per_frame * num_frames)]
+        tags = []
+        for f in range(num_frames):
+            tag = gr.tag_t()
+            tag.offset = f * symbols_per_frame
+            tag.key = pmt.intern("Start")
+            tag.value = pmt.from_float(0.0)
+            tags.append(tag)
+
+        src_ref = blocks.vector_source_c(data, False, fft_length)
+        fft_ref = fft.fft_vcc(fft_length, True, [], True)
+        dst_ref = blocks.vector_sink_c(fft_length)
+        self.tb.connect(src_ref, fft_ref, dst_ref)
+
+        src = blocks.vector_source_c(data, False, fft_length, tags)
+        batched_fft = dab.ofdm_fft_vcvc(fft_length, symbols_per_frame, 1.0, symbol_mask)
+        dst = blocks.vector_sink_c(fft_length)
+        self.tb.connect(src, batched_fft, dst)
+        self.tb.run()
+
+        expected = list(dst_ref.data())
+        for i in range(symbols_per_frame * num_frames):
+            if not symbol_mask[i % symbols_per_frame]:
+                expected[i * fft_length:(i + 1) * fft_length] = [0] * fft_length
+        self.assertComplexTuplesAlmostEqual(expected, dst.data(), 4)
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import numpy as np
+from gnuradio import gr, gr_unittest, blocks
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_ofdm_synchronization_cvf(gr_unittest.TestCase):
+    """
+    @brief QA for the OFDM frame synchronization
+
+    This class implements a test bench to verify the corresponding C++ class.
+    The frames are synthetic: a NULL symbol followed by OFDM symbols with random QPSK carriers.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+        self.fft_length = 512
+        self.cp_length = 128
+        self.null_length = 640
+        self.num_carriers = 384
+        self.symbols_per_frame = 10
+        self.frame_length = self.null_length + self.symbols_per_frame * (self.fft_length + self.cp_length)
+        self.rng = np.random.RandomState(1)
+
+    def tearDown(self):
+        self.tb = None
+
+    def noise(self, length, power):
+        return np.sqrt(power / 2) * (self.rng.randn(length) + 1j * self.rng.randn(length))
+
+    def ofdm_symbol(self):
+        # random QPSK on the carriers around DC (without DC), mean power 1
+        carriers = np.zeros(self.fft_length, dtype=complex)
+        indices = np.concatenate((np.arange(1, self.num_carriers // 2 + 1),
+                                  np.arange(self.fft_length - self.num_carriers // 2, self.fft_length)))
+        carriers[indices] = np.exp(1j * np.pi / 4 + 1j * np.pi / 2 * self.rng.randint(0, 4, self.num_carriers))
+        symbol = np.fft.ifft(carriers) * self.fft_length / np.sqrt(self.num_carriers)
+        return np.concatenate((symbol[-self.cp_length:], symbol))
+
+    def frame(self, null_symbol=True):
+        # without NULL symbol, the transmitter sends noise of the signal power instead
+        null = np.zeros(self.null_length, dtype=complex) if null_symbol else self.noise(self.null_length, 1.0)
+        return np.concatenate([null] + [self.ofdm_symbol() for _ in range(0, self.symbols_per_frame)])
+
+    def run_sync(self, frames):
+        # The stream starts in the middle of a frame. Each symbol is only output if the input reaches
+        # one symbol further, so the stream ends with 2 empty symbols (too short for another prediction).
+        signal = np.concatenate([self.ofdm_symbol() for _ in range(0, 3)] + frames +
+                                [np.zeros(2 * (self.fft_length + self.cp_length), dtype=complex)])
+        signal = signal + self.noise(len(signal), 1e-4)
+        src = blocks.vector_source_c(signal.tolist())
+        sync = dab.ofdm_synchronization_cvf(self.fft_length, self.cp_length, self.null_length,
+                                            self.symbols_per_frame)
+        dst = blocks.vector_sink_c(self.fft_length)
+        self.tb.connect(src, sync, dst)
+        self.tb.run()
+        num_symbols = len(dst.data()) // self.fft_length
+        self.assertEqual(0, num_symbols % self.symbols_per_frame)
+        tags = sorted([(tag.offset, pmt.to_bool(tag.value)) for tag in dst.tags()
+                       if pmt.symbol_to_string(tag.key) == "Lock"])
+        # one Lock tag at the first symbol of each frame
+        self.assertEqual([n * self.symbols_per_frame for n in range(0, num_symbols // self.symbols_per_frame)],
+                         [offset for offset, locked in tags])
+        return [locked for offset, locked in tags], sync.get_locked()
+
+    # the first frame is acquired, the following ones are verified at the predicted start
+    def test_001_t(self):
+        locks, locked = self.run_sync([self.frame() for _ in range(0, 6)])
+        self.assertEqual([False] + [True] * 5, locks)
+        self.assertTrue(locked)
+
+    # a frame without NULL symbol is found at the predicted start
+    def test_002_t(self):
+        frames = [self.frame(frame != 4) for frame in range(0, 8)]
+        locks, locked = self.run_sync(frames)
+        self.assertEqual([False] + [True] * 7, locks)
+        self.assertTrue(locked)
+
+    # 2 missed frames are bridged, after the 3rd miss the next frame is acquired again
+    def test_003_t(self):
+        frames = [self.frame() for _ in range(0, 10)]
+        for frame in (4, 5, 6):
+            frames[frame] = self.noise(self.frame_length, 1.0)
+        locks, locked = self.run_sync(frames)
+        # frames 0 .. 3, the noise of frames 4 and 5 with the predicted timing, frames 7 .. 9
+        self.assertEqual([False] + [True] * 5 + [False] + [True] * 2, locks)
+        self.assertTrue(locked)
+
+
+if __name__ == '__main__':
+    gr_unittest.run(qa_ofdm_synchronization_cvf)
@@ -21,21 +21,22 @@
 
 from gnuradio import gr, gr_unittest
 from gnuradio import blocks
-from . import dab_swig as dab
+import math
 import os
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
 
 class qa_reed_solomon_decode_bb (gr_unittest.TestCase):
 
     def setUp (self):
         self.tb = gr.top_block ()
-
-    def tearDown (self):
-        self.tb = None
-
-    def test_001_t(self):
-        """
-        insert 5 errors in rs-encoded prbs reference and correct them with rs_decoder
-        """
         self.prbs = (
         154, 15, 22, 223, 146, 92, 238, 15, 39, 87, 230, 120, 80, 186, 147, 176, 169, 49, 253, 117, 245, 122, 30, 187,
         74, 141, 148, 1, 181, 10, 0, 244, 250, 199, 227, 56, 155, 105, 187, 219, 135, 61, 241, 87, 223, 75, 59, 112, 78,
@@ -51,6 +52,13 @@ class qa_reed_solomon_decode_bb (gr_unittest.TestCase):
         78, 63, 3, 7, 3, 145, 60, 180, 134, 27, 104, 230, 32, 171, 6, 109, 106, 1, 6, 45, 104,
         206, 138, 38, 107, 242, 128, 228, 215, 34, 43, 109, 122, 92, 195, 54, 105, 246)
 
+    def tearDown (self):
+        self.tb = None
+
+    def test_001_t(self):
+        """
+        insert 5 errors in rs-encoded prbs reference and correct them with rs_decoder
+        """
         self.src = blocks.vector_source_b(self.corrupted_data)
         self.rs_decoder = dab.reed_solomon_decode_bb_make(1)
         self.sink = blocks.vector_sink_b_make()
@@ -58,6 +66,97 @@ class qa_reed_solomon_decode_bb (gr_unittest.TestCase):
         self.tb.run()
         data = self.sink.data()
         self.assertEqual(data, self.prbs)
+        self.assertEqual(5, self.rs_decoder.get_corrected_errors())
+
+    def test_002_t(self):
+        """
+        interleave the corrupted packet of test_001 with an error free packet and count the packets
+        """
+        codeword = self.prbs + self.corrupted_data[110:]
+        superframe = []
+        for pos in range(0, 120):
+            superframe.extend([self.corrupted_data[pos], codeword[pos]])
+
+        src = blocks.vector_source_b(superframe)
+        rs_decoder = dab.reed_solomon_decode_bb(2)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, rs_decoder, sink)
+        self.tb.run()
+        expected_result = []
+        for pos in range(0, 110):
+            expected_result.extend([codeword[pos], codeword[pos]])
+        self.assertEqual(expected_result, list(sink.data()))
+        self.assertEqual(1, rs_decoder.get_clean_packets())
+        self.assertEqual(1, rs_decoder.get_corrected_packets())
+        self.assertEqual(0, rs_decoder.get_uncorrectable_packets())
+        self.assertEqual(5, rs_decoder.get_corrected_errors())
+
+    def test_003_t(self):
+        """
+        add a 6th error to the packet of test_001 and correct it with 4 bytes tagged as unreliable as erasures
+        """
+        corrupted_data = list(self.corrupted_data)
+        corrupted_data[50] ^= 0x5a
+        tags = [gr.tag_utils.python_to_tag((pos, pmt.intern("reliability"), pmt.from_long(10), pmt.intern("src")))
+                for pos in range(0, 4)]
+        src = blocks.vector_source_b(corrupted_data, False, 1, tags)
+        rs_decoder = dab.reed_solomon_decode_bb(1)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, rs_decoder, sink)
+        self.tb.run()
+        self.assertEqual(self.prbs, sink.data())
+        self.assertEqual(1, rs_decoder.get_corrected_packets())
+        self.assertEqual(0, rs_decoder.get_uncorrectable_packets())
+        self.assertEqual(6, rs_decoder.get_corrected_errors())
+
+    def test_004_t(self):
+        """
+        the reliability and cif_start tags of the superframes end at the decoder and do not reach the audio
+        """
+        bit_rate_n = 12
+        num_superframes = 6
+        # DAB+ superframes (AAC LC, 48 kHz, stereo) of a 1 kHz tone with RS parity
+        pcm = [int(8000 * math.sin(2 * math.pi * n / 48.0)) for n in range(0, num_superframes * 5760)]
+        tb_encode = gr.top_block()
+        src_left = blocks.vector_source_s(pcm)
+        src_right = blocks.vector_source_s(pcm)
+        mp4_encode = dab.mp4_encode_sb(bit_rate_n, 2, 48000, 0)
+        rs_encoder = dab.reed_solomon_encode_bb(bit_rate_n)
+        superframes = blocks.vector_sink_b()
+        tb_encode.connect(src_left, (mp4_encode, 0), rs_encoder, superframes)
+        tb_encode.connect(src_right, (mp4_encode, 1))
+        tb_encode.run()
+        data = list(superframes.data())
+        self.assertEqual(num_superframes * 120 * bit_rate_n, len(data))
+
+        # a cif_start tag at each logical frame and 4 unreliable (but correct) bytes in each superframe
+        frame_size = 24 * bit_rate_n
+        tags = [gr.tag_utils.python_to_tag((frame * frame_size, pmt.intern("cif_start"),
+                                            pmt.from_uint64(frame), pmt.intern("src")))
+                for frame in range(0, 5 * num_superframes)]
+        tags += [gr.tag_utils.python_to_tag((superframe * 5 * frame_size + 100 + 7 * pos, pmt.intern("reliability"),
+                                             pmt.from_long(10), pmt.intern("src")))
+                 for superframe in range(0, num_superframes) for pos in range(0, 4)]
+        src = blocks.vector_source_b(data, False, 1, tags)
+        firecode_check = dab.firecode_check_bb(bit_rate_n)
+        rs_decoder = dab.reed_solomon_decode_bb(bit_rate_n)
+        mp4_decode = dab.mp4_decode_bs(bit_rate_n)
+        rs_sink = blocks.vector_sink_b()
+        sink_left = blocks.vector_sink_s()
+        sink_right = blocks.vector_sink_s()
+        self.tb.connect(src, firecode_check, rs_decoder, (mp4_decode, 0), sink_left)
+        self.tb.connect(rs_decoder, rs_sink)
+        self.tb.connect((mp4_decode, 1), sink_right)
+        self.tb.run()
+        self.assertEqual(num_superframes * 110 * bit_rate_n, len(rs_sink.data()))
+        self.assertEqual(0, rs_decoder.get_uncorrectable_packets())
+        self.assertEqual([], list(rs_sink.tags()))
+        # the first superframe is skipped by the audio decoder
+        self.assertGreater(len(sink_left.data()), 0)
+        for sink in (sink_left, sink_right):
+            keys = [pmt.symbol_to_string(tag.key) for tag in sink.tags()]
+            self.assertEqual(["ps", "sample_rate", "sbr"], sorted(keys))
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_select_cus_history_vbb(gr_unittest.TestCase):
+    """
+    @brief QA for the CU selection out of the CIF history
+
+    This class implements a test bench to verify the corresponding C++ class
+    against select_cus_vbvb followed by time_deinterleave_bb.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_t(self):
+        vlen = 4
+        frame_len = 10
+        scrambling_vector = [0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15]
+        src_data = [(i * 7 + 3) % 256 for i in range(0, vlen * frame_len * 20)]
+
+        src = blocks.vector_source_b(src_data)
+        s2v = blocks.stream_to_vector(gr.sizeof_char, vlen)
+        select_cus = dab.select_cus_vbvb(vlen, frame_len, 2, 3)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, vlen)
+        time_deinterleaver = dab.time_deinterleave_bb(vlen * 3, scrambling_vector)
+        reference = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, select_cus, v2s, time_deinterleaver, reference)
+
+        select_history = dab.select_cus_history_vbb(vlen, frame_len, 2, 3, scrambling_vector)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(s2v, select_history, dst)
+        self.tb.run()
+        self.assertEqual(list(reference.data()), list(dst.data()))
+        tags = [tag for tag in dst.tags() if str(tag.key) == "cif_start"]
+        self.assertEqual(list(range(0, 20 * vlen * 3, vlen * 3)), [tag.offset for tag in tags])
+        # same CIF index as select_cus_vbvb
+        self.assertEqual(list(range(0, 20)), [pmt.to_uint64(tag.value) for tag in tags])
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
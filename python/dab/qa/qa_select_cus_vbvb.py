@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_select_cus_vbvb(gr_unittest.TestCase):
+    """
+    @brief QA for the select cus block with int8 soft bits
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_t(self):
+        vector01 = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16)
+        expected_result = (5, 6, 7, 8, 13, 14, 15, 16)
+        src = blocks.vector_source_b(vector01)
+        s2v = blocks.stream_to_vector(gr.sizeof_char, 4)
+        select_cus = dab.select_cus_vbvb(4, 2, 1, 1)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, 4)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, select_cus, v2s, dst)
+        self.tb.run()
+        self.assertEqual(expected_result, tuple(dst.data()))
+
+    def test_002_t(self):
+        # switched sub-channel, first CU of each CIF is tagged
+        vector01 = tuple(range(1, 25))
+        expected_result = (1, 2, 3, 4, 5, 6, 13, 14, 15, 16, 17, 18)
+        src = blocks.vector_source_b(vector01)
+        s2v = blocks.stream_to_vector(gr.sizeof_char, 2)
+        select_cus = dab.select_cus_vbvb(2, 6, 4, 1)
+        select_cus.set_subchannel(0, 3)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, 2)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, select_cus, v2s, dst)
+        self.tb.run()
+        self.assertEqual(expected_result, tuple(dst.data()))
+        tags = [tag for tag in dst.tags() if str(tag.key) == "cif_start"]
+        self.assertEqual([0, 6], [tag.offset for tag in tags])
+        self.assertEqual([0, 1], [pmt.to_uint64(tag.value) for tag in tags])
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_time_deinterleave_bb(gr_unittest.TestCase):
+    """
+    @brief QA for the time deinterleave block with int8 soft bits
+
+    This class implements a test bench to verify the corresponding C++ class
+    with the test vectors of the float variant.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_t(self):
+        vector01 =          (1, 0, 3, 0, 5, 0,   7, 2, 9, 4, 11, 6,   13, 8, 15, 10, 17, 12)
+        expected_result =   (0, 0, 0, 0, 0, 0,   1, 2, 3, 4,  5, 6,    7, 8,  9, 10, 11, 12)
+        src = blocks.vector_source_b(vector01, True)
+        time_deinterleaver = dab.time_deinterleave_bb(6, [0, 1])
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, time_deinterleaver, blocks.head(gr.sizeof_char, 6*3), dst)
+        self.tb.run()
+        self.assertEqual(expected_result, tuple(dst.data()))
+
+    def test_002_t(self):
+        vector01 =          (3, 0, 0, 0, 7, 0, 0, 0,    11, 4, 0, 0, 15, 8,  0, 0,      19, 12, 1, 0, 23, 16, 5, 0,     27, 20,  9,  2, 31, 24, 13,  6)
+        expected_result =   (0, 0, 0, 0, 0, 0, 0, 0,     3, 4, 0, 0,  7, 8,  0, 0,      11, 12, 0, 0, 15, 16, 0, 0,      19,20, 0, 0, 23, 24, 0, 0)
+        src = blocks.vector_source_b(vector01, True)
+        time_deinterleaver = dab.time_deinterleave_bb(8, [2, 3, 0, 1])
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, time_deinterleaver, blocks.head(gr.sizeof_char, 8*4), dst)
+        self.tb.run()
+        self.assertEqual(expected_result, tuple(dst.data()))
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+from gnuradio import gr, gr_unittest, blocks
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_unpuncture_vbb(gr_unittest.TestCase):
+    """
+    @brief QA for the unpuncturing block with int8 soft bits.
+
+    This class implements a test bench to verify the corresponding C++ class.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def test_001_unpuncture_vbb(self):
+        src_data = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+        punc_seq = (1, 0, 0, 0, 1, 0, 1, 1, 1)
+        exp_res = (0, 77, 77, 77, 1, 77, 2, 3, 4, 5, 77, 77, 77, 6, 77, 7, 8, 9)
+        src = blocks.vector_source_b(src_data)
+        s2v = blocks.stream_to_vector(gr.sizeof_char, 5)
+        unpuncture_vbb = dab.unpuncture_vbb(punc_seq, 77)
+        v2s = blocks.vector_to_stream(gr.sizeof_char, 9)
+        dst = blocks.vector_sink_b()
+        self.tb.connect(src, s2v, unpuncture_vbb, v2s, dst)
+        self.tb.run()
+        self.assertEqual(exp_res, tuple(dst.data()))
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 Moritz Luca Schmid, Communications Engineering Lab (CEL) / Karlsruhe Institute of Technology (KIT).
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import random
+from gnuradio import gr, gr_unittest, blocks
+import pmt
+
+try:
+  from gnuradio import dab
+except ImportError:
+    import os
+    import sys
+    dirname, filename = os.path.split(os.path.abspath(__file__))
+    sys.path.append(os.path.join(dirname, "bindings"))
+    from gnuradio import dab
+
+class qa_viterbi_k7_r14(gr_unittest.TestCase):
+    """
+    @brief QA for the Viterbi decoder of the DAB convolutional code
+
+    This class implements a test bench to verify the corresponding C++ class
+    with codewords of the convolutional encoder block.
+    """
+
+    def setUp(self):
+        self.tb = gr.top_block()
+
+    def tearDown(self):
+        self.tb = None
+
+    def encode(self, data, framesize):
+        src = blocks.vector_source_b(data)
+        encoder = dab.conv_encoder_bb(framesize)
+        unpack = blocks.packed_to_unpacked_bb(1, gr.GR_MSB_FIRST)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, encoder, unpack, sink)
+        self.tb.run()
+        self.tb = gr.top_block()
+        return sink.data()
+
+    def bits(self, data):
+        return [(byte >> (7 - i)) & 1 for byte in data for i in range(8)]
+
+    def test_001_t(self):
+        # float soft bits with every third bit punctured and some wrong bits
+        framesize = 24
+        random.seed(42)
+        data = [random.randint(0, 255) for i in range(3 * framesize)]
+        codewords = self.encode(data, framesize)
+        soft_bits = [0.0 if i % 3 == 2 else (0.7 - 1.4 * b) * random.uniform(0.5, 1.5)
+                     for i, b in enumerate(codewords)]
+        for i in range(0, len(soft_bits), 97):
+            soft_bits[i] = -soft_bits[i]
+        src = blocks.vector_source_f(soft_bits)
+        decoder = dab.viterbi_k7_r14(8 * framesize)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, decoder, sink)
+        self.tb.run()
+        self.assertEqual(self.bits(data), list(sink.data()))
+
+    def test_002_t(self):
+        # int8 soft bits
+        framesize = 16
+        random.seed(23)
+        data = [random.randint(0, 255) for i in range(2 * framesize)]
+        codewords = self.encode(data, framesize)
+        soft_bits = [100 - 200 * b for b in codewords]
+        src = blocks.vector_source_f(soft_bits)
+        to_int8 = blocks.float_to_char()
+        decoder = dab.viterbi_k7_r14(8 * framesize, True)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, to_int8, decoder, sink)
+        self.tb.run()
+        self.assertEqual(self.bits(data), list(sink.data()))
+
+    def test_003_t(self):
+        # several CIF codewords decoded on a thread pool, output order preserved
+        framesize = 24
+        random.seed(5)
+        data = [random.randint(0, 255) for i in range(12 * framesize)]
+        codewords = self.encode(data, framesize)
+        soft_bits = [0.7 - 1.4 * b for b in codewords]
+        src = blocks.vector_source_f(soft_bits)
+        decoder = dab.viterbi_k7_r14(8 * framesize, False, 3)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, decoder, sink)
+        self.tb.run()
+        self.assertEqual(3, decoder.num_threads())
+        self.assertEqual(self.bits(data), list(sink.data()))
+
+    def test_004_t(self):
+        # the bytes decided by erased soft bits are tagged with their reliability
+        framesize = 16
+        data = [(37 * i + 11) & 0xff for i in range(framesize)]
+        codewords = self.encode(data, framesize)
+        soft_bits = [0 if 4 * 40 <= i < 4 * 56 else 100 - 200 * b for i, b in enumerate(codewords)]
+        src = blocks.vector_source_f(soft_bits)
+        to_int8 = blocks.float_to_char()
+        decoder = dab.viterbi_k7_r14(8 * framesize, True, 1, 32)
+        sink = blocks.vector_sink_b()
+        self.tb.connect(src, to_int8, decoder, sink)
+        self.tb.run()
+        tags = [(tag.offset, pmt.to_long(tag.value)) for tag in sink.tags()
+                if pmt.symbol_to_string(tag.key) == "reliability"]
+        self.assertEqual([(40, 0), (48, 0)], tags)
+        result = list(sink.data())
+        self.assertEqual(self.bits(data)[:40] + self.bits(data)[56:], result[:40] + result[56:])
+
+
+if __name__ == '__main__':
+    gr_unittest.main()
@@ -45,7 +45,7 @@ class transmitter_c(gr.hier_block2):
         # MSC
         self.msc_encoder()
         for i in range(0, num_subch):
-            self.msc_encoder[i] = dab.msc_encode(self.dp, data_rate_n[i], protection_mode[i])
+            self.msc_encoder[i] = dab.msc_encode_packed(self.dp, data_rate_n[i], protection_mode[i])
 
         # MUX
         self.subch_size = 6*data_rate_n
@@ -53,7 +53,7 @@ class transmitter_c(gr.hier_block2):
 
         # OFDM Modulator
         self.s2v = blocks.stream_to_vector(gr.sizeof_char, 384)
-        self.mod = dab.ofdm_mod(self.dp)
+        self.mod = dab.ofdm_mod(self.dp, fused=True)
 
         # connect everything
         self.connect(self.fic_source, self.fic_encode, (self.mux, 0))